@@ -10,7 +10,10 @@ Commands:
     run: Execute LLM queries and generate reports
     validate: Validate configuration without running queries
     eval: Run evaluation suite to test extraction accuracy
+    serve: Run configs on cron schedules in a long-lived process
+    api: Serve the HTTP job API (requires uvicorn)
     prices: Manage LLM pricing data (show, refresh, list)
+    db: Database maintenance (retention, archival, vacuum)
 
 Exit codes:
     0: Success - all queries successful
@@ -38,28 +41,18 @@ Security:
     - All exceptions are caught and formatted appropriately
 """
 
-import asyncio
 import json
-from contextlib import nullcontext
+import sys
+from contextlib import nullcontext, suppress
 from pathlib import Path
 
 import typer
-from rich.traceback import install as install_rich_traceback
 
-from llm_answer_watcher.config.loader import load_config
-from llm_answer_watcher.evals.runner import run_eval_suite
 from llm_answer_watcher.exceptions import (
     APIKeyMissingError,
     ConfigFileNotFoundError,
     ConfigValidationError,
 )
-from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
-from llm_answer_watcher.report.generator import write_report
-from llm_answer_watcher.storage.db import init_db_if_needed
-from llm_answer_watcher.storage.eval_db import (
-    init_eval_db_if_needed,
-    store_eval_results,
-)
 from llm_answer_watcher.storage.layout import get_parsed_answer_filename
 from llm_answer_watcher.utils.console import (
     create_progress_bar,
@@ -76,8 +69,110 @@ from llm_answer_watcher.utils.console import (
 )
 from llm_answer_watcher.utils.logging import setup_logging
 
-# Install Rich tracebacks for better error messages
-install_rich_traceback(show_locals=False)
+
+def _rich_excepthook(exc_type, exc_value, traceback) -> None:
+    """Install Rich tracebacks on the first uncaught exception and render it."""
+    from rich.traceback import install as install_rich_traceback
+
+    install_rich_traceback(show_locals=False)
+    sys.excepthook(exc_type, exc_value, traceback)
+
+
+# Rich tracebacks for better error messages (rich.traceback loads on first use)
+sys.excepthook = _rich_excepthook
+
+
+# Lazy entry points into the heavy modules. Importing the runner pulls in
+# httpx and every provider client, the report generator pulls in Jinja2 and
+# the config loader pulls in pydantic and YAML, so each is imported on first
+# call instead of at CLI startup. Tests patch these module-level names.
+
+
+def load_config(*args, **kwargs):
+    """Load and validate a config file (see config.loader.load_config)."""
+    from llm_answer_watcher.config.loader import load_config as _load_config
+
+    return _load_config(*args, **kwargs)
+
+
+async def run_all(*args, **kwargs):
+    """Execute a run (see llm_runner.runner.run_all)."""
+    from llm_answer_watcher.llm_runner.runner import run_all as _run_all
+
+    return await _run_all(*args, **kwargs)
+
+
+async def run_coordinator(*args, **kwargs):
+    """Coordinate a distributed run (see llm_runner.distributed.run_coordinator)."""
+    from llm_answer_watcher.llm_runner.distributed import (
+        run_coordinator as _run_coordinator,
+    )
+
+    return await _run_coordinator(*args, **kwargs)
+
+
+async def run_worker(*args, **kwargs):
+    """Execute queued work units (see llm_runner.distributed.run_worker)."""
+    from llm_answer_watcher.llm_runner.distributed import run_worker as _run_worker
+
+    return await _run_worker(*args, **kwargs)
+
+
+def estimate_run_cost(*args, **kwargs):
+    """Estimate run cost (see llm_runner.runner.estimate_run_cost)."""
+    from llm_answer_watcher.llm_runner.runner import (
+        estimate_run_cost as _estimate_run_cost,
+    )
+
+    return _estimate_run_cost(*args, **kwargs)
+
+
+def write_report(*args, **kwargs):
+    """Write report.html (see report.generator.write_report)."""
+    from llm_answer_watcher.report.generator import write_report as _write_report
+
+    return _write_report(*args, **kwargs)
+
+
+def build_result_rows(*args, **kwargs):
+    """Build report rows from a run summary (see report.generator)."""
+    from llm_answer_watcher.report.generator import (
+        build_result_rows as _build_result_rows,
+    )
+
+    return _build_result_rows(*args, **kwargs)
+
+
+def init_db_if_needed(*args, **kwargs):
+    """Create or migrate the SQLite database (see storage.db)."""
+    from llm_answer_watcher.storage.db import init_db_if_needed as _init_db_if_needed
+
+    return _init_db_if_needed(*args, **kwargs)
+
+
+def run_eval_suite(*args, **kwargs):
+    """Run the evaluation suite (see evals.runner.run_eval_suite)."""
+    from llm_answer_watcher.evals.runner import run_eval_suite as _run_eval_suite
+
+    return _run_eval_suite(*args, **kwargs)
+
+
+def init_eval_db_if_needed(*args, **kwargs):
+    """Create or migrate the evaluation database (see storage.eval_db)."""
+    from llm_answer_watcher.storage.eval_db import (
+        init_eval_db_if_needed as _init_eval_db_if_needed,
+    )
+
+    return _init_eval_db_if_needed(*args, **kwargs)
+
+
+def store_eval_results(*args, **kwargs):
+    """Persist evaluation results (see storage.eval_db.store_eval_results)."""
+    from llm_answer_watcher.storage.eval_db import (
+        store_eval_results as _store_eval_results,
+    )
+
+    return _store_eval_results(*args, **kwargs)
 
 
 def _check_brands_appeared(
@@ -210,6 +305,18 @@ def run(
         "-v",
         help="Enable debug logging",
     ),
+    *,
+    distributed: bool = typer.Option(
+        False,
+        "--distributed",
+        help="Enqueue queries for `worker` processes instead of running them here",
+    ),
+    workers: int = typer.Option(
+        0,
+        "--workers",
+        help="With --distributed, also start this many local worker processes",
+        min=0,
+    ),
 ):
     """
     Execute LLM queries and generate brand mention report.
@@ -243,7 +350,12 @@ def run(
 
       # Quiet mode for scripts
       llm-answer-watcher run --config watcher.config.yaml --quiet
+
+      # Distributed: 4 local workers plus any `worker` started elsewhere
+      llm-answer-watcher run --config watcher.config.yaml --distributed --workers 4
     """
+    import asyncio
+
     # Set global output mode based on flags
     output_mode.format = format
     output_mode.quiet = quiet
@@ -267,9 +379,12 @@ def run(
         if runtime_config.operation_models:
             model_summary += f", {len(runtime_config.operation_models)} operation models"
 
-        success(
-            f"Loaded {len(runtime_config.intents)} intents, {model_summary}"
-        )
+        intents_summary = f"{len(runtime_config.intents)} intents"
+        if runtime_config.intents_source:
+            source = runtime_config.intents_source
+            intents_summary += f" + {source.format} intents_source {source.path}"
+
+        success(f"Loaded {intents_summary}, {model_summary}")
 
     except ConfigFileNotFoundError as e:
         error(f"Configuration file not found: {e}")
@@ -307,16 +422,22 @@ def run(
             traceback.print_exc()
         raise typer.Exit(EXIT_DB_ERROR)
 
+    # Estimate cost with detailed breakdown. This also counts intents streamed
+    # from intents_source, which are not held in runtime_config.intents.
+    with spinner("Estimating costs..."):
+        cost_estimate = estimate_run_cost(runtime_config)
+
     # Calculate total work
-    total_queries = len(runtime_config.intents) * len(runtime_config.models)
+    total_intents = cost_estimate["total_intents"]
+    total_queries = total_intents * len(runtime_config.models)
 
-    # Calculate total operations
+    # Calculate total operations (source rows carry no per-intent operations)
     total_operations = 0
     if runtime_config.operation_models:
         ops_per_intent = len(runtime_config.global_operations)
         for intent in runtime_config.intents:
             ops_per_intent += len(intent.operations)
-        total_operations = ops_per_intent * len(runtime_config.intents)
+        total_operations = ops_per_intent * total_intents
 
     # Build execution summary
     if total_operations > 0:
@@ -324,10 +445,6 @@ def run(
     else:
         info(f"Will execute {total_queries} queries")
 
-    # Estimate cost with detailed breakdown
-    with spinner("Estimating costs..."):
-        cost_estimate = estimate_run_cost(runtime_config)
-
     # Get budget limit if configured
     budget_limit = None
     if (
@@ -422,57 +539,24 @@ def run(
                 if not output_mode.is_human()
                 else nullcontext()
             ):
-                results = asyncio.run(
-                    run_all(
-                        runtime_config,
-                        progress_callback=progress_callback,
-                        config_filename=config.name,
+                if distributed:
+                    results = _run_distributed(
+                        runtime_config, config, progress_callback, workers, verbose
+                    )
+                else:
+                    results = asyncio.run(
+                        run_all(
+                            runtime_config,
+                            progress_callback=progress_callback,
+                            config_filename=config.name,
+                        )
                     )
-                )
 
         # Generate HTML report
         with spinner("Generating report..."):
-            # Build list of result dicts for report generator
-            result_list = []
-            for intent in runtime_config.intents:
-                for model in runtime_config.models:
-                    # Find matching result (success or error)
-                    found_error = False
-                    for error_record in results.get("errors", []):
-                        if (
-                            error_record["intent_id"] == intent.id
-                            and error_record["model_provider"] == model.provider
-                            and error_record["model_name"] == model.model_name
-                        ):
-                            result_list.append(
-                                {
-                                    "intent_id": intent.id,
-                                    "provider": model.provider,
-                                    "model_name": model.model_name,
-                                    "status": "error",
-                                    "cost_usd": 0.0,
-                                    "timestamp_utc": results["timestamp_utc"],
-                                }
-                            )
-                            found_error = True
-                            break
-
-                    if not found_error:
-                        # Must be success
-                        result_list.append(
-                            {
-                                "intent_id": intent.id,
-                                "provider": model.provider,
-                                "model_name": model.model_name,
-                                "status": "success",
-                                "cost_usd": results["total_cost_usd"]
-                                / results["success_count"]
-                                if results["success_count"] > 0
-                                else 0.0,
-                                "timestamp_utc": results["timestamp_utc"],
-                            }
-                        )
-
+            # Intents streamed from intents_source stay in the database and
+            # JSON artifacts only
+            result_list = build_result_rows(runtime_config, results)
             write_report(results["output_dir"], runtime_config, result_list)
 
         success("Report generated successfully")
@@ -487,8 +571,42 @@ def run(
 
     # Build summary table data
     summary_results = []
+    skipped_units = {
+        (unit["intent_id"], unit["model_provider"], unit["model_name"])
+        for unit in results.get("skipped", [])
+    }
+    timed_out_units = {
+        (unit["intent_id"], unit["model_provider"], unit["model_name"])
+        for unit in results.get("timed_out", [])
+    }
     for intent in runtime_config.intents:
         for model in runtime_config.models:
+            if (intent.id, model.provider, model.model_name) in timed_out_units:
+                summary_results.append(
+                    {
+                        "intent_id": intent.id,
+                        "model": f"{model.provider}/{model.model_name}",
+                        "appeared": False,
+                        "cost": 0.0,
+                        "status": "timed_out",
+                    }
+                )
+                continue
+
+            if (intent.id, model.provider, model.model_name) in skipped_units:
+                summary_results.append(
+                    {
+                        "intent_id": intent.id,
+                        "model": f"{model.provider}/{model.model_name}",
+                        "appeared": _check_brands_appeared(
+                            results["output_dir"], intent.id, model.provider, model.model_name
+                        ),
+                        "cost": 0.0,
+                        "status": "skipped",
+                    }
+                )
+                continue
+
             # Check if this combination had an error
             found_error = False
             for error_record in results.get("errors", []):
@@ -538,19 +656,156 @@ def run(
         total=total_queries,
     )
 
+    skipped_count = results.get("skipped_count", 0)
+    if skipped_count:
+        info(f"Skipped {skipped_count} stable queries (previous answers carried forward)")
+    timed_out_count = results.get("timed_out_count", 0)
+    if timed_out_count:
+        warning(f"{timed_out_count} queries timed out before finishing")
+    if results.get("stop_reason"):
+        warning(f"Run stopped scheduling early: {results['stop_reason']}")
+
     # Print report link (human mode only)
     if output_mode.is_human():
         report_path = Path(results["output_dir"]) / "report.html"
         info(f"View report: file://{report_path.absolute()}")
 
-    # Determine exit code
-    if results["success_count"] == 0:
+    # Determine exit code (skipped stable queries are not failures)
+    answered = results["success_count"] + skipped_count
+    if answered == 0:
         raise typer.Exit(EXIT_COMPLETE_FAILURE)
-    if results["success_count"] < total_queries:
+    if answered < total_queries:
         raise typer.Exit(EXIT_PARTIAL_FAILURE)
     raise typer.Exit(EXIT_SUCCESS)
 
 
+def _run_distributed(runtime_config, config: Path, progress_callback, workers: int, verbose: bool):
+    """Run as coordinator of a distributed run, with optional local workers."""
+    import asyncio
+    import subprocess
+
+    from llm_answer_watcher.llm_runner.distributed import open_queue, start_local_workers
+    from llm_answer_watcher.utils.time import run_id_from_timestamp
+
+    queue = open_queue(runtime_config)
+    run_id = run_id_from_timestamp()
+    info(f"Distributed run {run_id}, queue {queue.path}")
+    processes = start_local_workers(str(config), run_id, workers, verbose=verbose)
+    try:
+        return asyncio.run(
+            run_coordinator(
+                runtime_config,
+                queue,
+                progress_callback=progress_callback,
+                config_filename=config.name,
+                run_id=run_id,
+                workers=processes or None,
+            )
+        )
+    finally:
+        for process in processes:
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+
+
+@app.command()
+def worker(
+    config: Path = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Path to YAML configuration file (same as the coordinator's)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    run_id: str | None = typer.Option(
+        None,
+        "--run-id",
+        help="Serve only this run and exit when it is finished",
+    ),
+    worker_id: str | None = typer.Option(
+        None,
+        "--worker-id",
+        help="Identifier recorded on leases (default: <hostname>-<pid>)",
+    ),
+    idle_seconds: float | None = typer.Option(
+        None,
+        "--idle-seconds",
+        help="Exit after this many seconds without work",
+        min=0.0,
+    ),
+    *,
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json' (worker summary on exit)",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Execute work units of distributed runs from the shared queue.
+
+    Start any number of workers, on this host or on others that share the
+    queue file (run_settings.distributed.queue_path), SQLite database and
+    output directory. Units of a worker that dies are retried by the others
+    once their lease expires.
+
+    Examples:
+      # Serve every distributed run until stopped
+      llm-answer-watcher worker --config watcher.config.yaml
+
+      # Help with one run, then exit
+      llm-answer-watcher worker --config watcher.config.yaml --run-id 2025-11-02T08-00-00Z
+    """
+    import asyncio
+
+    from llm_answer_watcher.llm_runner.distributed import open_queue
+
+    output_mode.format = format
+    # Logs are the primary output of a long-running process
+    setup_logging(verbose=verbose, quiet_logs=False)
+
+    try:
+        runtime_config = load_config(config)
+        init_db_if_needed(runtime_config.run_settings.sqlite_db_path)
+        queue = open_queue(runtime_config)
+    except ConfigValidationError as e:
+        error(f"Configuration validation failed: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+    except Exception as e:
+        error(f"Failed to start worker: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    with suppress(KeyboardInterrupt):
+        stats = asyncio.run(
+            run_worker(
+                runtime_config,
+                queue,
+                worker_id=worker_id,
+                run_id=run_id,
+                idle_seconds=idle_seconds,
+            )
+        )
+        if output_mode.is_agent():
+            output_mode.add_json("worker", stats)
+            output_mode.flush_json()
+        else:
+            success(
+                f"Worker {stats['worker_id']}: {stats['completed']} units completed, "
+                f"{stats['failed']} failed, {stats['lost']} lost"
+            )
+    raise typer.Exit(EXIT_SUCCESS)
+
+
 @app.command()
 def validate(
     config: Path = typer.Option(
@@ -603,6 +858,8 @@ def validate(
 
             success("Configuration is valid")
             info(f"Intents: {len(runtime_config.intents)}")
+            if runtime_config.intents_source:
+                info(f"Intents source: {runtime_config.intents_source.path}")
             info(f"Models: {len(runtime_config.models)}")
             info(f"Brands (mine): {len(runtime_config.brands.mine)}")
             info(f"Brands (competitors): {len(runtime_config.brands.competitors)}")
@@ -684,6 +941,26 @@ def eval(
         "--save-results",
         help="Save evaluation results to database for historical tracking",
     ),
+    *,
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=0,
+        help="Worker processes for evaluating test cases (0 = one per CPU)",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse saved results for test cases unchanged since they were stored",
+    ),
+    timing_iterations: int = typer.Option(
+        20,
+        "--timing-iterations",
+        min=0,
+        help="Timed extraction runs per test case for the latency gate (0 = skip). "
+        "Cases are timed one at a time after parallel scoring",
+    ),
 ):
     """
     Run evaluation suite to test extraction accuracy.
@@ -700,8 +977,11 @@ def eval(
     - Loads test cases from YAML fixtures file
     - Runs brand mention detection and rank extraction
     - Computes precision, recall, F1 scores
+    - Times extraction per test case and fails on p95 latency regressions
     - Shows detailed results for each test case
     - Optionally saves results to database for historical tracking
+    - Reuses saved results of test cases whose content and extractor code
+      are unchanged (see --save-results, --no-cache)
 
     Exit codes:
       0: All test cases passed
@@ -717,6 +997,9 @@ def eval(
 
       # Run evaluation and save results to database
       llm-answer-watcher eval --fixtures evals/testcases/fixtures.yaml --save-results
+
+      # Evaluate thousands of fixtures on all CPUs, reusing unchanged results
+      llm-answer-watcher eval --fixtures fixtures.yaml --workers 0 --save-results
     """
     # Set global output mode
     output_mode.format = format
@@ -742,10 +1025,17 @@ def eval(
             traceback.print_exc()
         raise typer.Exit(EXIT_CONFIG_ERROR)
 
+    eval_db_path = "./output/evals/eval_results.db"
+
     # Run evaluation suite
     try:
         with spinner("Running evaluation suite..."):
-            eval_results = run_eval_suite(fixtures)
+            eval_results = run_eval_suite(
+                fixtures,
+                workers=workers,
+                cache_db_path=eval_db_path if cache else None,
+                timing_iterations=timing_iterations,
+            )
 
         total_cases = eval_results["total_test_cases"]
         passed_cases = eval_results["total_passed"]
@@ -764,7 +1054,6 @@ def eval(
             try:
                 with spinner("Saving results to database..."):
                     # Initialize eval database
-                    eval_db_path = "./output/evals/eval_results.db"
                     init_eval_db_if_needed(eval_db_path)
 
                     # Store results
@@ -828,6 +1117,14 @@ def eval(
         info(f"  Total cases: {summary['total_test_cases']}")
         info(f"  Passed: {summary['total_passed']}")
         info(f"  Failed: {summary['total_failed']}")
+        info(
+            f"  Cache hits: {summary['cache_hits']}/{summary['total_test_cases']} "
+            f"({summary['cache_hit_rate']:.1%})"
+        )
+        info(
+            f"  Wall time: {summary['wall_time_seconds']:.2f}s "
+            f"({summary['workers']} worker(s))"
+        )
 
         # Show average scores
         if summary["average_scores"]:
@@ -854,6 +1151,16 @@ def eval(
                 f"  Violations: {threshold_summary['total_violations']} (critical: {threshold_summary['critical_violations']})"
             )
 
+            # Show extraction latency against its thresholds
+            if threshold_check.get("performance_summary"):
+                info("\nExtraction Performance (p95 across cases):")
+                for metric_name, perf in threshold_check["performance_summary"].items():
+                    status_icon = "✅" if perf["passes"] else "❌"
+                    info(
+                        f"  {status_icon} {metric_name}: {perf['p95']:.2f} ms "
+                        f"(max: {perf['max']:.2f} ms, threshold: {perf['threshold']:.1f} ms)"
+                    )
+
             # Show specific violations
             if threshold_check["threshold_violations"]:
                 info("\nThreshold Violations:")
@@ -864,7 +1171,8 @@ def eval(
                     info(
                         f"  {severity_icon} {violation['metric']}: {violation['average']:.3f} "
                         f"(threshold: {violation['threshold']:.1f}, "
-                        f"{violation['gap_percent']:.0f}% below)"
+                        f"{violation['gap_percent']:.0f}% "
+                        f"{violation.get('direction', 'below')})"
                     )
             else:
                 info("  ✅ All quality thresholds met")
@@ -879,6 +1187,13 @@ def eval(
             - eval_results["total_passed"],
             "pass_rate": eval_results["summary"]["pass_rate"],
             "average_scores": eval_results["summary"]["average_scores"],
+            "cache_hits": eval_results["summary"]["cache_hits"],
+            "cache_hit_rate": eval_results["summary"]["cache_hit_rate"],
+            "wall_time_seconds": eval_results["summary"]["wall_time_seconds"],
+            "workers": eval_results["summary"]["workers"],
+            "performance_summary": eval_results["threshold_check"][
+                "performance_summary"
+            ],
             "results": [],
         }
 
@@ -896,6 +1211,15 @@ def eval(
                     }
                     for metric in result.metrics
                 ],
+                "performance": [
+                    {
+                        "name": perf_metric.name,
+                        "value": perf_metric.value,
+                        "unit": perf_metric.unit,
+                        "passed": perf_metric.passed,
+                    }
+                    for perf_metric in result.performance
+                ],
             }
             json_output["results"].append(result_dict)
 
@@ -1154,6 +1478,192 @@ For most users, I'd recommend starting with Warmly due to its balance of feature
     raise typer.Exit(EXIT_SUCCESS)
 
 
+@app.command()
+def serve(
+    config: list[Path] = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Config file to schedule (repeat for multiple configs)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    poll_interval: float = typer.Option(
+        30.0,
+        "--poll-interval",
+        help="Seconds between config file change checks",
+        min=1.0,
+    ),
+    no_report: bool = typer.Option(
+        False,
+        "--no-report",
+        help="Skip HTML report generation after each run",
+    ),
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json' (status summary on shutdown)",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Run configs on their cron schedules in a long-lived process.
+
+    Each config needs a run_settings.schedule section, e.g.:
+
+      run_settings:
+        schedule:
+          cron: "0 * * * *"
+
+    Configs, pricing data, compiled brand matchers, HTTP connections, and
+    extraction caches stay warm between runs. Config files are reloaded when
+    they change, and runs of the same config never overlap. Stop with
+    Ctrl+C or SIGTERM; in-flight runs are allowed to finish.
+
+    Examples:
+      # Serve one config
+      llm-answer-watcher serve --config watcher.config.yaml
+
+      # Serve several configs with different schedules
+      llm-answer-watcher serve -c hourly.config.yaml -c daily.config.yaml
+    """
+    import asyncio
+    import signal
+
+    from llm_answer_watcher.daemon import WatcherDaemon
+    from llm_answer_watcher.exceptions import ConfigurationError
+
+    output_mode.format = format
+    # Logs are the primary output of a long-running process
+    setup_logging(verbose=verbose, quiet_logs=False)
+
+    daemon = WatcherDaemon(config, poll_interval=poll_interval, write_reports=not no_report)
+    try:
+        with spinner("Loading configurations..."):
+            daemon.load_all()
+    except ConfigurationError as e:
+        error(f"Configuration error: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+    except Exception as e:
+        error(f"Failed to start: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    for status in daemon.status():
+        if status["cron"]:
+            info(f"{status['config']}: '{status['cron']}', next run {status['next_run_at']}")
+    success(f"Serving {len(daemon.watched)} configs (Ctrl+C to stop)")
+
+    async def _serve() -> None:
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Signal handlers are unavailable on Windows; Ctrl+C still raises there
+            with suppress(NotImplementedError, RuntimeError):
+                loop.add_signal_handler(sig, stop_event.set)
+        await daemon.serve(stop_event)
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve())
+
+    if output_mode.is_agent():
+        output_mode.add_json("configs", daemon.status())
+        output_mode.flush_json()
+    else:
+        info("Stopped")
+    raise typer.Exit(EXIT_SUCCESS)
+
+
+@app.command()
+def api(
+    config: list[Path] = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Config file to expose (repeatable; referenced by file stem in requests)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8000, "--port", help="Port to listen on"),
+    *,
+    max_queue: int = typer.Option(
+        100, "--max-queue", help="Maximum queued jobs before POST /runs returns 429", min=1
+    ),
+    max_concurrent_jobs: int = typer.Option(
+        4, "--max-concurrent-jobs", help="Maximum jobs running at once", min=1
+    ),
+    max_jobs_per_tenant: int = typer.Option(
+        2, "--max-jobs-per-tenant", help="Maximum running jobs per tenant", min=1
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Serve the HTTP job API (POST /runs, GET /runs/{id}, SSE progress).
+
+    Requires an ASGI server: pip install "llm-answer-watcher[api]"
+
+    Configs are loaded once at startup and referenced by file stem, e.g.
+    --config ./configs/watcher.config.yaml is requested as
+    {"config": "watcher.config"}.
+
+    Examples:
+      llm-answer-watcher api --config watcher.config.yaml --port 8000
+
+      curl -X POST localhost:8000/runs -H 'X-Tenant: seo-team' \\
+        -d '{"config": "watcher.config", "intent_ids": ["best-crm"]}'
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        error(
+            "The api command requires uvicorn. "
+            'Install it with: pip install "llm-answer-watcher[api]"'
+        )
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    from llm_answer_watcher.service import RunService, ServiceApp
+
+    setup_logging(verbose=verbose, quiet_logs=False)
+
+    configs = {}
+    try:
+        for path in config:
+            if path.stem in configs:
+                raise ConfigValidationError(f"Duplicate config name '{path.stem}' ({path})")
+            configs[path.stem] = load_config(path)
+    except (ConfigFileNotFoundError, ConfigValidationError, APIKeyMissingError) as e:
+        error(f"Configuration error: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    try:
+        service = RunService(
+            configs,
+            max_queue_size=max_queue,
+            max_concurrent_jobs=max_concurrent_jobs,
+            max_jobs_per_tenant=max_jobs_per_tenant,
+        )
+    except Exception as e:
+        error(f"Failed to initialize database: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    success(f"Serving {len(configs)} configs ({', '.join(configs)}) on http://{host}:{port}")
+    uvicorn.run(ServiceApp(service), host=host, port=port, log_config=None)
+    raise typer.Exit(EXIT_SUCCESS)
+
+
 # Create export command subapp
 export_app = typer.Typer(help="Export data to CSV or JSON")
 app.add_typer(export_app, name="export")
@@ -1310,6 +1820,251 @@ def export_runs(
         raise typer.Exit(EXIT_DB_ERROR)
 
 
+
+@export_app.command("sources")
+def export_sources(
+    output: Path = typer.Option(
+        ...,
+        "--output",
+        "-o",
+        help="Output file path (extension determines format: .csv or .json)",
+    ),
+    db: Path = typer.Option(
+        "./output/watcher.db",
+        "--db",
+        help="Path to SQLite database",
+        exists=True,
+    ),
+    run_id: str = typer.Option(
+        None,
+        "--run-id",
+        help="Filter by specific run ID",
+    ),
+    days: int = typer.Option(
+        None,
+        "--days",
+        help="Include only last N days of data",
+    ),
+    domain: str = typer.Option(
+        None,
+        "--domain",
+        help="Filter by cited domain (e.g., g2.com)",
+    ),
+    *,
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="CLI output format: 'text' or 'json'",
+    ),
+):
+    """
+    Export cited web sources to CSV or JSON.
+
+    One row per cited URL of each web-search answer, with normalized URL,
+    domain, title and position.
+
+    Examples:
+      # Export all sources to CSV
+      llm-answer-watcher export sources --output sources.csv
+
+      # Export citations of one domain over the last 30 days
+      llm-answer-watcher export sources --output g2.json --domain g2.com --days 30
+    """
+    from llm_answer_watcher.storage.exporter import (
+        export_sources_csv,
+        export_sources_json,
+    )
+
+    output_mode.format = format
+
+    # Determine format from file extension
+    file_ext = output.suffix.lower()
+    if file_ext not in [".csv", ".json"]:
+        error("Output file must have .csv or .json extension")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    try:
+        # Older databases get the sources table (and its backfill) here
+        init_db_if_needed(str(db))
+        with spinner(f"Exporting sources to {output}..."):
+            export = export_sources_csv if file_ext == ".csv" else export_sources_json
+            count = export(str(output), str(db), run_id=run_id, days=days, domain=domain)
+
+        success(f"Exported {count} sources to {output}")
+        raise typer.Exit(EXIT_SUCCESS)
+
+    except typer.Exit:
+        # Re-raise typer.Exit to avoid catching it in generic Exception handler
+        raise
+    except Exception as e:
+        error(f"Export failed: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+
+# Create sources command subapp for citation analytics
+sources_app = typer.Typer(help="Analyze web sources cited in answers")
+app.add_typer(sources_app, name="sources")
+
+
+@sources_app.command("domains")
+def sources_domains(
+    db: Path = typer.Option(
+        "./output/watcher.db",
+        "--db",
+        help="Path to SQLite database",
+        exists=True,
+    ),
+    run_id: str = typer.Option(
+        None,
+        "--run-id",
+        help="Filter by specific run ID",
+    ),
+    intent: str = typer.Option(
+        None,
+        "--intent",
+        help="Filter by intent ID",
+    ),
+    days: int = typer.Option(
+        None,
+        "--days",
+        help="Include only last N days of data",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        help="Number of domains to show",
+    ),
+    *,
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json'",
+    ),
+):
+    """
+    Show the domains cited most often in web-search answers.
+
+    Examples:
+      # Top cited domains across all runs
+      llm-answer-watcher sources domains
+
+      # Domains cited for one intent over the last 30 days
+      llm-answer-watcher sources domains --intent best-crm --days 30
+
+      # JSON output
+      llm-answer-watcher sources domains --run-id 2025-11-05T10-00-00Z --format json
+    """
+    import sqlite3
+    from datetime import UTC, datetime, timedelta
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from llm_answer_watcher.storage.db import get_source_domains
+
+    output_mode.format = format
+
+    since_utc = (
+        (datetime.now(UTC) - timedelta(days=days)).isoformat() if days else None
+    )
+
+    try:
+        init_db_if_needed(str(db))
+        with sqlite3.connect(str(db)) as conn:
+            domains = get_source_domains(
+                conn, run_id=run_id, intent_id=intent, since_utc=since_utc, limit=limit
+            )
+
+        if output_mode.is_agent():
+            output_mode.add_json("source_domains", domains)
+            output_mode.flush_json()
+            raise typer.Exit(EXIT_SUCCESS)
+
+        if not domains:
+            warning("No cited sources found")
+            raise typer.Exit(EXIT_SUCCESS)
+
+        table = Table(
+            title="Cited Domains",
+            show_header=True,
+            header_style="bold cyan",
+        )
+        table.add_column("Domain", style="yellow", no_wrap=True)
+        table.add_column("Answers", justify="right", style="blue")
+        table.add_column("URLs", justify="right", style="blue")
+        table.add_column("Avg Position", justify="right", style="green")
+
+        for row in domains:
+            table.add_row(
+                row["domain"],
+                str(row["answers"]),
+                str(row["citations"]),
+                f"{row['avg_position']:.1f}",
+            )
+
+        Console().print(table)
+        raise typer.Exit(EXIT_SUCCESS)
+
+    except typer.Exit:
+        # Re-raise typer.Exit to avoid catching it in generic Exception handler
+        raise
+    except sqlite3.Error as e:
+        error(f"Database error: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+
+@sources_app.command("backfill")
+def sources_backfill(
+    db: Path = typer.Option(
+        "./output/watcher.db",
+        "--db",
+        help="Path to SQLite database",
+        exists=True,
+    ),
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json'",
+    ),
+):
+    """
+    Populate the sources table from stored web search results.
+
+    Runs automatically when the database is upgraded; run it again to pick
+    up answers written by older versions since then. Safe to repeat.
+
+    Examples:
+      llm-answer-watcher sources backfill --db ./output/watcher.db
+    """
+    import sqlite3
+
+    from llm_answer_watcher.storage.db import backfill_sources
+
+    output_mode.format = format
+
+    try:
+        init_db_if_needed(str(db))
+        with spinner("Backfilling sources..."), sqlite3.connect(str(db)) as conn:
+            count = backfill_sources(conn)
+            conn.commit()
+
+        if output_mode.is_agent():
+            output_mode.add_json("sources_backfilled", count)
+            output_mode.flush_json()
+        else:
+            success(f"Backfilled {count} sources")
+        raise typer.Exit(EXIT_SUCCESS)
+
+    except typer.Exit:
+        raise
+    except sqlite3.Error as e:
+        error(f"Database error: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+
 # Create costs command subapp for cost analytics
 costs_app = typer.Typer(help="Analyze historical costs")
 app.add_typer(costs_app, name="costs")
@@ -1505,6 +2260,203 @@ def costs_show(
         raise typer.Exit(EXIT_DB_ERROR)
 
 
+# Create db command subapp for database maintenance
+db_app = typer.Typer(help="Database maintenance (retention, archival, vacuum)")
+app.add_typer(db_app, name="db")
+
+
+@db_app.command("maintain")
+def db_maintain(
+    config: Path = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Read database path, output dir, and retention policy from config",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    db: Path = typer.Option(
+        None,
+        "--db",
+        help="Path to SQLite database (overrides config)",
+    ),
+    output_dir: Path = typer.Option(
+        None,
+        "--output-dir",
+        help="Base output directory containing run directories (overrides config)",
+    ),
+    keep_days: int = typer.Option(
+        None,
+        "--keep-days",
+        help="Delete runs older than N days (overrides retention.max_age_days)",
+    ),
+    archive_dir: Path = typer.Option(
+        None,
+        "--archive-dir",
+        help="Archive destination (default: <output-dir>/archive)",
+    ),
+    *,
+    archive_format: str = typer.Option(
+        None,
+        "--archive-format",
+        help="Archive format: 'ndjson' (gzip) or 'parquet' (requires pyarrow)",
+    ),
+    no_archive: bool = typer.Option(
+        False,
+        "--no-archive",
+        help="Delete expired data without archiving it",
+    ),
+    chunk_size: int = typer.Option(
+        None,
+        "--chunk-size",
+        help="Number of runs processed per batch",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show what would be deleted without changing anything",
+    ),
+    no_vacuum: bool = typer.Option(
+        False,
+        "--no-vacuum",
+        help="Skip incremental_vacuum, optimize, and ANALYZE",
+    ),
+    full_vacuum: bool = typer.Option(
+        False,
+        "--full-vacuum",
+        help="One-time conversion to incremental auto_vacuum (full VACUUM, exclusive lock)",
+    ),
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json'",
+    ),
+):
+    """
+    Apply retention policies, archive aged runs, and compact the database.
+
+    Expired runs are archived (database rows as compressed NDJSON or Parquet,
+    plus the run output directory as a tarball) before being deleted. Work is
+    chunked and resumable, so it is safe to run next to scheduled runs.
+    Screenshot and HTML blobs no longer referenced by any answer are removed.
+
+    Examples:
+      # Use retention policy from config
+      llm-answer-watcher db maintain --config watcher.config.yaml
+
+      # Keep 90 days of runs, preview only
+      llm-answer-watcher db maintain --db ./output/watcher.db --keep-days 90 --dry-run
+
+      # Convert an existing database to incremental vacuum (run once)
+      llm-answer-watcher db maintain --db ./output/watcher.db --full-vacuum
+    """
+    import sqlite3
+
+    from llm_answer_watcher.config.loader import load_run_settings
+    from llm_answer_watcher.config.schema import RetentionConfig
+    from llm_answer_watcher.storage.maintenance import (
+        enable_incremental_vacuum,
+        run_maintenance,
+    )
+
+    output_mode.format = format
+
+    try:
+        run_settings = load_run_settings(config) if config else None
+    except (ConfigFileNotFoundError, ConfigValidationError) as e:
+        error(f"Configuration error: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    db_path = str(db) if db else (run_settings.sqlite_db_path if run_settings else None)
+    if output_dir:
+        base_output_dir = str(output_dir)
+    elif run_settings:
+        base_output_dir = run_settings.output_dir
+    else:
+        base_output_dir = str(Path(db_path).parent) if db_path else None
+
+    if not db_path:
+        error("Provide --config or --db")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+    if not Path(db_path).exists():
+        error(f"Database not found: {db_path}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    # Merge retention policy from config with CLI overrides
+    overrides = {}
+    if keep_days is not None:
+        overrides["max_age_days"] = keep_days
+    if archive_dir is not None:
+        overrides["archive_dir"] = str(archive_dir)
+    if archive_format is not None:
+        overrides["archive_format"] = archive_format
+    if no_archive:
+        overrides["archive"] = False
+    if chunk_size is not None:
+        overrides["chunk_size"] = chunk_size
+
+    base_retention = (
+        run_settings.retention if run_settings and run_settings.retention else RetentionConfig()
+    )
+    try:
+        retention = RetentionConfig.model_validate(
+            {**base_retention.model_dump(), **overrides}
+        )
+    except Exception as e:
+        error(f"Invalid retention settings: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    try:
+        if full_vacuum and not dry_run:
+            with spinner("Converting database to incremental vacuum..."):
+                enable_incremental_vacuum(db_path)
+
+        with spinner("Running database maintenance..."):
+            report = run_maintenance(
+                db_path=db_path,
+                output_dir=base_output_dir,
+                retention=retention,
+                dry_run=dry_run,
+                vacuum=not no_vacuum,
+            )
+    except ImportError as e:
+        error(str(e))
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+    except (sqlite3.Error, OSError) as e:
+        error(f"Database maintenance failed: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    if output_mode.is_agent():
+        output_mode.add_json("maintenance", report.to_dict())
+        output_mode.flush_json()
+        raise typer.Exit(EXIT_SUCCESS)
+
+    prefix = "Would delete" if dry_run else "Deleted"
+    rows_deleted = sum(report.rows_deleted.values())
+    success(f"{prefix} {report.runs_deleted} runs ({rows_deleted} rows)")
+    for table, count in sorted(report.rows_deleted.items()):
+        info(f"  {table}: {count} rows")
+    if report.blobs_deleted:
+        info(
+            f"{prefix} {report.blobs_deleted} orphaned artifact blobs "
+            f"({report.blob_bytes_freed / 1024:.1f} KiB)"
+        )
+    if not dry_run:
+        if report.archive_files:
+            archive_root = retention.archive_dir or Path(base_output_dir) / "archive"
+            info(f"Archived {len(report.archive_files)} files to {archive_root}")
+        if report.run_dirs_removed:
+            info(f"Removed {report.run_dirs_removed} run directories")
+        if not no_vacuum:
+            info(f"Vacuum freed {report.pages_freed} pages")
+        if report.auto_vacuum_mode != 2 and not full_vacuum:
+            warning("auto_vacuum is not INCREMENTAL; run once with --full-vacuum to reclaim space")
+
+    raise typer.Exit(EXIT_SUCCESS)
+
+
 # Create prices command subapp
 prices_app = typer.Typer(help="Manage LLM pricing data")
 app.add_typer(prices_app, name="prices")
@@ -1778,7 +2730,10 @@ def main(
         console.print("  validate  Validate configuration without running")
         console.print("  eval      Run evaluation suite to test extraction accuracy")
         console.print("  demo      Run interactive demo with sample data (no API keys needed)")
+        console.print("  serve     Run configs on cron schedules (long-lived, warm caches)")
+        console.print("  api       Serve the HTTP job API for runs (requires uvicorn)")
         console.print("  prices    Manage LLM pricing data (show, refresh, list)")
+        console.print("  db        Database maintenance (retention, archival, vacuum)")
 
 
 def _read_version() -> str:
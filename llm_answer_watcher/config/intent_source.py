@@ -0,0 +1,183 @@
+"""
+Lazy intent streams backed by CSV, JSONL, or SQLite sources.
+
+Inline `intents` are fine for dozens of prompts; long-tail monitoring with
+hundreds of thousands of prompts uses `intents_source` instead. IntentStream
+reads the source row by row and validates each row as an Intent, so the cost
+estimator, budget checks, and run scheduler can all consume intents without
+materializing the list. Each consumer creates its own stream via
+RuntimeConfig.iter_intents(), which re-reads the source.
+
+Row handling:
+    - Each row is validated with the Intent model (ID slug, prompt length)
+    - IDs must be unique across inline intents and the source
+    - Invalid or duplicate rows are skipped with a warning (on_invalid: skip)
+      or abort the stream with ConfigValidationError (on_invalid: error)
+    - A missing file, table, or column is always fatal
+
+Only the set of seen IDs grows with the source size.
+
+Example:
+    >>> stream = config.iter_intents()
+    >>> for intent in stream:
+    ...     schedule(intent)
+    >>> stream.count, stream.rows_skipped
+    (250000, 12)
+"""
+
+import csv
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from llm_answer_watcher.exceptions import ConfigValidationError
+
+from .schema import Intent, IntentsSource
+
+logger = logging.getLogger(__name__)
+
+# Invalid rows logged individually before switching to a summary at the end
+MAX_LOGGED_INVALID_ROWS = 10
+
+
+class IntentStream:
+    """
+    Single-pass iterator over inline intents followed by source rows.
+
+    Attributes:
+        source: External source (None for inline intents only)
+        count: Intents yielded so far
+        rows_read: Source rows read so far (valid or not)
+        rows_skipped: Source rows skipped as invalid or duplicate
+    """
+
+    def __init__(self, inline: Iterable[Intent], source: IntentsSource | None = None):
+        self.source = source
+        self.count = 0
+        self.rows_read = 0
+        self.rows_skipped = 0
+        self._iterator = self._generate(inline)
+
+    def __iter__(self) -> Iterator[Intent]:
+        return self
+
+    def __next__(self) -> Intent:
+        return next(self._iterator)
+
+    def _generate(self, inline: Iterable[Intent]) -> Iterator[Intent]:
+        seen: set[str] = set()
+        for intent in inline:
+            seen.add(intent.id)
+            self.count += 1
+            yield intent
+
+        if self.source is None:
+            return
+
+        for row_number, row in _read_rows(self.source):
+            self.rows_read += 1
+            try:
+                intent = _row_to_intent(row, self.source)
+                if intent.id in seen:
+                    raise ValueError(f"Duplicate intent ID {intent.id!r}")
+            except (ValidationError, ValueError) as e:
+                self._reject(row_number, e)
+                continue
+
+            seen.add(intent.id)
+            self.count += 1
+            yield intent
+
+        if self.rows_skipped:
+            logger.warning(
+                f"Skipped {self.rows_skipped} of {self.rows_read} rows in "
+                f"{self.source.path} (invalid or duplicate intents)"
+            )
+
+    def _reject(self, row_number: int, error: Exception) -> None:
+        """Skip or raise for an invalid source row, per on_invalid."""
+        message = f"Invalid intent in {self.source.path} row {row_number}: {error}"
+        if self.source.on_invalid == "error":
+            raise ConfigValidationError(message) from error
+
+        self.rows_skipped += 1
+        if self.rows_skipped <= MAX_LOGGED_INVALID_ROWS:
+            logger.warning(f"{message} (skipped)")
+
+
+def _row_to_intent(row: dict | Exception, source: IntentsSource) -> Intent:
+    """Validate one raw row as an Intent."""
+    if isinstance(row, Exception):
+        raise ValueError(str(row))
+
+    intent_id = row.get(source.id_column)
+    prompt = row.get(source.prompt_column)
+    # JSONL and SQLite rows may carry integer IDs
+    if isinstance(intent_id, int):
+        intent_id = str(intent_id)
+    return Intent.model_validate({"id": intent_id, "prompt": prompt})
+
+
+def _read_rows(source: IntentsSource) -> Iterator[tuple[int, dict | Exception]]:
+    """Yield (row number, raw row) pairs; unparseable rows are yielded as errors."""
+    path = Path(source.path)
+    if not path.is_file():
+        raise ConfigValidationError(f"intents_source file not found: {source.path}")
+
+    if source.format == "csv":
+        yield from _read_csv(path, source)
+    elif source.format == "jsonl":
+        yield from _read_jsonl(path)
+    else:
+        yield from _read_sqlite(path, source)
+
+
+def _read_csv(path: Path, source: IntentsSource) -> Iterator[tuple[int, dict | Exception]]:
+    # utf-8-sig drops the BOM spreadsheet exports often start with
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or []
+        for column in (source.id_column, source.prompt_column):
+            if column not in columns:
+                raise ConfigValidationError(
+                    f"intents_source {path} has no column {column!r} (columns: {columns})"
+                )
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _read_jsonl(path: Path) -> Iterator[tuple[int, dict | Exception]]:
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                yield line_number, ValueError("Expected a JSON object")
+                continue
+            yield line_number, row
+
+
+def _read_sqlite(path: Path, source: IntentsSource) -> Iterator[tuple[int, dict | Exception]]:
+    # Column and table names are validated identifiers; quote them anyway
+    query = f'SELECT "{source.id_column}", "{source.prompt_column}" FROM "{source.table}"'
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        try:
+            cursor = conn.execute(query)
+        except sqlite3.Error as e:
+            raise ConfigValidationError(f"Cannot read intents from {path}: {e}") from e
+
+        # The cursor fetches lazily, so only one row is resident at a time
+        for row_number, (intent_id, prompt) in enumerate(cursor, start=1):
+            yield row_number, {source.id_column: intent_id, source.prompt_column: prompt}
+    finally:
+        conn.close()
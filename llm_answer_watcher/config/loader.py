@@ -10,6 +10,7 @@ API keys), ensuring secrets never get committed to version control.
 
 Functions:
     load_config: Main entrypoint to load and validate watcher.config.yaml
+    load_run_settings: Load only run_settings (no API keys) for maintenance commands
     resolve_api_keys: Helper to resolve environment variables to API keys
 """
 
@@ -27,6 +28,7 @@ from llm_answer_watcher.exceptions import (
 from llm_answer_watcher.system_prompts import get_provider_default, load_prompt
 
 from .schema import (
+    RunSettings,
     RuntimeConfig,
     RuntimeExtractionModel,
     RuntimeExtractionSettings,
@@ -34,9 +36,11 @@ from .schema import (
     RuntimeOperation,
     WatcherConfig,
 )
+from .snapshot import SNAPSHOT_MIN_BYTES, load_snapshot, save_snapshot
+from .templates import compile_condition, compile_template
 
 
-def load_config(config_path: str | Path) -> RuntimeConfig:
+def load_config(config_path: str | Path, snapshot: bool | None = None) -> RuntimeConfig:
     """
     Load watcher.config.yaml and resolve API keys from environment variables.
 
@@ -46,8 +50,14 @@ def load_config(config_path: str | Path) -> RuntimeConfig:
     3. Resolves API key environment variables to actual secrets
     4. Returns RuntimeConfig with resolved API keys ready for LLM calls
 
+    Steps 1-2 can be served from a compiled snapshot (see config.snapshot),
+    which skips YAML parsing for large configs. Step 3 always runs, so keys
+    come from the current environment and never from the snapshot.
+
     Args:
         config_path: Path to watcher.config.yaml file (relative or absolute)
+        snapshot: Use the compiled snapshot cache. None (default) enables it
+            for files of at least SNAPSHOT_MIN_BYTES
 
     Returns:
         RuntimeConfig with resolved API keys and validated configuration
@@ -76,36 +86,28 @@ def load_config(config_path: str | Path) -> RuntimeConfig:
     if not config_path.exists():
         raise ConfigFileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load YAML content
-    try:
-        with config_path.open(encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ConfigValidationError(f"Invalid YAML syntax in {config_path}: {e}") from e
-    except Exception as e:
-        raise ConfigValidationError(
-            f"Failed to read configuration file {config_path}: {e}"
-        ) from e
+    if snapshot is None:
+        snapshot = config_path.stat().st_size >= SNAPSHOT_MIN_BYTES
 
-    # Handle empty YAML file
-    if raw_config is None:
-        raise ConfigValidationError(f"Configuration file is empty: {config_path}")
+    watcher_config = load_snapshot(config_path) if snapshot else None
+    if watcher_config is None:
+        try:
+            content = config_path.read_bytes()
+        except Exception as e:
+            raise ConfigValidationError(
+                f"Failed to read configuration file {config_path}: {e}"
+            ) from e
 
-    # Validate configuration structure with Pydantic
-    try:
-        watcher_config = WatcherConfig.model_validate(raw_config)
-    except ValidationError as e:
-        # Format validation errors in a user-friendly way
-        error_messages = []
-        for error in e.errors():
-            loc = ".".join(str(x) for x in error["loc"])
-            msg = error["msg"]
-            error_messages.append(f"  - {loc}: {msg}")
+        watcher_config = _parse_watcher_config(content, config_path)
+        if snapshot:
+            save_snapshot(config_path, content, watcher_config)
 
+    # Rows are streamed at run time; only check the source is there
+    source = watcher_config.intents_source
+    if source is not None and not Path(source.path).is_file():
         raise ConfigValidationError(
-            f"Configuration validation failed in {config_path}:\n"
-            + "\n".join(error_messages)
-        ) from e
+            f"intents_source file not found: {source.path} (from {config_path})"
+        )
 
     # Determine which format is used: legacy (models) or new (runners)
     has_runners = watcher_config.runners and len(watcher_config.runners) > 0
@@ -209,6 +211,7 @@ def load_config(config_path: str | Path) -> RuntimeConfig:
         extraction_settings=resolved_extraction_settings,
         brands=watcher_config.brands,
         intents=watcher_config.intents,
+        intents_source=watcher_config.intents_source,
         models=resolved_models,
         operation_models=resolved_operation_models,
         runner_configs=resolved_runner_configs,
@@ -216,6 +219,91 @@ def load_config(config_path: str | Path) -> RuntimeConfig:
     )
 
 
+def _parse_watcher_config(content: bytes, config_path: Path) -> WatcherConfig:
+    """
+    Parse YAML bytes and validate them as a WatcherConfig.
+
+    Args:
+        content: Raw config file bytes
+        config_path: Path the bytes were read from (for error messages)
+
+    Returns:
+        Validated WatcherConfig (API keys still unresolved)
+
+    Raises:
+        ConfigValidationError: If YAML is invalid, empty, or fails validation
+    """
+    # Load YAML content
+    try:
+        raw_config = yaml.safe_load(content)
+    except yaml.YAMLError as e:
+        raise ConfigValidationError(f"Invalid YAML syntax in {config_path}: {e}") from e
+
+    # Handle empty YAML file
+    if raw_config is None:
+        raise ConfigValidationError(f"Configuration file is empty: {config_path}")
+
+    # Validate configuration structure with Pydantic
+    try:
+        return WatcherConfig.model_validate(raw_config)
+    except ValidationError as e:
+        # Format validation errors in a user-friendly way
+        error_messages = []
+        for error in e.errors():
+            loc = ".".join(str(x) for x in error["loc"])
+            msg = error["msg"]
+            error_messages.append(f"  - {loc}: {msg}")
+
+        raise ConfigValidationError(
+            f"Configuration validation failed in {config_path}:\n"
+            + "\n".join(error_messages)
+        ) from e
+
+
+def load_run_settings(config_path: str | Path) -> RunSettings:
+    """
+    Load and validate only the run_settings section of a config file.
+
+    Used by maintenance commands (e.g. `db maintain`) that need paths and
+    retention policies but must not require provider API keys to be set.
+
+    Args:
+        config_path: Path to watcher.config.yaml file
+
+    Returns:
+        Validated RunSettings
+
+    Raises:
+        ConfigFileNotFoundError: If config file doesn't exist
+        ConfigValidationError: If YAML is invalid or run_settings fails validation
+    """
+    config_path = Path(config_path)
+
+    if not config_path.exists():
+        raise ConfigFileNotFoundError(f"Configuration file not found: {config_path}")
+
+    try:
+        with config_path.open(encoding="utf-8") as f:
+            raw_config = yaml.safe_load(f)
+    except yaml.YAMLError as e:
+        raise ConfigValidationError(f"Invalid YAML syntax in {config_path}: {e}") from e
+
+    if not isinstance(raw_config, dict) or "run_settings" not in raw_config:
+        raise ConfigValidationError(f"Missing run_settings section in {config_path}")
+
+    try:
+        return RunSettings.model_validate(raw_config["run_settings"])
+    except ValidationError as e:
+        error_messages = [
+            f"  - run_settings.{'.'.join(str(x) for x in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        ]
+        raise ConfigValidationError(
+            f"Configuration validation failed in {config_path}:\n"
+            + "\n".join(error_messages)
+        ) from e
+
+
 def resolve_api_keys(config: WatcherConfig) -> list[RuntimeModel]:
     """
     Resolve API key environment variables and system prompts for runtime use.
@@ -314,8 +402,18 @@ def resolve_api_keys(config: WatcherConfig) -> list[RuntimeModel]:
             system_prompt=system_prompt_text,
             tools=model_config.tools,
             tool_choice=model_config.tool_choice,
+            timeout_seconds=model_config.timeout_seconds,
         )
 
+        # Fallback models go through the same key and prompt resolution
+        if model_config.fallback is not None:
+            fallback_settings = config.run_settings.model_copy(
+                update={"models": [model_config.fallback]}
+            )
+            runtime_model.fallback = resolve_api_keys(
+                config.model_copy(update={"run_settings": fallback_settings})
+            )[0]
+
         resolved_models.append(runtime_model)
 
     return resolved_models
@@ -730,6 +828,9 @@ def resolve_operations(
             function_schema=op.function_schema,
             function_template=op.function_template,
             function_params=op.function_params,
+            # Compile once here so rendering is a single pass per intent
+            compiled_prompt=compile_template(op.prompt),
+            compiled_condition=compile_condition(op.condition) if op.condition else None,
         )
 
         runtime_operations.append(runtime_operation)
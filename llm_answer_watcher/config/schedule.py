@@ -0,0 +1,214 @@
+"""
+Cron-style schedule parsing for `serve` mode.
+
+Schedules use the standard five-field cron syntax, evaluated in UTC:
+
+    ┌───────── minute (0-59)
+    │ ┌─────── hour (0-23)
+    │ │ ┌───── day of month (1-31)
+    │ │ │ ┌─── month (1-12)
+    │ │ │ │ ┌─ day of week (0-6, Sunday=0; 7 is also Sunday)
+    │ │ │ │ │
+    0 * * * *
+
+Each field accepts "*", single values, ranges ("1-5"), lists ("1,15"), and
+steps ("*/15", "0-30/10"). The macros @hourly, @daily, @weekly, @monthly,
+and @yearly are also accepted. As in classic cron, when both day-of-month
+and day-of-week are restricted, a time matches if EITHER field matches.
+
+Expressions are parsed once (at config load) into sets of allowed values,
+so checking and computing the next fire time never re-parse the string.
+
+Example:
+    >>> schedule = parse_cron("*/30 9-17 * * 1-5")
+    >>> schedule.next_after(datetime(2025, 11, 1, 12, 0, tzinfo=UTC))  # Saturday
+    datetime.datetime(2025, 11, 3, 9, 0, tzinfo=datetime.timezone.utc)
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+
+# Macro aliases for common schedules
+CRON_MACROS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+# (name, min, max) for each of the five fields
+_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+)
+
+# Upper bound on the next_after() search (covers Feb 29 on leap years)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """
+    Parsed cron expression.
+
+    Attributes:
+        source: Original expression (macros kept as written)
+        minutes: Allowed minutes (0-59)
+        hours: Allowed hours (0-23)
+        days: Allowed days of month (1-31)
+        months: Allowed months (1-12)
+        weekdays: Allowed days of week (0-6, Sunday=0)
+        days_restricted: Whether day-of-month was anything other than "*"
+        weekdays_restricted: Whether day-of-week was anything other than "*"
+    """
+
+    source: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    def matches(self, when: datetime) -> bool:
+        """
+        Check whether a time (truncated to the minute) fires this schedule.
+
+        Args:
+            when: Timezone-aware datetime (converted to UTC)
+
+        Returns:
+            True if the schedule fires at that minute
+        """
+        when = when.astimezone(UTC)
+        return when.minute in self.minutes and when.hour in self.hours and self._matches_day(when)
+
+    def next_after(self, when: datetime) -> datetime:
+        """
+        Compute the first fire time strictly after a given time.
+
+        Skips whole days and hours that cannot match, so even sparse
+        schedules (e.g. "0 0 29 2 *") resolve in a few hundred steps.
+
+        Args:
+            when: Timezone-aware datetime
+
+        Returns:
+            Next fire time in UTC (seconds and microseconds zeroed)
+
+        Raises:
+            ValueError: If the schedule never fires (e.g. "0 0 31 2 *")
+        """
+        candidate = when.astimezone(UTC).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self.months or not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"Cron schedule '{self.source}' never fires")
+
+    def _matches_day(self, when: datetime) -> bool:
+        """Apply cron's day-of-month / day-of-week OR rule."""
+        if when.month not in self.months:
+            return False
+        day_ok = when.day in self.days
+        # datetime.weekday() is Monday=0; cron is Sunday=0
+        weekday_ok = (when.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+
+def _parse_field(value: str, name: str, low: int, high: int) -> frozenset[int]:
+    """Expand one cron field into the set of values it allows."""
+    allowed: set[int] = set()
+
+    for part in value.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = 1
+        if step_part:
+            if not step_part.isdigit() or int(step_part) == 0:
+                raise ValueError(f"Invalid step '{step_part}' in cron {name} field")
+            step = int(step_part)
+
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            start_text, _, end_text = range_part.partition("-")
+            if not (start_text.isdigit() and end_text.isdigit()):
+                raise ValueError(f"Invalid range '{range_part}' in cron {name} field")
+            start, end = int(start_text), int(end_text)
+        elif range_part.isdigit():
+            start = int(range_part)
+            # "5/15" means "from 5 to the end, every 15"
+            end = high if step_part else start
+        else:
+            raise ValueError(f"Invalid value '{range_part}' in cron {name} field")
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron {name} field value '{part}' out of range ({low}-{high})")
+        allowed.update(range(start, end + 1, step))
+
+    return frozenset(allowed)
+
+
+@lru_cache(maxsize=256)
+def parse_cron(expression: str) -> CronSchedule:
+    """
+    Parse a five-field cron expression or macro.
+
+    Args:
+        expression: Cron expression (e.g. "0 * * * *") or macro ("@hourly")
+
+    Returns:
+        CronSchedule with expanded field values
+
+    Raises:
+        ValueError: If the expression is malformed or a value is out of range
+
+    Example:
+        >>> sorted(parse_cron("*/20 * * * *").minutes)
+        [0, 20, 40]
+    """
+    stripped = expression.strip()
+    fields = CRON_MACROS.get(stripped.lower(), stripped).split()
+    if len(fields) != len(_FIELDS):
+        raise ValueError(
+            f"Cron expression '{expression}' must have 5 fields "
+            f"(minute hour day-of-month month day-of-week) or be one of: "
+            f"{', '.join(CRON_MACROS)}"
+        )
+
+    minutes, hours, days, months, weekdays = (
+        _parse_field(value, name, low, high)
+        for value, (name, low, high) in zip(fields, _FIELDS, strict=True)
+    )
+
+    return CronSchedule(
+        source=expression,
+        minutes=minutes,
+        hours=hours,
+        days=days,
+        months=months,
+        # Fold 7 (alternate Sunday) onto 0
+        weekdays=frozenset(day % 7 for day in weekdays),
+        days_restricted=fields[2] != "*",
+        weekdays_restricted=fields[4] != "*",
+    )
@@ -9,11 +9,18 @@ Models:
     ModelConfig: LLM model configuration (provider, model_name, env_api_key) [LEGACY]
     RunnerConfig: Unified runner configuration for API and browser runners [NEW]
     RunSettings: Runtime settings (output paths, models, feature flags)
+    RetentionConfig: Data retention and archival policy for `db maintain`
+    ExtractionCacheConfig: Memoization of extraction results across answers and runs
+    ScheduleConfig: Cron schedule used by `serve` mode
+    SamplingConfig: Adaptive multi-sample querying with confidence-based early stopping
+    StabilityConfig: Skipping of units whose rankings are stable across runs
+    SchedulingConfig: Latency-aware ordering of run work
     ExtractionModelConfig: Extraction model configuration (project-level)
     ExtractionSettings: Extraction method configuration (function calling vs regex)
     Brands: Brand alias collections (mine vs competitors)
     Operation: Custom post-intent operation configuration
     Intent: Buyer-intent query configuration
+    IntentsSource: External CSV/JSONL/SQLite table of intents, streamed at run time
     WatcherConfig: Root configuration model (validates entire YAML)
     RuntimeModel: Resolved model configuration with API key [LEGACY]
     RuntimeExtractionModel: Resolved extraction model with API key
@@ -21,9 +28,16 @@ Models:
     RuntimeConfig: Runtime configuration with resolved API keys
 """
 
-from typing import Literal
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Literal
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from .schedule import CronSchedule, parse_cron
+from .templates import CompiledCondition, CompiledTemplate, compile_condition, compile_template
+
+if TYPE_CHECKING:
+    from .intent_source import IntentStream
 
 
 class ModelConfig(BaseModel):
@@ -45,6 +59,12 @@ class ModelConfig(BaseModel):
                Config is passed directly to provider API without translation.
         tool_choice: Tool selection mode ("auto", "required", "none"). Default: "auto"
                     Note: Only used by OpenAI. Google auto-decides when to use tools.
+        fallback: Optional model queried instead while this model's circuit
+                  breaker is open (see CircuitBreakerConfig). Cannot itself
+                  have a fallback.
+        timeout_seconds: Optional time limit for one query of this model, covering
+                         retries, extraction and operations. Unfinished queries
+                         are marked timed_out.
     """
 
     provider: Literal["openai", "anthropic", "google", "mistral", "grok", "perplexity"]
@@ -53,6 +73,8 @@ class ModelConfig(BaseModel):
     system_prompt: str | None = None
     tools: list[dict] | None = None
     tool_choice: str = "auto"
+    fallback: "ModelConfig | None" = None
+    timeout_seconds: float | None = None
 
     @field_validator("model_name")
     @classmethod
@@ -79,6 +101,22 @@ class ModelConfig(BaseModel):
             raise ValueError(f"tool_choice must be one of {allowed}, got: {v}")
         return v
 
+    @field_validator("timeout_seconds")
+    @classmethod
+    def validate_timeout_seconds(cls, v: float | None) -> float | None:
+        """Validate timeout is positive if specified."""
+        if v is not None and v <= 0:
+            raise ValueError(f"timeout_seconds must be positive, got: {v}")
+        return v
+
+    @field_validator("fallback")
+    @classmethod
+    def validate_fallback(cls, v: "ModelConfig | None") -> "ModelConfig | None":
+        """Validate the fallback model has no fallback of its own."""
+        if v is not None and v.fallback is not None:
+            raise ValueError("fallback models cannot have their own fallback")
+        return v
+
 
 class BudgetConfig(BaseModel):
     """
@@ -107,6 +145,559 @@ class BudgetConfig(BaseModel):
         return v
 
 
+RETENTION_TABLES = (
+    "runs",
+    "answers_raw",
+    "mentions",
+    "operations",
+    "intent_classifications",
+    "intent_classification_cache",
+    "extraction_cache",
+    "answer_samples",
+    "sample_aggregates",
+    "query_skips",
+    "sources",
+)
+
+
+class RetentionConfig(BaseModel):
+    """
+    Data retention and archival settings for `db maintain`.
+
+    Runs older than max_age_days are archived (database rows plus the run's
+    output directory) and then deleted. Individual tables can be given a
+    shorter retention window via tables, e.g. to drop bulky answer text after
+    30 days while keeping mentions for a year.
+
+    Attributes:
+        enabled: Enable retention policies (default: True)
+        max_age_days: Retention for whole runs in days (None = keep forever)
+        tables: Per-table retention overrides in days (keys from RETENTION_TABLES)
+        archive: Archive rows and run directories before deleting (default: True)
+        archive_dir: Archive destination (default: "{output_dir}/archive")
+        archive_format: "ndjson" (gzip-compressed) or "parquet" (requires pyarrow)
+        chunk_size: Number of runs processed per batch (default: 50)
+
+    Example:
+        run_settings:
+          retention:
+            max_age_days: 365
+            tables:
+              answers_raw: 30
+              operations: 30
+              intent_classification_cache: 90
+            archive_format: "ndjson"
+    """
+
+    enabled: bool = True
+    max_age_days: int | None = None
+    tables: dict[str, int] = {}
+    archive: bool = True
+    archive_dir: str | None = None
+    archive_format: Literal["ndjson", "parquet"] = "ndjson"
+    chunk_size: int = 50
+
+    @field_validator("max_age_days", "chunk_size")
+    @classmethod
+    def validate_positive(cls, v: int | None) -> int | None:
+        """Validate day counts and chunk sizes are positive if specified."""
+        if v is not None and v <= 0:
+            raise ValueError(f"Retention value must be positive, got: {v}")
+        return v
+
+    @field_validator("tables")
+    @classmethod
+    def validate_tables(cls, v: dict[str, int]) -> dict[str, int]:
+        """Validate per-table overrides reference known tables with positive days."""
+        for table, days in v.items():
+            if table not in RETENTION_TABLES:
+                raise ValueError(
+                    f"Unknown retention table '{table}'. "
+                    f"Supported tables: {', '.join(RETENTION_TABLES)}"
+                )
+            if days <= 0:
+                raise ValueError(
+                    f"Retention for table '{table}' must be positive, got: {days}"
+                )
+        return v
+
+
+class ExtractionCacheConfig(BaseModel):
+    """
+    Memoization of extraction results for identical answers.
+
+    Deterministic models, cached provider responses, and repeated runs often
+    return byte-identical answers. With the cache enabled, parse results are
+    reused instead of re-running mention detection, rank extraction, and paid
+    function-calling extraction. Entries are keyed by the answer text, the
+    brand lists, and the extraction settings, so changing brands or settings
+    never returns a stale result.
+
+    Attributes:
+        enabled: Enable the extraction cache (default: True)
+        max_memory_entries: LRU size of the in-process cache (default: 1024)
+        persist: Also store results in the SQLite extraction_cache table (default: True)
+        max_db_entries: LRU cap for persisted entries (None = unbounded)
+        ttl_days: Ignore persisted entries older than this (None = never expire)
+
+    Example:
+        run_settings:
+          extraction_cache:
+            max_memory_entries: 2048
+            max_db_entries: 50000
+            ttl_days: 30
+    """
+
+    enabled: bool = True
+    max_memory_entries: int = 1024
+    persist: bool = True
+    max_db_entries: int | None = 10_000
+    ttl_days: int | None = None
+
+    @field_validator("max_memory_entries", "max_db_entries", "ttl_days")
+    @classmethod
+    def validate_positive(cls, v: int | None) -> int | None:
+        """Validate cache limits are positive if specified."""
+        if v is not None and v <= 0:
+            raise ValueError(f"Extraction cache limit must be positive, got: {v}")
+        return v
+
+
+class ScheduleConfig(BaseModel):
+    """
+    Cron schedule for running a config from the long-running `serve` mode.
+
+    The `run` command ignores this section; it is only read by `serve`,
+    which keeps configs, pricing, connection pools, and caches loaded
+    between runs instead of paying startup costs on every cron invocation.
+
+    Attributes:
+        cron: Five-field cron expression or macro, evaluated in UTC
+              (e.g. "0 * * * *", "*/30 9-17 * * 1-5", "@daily")
+        enabled: Whether `serve` should schedule this config (default: True)
+        run_on_start: Run once immediately when `serve` starts (default: False)
+
+    Example:
+        run_settings:
+          schedule:
+            cron: "0 */6 * * *"
+            run_on_start: true
+    """
+
+    cron: str
+    enabled: bool = True
+    run_on_start: bool = False
+
+    @field_validator("cron")
+    @classmethod
+    def validate_cron(cls, v: str) -> str:
+        """Validate the cron expression parses and fires at least once."""
+        schedule = parse_cron(v)
+        schedule.next_after(datetime(2000, 1, 1, tzinfo=UTC))
+        return v
+
+    @property
+    def compiled(self) -> CronSchedule:
+        """Parsed cron schedule (cached by expression)."""
+        return parse_cron(self.cron)
+
+
+class SamplingConfig(BaseModel):
+    """
+    Adaptive multi-sample querying per (intent, model).
+
+    LLM answers are stochastic, so a single sample gives a noisy view of
+    whether a brand is mentioned. With sampling enabled, each API model is
+    queried repeatedly for an intent and the mention rate of every brand is
+    tracked with a Wilson score interval. Sampling stops as soon as all
+    intervals are narrower than target_ci_width (after min_samples), or at
+    max_samples.
+
+    Providers that accept a native `n` parameter return batch_size samples
+    per request, so the prompt is billed once per batch. Other providers
+    are sampled one request at a time. Browser runners are never sampled.
+
+    Attributes:
+        enabled: Enable adaptive sampling (default: True)
+        min_samples: Samples taken before the stopping rule applies (default: 3)
+        max_samples: Hard cap on samples per (intent, model) (default: 10)
+        batch_size: Samples requested per call from providers with native `n`
+                    (default: 3)
+        target_ci_width: Stop once every brand's interval is at most this
+                         wide (0-1, default: 0.4)
+        confidence: Confidence level of the intervals (default: 0.9)
+
+    Example:
+        run_settings:
+          sampling:
+            min_samples: 3
+            max_samples: 12
+            target_ci_width: 0.35
+    """
+
+    enabled: bool = True
+    min_samples: int = 3
+    max_samples: int = 10
+    batch_size: int = 3
+    target_ci_width: float = 0.4
+    confidence: float = 0.9
+
+    @field_validator("min_samples", "max_samples", "batch_size")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate sample counts are positive."""
+        if v < 1:
+            raise ValueError(f"Sample counts must be at least 1, got: {v}")
+        return v
+
+    @field_validator("target_ci_width", "confidence")
+    @classmethod
+    def validate_fraction(cls, v: float) -> float:
+        """Validate interval settings are strictly between 0 and 1."""
+        if not 0 < v < 1:
+            raise ValueError(f"Must be between 0 and 1 (exclusive), got: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_sample_range(self) -> "SamplingConfig":
+        """Validate min_samples does not exceed max_samples."""
+        if self.min_samples > self.max_samples:
+            raise ValueError(
+                f"min_samples ({self.min_samples}) cannot exceed "
+                f"max_samples ({self.max_samples})"
+            )
+        return self
+
+
+class StabilityConfig(BaseModel):
+    """
+    Stability-aware skipping of (intent, model) queries.
+
+    Many intents return the same brand ranking run after run. With this
+    section enabled, run_all compares the ranked brand lists of each unit's
+    last lookback_runs answered runs (stored in `mentions`). The mean
+    normalized edit distance between consecutive lists is the unit's
+    volatility. Volatile units (above max_rank_distance) are queried every
+    run. Stable units are queried every 1 + max_skip_runs runs at most: a
+    unit with identical rankings waits the longest, and one near the
+    threshold is refreshed almost every run.
+
+    Skipped units are recorded in the query_skips table. Their previous
+    answer is carried forward into the run's artifacts and summaries.
+
+    Attributes:
+        enabled: Enable stability-aware skipping (default: True)
+        lookback_runs: Answered runs compared per unit (default: 5, min: 2)
+        min_history: Answered runs required before a unit can be skipped
+                     (default: 3, min: 2)
+        max_rank_distance: Highest mean normalized rank-list edit distance
+                           (0-1) that still counts as stable (default: 0.2)
+        max_skip_runs: Most consecutive runs a fully stable unit is skipped
+                       (default: 3)
+
+    Example:
+        run_settings:
+          stability:
+            lookback_runs: 6
+            max_rank_distance: 0.15
+            max_skip_runs: 5
+    """
+
+    enabled: bool = True
+    lookback_runs: int = 5
+    min_history: int = 3
+    max_rank_distance: float = 0.2
+    max_skip_runs: int = 3
+
+    @field_validator("lookback_runs", "min_history")
+    @classmethod
+    def validate_history(cls, v: int) -> int:
+        """Validate at least two runs are compared."""
+        if v < 2:
+            raise ValueError(f"Stability history needs at least 2 runs, got: {v}")
+        return v
+
+    @field_validator("max_rank_distance")
+    @classmethod
+    def validate_distance(cls, v: float) -> float:
+        """Validate the distance threshold is a fraction."""
+        if not 0 <= v <= 1:
+            raise ValueError(f"max_rank_distance must be between 0 and 1, got: {v}")
+        return v
+
+    @field_validator("max_skip_runs")
+    @classmethod
+    def validate_max_skip_runs(cls, v: int) -> int:
+        """Validate max_skip_runs is non-negative."""
+        if v < 0:
+            raise ValueError(f"max_skip_runs cannot be negative, got: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_min_history(self) -> "StabilityConfig":
+        """Validate min_history fits in the lookback window."""
+        if self.min_history > self.lookback_runs:
+            raise ValueError(
+                f"min_history ({self.min_history}) cannot exceed "
+                f"lookback_runs ({self.lookback_runs})"
+            )
+        return self
+
+
+class SchedulingConfig(BaseModel):
+    """
+    Latency-aware ordering of (intent, model) and (intent, runner) work.
+
+    Work is normally dispatched in intent order, so slow units (web search
+    models, browser runners) that happen to come last stretch the end of
+    the run. With strategy "longest_first", run_all estimates each unit's
+    duration from the median latency of its model's recent answers in
+    answers_raw, then dispatches higher-priority intents first and, within
+    a priority, the longest expected units first. Units are ordered in
+    windows of window_units so intents_source rows are still streamed.
+
+    Attributes:
+        strategy: "longest_first" or "intent_order" (default: "longest_first")
+        latency_window: Recent answers per model used for estimates (default: 50)
+        window_units: Units buffered and ordered at a time (default: 5000)
+
+    Example:
+        run_settings:
+          scheduling:
+            strategy: longest_first
+            latency_window: 100
+    """
+
+    strategy: Literal["longest_first", "intent_order"] = "longest_first"
+    latency_window: int = 50
+    window_units: int = 5000
+
+    @field_validator("latency_window", "window_units")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate window sizes are positive."""
+        if v < 1:
+            raise ValueError(f"Must be at least 1, got: {v}")
+        return v
+
+
+class CircuitBreakerConfig(BaseModel):
+    """
+    Per-model circuit breakers and a run-wide retry budget.
+
+    Each API model gets a breaker that tracks the outcome of its last
+    window_size requests (every failed retry attempt counts). Once at least
+    min_calls outcomes are recorded and the failure rate reaches
+    failure_rate_threshold, the breaker opens: queries for that model fail
+    fast, or go to its fallback model if one is configured. After
+    open_seconds a few probe requests are allowed through, and the first
+    success closes the breaker again.
+
+    Attributes:
+        enabled: Enable circuit breakers (default: True)
+        window_size: Recent outcomes tracked per model (default: 10)
+        min_calls: Outcomes needed before the breaker can open (default: 4)
+        failure_rate_threshold: Failure rate that opens the breaker (default: 0.5)
+        open_seconds: Seconds to fail fast before probing (default: 60)
+        half_open_max_calls: Probe requests allowed while half-open (default: 1)
+        max_retries_per_run: Retries allowed across the whole run (None = unlimited)
+
+    Example:
+        run_settings:
+          circuit_breaker:
+            failure_rate_threshold: 0.5
+            open_seconds: 120
+            max_retries_per_run: 30
+    """
+
+    enabled: bool = True
+    window_size: int = 10
+    min_calls: int = 4
+    failure_rate_threshold: float = 0.5
+    open_seconds: float = 60.0
+    half_open_max_calls: int = 1
+    max_retries_per_run: int | None = 20
+
+    @field_validator("window_size", "min_calls", "half_open_max_calls")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate counts are positive."""
+        if v < 1:
+            raise ValueError(f"Must be at least 1, got: {v}")
+        return v
+
+    @field_validator("failure_rate_threshold")
+    @classmethod
+    def validate_threshold(cls, v: float) -> float:
+        """Validate failure rate threshold is a fraction."""
+        if not 0 < v <= 1:
+            raise ValueError(f"failure_rate_threshold must be in (0, 1], got: {v}")
+        return v
+
+    @field_validator("open_seconds")
+    @classmethod
+    def validate_open_seconds(cls, v: float) -> float:
+        """Validate open duration is not negative."""
+        if v < 0:
+            raise ValueError(f"open_seconds cannot be negative, got: {v}")
+        return v
+
+    @field_validator("max_retries_per_run")
+    @classmethod
+    def validate_max_retries(cls, v: int | None) -> int | None:
+        """Validate retry budget is not negative if specified."""
+        if v is not None and v < 0:
+            raise ValueError(f"max_retries_per_run cannot be negative, got: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_min_calls_within_window(self) -> "CircuitBreakerConfig":
+        """Ensure min_calls outcomes fit in the window."""
+        if self.min_calls > self.window_size:
+            raise ValueError(
+                f"min_calls ({self.min_calls}) cannot exceed "
+                f"window_size ({self.window_size})"
+            )
+        return self
+
+
+class HedgingConfig(BaseModel):
+    """
+    Hedged requests to cut tail latency on slow providers.
+
+    When a request has been outstanding longer than the model's
+    latency_percentile of recent latencies, a duplicate request is sent.
+    Whichever answers first is used and the other is cancelled. Hedges are
+    limited to max_hedge_rate of each model's requests and to
+    max_extra_cost_usd of extra spend per run. A cancelled request may
+    still be billed, so each hedge is charged as a full second answer.
+
+    Attributes:
+        enabled: Enable hedging (default: True)
+        latency_percentile: Percentile of recent latencies after which to hedge (default: 95)
+        min_samples: Latencies needed before a model is hedged (default: 20)
+        latency_window: Recent latencies per model kept for the threshold (default: 100)
+        max_hedge_rate: Maximum fraction of a model's requests hedged (default: 0.1)
+        max_extra_cost_usd: Maximum extra spend on hedges per run (None = unlimited)
+
+    Example:
+        run_settings:
+          hedging:
+            latency_percentile: 95
+            max_hedge_rate: 0.05
+            max_extra_cost_usd: 0.50
+    """
+
+    enabled: bool = True
+    latency_percentile: float = 95.0
+    min_samples: int = 20
+    latency_window: int = 100
+    max_hedge_rate: float = 0.1
+    max_extra_cost_usd: float | None = None
+
+    @field_validator("latency_percentile")
+    @classmethod
+    def validate_percentile(cls, v: float) -> float:
+        """Validate percentile is within (0, 100)."""
+        if not 0 < v < 100:
+            raise ValueError(f"latency_percentile must be between 0 and 100, got: {v}")
+        return v
+
+    @field_validator("min_samples", "latency_window")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate sample counts are positive."""
+        if v < 1:
+            raise ValueError(f"Must be at least 1, got: {v}")
+        return v
+
+    @field_validator("max_hedge_rate")
+    @classmethod
+    def validate_rate(cls, v: float) -> float:
+        """Validate hedge rate is a fraction."""
+        if not 0 <= v <= 1:
+            raise ValueError(f"max_hedge_rate must be between 0 and 1, got: {v}")
+        return v
+
+    @field_validator("max_extra_cost_usd")
+    @classmethod
+    def validate_cost(cls, v: float | None) -> float | None:
+        """Validate cost cap is not negative if specified."""
+        if v is not None and v < 0:
+            raise ValueError(f"max_extra_cost_usd cannot be negative, got: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_min_samples_within_window(self) -> "HedgingConfig":
+        """Ensure min_samples latencies fit in the window."""
+        if self.min_samples > self.latency_window:
+            raise ValueError(
+                f"min_samples ({self.min_samples}) cannot exceed "
+                f"latency_window ({self.latency_window})"
+            )
+        return self
+
+
+class DistributedConfig(BaseModel):
+    """
+    Coordinator/worker execution of a run through a durable work queue.
+
+    With `run --distributed`, the coordinator enqueues the run's
+    (intent, model) and (intent, runner) units in a SQLite queue and waits;
+    `worker` processes (possibly on other hosts sharing the filesystem)
+    lease units, execute them and report results. A unit whose lease is not
+    renewed by heartbeats within lease_seconds (crashed or stuck worker) is
+    leased again, up to max_attempts times. The coordinator aggregates unit
+    results into the run's runs row and run_meta.json.
+
+    Attributes:
+        queue_path: SQLite queue file (default: "{output_dir}/queue.db")
+        lease_seconds: Time a worker may hold a unit without a heartbeat (default: 300)
+        heartbeat_seconds: Interval between lease renewals (default: 30)
+        max_attempts: Leases per unit before it is failed (default: 3)
+        poll_seconds: Idle polling interval of coordinator and workers (default: 1)
+
+    Example:
+        run_settings:
+          distributed:
+            queue_path: /mnt/shared/watcher-queue.db
+            lease_seconds: 600
+            max_attempts: 2
+    """
+
+    queue_path: str | None = None
+    lease_seconds: float = 300.0
+    heartbeat_seconds: float = 30.0
+    max_attempts: int = 3
+    poll_seconds: float = 1.0
+
+    @field_validator("lease_seconds", "heartbeat_seconds", "poll_seconds")
+    @classmethod
+    def validate_positive_seconds(cls, v: float) -> float:
+        """Validate intervals are positive."""
+        if v <= 0:
+            raise ValueError(f"Must be positive, got: {v}")
+        return v
+
+    @field_validator("max_attempts")
+    @classmethod
+    def validate_max_attempts(cls, v: int) -> int:
+        """Validate at least one attempt is allowed."""
+        if v < 1:
+            raise ValueError(f"max_attempts must be at least 1, got: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_heartbeat_within_lease(self) -> "DistributedConfig":
+        """Ensure leases are renewed before they expire."""
+        if self.heartbeat_seconds >= self.lease_seconds:
+            raise ValueError(
+                f"heartbeat_seconds ({self.heartbeat_seconds}) must be less than "
+                f"lease_seconds ({self.lease_seconds})"
+            )
+        return self
+
+
 class RunnerConfig(BaseModel):
     """
     Unified runner configuration for API-based and browser-based runners.
@@ -258,6 +849,18 @@ class RunSettings(BaseModel):
                          Optional - if empty, operations fall back to models list
         use_llm_rank_extraction: Enable LLM-assisted ranking (slower, more accurate)
         budget: Optional budget controls to prevent runaway costs
+        retention: Optional retention/archival policy applied by `db maintain`
+        extraction_cache: Optional memoization of extraction results (disabled if omitted)
+        schedule: Optional cron schedule used by `serve` mode
+        sampling: Optional adaptive multi-sample querying (one sample if omitted)
+        stability: Optional skipping of stable units (every unit queried if omitted)
+        scheduling: Optional latency-aware work ordering (intent order if omitted)
+        circuit_breaker: Optional per-model circuit breakers and retry budget
+        hedging: Optional hedged requests for slow answers (no hedging if omitted)
+        distributed: Optional work queue settings for `run --distributed` and `worker`
+        deadline_seconds: Optional wall-clock limit for the whole run. Queries still
+                          running or queued when it passes are cancelled and
+                          marked timed_out.
     """
 
     output_dir: str
@@ -267,6 +870,16 @@ class RunSettings(BaseModel):
     operation_models: list[ModelConfig] = []  # Models used only for operations
     use_llm_rank_extraction: bool = False
     budget: BudgetConfig | None = None
+    retention: RetentionConfig | None = None
+    extraction_cache: ExtractionCacheConfig | None = None
+    schedule: ScheduleConfig | None = None
+    sampling: SamplingConfig | None = None
+    stability: StabilityConfig | None = None
+    scheduling: SchedulingConfig | None = None
+    circuit_breaker: CircuitBreakerConfig | None = None
+    hedging: HedgingConfig | None = None
+    distributed: DistributedConfig | None = None
+    deadline_seconds: float | None = None
 
     @field_validator("output_dir")
     @classmethod
@@ -284,6 +897,14 @@ class RunSettings(BaseModel):
             raise ValueError("sqlite_db_path cannot be empty")
         return v
 
+    @field_validator("deadline_seconds")
+    @classmethod
+    def validate_deadline_seconds(cls, v: float | None) -> float | None:
+        """Validate deadline is positive if specified."""
+        if v is not None and v <= 0:
+            raise ValueError(f"deadline_seconds must be positive, got: {v}")
+        return v
+
     @field_validator("max_concurrent_requests")
     @classmethod
     def validate_max_concurrent_requests(cls, v: int) -> int:
@@ -532,6 +1153,8 @@ class Operation(BaseModel):
         Validate prompt is non-empty and within length limits.
 
         Prevents excessively long prompts that could cause runaway API costs.
+        Also compiles the template, rejecting unknown template variables
+        (e.g. {brand:mien}) before any API call is made.
         """
         if not v or v.isspace():
             raise ValueError("Operation prompt cannot be empty")
@@ -543,6 +1166,22 @@ class Operation(BaseModel):
                 f"Operation prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} "
                 f"characters (received {len(v):,} characters)"
             )
+
+        compile_template(v)
+        return v
+
+    @field_validator("condition")
+    @classmethod
+    def validate_condition(cls, v: str | None) -> str | None:
+        """
+        Validate condition is a supported expression with known variables.
+
+        Supported forms: "{x} == null", "{x} > 3" (==, !=, >, <, >=, <=),
+        and '{x} contains "text"'.
+        """
+        if v is None:
+            return v
+        compile_condition(v)
         return v
 
     @field_validator("depends_on")
@@ -604,6 +1243,26 @@ class Operation(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_operation_references(self) -> "Operation":
+        """
+        Warn when {operation:id} references are not listed in depends_on.
+
+        Operations only run after their declared dependencies, so a reference
+        to an undeclared operation may render as the literal placeholder.
+        """
+        referenced = compile_template(self.prompt).operation_refs
+        missing = sorted(referenced - set(self.depends_on))
+        if missing:
+            import logging
+
+            logging.warning(
+                f"Operation '{self.id}' references {missing} in its prompt "
+                f"without listing them in depends_on; they may not have run yet."
+            )
+
+        return self
+
 
 class Intent(BaseModel):
     """
@@ -616,11 +1275,14 @@ class Intent(BaseModel):
         id: Unique identifier slug (alphanumeric, hyphens, underscores)
         prompt: The actual question to ask the LLM
         operations: Optional list of custom operations to run after this intent completes
+        priority: Scheduling priority with run_settings.scheduling; higher runs
+                  first (default: 0)
     """
 
     id: str
     prompt: str
     operations: list[Operation] = []
+    priority: int = 0
 
     @field_validator("id")
     @classmethod
@@ -681,6 +1343,69 @@ class Intent(BaseModel):
         return v
 
 
+class IntentsSource(BaseModel):
+    """
+    External intent list streamed row by row instead of inlined in YAML.
+
+    For long-tail monitoring (hundreds of thousands of prompts) the intents
+    live in a CSV file, a JSONL file, or a SQLite table. Rows are read and
+    validated lazily each time the run iterates intents, so neither the
+    config nor the runner holds the whole list in memory. Streamed intents
+    carry only an id and a prompt; global_operations still apply to them.
+
+    Attributes:
+        path: File path (relative paths resolve from the working directory,
+              like output_dir and sqlite_db_path)
+        format: "csv", "jsonl" or "sqlite" (default: inferred from extension)
+        table: Table to read when format is "sqlite" (default: "intents")
+        id_column: Column/key holding the intent ID (default: "id")
+        prompt_column: Column/key holding the prompt (default: "prompt")
+        on_invalid: "skip" logs and skips rows that fail Intent validation or
+                    repeat an ID; "error" aborts the run (default: "skip")
+
+    Example:
+        intents_source:
+          path: "./intents/long-tail.csv"
+          prompt_column: "question"
+    """
+
+    path: str
+    format: Literal["csv", "jsonl", "sqlite"] | None = None
+    table: str = "intents"
+    id_column: str = "id"
+    prompt_column: str = "prompt"
+    on_invalid: Literal["skip", "error"] = "skip"
+
+    @field_validator("table", "id_column", "prompt_column")
+    @classmethod
+    def validate_identifier(cls, v: str) -> str:
+        """Restrict names to identifiers (they are interpolated into SQL)."""
+        if not v.isidentifier():
+            raise ValueError(f"Must be a plain identifier (letters, digits, _): {v!r}")
+        return v
+
+    @model_validator(mode="after")
+    def infer_format(self) -> "IntentsSource":
+        """Infer format from the file extension when not given."""
+        if self.format is None:
+            suffix = self.path.rsplit(".", 1)[-1].lower() if "." in self.path else ""
+            formats = {
+                "csv": "csv",
+                "jsonl": "jsonl",
+                "ndjson": "jsonl",
+                "db": "sqlite",
+                "sqlite": "sqlite",
+                "sqlite3": "sqlite",
+            }
+            if suffix not in formats:
+                raise ValueError(
+                    f"Cannot infer intents_source format from {self.path!r}; "
+                    "set format to csv, jsonl or sqlite"
+                )
+            self.format = formats[suffix]
+        return self
+
+
 class WatcherConfig(BaseModel):
     """
     Root configuration model for watcher.config.yaml.
@@ -697,7 +1422,9 @@ class WatcherConfig(BaseModel):
                      If runners is specified, run_settings.models is optional
         extraction_settings: Optional extraction settings (defaults to regex with first model)
         brands: Brand alias collections (mine vs competitors)
-        intents: List of buyer-intent queries to monitor
+        intents: List of buyer-intent queries to monitor (may be empty when
+                 intents_source is set)
+        intents_source: Optional external intent list streamed at run time
         global_operations: Operations that run for EVERY intent (applied automatically)
         runners: Optional list of unified runner configurations (NEW!)
                 If specified, takes precedence over run_settings.models
@@ -724,7 +1451,8 @@ class WatcherConfig(BaseModel):
     run_settings: RunSettings
     extraction_settings: ExtractionSettings | None = None
     brands: Brands
-    intents: list[Intent]
+    intents: list[Intent] = []
+    intents_source: IntentsSource | None = None
     global_operations: list[Operation] = []
     runners: list[RunnerConfig] | None = None
 
@@ -732,14 +1460,11 @@ class WatcherConfig(BaseModel):
     @classmethod
     def validate_intents_unique(cls, v: list[Intent]) -> list[Intent]:
         """
-        Validate intents list is non-empty and all IDs are unique.
+        Validate all intent IDs are unique.
 
         Raises:
-            ValueError: If no intents configured or duplicate IDs found
+            ValueError: If duplicate IDs found
         """
-        if not v:
-            raise ValueError("At least one intent must be configured")
-
         # Check for duplicate IDs
         ids = [intent.id for intent in v]
         if len(ids) != len(set(ids)):
@@ -770,6 +1495,20 @@ class WatcherConfig(BaseModel):
 
         return v
 
+    @model_validator(mode="after")
+    def validate_intents_configured(self) -> "WatcherConfig":
+        """
+        Validate at least one intent is configured inline or via intents_source.
+
+        Raises:
+            ValueError: If neither intents nor intents_source is set
+        """
+        if not self.intents and self.intents_source is None:
+            raise ValueError(
+                "At least one intent must be configured (intents or intents_source)"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_models_or_runners(self) -> "WatcherConfig":
         """
@@ -899,6 +1638,8 @@ class RuntimeModel(BaseModel):
         system_prompt: Resolved system prompt text (loaded from JSON file or default)
         tools: Optional list of tool configurations (e.g., [{"type": "web_search"}])
         tool_choice: Tool selection mode ("auto", "required", "none")
+        fallback: Resolved fallback model used while the circuit breaker is open
+        timeout_seconds: Time limit for one query of this model (None = no limit)
     """
 
     provider: str
@@ -907,6 +1648,8 @@ class RuntimeModel(BaseModel):
     system_prompt: str = "You are a helpful AI assistant."
     tools: list[dict] | None = None
     tool_choice: str = "auto"
+    fallback: "RuntimeModel | None" = None
+    timeout_seconds: float | None = None
 
     @field_validator("provider")
     @classmethod
@@ -1036,8 +1779,12 @@ class RuntimeOperation(BaseModel):
         function_schema: Resolved function calling schema (for type="structured")
         function_template: Function template name (for type="structured")
         function_params: Function template parameters (for type="structured")
+        compiled_prompt: Prompt parsed into tokens at config load (see config.templates)
+        compiled_condition: Condition parsed at config load (None if no condition)
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str
     description: str | None = None
     prompt: str
@@ -1053,6 +1800,10 @@ class RuntimeOperation(BaseModel):
     function_template: str | None = None
     function_params: dict | None = None
 
+    # Precompiled template forms (derived from prompt/condition, not serialized)
+    compiled_prompt: CompiledTemplate | None = Field(default=None, exclude=True)
+    compiled_condition: CompiledCondition | None = Field(default=None, exclude=True)
+
 
 class RuntimeConfig(BaseModel):
     """
@@ -1068,7 +1819,8 @@ class RuntimeConfig(BaseModel):
         run_settings: Runtime settings from config
         extraction_settings: Extraction settings with resolved model (optional)
         brands: Brand aliases from config
-        intents: Intent queries from config
+        intents: Inline intent queries from config
+        intents_source: External intent list streamed by iter_intents()
         models: Resolved model configurations with API keys (LEGACY)
         operation_models: Resolved model configurations used ONLY for operations
                          Enables strategic model selection (e.g., reasoning models)
@@ -1081,6 +1833,7 @@ class RuntimeConfig(BaseModel):
     extraction_settings: RuntimeExtractionSettings | None = None
     brands: Brands
     intents: list[Intent]
+    intents_source: IntentsSource | None = None
     models: list[RuntimeModel] = []  # Now optional for backward compatibility
     operation_models: list[RuntimeModel] = []  # Models used only for operations
     runner_configs: list[RunnerConfig] | None = None  # New format
@@ -1105,3 +1858,14 @@ class RuntimeConfig(BaseModel):
             )
 
         return self
+
+    def iter_intents(self) -> "IntentStream":
+        """
+        Iterate inline intents followed by rows streamed from intents_source.
+
+        Returns a fresh single-pass iterator on every call; the source is
+        re-read each time, so memory use does not grow with its size.
+        """
+        from .intent_source import IntentStream
+
+        return IntentStream(self.intents, self.intents_source)
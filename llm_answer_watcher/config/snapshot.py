@@ -0,0 +1,179 @@
+"""
+Compiled config snapshots for fast load_config on large configs.
+
+Parsing YAML dominates load time for big configs (tens of thousands of
+intents, thousands of brand aliases): PyYAML spends seconds building the
+document, while validating the same data from JSON takes a fraction of that.
+After a successful parse, load_config stores the validated WatcherConfig as
+JSON and later loads validate that snapshot instead of the YAML file.
+
+Snapshots hold the validated WatcherConfig, never the RuntimeConfig: API keys
+appear only as environment variable names (env_api_key, "${VAR}" runner
+values), so no resolved secret is written to disk. load_config resolves
+keys and system prompts after every load, snapshot or not.
+
+Invalidation:
+    - Unchanged (mtime_ns, size): snapshot used without reading the file
+    - Changed stat: file is hashed; same SHA-256 reuses the snapshot
+      (e.g. after `touch` or a checkout) and records the new stat
+    - Different hash, or a snapshot written by another package/pydantic
+      version or schema module: treated as a miss and rewritten
+
+Snapshots live in ~/.cache/llm-answer-watcher/config_snapshots, or in
+$LLM_ANSWER_WATCHER_CACHE_DIR/config_snapshots when that is set. Any error
+reading or writing a snapshot falls back to a normal parse.
+
+Example:
+    >>> watcher_config = load_snapshot(Path("big.config.yaml"))
+    >>> if watcher_config is None:
+    ...     watcher_config = parse(...)
+    ...     save_snapshot(Path("big.config.yaml"), content, watcher_config)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from . import schema
+from .schema import WatcherConfig
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+# Configs smaller than this load faster than hashing plus a snapshot round trip
+SNAPSHOT_MIN_BYTES = 64 * 1024
+
+CACHE_DIR_ENV = "LLM_ANSWER_WATCHER_CACHE_DIR"
+
+
+def snapshot_dir() -> Path:
+    """Directory holding config snapshots (honours LLM_ANSWER_WATCHER_CACHE_DIR)."""
+    base = os.environ.get(CACHE_DIR_ENV)
+    root = Path(base) if base else Path.home() / ".cache" / "llm-answer-watcher"
+    return root / "config_snapshots"
+
+
+def snapshot_path(config_path: Path) -> Path:
+    """Snapshot file for a config, keyed by the config's absolute path."""
+    key = hashlib.sha256(str(config_path.resolve()).encode("utf-8")).hexdigest()[:32]
+    return snapshot_dir() / f"{key}.json"
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> str:
+    """
+    Identify the code that produced a snapshot.
+
+    Combines the snapshot format, package and pydantic versions, and the
+    schema module's mtime so editing schema.py in a dev checkout also
+    invalidates existing snapshots.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("llm-answer-watcher")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    schema_mtime = Path(schema.__file__).stat().st_mtime_ns
+    return f"{SNAPSHOT_FORMAT}:{package_version}:{PYDANTIC_VERSION}:{schema_mtime}"
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of raw config file bytes."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_snapshot(config_path: Path) -> WatcherConfig | None:
+    """
+    Load the validated WatcherConfig snapshot for a config file.
+
+    Args:
+        config_path: Config file the snapshot was taken from
+
+    Returns:
+        Validated WatcherConfig, or None if there is no usable snapshot
+    """
+    path = snapshot_path(config_path)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        header_line, _, body = data.partition(b"\n")
+        header = json.loads(header_line)
+        if header.get("fingerprint") != schema_fingerprint():
+            logger.debug(f"Config snapshot {path} is from another version, ignoring")
+            return None
+
+        stat = config_path.stat()
+        if (header["mtime_ns"], header["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if content_hash(config_path.read_bytes()) != header["sha256"]:
+                logger.debug(f"Config {config_path} changed since snapshot")
+                return None
+            # Same content, new stat (touch, checkout): refresh the header
+            header.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            _write_atomic(path, _encode_header(header) + body)
+
+        watcher_config = WatcherConfig.model_validate_json(body)
+    except Exception as e:
+        logger.debug(f"Ignoring unusable config snapshot {path}: {e}")
+        return None
+
+    logger.debug(f"Loaded config snapshot for {config_path}")
+    return watcher_config
+
+
+def save_snapshot(config_path: Path, content: bytes, watcher_config: WatcherConfig) -> None:
+    """
+    Store a validated WatcherConfig as the snapshot for a config file.
+
+    Never raises: a failed write only means the next load parses YAML again.
+
+    Args:
+        config_path: Config file that was parsed
+        content: Exact bytes that were parsed (hashed for invalidation)
+        watcher_config: Validated config built from content
+    """
+    path = snapshot_path(config_path)
+    try:
+        stat = config_path.stat()
+        header = {
+            "fingerprint": schema_fingerprint(),
+            "source": str(config_path.resolve()),
+            "sha256": content_hash(content),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        body = watcher_config.model_dump_json().encode("utf-8")
+        _write_atomic(path, _encode_header(header) + body)
+    except Exception as e:
+        logger.warning(f"Failed to write config snapshot {path}: {e}")
+        return
+
+    logger.debug(f"Saved config snapshot for {config_path} to {path}")
+
+
+def _encode_header(header: dict) -> bytes:
+    return json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file and rename so readers never see partial snapshots."""
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,245 @@
+"""
+Prompt template and condition compilation for custom operations.
+
+Operation prompts and conditions are parsed once (at config load) into
+token lists so that rendering is a single pass over precomputed segments
+instead of one str.replace() per supported variable. Compilation also
+validates placeholders up front, so a typo like {brand:mien} fails config
+validation instead of being sent to the LLM verbatim.
+
+Placeholder syntax is {namespace:key}. Only known namespaces are treated
+as variables; anything else in braces (JSON examples, unknown namespaces)
+is kept as literal text.
+
+Example:
+    >>> template = compile_template("Rank of {brand:mine}: {rank:mine}")
+    >>> template.variables
+    frozenset({'brand:mine', 'rank:mine'})
+    >>> template.render({"brand:mine": "Warmly", "rank:mine": "2"})
+    'Rank of Warmly: 2'
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+# Variables supported in operation prompts and conditions
+TEMPLATE_VARIABLES = frozenset(
+    {
+        "brand:mine",
+        "brand:mine_all",
+        "brand:competitors",
+        "competitors:mentioned",
+        "intent:id",
+        "intent:prompt",
+        "intent:response",
+        "rank:mine",
+        "mentions:mine",
+        "mentions:competitors",
+        "model:provider",
+        "model:name",
+        "run:id",
+        "run:timestamp",
+    }
+)
+
+# Namespace whose keys are operation IDs (resolved from prior results)
+OPERATION_NAMESPACE = "operation"
+
+_KNOWN_NAMESPACES = frozenset(
+    {var.split(":", 1)[0] for var in TEMPLATE_VARIABLES} | {OPERATION_NAMESPACE}
+)
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{([a-z_]+):([A-Za-z0-9_-]+)\}")
+
+_COMPARISON_PATTERN = re.compile(r"^(.*?)\s*(==|!=|>=|<=|>|<)\s*(\d+)\s*$", re.DOTALL)
+
+_CONTAINS_SEPARATOR = " contains "
+
+_NULL_SUFFIX = "== null"
+
+# Value that {rank:mine} renders to when the brand was not ranked
+NOT_FOUND = "not found"
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    Template parsed into literal and placeholder segments.
+
+    Attributes:
+        source: Original template string
+        tokens: Literal text and placeholder keys, in order
+        slots: Indices into tokens that hold placeholder keys
+        variables: Placeholder keys used by the template (e.g. "rank:mine")
+        operation_refs: Operation IDs referenced via {operation:id}
+    """
+
+    source: str
+    tokens: tuple[str, ...]
+    slots: tuple[int, ...]
+    variables: frozenset[str]
+    operation_refs: frozenset[str]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Substitute placeholder values in a single pass.
+
+        Placeholders missing from values (e.g. an operation that has not run)
+        are left as-is, matching the behavior of unresolved variables.
+
+        Args:
+            values: Mapping of placeholder key to substitution text
+
+        Returns:
+            Rendered string
+        """
+        if not self.slots:
+            return self.source
+        parts = list(self.tokens)
+        for index in self.slots:
+            key = parts[index]
+            value = values.get(key)
+            parts[index] = value if value is not None else f"{{{key}}}"
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    """
+    Operation condition parsed into its operator and operand templates.
+
+    Attributes:
+        source: Original condition string
+        kind: "null" ({x} == null), "compare" ({x} > 3), or "contains"
+        left: Template for the left-hand side
+        operator: Comparison operator for kind="compare"
+        right: Template for the right-hand side (number or needle)
+    """
+
+    source: str
+    kind: Literal["null", "compare", "contains"]
+    left: CompiledTemplate
+    operator: str | None = None
+    right: CompiledTemplate | None = None
+
+    @property
+    def variables(self) -> frozenset[str]:
+        """Placeholder keys used on either side of the condition."""
+        right_vars = self.right.variables if self.right else frozenset()
+        return self.left.variables | right_vars
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Parse a prompt template into literal and placeholder tokens.
+
+    Compilation is cached by template string, so validating a config and
+    building its runtime operations compile each template only once.
+
+    Args:
+        template: Template with {namespace:key} placeholders
+
+    Returns:
+        CompiledTemplate ready for single-pass rendering
+
+    Raises:
+        ValueError: If a placeholder uses a known namespace with an unknown key
+
+    Example:
+        >>> compile_template("{intent:response}").slots
+        (1,)
+    """
+    tokens: list[str] = []
+    slots: list[int] = []
+    variables: set[str] = set()
+    operation_refs: set[str] = set()
+    literal_start = 0
+
+    for match in _PLACEHOLDER_PATTERN.finditer(template):
+        namespace, key = match.groups()
+        if namespace not in _KNOWN_NAMESPACES:
+            continue  # Literal text that happens to look like a placeholder
+
+        placeholder = f"{namespace}:{key}"
+        if namespace == OPERATION_NAMESPACE:
+            operation_refs.add(key)
+        elif placeholder not in TEMPLATE_VARIABLES:
+            raise ValueError(
+                f"Unknown template variable '{{{placeholder}}}'. "
+                f"Supported variables: "
+                f"{', '.join(f'{{{v}}}' for v in sorted(TEMPLATE_VARIABLES))}, "
+                f"{{operation:<id>}}"
+            )
+
+        tokens.append(template[literal_start : match.start()])
+        slots.append(len(tokens))
+        tokens.append(placeholder)
+        variables.add(placeholder)
+        literal_start = match.end()
+
+    tokens.append(template[literal_start:])
+
+    return CompiledTemplate(
+        source=template,
+        tokens=tuple(tokens),
+        slots=tuple(slots),
+        variables=frozenset(variables),
+        operation_refs=frozenset(operation_refs),
+    )
+
+
+@lru_cache(maxsize=256)
+def compile_condition(condition: str) -> CompiledCondition:
+    """
+    Parse an operation condition into operator and operand templates.
+
+    Supported forms:
+        {rank:mine} == null
+        {rank:mine} > 3   (also ==, !=, <, >=, <=)
+        {competitors:mentioned} contains "HubSpot"
+
+    Args:
+        condition: Condition expression with template variables
+
+    Returns:
+        CompiledCondition for evaluation against rendered values
+
+    Raises:
+        ValueError: If the expression is not one of the supported forms or
+            references unknown template variables
+    """
+    stripped = condition.strip()
+
+    if stripped.endswith(_NULL_SUFFIX):
+        left = stripped[: -len(_NULL_SUFFIX)].strip()
+        return CompiledCondition(source=condition, kind="null", left=compile_template(left))
+
+    match = _COMPARISON_PATTERN.match(stripped)
+    if match:
+        left, operator, right = match.groups()
+        return CompiledCondition(
+            source=condition,
+            kind="compare",
+            left=compile_template(left),
+            operator=operator,
+            right=compile_template(right),
+        )
+
+    if _CONTAINS_SEPARATOR in stripped:
+        left, right = stripped.split(_CONTAINS_SEPARATOR, 1)
+        return CompiledCondition(
+            source=condition,
+            kind="contains",
+            left=compile_template(left.strip()),
+            right=compile_template(right.strip()),
+        )
+
+    raise ValueError(
+        f"Unsupported condition '{condition}'. Expected '<value> == null', "
+        f"'<value> <op> <number>' (==, !=, >, <, >=, <=), or "
+        f"'<value> contains \"text\"'"
+    )
@@ -0,0 +1,336 @@
+"""
+Long-running watcher daemon for LLM Answer Watcher (`serve` command).
+
+Running the CLI from system cron pays interpreter startup, YAML parsing,
+pydantic validation, pricing JSON loading, and fresh TLS connections on
+every invocation. WatcherDaemon loads each config once and runs it on the
+cron schedule from its run_settings.schedule section, keeping warm between
+runs:
+
+- Validated RuntimeConfig objects (including precompiled operation templates)
+- One shared httpx connection pool for all provider clients
+- The parsed pricing cache and compiled brand-matcher regexes
+- One ExtractionMemo per config (in-memory tier survives across runs)
+
+Config files are watched by (mtime, size) and hot-reloaded when they change.
+A reload that fails validation is logged and the previous config keeps
+running. Runs of the same config never overlap: if a run is still in
+progress when the next fire time arrives, that occurrence is skipped and
+counted in the config's status.
+
+Example:
+    >>> daemon = WatcherDaemon(["hourly.config.yaml", "daily.config.yaml"])
+    >>> daemon.load_all()
+    >>> await daemon.serve(stop_event)
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from llm_answer_watcher.config.loader import load_config
+from llm_answer_watcher.config.schedule import CronSchedule
+from llm_answer_watcher.config.schema import RuntimeConfig
+from llm_answer_watcher.exceptions import ConfigurationError
+from llm_answer_watcher.extractor.memo import ExtractionMemo
+from llm_answer_watcher.llm_runner.http_pool import connection_pool
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.report.generator import build_result_rows, write_report
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Default seconds between config file change checks
+DEFAULT_POLL_INTERVAL = 30.0
+
+
+@dataclass
+class WatchedConfig:
+    """
+    State for one config file managed by the daemon.
+
+    Attributes:
+        path: Resolved config file path
+        config: Currently active runtime config (None until first load)
+        signature: (mtime_ns, size) of the file when config was loaded
+        next_run_at: Next scheduled fire time (None if unscheduled)
+        memo: Extraction memo reused across runs of this config
+        task: In-flight run task (None when idle)
+        runs_started: Number of runs started
+        runs_failed: Number of runs that raised
+        overlaps_skipped: Fire times skipped because a run was still in progress
+        reloads: Number of successful hot reloads
+        last_run_id: run_id of the last completed run
+        last_error: Last run or reload error message
+    """
+
+    path: Path
+    config: RuntimeConfig | None = None
+    signature: tuple[int, int] | None = None
+    next_run_at: datetime | None = None
+    memo: ExtractionMemo | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+    runs_started: int = 0
+    runs_failed: int = 0
+    overlaps_skipped: int = 0
+    reloads: int = 0
+    last_run_id: str | None = None
+    last_error: str | None = None
+
+    @property
+    def schedule(self) -> CronSchedule | None:
+        """Parsed cron schedule, or None if the config is not scheduled."""
+        if self.config is None:
+            return None
+        settings = self.config.run_settings.schedule
+        if settings is None or not settings.enabled:
+            return None
+        return settings.compiled
+
+    @property
+    def running(self) -> bool:
+        """Whether a run of this config is in progress."""
+        return self.task is not None and not self.task.done()
+
+    def to_dict(self) -> dict:
+        """Status summary for JSON output."""
+        schedule = self.schedule
+        return {
+            "config": str(self.path),
+            "cron": schedule.source if schedule else None,
+            "next_run_at": self.next_run_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+            if self.next_run_at
+            else None,
+            "running": self.running,
+            "runs_started": self.runs_started,
+            "runs_failed": self.runs_failed,
+            "overlaps_skipped": self.overlaps_skipped,
+            "reloads": self.reloads,
+            "last_run_id": self.last_run_id,
+            "last_error": self.last_error,
+        }
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Return (mtime_ns, size) used to detect config file changes."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class WatcherDaemon:
+    """
+    Run configs on cron schedules inside one long-lived process.
+
+    Attributes:
+        watched: Watched configs keyed by resolved path
+        poll_interval: Maximum seconds between wakeups (file change checks)
+        write_reports: Generate report.html after each run
+
+    Example:
+        >>> daemon = WatcherDaemon(["watcher.config.yaml"], poll_interval=10)
+        >>> daemon.load_all()
+        >>> started = await daemon.tick()
+    """
+
+    def __init__(
+        self,
+        config_paths: Iterable[str | Path],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        write_reports: bool = True,
+        clock: Callable[[], datetime] = utc_now,
+    ):
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got: {poll_interval}")
+
+        self.poll_interval = poll_interval
+        self.write_reports = write_reports
+        self._clock = clock
+        self.watched: dict[Path, WatchedConfig] = {}
+        for config_path in config_paths:
+            resolved = Path(config_path).resolve()
+            self.watched.setdefault(resolved, WatchedConfig(path=resolved))
+
+    def load_all(self) -> None:
+        """
+        Load and validate every config (fail fast at startup).
+
+        Raises:
+            ConfigurationError: If any config fails to load, or none of them
+                has an enabled run_settings.schedule
+        """
+        now = self._clock()
+        for entry in self.watched.values():
+            self._load(entry)
+            settings = entry.config.run_settings.schedule
+            if entry.schedule is None:
+                logger.warning(f"No enabled run_settings.schedule in {entry.path}; not scheduled")
+            elif settings.run_on_start:
+                entry.next_run_at = now
+            else:
+                entry.next_run_at = entry.schedule.next_after(now)
+
+        if not any(entry.schedule for entry in self.watched.values()):
+            raise ConfigurationError(
+                "No config has an enabled run_settings.schedule. "
+                'Add e.g. `schedule: {cron: "0 * * * *"}` under run_settings.'
+            )
+
+    def reload_changed(self) -> list[Path]:
+        """
+        Hot-reload configs whose files changed since they were loaded.
+
+        A config that fails to reload keeps its previous version active. A
+        changed cron expression reschedules the config from now; a run in
+        progress keeps using the config it started with.
+
+        Returns:
+            Paths that were reloaded successfully
+        """
+        reloaded = []
+        for entry in self.watched.values():
+            try:
+                signature = _file_signature(entry.path)
+            except OSError as e:
+                logger.error(f"Cannot stat {entry.path}, keeping previous config: {e}")
+                entry.last_error = str(e)
+                continue
+            if signature == entry.signature:
+                continue
+
+            previous = entry.schedule
+            try:
+                self._load(entry)
+            except Exception as e:
+                logger.error(f"Reload of {entry.path} failed, keeping previous config: {e}")
+                entry.last_error = f"Reload failed: {e}"
+                # Don't retry the same broken file on every poll
+                entry.signature = signature
+                continue
+
+            entry.reloads += 1
+            reloaded.append(entry.path)
+            logger.info(f"Reloaded config {entry.path}")
+            if entry.schedule != previous:
+                entry.next_run_at = (
+                    entry.schedule.next_after(self._clock()) if entry.schedule else None
+                )
+        return reloaded
+
+    async def tick(self, now: datetime | None = None) -> list[Path]:
+        """
+        Reload changed configs and start every due run.
+
+        Args:
+            now: Current time (defaults to the daemon clock)
+
+        Returns:
+            Paths of configs whose runs were started
+        """
+        now = now or self._clock()
+        self.reload_changed()
+
+        started = []
+        for entry in self.watched.values():
+            schedule = entry.schedule
+            if schedule is None or entry.next_run_at is None or entry.next_run_at > now:
+                continue
+
+            entry.next_run_at = schedule.next_after(now)
+            if entry.running:
+                entry.overlaps_skipped += 1
+                logger.warning(
+                    f"Skipping scheduled run of {entry.path}: previous run still in progress"
+                )
+                continue
+
+            entry.runs_started += 1
+            entry.task = asyncio.create_task(self._execute(entry, entry.config, entry.memo))
+            started.append(entry.path)
+        return started
+
+    async def serve(self, stop_event: asyncio.Event | None = None) -> None:
+        """
+        Run the scheduling loop until stop_event is set.
+
+        Must be called after load_all(). On stop, waits for in-flight runs
+        to finish so their results are fully written.
+
+        Args:
+            stop_event: Event that ends the loop (None = run forever)
+        """
+        stop_event = stop_event or asyncio.Event()
+
+        async with connection_pool():
+            while not stop_event.is_set():
+                await self.tick()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), timeout=self._seconds_until_wakeup())
+
+            in_flight = [entry.task for entry in self.watched.values() if entry.running]
+            if in_flight:
+                logger.info(f"Waiting for {len(in_flight)} in-flight runs to finish")
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    def status(self) -> list[dict]:
+        """Status summaries for all watched configs."""
+        return [entry.to_dict() for entry in self.watched.values()]
+
+    def _load(self, entry: WatchedConfig) -> None:
+        """Load (or reload) one config and prepare its database and memo."""
+        signature = _file_signature(entry.path)
+        config = load_config(entry.path)
+        init_db_if_needed(config.run_settings.sqlite_db_path)
+
+        # Keep the warm memo unless the cache settings or database changed
+        cache_config = config.run_settings.extraction_cache
+        if cache_config is None or not cache_config.enabled:
+            entry.memo = None
+        elif (
+            entry.config is None
+            or entry.memo is None
+            or entry.config.run_settings.extraction_cache != cache_config
+            or entry.config.run_settings.sqlite_db_path != config.run_settings.sqlite_db_path
+        ):
+            entry.memo = ExtractionMemo.from_config(
+                cache_config, config.run_settings.sqlite_db_path
+            )
+
+        entry.config = config
+        entry.signature = signature
+        entry.last_error = None
+
+    async def _execute(
+        self, entry: WatchedConfig, config: RuntimeConfig, memo: ExtractionMemo | None
+    ) -> None:
+        """Run one config snapshot and record the outcome (never raises)."""
+        logger.info(f"Starting scheduled run of {entry.path}")
+        try:
+            results = await run_all(config, config_filename=entry.path.name, memo=memo)
+            if self.write_reports:
+                write_report(results["output_dir"], config, build_result_rows(config, results))
+        except Exception as e:
+            entry.runs_failed += 1
+            entry.last_error = str(e)
+            logger.error(f"Scheduled run of {entry.path} failed: {e}", exc_info=True)
+            return
+
+        entry.last_run_id = results["run_id"]
+        logger.info(
+            f"Scheduled run {results['run_id']} of {entry.path} complete: "
+            f"{results['success_count']}/{results['total_queries']} successful, "
+            f"cost=${results['total_cost_usd']:.6f}"
+        )
+
+    def _seconds_until_wakeup(self) -> float:
+        """Seconds until the next fire time, capped at poll_interval."""
+        now = self._clock()
+        wait = self.poll_interval
+        for entry in self.watched.values():
+            if entry.schedule is not None and entry.next_run_at is not None:
+                wait = min(wait, (entry.next_run_at - now).total_seconds())
+        return max(wait, 0.0)
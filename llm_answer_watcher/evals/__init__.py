@@ -7,10 +7,11 @@ catch extraction regressions, and future-proof the product for Cloud deployment.
 
 from .metrics import compute_mention_metrics, compute_rank_metrics
 from .runner import run_eval_suite
-from .schema import EvalMetricScore, EvalResult, EvalTestCase
+from .schema import EvalMetricScore, EvalPerformanceMetric, EvalResult, EvalTestCase
 
 __all__ = [
     "EvalMetricScore",
+    "EvalPerformanceMetric",
     "EvalResult",
     "EvalTestCase",
     "compute_mention_metrics",
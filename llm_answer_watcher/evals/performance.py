@@ -0,0 +1,154 @@
+"""
+Extraction performance measurement for the evaluation framework.
+
+Accuracy metrics catch extraction regressions; these metrics catch extraction
+getting slow. For each test case, detect_mentions() and
+extract_ranked_list_pattern() are run for a number of timed iterations after
+a warmup call, and one extra untimed pass under tracemalloc records peak
+allocation (tracemalloc slows code down, so it never overlaps the timings).
+
+Metrics are named with the PERFORMANCE_METRIC_PREFIX so they are stored in
+eval_results next to the accuracy metrics but never mixed into accuracy
+averages:
+
+    perf_detect_mentions_p50_ms / _p95_ms / _peak_alloc_kib
+    perf_rank_extraction_p50_ms / _p95_ms / _peak_alloc_kib
+    perf_extraction_p95_ms        (both extractors, per iteration)
+
+Timings are wall-clock and machine dependent. Run the suite with a single
+worker when the numbers are used as a gate; parallel workers compete for
+CPU and inflate latencies.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from ..extractor.mention_detector import detect_mentions
+from ..extractor.rank_extractor import extract_ranked_list_pattern
+from ..storage.eval_db import PERFORMANCE_METRIC_PREFIX
+from ..utils.stats import percentile
+from .schema import EvalPerformanceMetric, EvalTestCase
+
+# Timed iterations per extractor and test case
+DEFAULT_TIMING_ITERATIONS = 20
+
+# Untimed calls before timing (populate regex and fuzzy matching caches)
+WARMUP_ITERATIONS = 1
+
+# Combined detect_mentions + extract_ranked_list_pattern time per iteration
+EXTRACTION_P95_METRIC = f"{PERFORMANCE_METRIC_PREFIX}extraction_p95_ms"
+
+
+def _time_calls(func: Callable[[], object], iterations: int) -> list[float]:
+    """Run func iterations times and return each duration in milliseconds."""
+    for _ in range(WARMUP_ITERATIONS):
+        func()
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        durations.append((time.perf_counter_ns() - start) / 1_000_000)
+    return durations
+
+
+def _peak_allocation_kib(func: Callable[[], object]) -> float:
+    """Peak memory allocated by one call of func, in KiB."""
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return max(0, peak - baseline) / 1024
+
+
+def _latency_metrics(
+    label: str, durations: list[float], peak_kib: float
+) -> list[EvalPerformanceMetric]:
+    details = {
+        "iterations": len(durations),
+        "min_ms": min(durations),
+        "max_ms": max(durations),
+    }
+    return [
+        EvalPerformanceMetric(
+            name=f"{PERFORMANCE_METRIC_PREFIX}{label}_p50_ms",
+            value=percentile(durations, 50),
+            unit="ms",
+            details=details,
+        ),
+        EvalPerformanceMetric(
+            name=f"{PERFORMANCE_METRIC_PREFIX}{label}_p95_ms",
+            value=percentile(durations, 95),
+            unit="ms",
+            details=details,
+        ),
+        EvalPerformanceMetric(
+            name=f"{PERFORMANCE_METRIC_PREFIX}{label}_peak_alloc_kib",
+            value=peak_kib,
+            unit="KiB",
+        ),
+    ]
+
+
+def measure_extraction_performance(
+    test_case: EvalTestCase,
+    iterations: int = DEFAULT_TIMING_ITERATIONS,
+) -> list[EvalPerformanceMetric]:
+    """
+    Time and profile the extraction functions on one test case.
+
+    Args:
+        test_case: The test case whose answer text and brands are used
+        iterations: Timed iterations per extractor (must be positive)
+
+    Returns:
+        Latency (p50/p95 per extractor, combined p95) and peak allocation
+        metrics for this test case
+
+    Raises:
+        ValueError: If iterations is not positive
+
+    Example:
+        >>> metrics = measure_extraction_performance(test_case, iterations=10)
+        >>> {m.name: round(m.value, 2) for m in metrics}["perf_extraction_p95_ms"]
+        0.31
+    """
+    if iterations < 1:
+        raise ValueError(f"iterations must be >= 1, got: {iterations}")
+
+    all_brands = test_case.brands_mine + test_case.brands_competitors
+
+    def run_detect() -> object:
+        return detect_mentions(
+            answer_text=test_case.llm_answer_text,
+            our_brands=test_case.brands_mine,
+            competitor_brands=test_case.brands_competitors,
+        )
+
+    def run_rank() -> object:
+        return extract_ranked_list_pattern(
+            text=test_case.llm_answer_text,
+            known_brands=all_brands,
+        )
+
+    detect_durations = _time_calls(run_detect, iterations)
+    rank_durations = _time_calls(run_rank, iterations)
+    combined = [a + b for a, b in zip(detect_durations, rank_durations, strict=True)]
+
+    return [
+        *_latency_metrics("detect_mentions", detect_durations, _peak_allocation_kib(run_detect)),
+        *_latency_metrics("rank_extraction", rank_durations, _peak_allocation_kib(run_rank)),
+        EvalPerformanceMetric(
+            name=EXTRACTION_P95_METRIC,
+            value=percentile(combined, 95),
+            unit="ms",
+            details={"iterations": iterations},
+        ),
+    ]
@@ -3,23 +3,55 @@ Evaluation runner for the LLM Answer Watcher evaluation framework.
 
 This module provides the main orchestrator function `run_eval_suite()` that
 loads test cases, executes the evaluation pipeline, and returns results.
+
+Large fixture files are evaluated in parallel on a process pool (results keep
+fixture order), and cases whose hash - test case content plus extractor code
+version - already has stored results in the eval database are reused instead
+of re-evaluated.
+
+Each case is also timed (see evals.performance) and the suite fails when the
+95th percentile extraction latency exceeds EXTRACTION_P95_MS_THRESHOLD.
 """
 
+import functools
+import hashlib
+import json
+import logging
+import os
 import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import rapidfuzz
 import yaml
 
+from ..extractor import mention_detector, rank_extractor
 from ..extractor.mention_detector import detect_mentions
 from ..extractor.rank_extractor import extract_ranked_list_pattern
-from ..storage.eval_db import init_eval_db_if_needed, store_eval_results
+from ..storage.eval_db import (
+    PERFORMANCE_METRIC_PREFIX,
+    get_cached_eval_results,
+    init_eval_db_if_needed,
+    store_eval_results,
+)
+from ..utils.stats import percentile
+from . import metrics, performance, schema
 from .metrics import (
     compute_completeness_metrics,
     compute_mention_metrics,
     compute_rank_metrics,
 )
-from .schema import EvalResult, EvalTestCase
+from .performance import (
+    DEFAULT_TIMING_ITERATIONS,
+    EXTRACTION_P95_METRIC,
+    measure_extraction_performance,
+)
+from .schema import EvalMetricScore, EvalPerformanceMetric, EvalResult, EvalTestCase
+
+logger = logging.getLogger(__name__)
 
 # Evaluation quality thresholds
 # These define the minimum acceptable quality levels for different metrics
@@ -54,6 +86,67 @@ FALSE_IS_MINE_VIOLATIONS_THRESHOLD = (
 # Overall evaluation thresholds
 MINIMUM_PASS_RATE = 0.75  # 75% - At least 75% of test cases must pass overall
 
+# Extraction performance thresholds (upper bounds, in milliseconds)
+# Applied to the 95th percentile across test cases of each case's p95 timing
+EXTRACTION_P95_MS_THRESHOLD = 50.0  # detect_mentions + rank extraction per answer
+
+PERFORMANCE_THRESHOLDS_MS = {
+    EXTRACTION_P95_METRIC: EXTRACTION_P95_MS_THRESHOLD,
+}
+
+# Test cases handed to a worker process per task (upper bound)
+MAX_CASES_PER_TASK = 64
+
+
+@functools.cache
+def extractor_code_version() -> str:
+    """
+    Fingerprint the code that produces evaluation results.
+
+    Hashes the source of the extraction modules and the evaluation
+    metrics/schema/runner, plus the rapidfuzz version. Any edit to these
+    modules changes every case hash, so stored results are never reused
+    across code changes.
+
+    Returns:
+        Hex SHA256 of the extraction and evaluation code
+    """
+    digest = hashlib.sha256()
+    for module in (
+        mention_detector,
+        rank_extractor,
+        metrics,
+        performance,
+        schema,
+        sys.modules[__name__],
+    ):
+        digest.update(module.__name__.encode("utf-8"))
+        digest.update(Path(module.__file__).read_bytes())
+    digest.update(rapidfuzz.__version__.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def compute_case_hash(test_case: EvalTestCase, code_version: str | None = None) -> str:
+    """
+    Compute the cache key of a test case.
+
+    Args:
+        test_case: The test case
+        code_version: Extractor code version (default: extractor_code_version())
+
+    Returns:
+        Hex SHA256 of the test case content and code version
+    """
+    payload = json.dumps(
+        {
+            "case": test_case.model_dump(),
+            "code_version": code_version or extractor_code_version(),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 def load_test_cases(fixtures_path: str | Path) -> list[EvalTestCase]:
     """
@@ -94,12 +187,15 @@ def load_test_cases(fixtures_path: str | Path) -> list[EvalTestCase]:
 
 def evaluate_single_test_case(
     test_case: EvalTestCase,
+    timing_iterations: int = 0,
 ) -> EvalResult:
     """
     Evaluate a single test case using the extraction functions.
 
     Args:
         test_case: The test case to evaluate
+        timing_iterations: Timed extraction iterations for performance
+            metrics (0 = skip performance measurement)
 
     Returns:
         EvalResult containing all computed metrics for this test case
@@ -141,13 +237,132 @@ def evaluate_single_test_case(
     critical_metrics = [m for m in all_metrics if m.name in critical_metric_names]
     overall_passed = all(m.passed for m in critical_metrics)
 
+    perf_metrics = []
+    if timing_iterations > 0:
+        perf_metrics = _measure_performance(test_case, timing_iterations)
+
     return EvalResult(
         test_description=test_case.description,
         metrics=all_metrics,
         overall_passed=overall_passed,
+        performance=perf_metrics,
+    )
+
+
+def _measure_performance(
+    test_case: EvalTestCase, timing_iterations: int
+) -> list[EvalPerformanceMetric]:
+    """Time the extractors on a test case and apply the latency thresholds."""
+    perf_metrics = measure_extraction_performance(test_case, timing_iterations)
+    for perf_metric in perf_metrics:
+        limit = PERFORMANCE_THRESHOLDS_MS.get(perf_metric.name)
+        if limit is not None:
+            perf_metric.passed = perf_metric.value <= limit
+    return perf_metrics
+
+
+def _failed_result(test_case: EvalTestCase) -> EvalResult:
+    """Result for a test case whose evaluation raised."""
+    # Note: In a real implementation, you might want to include the error
+    # information in the result, but the current schema doesn't support it
+    return EvalResult(
+        test_description=test_case.description,
+        metrics=[],
+        overall_passed=False,
     )
 
 
+def _evaluate_case(test_case: EvalTestCase, timing_iterations: int = 0) -> EvalResult:
+    """
+    Evaluate a test case, turning exceptions into a failed result.
+
+    Module-level so it can be sent to worker processes.
+    """
+    try:
+        return evaluate_single_test_case(test_case, timing_iterations)
+    except Exception:
+        return _failed_result(test_case)
+
+
+def _load_cached_results(
+    cache_db_path: str | Path, case_hashes: list[str]
+) -> dict[str, EvalResult]:
+    """
+    Load stored results for case hashes from the eval database.
+
+    Returns an empty mapping if the database does not exist or cannot be read
+    (e.g. it predates case hashes); the cache is an optimization only.
+    """
+    if not Path(cache_db_path).exists():
+        return {}
+
+    try:
+        with sqlite3.connect(f"file:{cache_db_path}?mode=ro", uri=True) as conn:
+            rows = get_cached_eval_results(conn, case_hashes)
+    except sqlite3.Error as e:
+        logger.warning(f"Eval result cache unavailable ({cache_db_path}): {e}")
+        return {}
+
+    cached = {}
+    for case_hash, row in rows.items():
+        scores = []
+        perf_metrics = []
+        for metric in row["metrics"]:
+            if metric["name"].startswith(PERFORMANCE_METRIC_PREFIX):
+                details = dict(metric["details"] or {})
+                unit = details.pop("unit", "ms")
+                perf_metrics.append(
+                    EvalPerformanceMetric(**{**metric, "details": details or None}, unit=unit)
+                )
+            else:
+                scores.append(EvalMetricScore(**metric))
+        cached[case_hash] = EvalResult(
+            test_description=row["test_description"],
+            metrics=scores,
+            overall_passed=row["overall_passed"],
+            performance=perf_metrics,
+            case_hash=case_hash,
+        )
+    return cached
+
+
+def _evaluate_cases(
+    test_cases: list[EvalTestCase], workers: int, timing_iterations: int = 0
+) -> list[EvalResult]:
+    """
+    Evaluate test cases, on a process pool when workers > 1, in input order.
+
+    Pool workers compute the quality metrics only. Performance metrics are
+    timed afterwards in this process, one case at a time, so the latency gate
+    never sees timings taken while workers compete for CPU.
+    """
+    if workers <= 1 or len(test_cases) <= 1:
+        return [
+            _evaluate_case(test_case, timing_iterations) for test_case in test_cases
+        ]
+
+    workers = min(workers, len(test_cases))
+    # Several cases per task amortize pickling; ~4 tasks per worker balance load
+    chunksize = max(1, min(MAX_CASES_PER_TASK, len(test_cases) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in input order regardless of completion order
+        results = list(
+            executor.map(_evaluate_case, test_cases, chunksize=chunksize)
+        )
+
+    if timing_iterations > 0:
+        for index, test_case in enumerate(test_cases):
+            if not results[index].metrics:
+                continue  # Evaluation already failed
+            try:
+                results[index].performance = _measure_performance(
+                    test_case, timing_iterations
+                )
+            except Exception:
+                results[index] = _failed_result(test_case)
+    return results
+
+
 def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
     """
     Check evaluation results against defined quality thresholds.
@@ -164,6 +379,9 @@ def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
         - 'passes_thresholds': bool - Whether evaluation meets all quality thresholds
         - 'pass_rate': float - Overall pass rate
         - 'threshold_violations': list[dict] - Details of metric failures
+        - 'performance_summary': dict - p95 across cases of each gated
+          performance metric with its threshold (latency regressions are
+          critical violations)
         - 'summary': dict - Summary statistics about threshold compliance
     """
     total_cases = len(results)
@@ -236,6 +454,41 @@ def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
                     }
                 )
 
+    # Check extraction latency (upper bounds) on the p95 across test cases
+    perf_values: dict[str, list[float]] = {}
+    for result in results:
+        for perf_metric in result.performance:
+            perf_values.setdefault(perf_metric.name, []).append(perf_metric.value)
+
+    performance_summary = {}
+    for metric_name, threshold in PERFORMANCE_THRESHOLDS_MS.items():
+        values = perf_values.get(metric_name)
+        if not values:
+            continue
+        p95_value = percentile(values, 95)
+        passes = p95_value <= threshold
+        gap = p95_value - threshold if not passes else 0.0
+        performance_summary[metric_name] = {
+            "p95": p95_value,
+            "max": max(values),
+            "threshold": threshold,
+            "passes": passes,
+            "gap": gap,
+            "gap_percent": gap / threshold * 100,
+        }
+        if not passes:
+            threshold_violations.append(
+                {
+                    "metric": metric_name,
+                    "average": p95_value,
+                    "threshold": threshold,
+                    "gap": gap,
+                    "gap_percent": gap / threshold * 100,
+                    "severity": "critical",
+                    "direction": "above",
+                }
+            )
+
     # Check for critical failures (any critical metric below threshold)
     critical_violations = [
         v for v in threshold_violations if v.get("severity") == "critical"
@@ -252,6 +505,7 @@ def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
         "critical_violations": len(critical_violations),
         "metric_summary": metric_summary,
         "average_scores": average_scores,
+        "performance_summary": performance_summary,
         "summary": {
             "overall_status": "PASS" if passes_thresholds else "FAIL",
             "pass_rate_threshold": MINIMUM_PASS_RATE,
@@ -268,6 +522,9 @@ def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
 
 def run_eval_suite(
     fixtures_path: str | Path,
+    workers: int = 1,
+    cache_db_path: str | Path | None = None,
+    timing_iterations: int = DEFAULT_TIMING_ITERATIONS,
 ) -> dict[str, Any]:
     """
     Run the complete evaluation suite on all test cases.
@@ -278,33 +535,68 @@ def run_eval_suite(
 
     Args:
         fixtures_path: Path to YAML file containing test cases
+        workers: Worker processes for evaluation (1 = in-process, 0 = one per CPU)
+        cache_db_path: Eval database to reuse stored results from; cases whose
+            hash (test case + extractor code version) has stored results are
+            not re-evaluated. None disables the cache.
+        timing_iterations: Timed extraction iterations per test case for
+            performance metrics (0 = skip performance measurement)
 
     Returns:
         Dictionary containing:
-        - 'results': List of EvalResult objects for each test case
-        - 'summary': Overall statistics (pass rate, average scores, etc.)
+        - 'results': List of EvalResult objects for each test case (fixture order)
+        - 'summary': Overall statistics (pass rate, average scores, cache hit
+          rate, wall time, etc.)
         - 'total_test_cases': Number of test cases evaluated
         - 'total_passed': Number of test cases that passed overall
+
+    Raises:
+        ValueError: If workers or timing_iterations is negative
     """
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got: {workers}")
+    if timing_iterations < 0:
+        raise ValueError(f"timing_iterations must be >= 0, got: {timing_iterations}")
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    started = time.perf_counter()
+
     # Load test cases
     test_cases = load_test_cases(fixtures_path)
+    code_version = extractor_code_version()
+    case_hashes = [compute_case_hash(case, code_version) for case in test_cases]
+
+    cached: dict[str, EvalResult] = {}
+    if cache_db_path is not None:
+        cached = _load_cached_results(cache_db_path, case_hashes)
+        if timing_iterations > 0:
+            # Results stored without timings cannot feed the latency gate
+            cached = {h: r for h, r in cached.items() if r.performance}
+
+    # Evaluate cases without stored results
+    pending = [
+        (index, test_case)
+        for index, (test_case, case_hash) in enumerate(
+            zip(test_cases, case_hashes, strict=True)
+        )
+        if case_hash not in cached
+    ]
+    evaluated = _evaluate_cases(
+        [test_case for _, test_case in pending], workers, timing_iterations
+    )
 
-    # Evaluate each test case
-    results = []
-    for test_case in test_cases:
-        try:
-            result = evaluate_single_test_case(test_case)
-            results.append(result)
-        except Exception as e:
-            # Create a failure result for test cases that throw exceptions
-            failure_result = EvalResult(
-                test_description=test_case.description,
-                metrics=[],
-                overall_passed=False,
-            )
-            # Note: In a real implementation, you might want to include the error
-            # information in the result, but the current schema doesn't support it
-            results.append(failure_result)
+    results = [cached.get(case_hash) for case_hash in case_hashes]
+    for (index, _), result in zip(pending, evaluated, strict=True):
+        result.case_hash = case_hashes[index]
+        results[index] = result
+
+    cache_hits = len(test_cases) - len(pending)
+    wall_time_seconds = time.perf_counter() - started
+    logger.info(
+        f"Evaluated {len(pending)} test cases ({cache_hits} reused from cache) "
+        f"with {workers} worker(s) in {wall_time_seconds:.2f}s"
+    )
 
     # Compute summary statistics
     total_test_cases = len(results)
@@ -333,6 +625,12 @@ def run_eval_suite(
         "total_test_cases": total_test_cases,
         "total_passed": total_passed,
         "total_failed": total_test_cases - total_passed,
+        "cache_hits": cache_hits,
+        "cache_hit_rate": cache_hits / total_test_cases if total_test_cases > 0 else 0.0,
+        "workers": workers,
+        "timing_iterations": timing_iterations,
+        "wall_time_seconds": wall_time_seconds,
+        "code_version": code_version,
     }
 
     # Check results against quality thresholds
@@ -4,6 +4,7 @@ Pydantic schema models for the evaluation framework.
 This module defines the core data structures used throughout the evaluation system:
 - EvalTestCase: A single test case with input and expected output
 - EvalMetricScore: A single metric with score and pass/fail status
+- EvalPerformanceMetric: A latency or allocation measurement of the extractors
 - EvalResult: Complete result for a test case with all metrics
 """
 
@@ -110,6 +111,28 @@ class EvalMetricScore(BaseModel):
         return v.strip()
 
 
+class EvalPerformanceMetric(BaseModel):
+    """
+    A single extraction performance measurement.
+
+    Unlike EvalMetricScore this is not a 0.0-1.0 score: values are latencies
+    or allocation sizes, where lower is better. Suite-level thresholds are
+    applied in check_evaluation_thresholds().
+    """
+
+    name: str = Field(
+        ..., description="Name of the metric (e.g., 'perf_extraction_p95_ms')"
+    )
+    value: float = Field(..., ge=0.0, description="Measured value in `unit`")
+    unit: str = Field(..., description="Unit of the value ('ms' or 'KiB')")
+    passed: bool = Field(
+        True, description="Whether the value is within its per-case threshold"
+    )
+    details: dict[str, Any] | None = Field(
+        None, description="Additional details (iterations, min/max timings)"
+    )
+
+
 class EvalResult(BaseModel):
     """
     Complete evaluation result for a single test case.
@@ -127,6 +150,14 @@ class EvalResult(BaseModel):
     overall_passed: bool = Field(
         ..., description="Whether the test case passed overall"
     )
+    performance: list[EvalPerformanceMetric] = Field(
+        default_factory=list,
+        description="Extraction latency and allocation measurements",
+    )
+    case_hash: str | None = Field(
+        None,
+        description="Hash of the test case and extractor code (used to reuse results)",
+    )
 
     @field_validator("test_description")
     @classmethod
@@ -19,7 +19,8 @@ Exception Hierarchy:
     │   ├── LLMAuthenticationError
     │   ├── LLMRateLimitError
     │   ├── LLMTimeoutError
-    │   └── LLMResponseError
+    │   ├── LLMResponseError
+    │   └── LLMCircuitOpenError
     ├── BudgetExceededError
     ├── ExtractionError
     │   ├── MentionDetectionError
@@ -227,6 +228,21 @@ class LLMResponseError(LLMProviderError):
     pass
 
 
+class LLMCircuitOpenError(LLMProviderError):
+    """
+    Request refused because the model's circuit breaker is open.
+
+    Raised without calling the provider, after recent requests to the model
+    failed at a high rate and no usable fallback model is configured.
+    This error should NOT be retried until the breaker closes.
+
+    Example:
+        raise LLMCircuitOpenError("Circuit open for openai/gpt-4o, failing fast")
+    """
+
+    pass
+
+
 # ============================================================================
 # Budget Errors
 # ============================================================================
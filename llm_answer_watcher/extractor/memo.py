@@ -0,0 +1,367 @@
+"""
+Memoized extraction results for identical answers.
+
+Identical answers are common: deterministic models, cached provider
+responses, and repeated runs of the same config all return byte-identical
+text. Re-running mention detection, rank extraction, and especially paid
+function-calling extraction on them wastes time and money. ExtractionMemo
+stores extraction results keyed by:
+
+- SHA256 of the answer text
+- A fingerprint of the Brands configuration (mine + competitors)
+- A fingerprint of the extraction settings (method, model, flags; never the API key)
+
+Because brands and settings are part of the key, editing the brand list or
+switching extraction models automatically stops old entries from matching.
+Stale entries are then aged out by LRU eviction (and `db maintain`).
+
+Two tiers:
+- In-memory LRU (OrderedDict) shared by all queries in a run
+- Optional SQLite extraction_cache table shared across runs
+
+Example:
+    >>> memo = ExtractionMemo(max_memory_entries=1024, db_path="./output/watcher.db")
+    >>> result = await parse_answer(..., memo=memo)
+    >>> memo.stats()
+    {'hits': 3, 'misses': 7, 'cost_saved_usd': 0.00042}
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from ..config.schema import Brands, ExtractionCacheConfig, RuntimeExtractionSettings
+from ..storage.db import (
+    lookup_extraction_cache,
+    prune_extraction_cache,
+    store_extraction_cache,
+)
+from ..utils.time import utc_now
+from .mention_detector import BrandMention
+from .rank_extractor import RankedBrand
+
+if TYPE_CHECKING:
+    from .parser import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction logic changes in a way that invalidates stored results
+MEMO_VERSION = 1
+
+# Persisted entries are pruned to max_db_entries after this many stores
+PRUNE_INTERVAL = 64
+
+# ExtractionResult fields that depend on the call, not on the answer text
+_CALL_METADATA_FIELDS = ("intent_id", "model_provider", "model_name", "timestamp_utc")
+
+
+@dataclass(frozen=True)
+class MemoKey:
+    """
+    Components of an extraction memo key.
+
+    Attributes:
+        answer_hash: SHA256 of the answer text
+        brands_fingerprint: SHA256 of the Brands configuration
+        settings_fingerprint: SHA256 of the extraction settings
+    """
+
+    answer_hash: str
+    brands_fingerprint: str
+    settings_fingerprint: str
+
+    @property
+    def digest(self) -> str:
+        """Combined key used for lookups."""
+        combined = f"{self.answer_hash}:{self.brands_fingerprint}:{self.settings_fingerprint}"
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+def _sha256_json(data: object) -> str:
+    """SHA256 of canonical JSON (sorted keys, no whitespace)."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def brands_fingerprint(brands: Brands) -> str:
+    """
+    Fingerprint a Brands configuration.
+
+    Order is preserved (not sorted) because detection and ranking receive the
+    lists as configured.
+
+    Args:
+        brands: Brand configuration
+
+    Returns:
+        Hex SHA256 of the brand lists
+    """
+    return _sha256_json(brands.model_dump())
+
+
+def settings_fingerprint(
+    extraction_settings: RuntimeExtractionSettings | None,
+    use_llm_extraction: bool = False,
+) -> str:
+    """
+    Fingerprint the settings that influence extraction output.
+
+    The extraction model's API key is excluded so keys are never hashed into
+    stored data and rotating a key does not invalidate the cache.
+
+    Args:
+        extraction_settings: Extraction settings (None = regex extraction)
+        use_llm_extraction: Whether LLM-assisted rank extraction is enabled
+
+    Returns:
+        Hex SHA256 of the relevant settings
+    """
+    settings = None
+    if extraction_settings is not None:
+        settings = extraction_settings.model_dump(exclude={"extraction_model": {"api_key"}})
+    return _sha256_json(
+        {
+            "memo_version": MEMO_VERSION,
+            "settings": settings,
+            "use_llm_extraction": use_llm_extraction,
+        }
+    )
+
+
+def compute_memo_key(
+    answer_text: str,
+    brands: Brands,
+    extraction_settings: RuntimeExtractionSettings | None = None,
+    use_llm_extraction: bool = False,
+) -> MemoKey:
+    """
+    Compute the memo key for an extraction.
+
+    Args:
+        answer_text: Raw LLM answer text
+        brands: Brand configuration
+        extraction_settings: Extraction settings (None = regex extraction)
+        use_llm_extraction: Whether LLM-assisted rank extraction is enabled
+
+    Returns:
+        MemoKey identifying this extraction
+
+    Example:
+        >>> key = compute_memo_key("1. Warmly 2. HubSpot", brands)
+        >>> len(key.digest)
+        64
+    """
+    return MemoKey(
+        answer_hash=hashlib.sha256(answer_text.encode("utf-8")).hexdigest(),
+        brands_fingerprint=brands_fingerprint(brands),
+        settings_fingerprint=settings_fingerprint(extraction_settings, use_llm_extraction),
+    )
+
+
+def _to_payload(result: "ExtractionResult") -> dict:
+    """Serialize the answer-dependent part of an ExtractionResult."""
+    payload = result.to_dict()
+    for name in (*_CALL_METADATA_FIELDS, "from_cache", "extraction_cost_saved_usd"):
+        payload.pop(name, None)
+    return payload
+
+
+def _from_payload(payload: dict) -> "ExtractionResult":
+    """Rebuild an ExtractionResult (with empty call metadata) from a payload."""
+    from .parser import ExtractionResult
+
+    data = dict(payload)
+    data["my_mentions"] = [BrandMention(**m) for m in data["my_mentions"]]
+    data["competitor_mentions"] = [BrandMention(**m) for m in data["competitor_mentions"]]
+    data["ranked_list"] = [RankedBrand(**r) for r in data["ranked_list"]]
+    return ExtractionResult(**dict.fromkeys(_CALL_METADATA_FIELDS, ""), **data)
+
+
+class ExtractionMemo:
+    """
+    Two-tier (memory + SQLite) store of extraction results.
+
+    Attributes:
+        max_memory_entries: LRU size of the in-process tier
+        db_path: SQLite database for the persistent tier (None = memory only)
+        max_db_entries: LRU cap for persisted entries (None = unbounded)
+        ttl_days: Ignore persisted entries older than this (None = no expiry)
+        hits: Number of lookups served from the memo
+        misses: Number of lookups not found
+        cost_saved_usd: Sum of original extraction costs for all hits
+
+    Example:
+        >>> memo = ExtractionMemo(max_memory_entries=2)
+        >>> key = compute_memo_key(answer_text, brands)
+        >>> memo.put(key, result)
+        >>> cached, saved = memo.get(key)
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 1024,
+        db_path: str | None = None,
+        max_db_entries: int | None = None,
+        ttl_days: int | None = None,
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.db_path = db_path
+        self.max_db_entries = max_db_entries
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self.misses = 0
+        self.cost_saved_usd = 0.0
+        self._memory: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._stores_since_prune = 0
+
+    @classmethod
+    def from_config(cls, config: ExtractionCacheConfig, db_path: str) -> "ExtractionMemo":
+        """
+        Build a memo from run_settings.extraction_cache.
+
+        Args:
+            config: Extraction cache configuration
+            db_path: SQLite database path (used when config.persist is True)
+
+        Returns:
+            Configured ExtractionMemo
+        """
+        return cls(
+            max_memory_entries=config.max_memory_entries,
+            db_path=db_path if config.persist else None,
+            max_db_entries=config.max_db_entries,
+            ttl_days=config.ttl_days,
+        )
+
+    def get(self, key: MemoKey) -> tuple["ExtractionResult", float] | None:
+        """
+        Look up a memoized extraction result.
+
+        Args:
+            key: Memo key from compute_memo_key()
+
+        Returns:
+            (ExtractionResult, cost_saved_usd) on hit, None on miss. The result
+            has empty call metadata (intent_id, provider, model, timestamp);
+            callers fill these in for the current query.
+        """
+        digest = key.digest
+        entry = self._memory.get(digest)
+
+        if entry is not None:
+            self._memory.move_to_end(digest)
+        elif self.db_path is not None:
+            entry = self._load(digest)
+            if entry is not None:
+                self._remember(digest, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        payload, cost = entry
+        self.hits += 1
+        self.cost_saved_usd += cost
+        return _from_payload(payload), cost
+
+    def put(self, key: MemoKey, result: "ExtractionResult") -> None:
+        """
+        Memoize an extraction result.
+
+        Args:
+            key: Memo key from compute_memo_key()
+            result: Fresh (non-cached) extraction result
+        """
+        digest = key.digest
+        entry = (_to_payload(result), result.extraction_cost_usd)
+        self._remember(digest, entry)
+
+        if self.db_path is None:
+            return
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                store_extraction_cache(
+                    conn=conn,
+                    memo_key=digest,
+                    answer_hash=key.answer_hash,
+                    brands_fingerprint=key.brands_fingerprint,
+                    settings_fingerprint=key.settings_fingerprint,
+                    result_json=json.dumps(entry[0]),
+                    extraction_cost_usd=entry[1],
+                )
+                self._stores_since_prune += 1
+                if self.max_db_entries and self._stores_since_prune >= PRUNE_INTERVAL:
+                    prune_extraction_cache(conn, self.max_db_entries)
+                    self._stores_since_prune = 0
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist extraction memo entry: {e}")
+
+    def prune(self) -> int:
+        """
+        Apply max_db_entries to the persistent tier now.
+
+        Returns:
+            Number of persisted entries evicted
+        """
+        if self.db_path is None or not self.max_db_entries:
+            return 0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                deleted = prune_extraction_cache(conn, self.max_db_entries)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to prune extraction cache: {e}")
+            return 0
+        self._stores_since_prune = 0
+        return deleted
+
+    def stats(self, since: dict | None = None) -> dict:
+        """
+        Return hit/miss counters and total extraction cost saved.
+
+        Args:
+            since: Earlier stats() snapshot; if given, counters are reported
+                relative to it (used when one memo is shared across runs)
+
+        Returns:
+            Dict with hits, misses, and cost_saved_usd
+        """
+        baseline = since or {}
+        return {
+            "hits": self.hits - baseline.get("hits", 0),
+            "misses": self.misses - baseline.get("misses", 0),
+            "cost_saved_usd": round(self.cost_saved_usd - baseline.get("cost_saved_usd", 0.0), 6),
+        }
+
+    def _remember(self, digest: str, entry: tuple[dict, float]) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        self._memory[digest] = entry
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, digest: str) -> tuple[dict, float] | None:
+        """Load an entry from SQLite, honoring ttl_days."""
+        min_cached_at = None
+        if self.ttl_days is not None:
+            cutoff = utc_now() - timedelta(days=self.ttl_days)
+            min_cached_at = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = lookup_extraction_cache(conn, digest, min_cached_at=min_cached_at)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Extraction memo lookup failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row["result_json"]), row["extraction_cost_usd"] or 0.0
@@ -24,15 +24,19 @@ Performance:
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rapidfuzz import fuzz
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrandMention:
     """
     Represents a detected brand mention in answer text.
 
+    Immutable and slotted: runs hold many of these, and extraction results
+    (including their mentions) are shared through the extraction memo.
+
     Attributes:
         original_text: How the brand appeared in the answer (preserves case)
         normalized_name: Canonical brand name (primary alias, first in list)
@@ -65,11 +69,28 @@ class BrandMention:
                 f"match_type must be 'exact' or 'fuzzy', got: {self.match_type}"
             )
 
-
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "original_text": self.original_text,
+            "normalized_name": self.normalized_name,
+            "brand_category": self.brand_category,
+            "match_position": self.match_position,
+            "match_type": self.match_type,
+            "fuzzy_score": self.fuzzy_score,
+            "sentiment": self.sentiment,
+            "mention_context": self.mention_context,
+        }
+
+
+@lru_cache(maxsize=4096)
 def create_brand_pattern(alias: str) -> re.Pattern:
     """
     Create word-boundary regex pattern for brand alias matching.
 
+    Patterns are cached by alias, so brand matchers are compiled once per
+    process and stay warm across answers and (in `serve` mode) across runs.
+
     CRITICAL: Uses word boundaries to prevent false positives.
     - "HubSpot" matches in "I use HubSpot daily"
     - "hub" does NOT match in "GitHub"
@@ -36,9 +36,10 @@ Example:
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from ..config.schema import Brands, RuntimeExtractionSettings
+from .memo import ExtractionMemo, compute_memo_key
 from .mention_detector import BrandMention, detect_mentions
 from .rank_extractor import (
     RankedBrand,
@@ -49,13 +50,14 @@ from .rank_extractor import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractionResult:
     """
     Complete extraction result from LLM answer parsing.
 
     Contains all extracted signals: metadata, brand mentions, and rankings.
-    Used for database storage and JSON artifact generation.
+    Used for database storage and JSON artifact generation (via to_dict()).
+    Immutable: derive variants with dataclasses.replace().
 
     Attributes:
         intent_id: Intent query identifier from config
@@ -68,7 +70,9 @@ class ExtractionResult:
         ranked_list: Extracted ranked brands (if ranking structure detected)
         rank_extraction_method: Method used ("pattern", "llm", "function_calling", "regex_fallback")
         rank_confidence: Overall confidence in ranking (0.0-1.0)
-        extraction_cost_usd: Cost of extraction in USD (0.0 for regex)
+        extraction_cost_usd: Cost of extraction in USD (0.0 for regex and cache hits)
+        from_cache: True if the result was served from an ExtractionMemo
+        extraction_cost_saved_usd: Original extraction cost avoided by a cache hit
     """
 
     intent_id: str
@@ -82,6 +86,8 @@ class ExtractionResult:
     rank_extraction_method: str
     rank_confidence: float
     extraction_cost_usd: float = 0.0
+    from_cache: bool = False
+    extraction_cost_saved_usd: float = 0.0
 
     def __post_init__(self):
         """Validate rank_extraction_method."""
@@ -98,6 +104,30 @@ class ExtractionResult:
                 f"got: {self.rank_extraction_method}"
             )
 
+    def to_dict(self) -> dict:
+        """
+        Convert to the parsed answer JSON structure.
+
+        Unlike dataclasses.asdict(), this does not deep-copy: nested mentions
+        and rankings are converted with their own to_dict() and scalar fields
+        are used as-is.
+        """
+        return {
+            "intent_id": self.intent_id,
+            "model_provider": self.model_provider,
+            "model_name": self.model_name,
+            "timestamp_utc": self.timestamp_utc,
+            "appeared_mine": self.appeared_mine,
+            "my_mentions": [m.to_dict() for m in self.my_mentions],
+            "competitor_mentions": [m.to_dict() for m in self.competitor_mentions],
+            "ranked_list": [r.to_dict() for r in self.ranked_list],
+            "rank_extraction_method": self.rank_extraction_method,
+            "rank_confidence": self.rank_confidence,
+            "extraction_cost_usd": self.extraction_cost_usd,
+            "from_cache": self.from_cache,
+            "extraction_cost_saved_usd": self.extraction_cost_saved_usd,
+        }
+
 
 async def parse_answer(
     answer_text: str,
@@ -109,6 +139,8 @@ async def parse_answer(
     use_llm_extraction: bool = False,
     llm_client: object | None = None,
     extraction_settings: RuntimeExtractionSettings | None = None,
+    *,
+    memo: ExtractionMemo | None = None,
 ) -> ExtractionResult:
     """
     Parse LLM answer and extract all signals (async).
@@ -120,6 +152,8 @@ async def parse_answer(
     LLM clients which are async.
 
     Processing pipeline (with function calling):
+    0. If memo provided and the same answer was already extracted with the
+       same brands and settings, return the memoized result (no API call)
     1. If extraction_settings provided and method=function_calling:
        - Call extraction model with function calling
        - Get structured brand mentions with ranks
@@ -139,6 +173,7 @@ async def parse_answer(
         use_llm_extraction: If True, use LLM-assisted rank extraction (default: False)
         llm_client: LLM client for LLM-assisted extraction (required if use_llm_extraction=True)
         extraction_settings: Optional extraction settings (enables function calling)
+        memo: Optional ExtractionMemo for reusing results of identical answers
 
     Returns:
         ExtractionResult with all extracted signals and metadata
@@ -172,6 +207,30 @@ async def parse_answer(
     if use_llm_extraction and llm_client is None:
         raise ValueError("llm_client required when use_llm_extraction=True")
 
+    # Serve identical answers from the memo (brands/settings are part of the key)
+    memo_key = None
+    if memo is not None:
+        memo_key = compute_memo_key(
+            answer_text, brands, extraction_settings, use_llm_extraction
+        )
+        cached = memo.get(memo_key)
+        if cached is not None:
+            cached_result, cost_saved = cached
+            logger.info(
+                f"Extraction memo HIT for {intent_id} ({provider}/{model_name}), "
+                f"saved=${cost_saved:.6f}"
+            )
+            return replace(
+                cached_result,
+                intent_id=intent_id,
+                model_provider=provider,
+                model_name=model_name,
+                timestamp_utc=timestamp_utc,
+                extraction_cost_usd=0.0,
+                from_cache=True,
+                extraction_cost_saved_usd=cost_saved,
+            )
+
     # Check if function calling is enabled
     use_function_calling = (
         extraction_settings is not None
@@ -269,6 +328,8 @@ async def parse_answer(
             ):
                 logger.info(f"Falling back to regex extraction for {intent_id}")
                 use_function_calling = False
+                # Don't memoize a fallback caused by a transient API error
+                memo_key = None
             else:
                 raise
 
@@ -311,7 +372,7 @@ async def parse_answer(
             rank_method = "pattern"
 
     # Step 5: Build ExtractionResult
-    return ExtractionResult(
+    result = ExtractionResult(
         intent_id=intent_id,
         model_provider=provider,
         model_name=model_name,
@@ -324,3 +385,8 @@ async def parse_answer(
         rank_confidence=rank_confidence,
         extraction_cost_usd=extraction_cost,
     )
+
+    if memo is not None and memo_key is not None:
+        memo.put(memo_key, result)
+
+    return result
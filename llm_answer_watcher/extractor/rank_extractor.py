@@ -49,11 +49,13 @@ from .mention_detector import create_brand_pattern
 FUZZY_THRESHOLD = 0.8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RankedBrand:
     """
     Represents a brand in a ranked list with position and confidence.
 
+    Immutable and slotted, like BrandMention.
+
     Attributes:
         brand_name: Canonical brand name (from known_brands)
         rank_position: Position in ranked list (1 = top/first, 2 = second, etc.)
@@ -73,6 +75,14 @@ class RankedBrand:
                 f"confidence must be in range [0.0, 1.0], got: {self.confidence}"
             )
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "brand_name": self.brand_name,
+            "rank_position": self.rank_position,
+            "confidence": self.confidence,
+        }
+
 
 def extract_ranked_list_pattern(
     text: str, known_brands: list[str]
@@ -7,8 +7,9 @@ This module provides the complete runner infrastructure including:
 - Plugin registry system
 - Built-in plugins (API, Steel ChatGPT, Steel Perplexity)
 
-The module automatically registers all built-in plugins on import, making them
-available via the RunnerRegistry.
+Built-in plugins are registered on the first RunnerRegistry lookup rather than
+on import, so importing this package does not load the Steel SDK. The plugin
+classes themselves are importable from here and load their modules on access.
 
 Example:
     >>> from llm_answer_watcher.llm_runner import RunnerRegistry
@@ -27,18 +28,27 @@ Example:
     >>> result = runner.run_intent("What are the best CRM tools?")
 """
 
+import importlib
+
 # Core protocols and models
 from .intent_runner import IntentResult, IntentRunner
 from .models import LLMClient, LLMResponse, build_client
 from .plugin_registry import RunnerPlugin, RunnerRegistry
 
-# Import plugins to trigger auto-registration
-# API plugin
-from .api_runner import APIRunnerPlugin
+# Plugin class -> defining module, imported on first attribute access
+_PLUGIN_EXPORTS = {
+    "APIRunnerPlugin": ".api_runner",
+    "SteelChatGPTPlugin": ".browser.steel_chatgpt",
+    "SteelPerplexityPlugin": ".browser.steel_perplexity",
+}
+
+
+def __getattr__(name: str):
+    if name in _PLUGIN_EXPORTS:
+        module = importlib.import_module(_PLUGIN_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Browser plugins
-from .browser.steel_chatgpt import SteelChatGPTPlugin
-from .browser.steel_perplexity import SteelPerplexityPlugin
 
 __all__ = [
     # Protocols
@@ -27,10 +27,10 @@ from typing import Any
 
 import httpx
 
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
@@ -243,7 +243,7 @@ class AnthropicClient:
 
         # Make async HTTP request with context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     ANTHROPIC_API_URL,
                     json=payload,
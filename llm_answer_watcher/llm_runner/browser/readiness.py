@@ -0,0 +1,240 @@
+"""
+Readiness polling for browser runners.
+
+Browser runners used to sleep for fixed intervals (5s for a page load, 2s
+between "still generating?" checks, 5s before scraping), so every query sat
+idle for 10s+ even when the page was ready in one second, and answers still
+streaming after the last check were cut off. This module replaces the
+sleeps with polling:
+
+    - wait_until() polls a condition with exponential backoff until it
+      returns a truthy value or the step's timeout passes
+    - wait_for_stable_text() polls the answer text until it is non-empty,
+      nothing reports the page as busy, and the last `stable_polls` polls
+      returned the same text
+    - PhaseTimer records how long each phase of an intent took; timed()
+      blocks and the waits above record themselves under their step name in
+      the active timer, and the result ends up in IntentResult.phase_timings
+
+Example:
+    >>> with PhaseTimer() as timer:
+    ...     with timed("navigate"):
+    ...         element = wait_until(lambda: page.query_selector("textarea"), 10, step="input")
+    ...     text = wait_for_stable_text(read_answer, 60, busy=is_generating)
+    >>> timer.timings
+    {'input': 0.412, 'navigate': 0.518, 'answer': 7.93}
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+_active_timer: ContextVar["PhaseTimer | None"] = ContextVar("phase_timer", default=None)
+
+
+class ReadinessTimeoutError(TimeoutError):
+    """
+    A readiness step did not complete within its timeout.
+
+    Attributes:
+        step: Name of the step that timed out
+        timeout: Step timeout in seconds
+        last_value: Last value the condition returned (e.g. partial answer text)
+    """
+
+    def __init__(self, step: str, timeout: float, last_value: object = None):
+        super().__init__(f"Timed out after {timeout:.1f}s waiting for {step}")
+        self.step = step
+        self.timeout = timeout
+        self.last_value = last_value
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """
+    Exponential poll intervals.
+
+    Attributes:
+        initial: First interval in seconds
+        factor: Growth per poll
+        maximum: Interval cap in seconds
+    """
+
+    initial: float = 0.1
+    factor: float = 2.0
+    maximum: float = 2.0
+
+    def intervals(self) -> Iterator[float]:
+        """Yield initial, initial*factor, ... capped at maximum (endless)."""
+        interval = self.initial
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.maximum)
+
+
+@dataclass
+class PhaseTimer:
+    """
+    Seconds spent in each phase of one intent.
+
+    Entering the timer makes it the active timer for the current context, so
+    timed() blocks, wait_until() and wait_for_stable_text() record their
+    step times in it. Steps can nest (a "navigate" phase includes its
+    "page_load" and "input" waits).
+
+    Attributes:
+        timings: Phase name -> seconds (repeated phases accumulate)
+    """
+
+    timings: dict[str, float] = field(default_factory=dict)
+    _token: object = field(default=None, repr=False)
+
+    def __enter__(self) -> "PhaseTimer":
+        self._token = _active_timer.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_timer.reset(self._token)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase."""
+        self.timings[phase] = round(self.timings.get(phase, 0.0) + seconds, 3)
+
+
+def _record(step: str, seconds: float) -> None:
+    timer = _active_timer.get()
+    if timer is not None:
+        timer.record(step, seconds)
+
+
+@contextmanager
+def timed(step: str) -> Iterator[None]:
+    """Record the enclosed block's duration in the active PhaseTimer (even if it raises)."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _record(step, time.monotonic() - started)
+
+
+def wait_until[T](
+    condition: Callable[[], T],
+    timeout: float,
+    *,
+    step: str,
+    backoff: Backoff = Backoff(),
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> T:
+    """
+    Poll `condition` until it returns a truthy value.
+
+    Exceptions raised by the condition count as "not ready yet" (pages
+    raise while they are navigating).
+
+    Args:
+        condition: Returns a truthy value once ready
+        timeout: Seconds before giving up
+        step: Step name for errors and phase timings
+        backoff: Poll intervals
+        sleep: Sleep function (injectable for tests)
+        clock: Monotonic clock (injectable for tests)
+
+    Returns:
+        The condition's first truthy value
+
+    Raises:
+        ReadinessTimeoutError: If the condition is not met within timeout
+    """
+    started = clock()
+    deadline = started + timeout
+    intervals = backoff.intervals()
+    value = None
+    try:
+        while True:
+            try:
+                value = condition()
+            except Exception as e:
+                logger.debug(f"Readiness check for {step} raised: {e}")
+                value = None
+            if value:
+                return value
+            now = clock()
+            if now >= deadline:
+                raise ReadinessTimeoutError(step, timeout, value)
+            sleep(min(next(intervals), deadline - now))
+    finally:
+        _record(step, clock() - started)
+
+
+def wait_for_stable_text(
+    read: Callable[[], str | None],
+    timeout: float,
+    *,
+    step: str = "answer",
+    stable_polls: int = 3,
+    busy: Callable[[], bool] | None = None,
+    backoff: Backoff = Backoff(initial=0.25, maximum=2.0),
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> str:
+    """
+    Poll streaming text until it stops changing.
+
+    The text counts as complete once it is non-empty, `busy` (e.g. a
+    "Stop generating" button is visible) returns False, and the last
+    `stable_polls` polls returned the same text. The poll interval restarts
+    from backoff.initial whenever the text changes, so a stream that is
+    still growing is sampled quickly.
+
+    Args:
+        read: Returns the current text (None or "" while nothing is there)
+        timeout: Seconds before giving up
+        step: Step name for errors and phase timings
+        stable_polls: Consecutive identical reads required (>= 1)
+        busy: Optional check that the page is still producing the text
+        backoff: Poll intervals
+        sleep: Sleep function (injectable for tests)
+        clock: Monotonic clock (injectable for tests)
+
+    Returns:
+        The stable text
+
+    Raises:
+        ReadinessTimeoutError: If the text did not settle within timeout;
+            last_value holds the latest text (possibly partial)
+    """
+    started = clock()
+    deadline = started + timeout
+    intervals = backoff.intervals()
+    last: str | None = None
+    unchanged = 0
+    try:
+        while True:
+            try:
+                text = read() or None
+                still_busy = busy() if busy is not None else False
+            except Exception as e:
+                logger.debug(f"Readiness check for {step} raised: {e}")
+                text, still_busy = last, True
+
+            if text is not None and text == last:
+                unchanged += 1
+            else:
+                unchanged = 0
+                intervals = backoff.intervals()
+            last = text
+
+            if text and not still_busy and unchanged + 1 >= stable_polls:
+                return text
+            now = clock()
+            if now >= deadline:
+                raise ReadinessTimeoutError(step, timeout, last)
+            sleep(min(next(intervals), deadline - now))
+    finally:
+        _record(step, clock() - started)
@@ -0,0 +1,292 @@
+"""
+Pool of warm Steel browser sessions shared across intents.
+
+Creating a Steel session and loading ChatGPT or Perplexity into it is the
+slowest part of a browser intent. With a pool, a runner keeps up to
+`size` sessions alive and hands one out per intent:
+
+    1. acquire() returns an idle session after checking it is still live,
+       or creates a new one while fewer than `size` exist (otherwise it
+       waits for a session to be returned)
+    2. release() resets the session for the next prompt and puts it back,
+       unless it has reached max_age_seconds or max_errors, its reset
+       failed, or the pool is closed, in which case it is released at Steel
+    3. close() releases every idle session; leased sessions are released
+       when they come back
+
+The pool only talks to Steel through the callables it is given, so it works
+against any Steel-compatible API (including a local fake in tests).
+
+Example:
+    >>> pool = SteelSessionPool(
+    ...     create=runner._create_session,
+    ...     release=runner._release_session,
+    ...     check=runner._check_session,
+    ...     reset=runner._reset_session,
+    ...     size=2,
+    ... )
+    >>> with pool.session() as session:
+    ...     runner._navigate_and_submit(session, prompt)
+    >>> pool.close()
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Reasons a session is taken out of the pool
+RECYCLE_AGE = "max_age"
+RECYCLE_ERRORS = "max_errors"
+RECYCLE_UNHEALTHY = "unhealthy"
+RECYCLE_RESET_FAILED = "reset_failed"
+RECYCLE_CLOSED = "closed"
+
+
+@dataclass
+class PooledSession:
+    """
+    A Steel session owned by the pool.
+
+    Attributes:
+        session: Session data from SteelBaseRunner._create_session()
+        created_at: Pool clock reading when the session was created
+        uses: Prompts run in this session
+        errors: Prompts that failed in this session
+    """
+
+    session: dict
+    created_at: float
+    uses: int = 0
+    errors: int = 0
+
+    @property
+    def session_id(self) -> str:
+        """Steel session ID."""
+        return self.session["id"]
+
+
+class SteelSessionPool:
+    """
+    Thread-safe pool of warm Steel sessions.
+
+    Attributes:
+        size: Maximum number of sessions alive at once
+        max_age_seconds: Sessions older than this are recycled on return
+        max_errors: Sessions with this many failed prompts are recycled
+        created: Sessions created
+        reused: Acquires served by an existing session
+        recycled: Sessions released at Steel, by reason
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], dict],
+        release: Callable[[str], None],
+        check: Callable[[dict], bool],
+        reset: Callable[[dict], bool],
+        *,
+        size: int,
+        max_age_seconds: float = 600.0,
+        max_errors: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty pool (sessions are created on first use or warm()).
+
+        Args:
+            create: Creates a Steel session and returns its data
+            release: Releases a Steel session by ID
+            check: Returns True if a session is still usable
+            reset: Prepares a session for the next prompt; False if it failed
+            size: Maximum number of sessions alive at once (>= 1)
+            max_age_seconds: Recycle sessions older than this
+            max_errors: Recycle sessions after this many failed prompts
+            clock: Monotonic clock (injectable for tests)
+        """
+        if size < 1:
+            raise ValueError(f"Session pool size must be at least 1, got: {size}")
+        self.size = size
+        self.max_age_seconds = max_age_seconds
+        self.max_errors = max_errors
+        self.created = 0
+        self.reused = 0
+        self.recycled: Counter[str] = Counter()
+        self._create = create
+        self._release = release
+        self._check = check
+        self._reset = reset
+        self._clock = clock
+        self._idle: deque[PooledSession] = deque()
+        self._leased = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def warm(self) -> int:
+        """
+        Create sessions until the pool holds `size` of them.
+
+        Returns:
+            Number of sessions created
+        """
+        created = 0
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + self._leased >= self.size:
+                    return created
+                self._leased += 1
+            pooled = self._new_or_free_slot()
+            self._put_back(pooled)
+            created += 1
+
+    def acquire(self) -> PooledSession:
+        """
+        Take a live session, creating one if the pool has room.
+
+        Blocks while all `size` sessions are leased.
+
+        Raises:
+            RuntimeError: If the pool is closed
+            Exception: Whatever session creation raised
+        """
+        while True:
+            with self._cond:
+                while not self._closed and not self._idle and self._leased >= self.size:
+                    self._cond.wait()
+                if self._closed:
+                    raise RuntimeError("Steel session pool is closed")
+                pooled = self._idle.popleft() if self._idle else None
+                self._leased += 1
+
+            if pooled is None:
+                return self._new_or_free_slot()
+
+            if self._clock() - pooled.created_at >= self.max_age_seconds:
+                self._discard(pooled, RECYCLE_AGE)
+                continue
+            if not self._is_healthy(pooled):
+                self._discard(pooled, RECYCLE_UNHEALTHY)
+                continue
+            self.reused += 1
+            return pooled
+
+    def release(self, pooled: PooledSession, failed: bool = False) -> None:
+        """
+        Return a session after a prompt, recycling it if it is worn out.
+
+        Args:
+            pooled: Session from acquire()
+            failed: True if the prompt failed in this session
+        """
+        pooled.uses += 1
+        if failed:
+            pooled.errors += 1
+
+        if self._closed:
+            reason = RECYCLE_CLOSED
+        elif pooled.errors >= self.max_errors:
+            reason = RECYCLE_ERRORS
+        elif self._clock() - pooled.created_at >= self.max_age_seconds:
+            reason = RECYCLE_AGE
+        elif not self._reset_ok(pooled):
+            reason = RECYCLE_RESET_FAILED
+        else:
+            reason = None
+
+        if reason is not None:
+            self._discard(pooled, reason)
+        else:
+            self._put_back(pooled)
+
+    @contextmanager
+    def session(self) -> Iterator[dict]:
+        """
+        Lease a session for one prompt.
+
+        The session counts as failed if the block raises.
+
+        Yields:
+            Session data (same shape as SteelBaseRunner._create_session())
+        """
+        pooled = self.acquire()
+        failed = True
+        try:
+            yield pooled.session
+            failed = False
+        finally:
+            self.release(pooled, failed=failed)
+
+    def close(self) -> None:
+        """Release idle sessions and stop handing out new ones."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._leased += len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled, RECYCLE_CLOSED)
+
+    def stats(self) -> dict:
+        """Pool counters for logging."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "leased": self._leased,
+                "created": self.created,
+                "reused": self.reused,
+                "recycled": dict(self.recycled),
+            }
+
+    def _new_or_free_slot(self) -> PooledSession:
+        """Create a session for a slot already counted in _leased."""
+        try:
+            session = self._create()
+        except Exception:
+            with self._cond:
+                self._leased -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.created += 1
+        logger.debug(f"Steel session pool created session {session['id']}")
+        return PooledSession(session=session, created_at=self._clock())
+
+    def _put_back(self, pooled: PooledSession) -> None:
+        with self._cond:
+            self._leased -= 1
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    def _discard(self, pooled: PooledSession, reason: str) -> None:
+        """Release a leased session at Steel and free its slot."""
+        logger.info(
+            f"Recycling Steel session {pooled.session_id} ({reason}, "
+            f"uses={pooled.uses}, errors={pooled.errors})"
+        )
+        # _release logs and swallows its own errors
+        self._release(pooled.session_id)
+        with self._cond:
+            self.recycled[reason] += 1
+            self._leased -= 1
+            self._cond.notify()
+
+    def _is_healthy(self, pooled: PooledSession) -> bool:
+        try:
+            return self._check(pooled.session)
+        except Exception as e:
+            logger.warning(f"Health check failed for Steel session {pooled.session_id}: {e}")
+            return False
+
+    def _reset_ok(self, pooled: PooledSession) -> bool:
+        try:
+            return self._reset(pooled.session)
+        except Exception as e:
+            logger.warning(f"Failed to reset Steel session {pooled.session_id}: {e}")
+            return False
@@ -7,6 +7,8 @@ including session management, navigation, screenshot capture, and HTML extractio
 Key components:
 - SteelConfig: Configuration dataclass for Steel API settings
 - SteelBaseRunner: Base class with common Steel operations
+- SteelSessionPool (session_pool.py): Warm sessions shared across intents
+- BlobStore (storage/blobs.py): Deduplicated, asynchronous artifact writes
 
 Architecture:
     The base class handles Steel API interactions (session creation, cleanup,
@@ -31,6 +33,8 @@ Example:
 import base64
 import logging
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -39,7 +43,10 @@ try:
 except ImportError:
     Steel = None
 
+from ...storage.blobs import SCREENSHOT_FORMATS, BlobStore
 from ...utils.time import utc_timestamp
+from .readiness import ReadinessTimeoutError, timed, wait_for_stable_text, wait_until
+from .session_pool import SteelSessionPool
 
 logger = logging.getLogger(__name__)
 
@@ -53,25 +60,80 @@ class SteelConfig:
         steel_api_key: Steel API key for authentication
         target_url: Starting URL for browser session
         session_timeout: Maximum session duration in seconds (default: 300)
-        wait_for_response_timeout: Max wait for response in seconds (default: 60)
+        wait_for_response_timeout: Max wait for the answer to finish streaming
+            in seconds (default: 60)
+        page_load_timeout: Max wait for the target page to load (default: 15)
+        input_timeout: Max wait for the prompt input to appear (default: 10)
+        response_start_timeout: Max wait for the answer to start (default: 15)
+        stable_polls: Identical answer polls that mark the answer complete
+            (default: 3)
         take_screenshots: Whether to capture screenshots (default: True)
         save_html_snapshot: Whether to save HTML snapshots (default: True)
         session_reuse: Whether to reuse sessions (default: True)
         solver: CAPTCHA solver service (default: "capsolver")
         proxy: Optional proxy configuration (default: None)
         output_dir: Directory for saving screenshots/HTML (default: "./output")
+        base_url: Steel API base URL (default: None = Steel SDK default)
+        session_pool_size: Warm sessions kept for reuse across intents
+            (default: 0 = create a session per intent)
+        session_max_age_seconds: Recycle pooled sessions older than this
+            (default: 600)
+        session_max_errors: Recycle pooled sessions after this many failed
+            prompts (default: 3)
+        artifact_blobs: Store screenshots and HTML in the content-addressed
+            blob store under output_dir/blobs (default: True); False keeps
+            the per-intent files written synchronously
+        screenshot_format: "png" (as captured) or "webp" (default: "png")
+        screenshot_max_width: Downscale wider screenshots to this width
+            (default: None = keep)
     """
 
     steel_api_key: str
     target_url: str
     session_timeout: int = 300
     wait_for_response_timeout: int = 60
+    page_load_timeout: float = 15.0
+    input_timeout: float = 10.0
+    response_start_timeout: float = 15.0
+    stable_polls: int = 3
     take_screenshots: bool = True
     save_html_snapshot: bool = True
     session_reuse: bool = True
     solver: str = "capsolver"
     proxy: str | None = None
     output_dir: str = "./output"
+    base_url: str | None = None
+    session_pool_size: int = 0
+    session_max_age_seconds: float = 600.0
+    session_max_errors: int = 3
+    artifact_blobs: bool = True
+    screenshot_format: str = "png"
+    screenshot_max_width: int | None = None
+
+
+def validate_steel_options(config: dict) -> str:
+    """
+    Validate runner options shared by all Steel plugins.
+
+    Args:
+        config: Runner configuration dictionary
+
+    Returns:
+        Error message, or "" if the options are valid
+    """
+    pool_size = config.get("session_pool_size", 0)
+    if not isinstance(pool_size, int) or pool_size < 0:
+        return "session_pool_size must be a non-negative integer"
+    if config.get("session_max_errors", 3) < 1:
+        return "session_max_errors must be at least 1"
+    if config.get("session_max_age_seconds", 600) <= 0:
+        return "session_max_age_seconds must be positive"
+    if config.get("screenshot_format", "png") not in SCREENSHOT_FORMATS:
+        return f"screenshot_format must be one of {SCREENSHOT_FORMATS}"
+    max_width = config.get("screenshot_max_width")
+    if max_width is not None and (not isinstance(max_width, int) or max_width < 1):
+        return "screenshot_max_width must be a positive integer"
+    return ""
 
 
 class SteelBaseRunner:
@@ -93,6 +155,9 @@ class SteelBaseRunner:
         config: Steel configuration
         steel_api_url: Steel API base URL
         session_id: Current browser session ID (if active)
+        session_pool: Warm session pool (None when session_pool_size is 0)
+        blob_store: Artifact blob store (None when artifact_blobs is off or
+            no artifacts are captured)
         _client: HTTP client for Steel API calls
 
     Example:
@@ -122,7 +187,8 @@ class SteelBaseRunner:
             config: Steel configuration
 
         Raises:
-            ImportError: If steel-sdk is not installed
+            ImportError: If steel-sdk is not installed, or screenshot
+                conversion is configured without Pillow
         """
         if Steel is None:
             raise ImportError(
@@ -131,8 +197,26 @@ class SteelBaseRunner:
 
         self.config = config
         self.session_id: str | None = None
-        self._steel_client = Steel(steel_api_key=config.steel_api_key)
+        self._steel_client = Steel(steel_api_key=config.steel_api_key, base_url=config.base_url)
         self._current_session = None
+        self.session_pool: SteelSessionPool | None = None
+        if config.session_pool_size > 0:
+            self.session_pool = SteelSessionPool(
+                create=self._create_session,
+                release=self._release_session,
+                check=self._check_session,
+                reset=self._reset_session,
+                size=config.session_pool_size,
+                max_age_seconds=config.session_max_age_seconds,
+                max_errors=config.session_max_errors,
+            )
+        self.blob_store: BlobStore | None = None
+        if config.artifact_blobs and (config.take_screenshots or config.save_html_snapshot):
+            self.blob_store = BlobStore(
+                config.output_dir,
+                screenshot_format=config.screenshot_format,
+                screenshot_max_width=config.screenshot_max_width,
+            )
 
     @property
     def runner_type(self) -> str:
@@ -217,6 +301,180 @@ class SteelBaseRunner:
         except Exception as e:
             logger.warning(f"Failed to release session {session_id}: {e}")
 
+    @contextmanager
+    def _session(self) -> Iterator[dict]:
+        """
+        Provide a browser session for one prompt.
+
+        With a session pool, a warm session is leased and returned afterwards
+        (counted as failed if the block raises). Otherwise a new session is
+        created and released afterwards unless session_reuse is set. Getting
+        the session is timed as the "session" phase.
+
+        Yields:
+            dict: Session data (see _create_session)
+        """
+        if self.session_pool is not None:
+            with timed("session"):
+                pooled = self.session_pool.acquire()
+            failed = True
+            try:
+                yield pooled.session
+                failed = False
+            finally:
+                self.session_pool.release(pooled, failed=failed)
+            return
+
+        with timed("session"):
+            session = self._create_session()
+        self.session_id = session["id"]
+        try:
+            yield session
+        finally:
+            if not self.config.session_reuse:
+                self._release_session(session["id"])
+
+    def _check_session(self, session: dict) -> bool:
+        """
+        Check that a pooled session is still live at Steel.
+
+        Args:
+            session: Steel session data
+
+        Returns:
+            bool: True if Steel reports the session as live
+        """
+        session_obj = self._steel_client.sessions.retrieve(session["id"])
+        return getattr(session_obj, "status", None) == "live"
+
+    def _reset_session(self, session: dict) -> bool:
+        """
+        Prepare a pooled session for the next prompt.
+
+        Closes extra tabs and loads target_url in the remaining one, so the
+        next prompt starts in a fresh conversation on an already loaded page.
+        Sessions without a CDP URL (or without Playwright installed) are
+        left as they are.
+
+        Args:
+            session: Steel session data
+
+        Returns:
+            bool: False if the reset failed and the session should be recycled
+        """
+        session_obj = self._steel_client.sessions.retrieve(session["id"])
+        ws_url = getattr(session_obj, "websocket_url", None) or getattr(
+            session_obj, "cdp_url", None
+        )
+        if not ws_url:
+            return True
+
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            return True
+
+        try:
+            with sync_playwright() as p:
+                browser = p.chromium.connect_over_cdp(ws_url)
+                context = browser.contexts[0] if browser.contexts else browser.new_context()
+                pages = context.pages or [context.new_page()]
+                for extra in pages[1:]:
+                    extra.close()
+                pages[0].goto(self.config.target_url)
+                pages[0].wait_for_load_state("domcontentloaded")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset session {session['id']}: {e}")
+            return False
+
+    def _wait_for_session_live(self, session: dict) -> None:
+        """
+        Wait until Steel reports the session live (used when there is no CDP URL).
+
+        Args:
+            session: Steel session data
+
+        Raises:
+            ReadinessTimeoutError: If the session is not live within page_load_timeout
+        """
+        wait_until(
+            lambda: self._check_session(session),
+            self.config.page_load_timeout,
+            step="page_load",
+        )
+
+    @staticmethod
+    def _first_element(page, selectors: list[str]):
+        """
+        First element matching any of the selectors (in order), or None.
+
+        Args:
+            page: Playwright page
+            selectors: CSS selectors to try
+
+        Returns:
+            Playwright element handle, or None if nothing matches yet
+        """
+        for selector in selectors:
+            element = page.query_selector(selector)
+            if element:
+                return element
+        return None
+
+    def _wait_for_answer_text(self, read, busy=None) -> str | None:
+        """
+        Wait for streamed answer text to settle.
+
+        Args:
+            read: Returns the current answer text
+            busy: Optional check that the page is still generating
+
+        Returns:
+            str | None: Stable text, or the latest (possibly partial) text if
+                wait_for_response_timeout passed first
+        """
+        try:
+            return wait_for_stable_text(
+                read,
+                self.config.wait_for_response_timeout,
+                stable_polls=self.config.stable_polls,
+                busy=busy,
+            )
+        except ReadinessTimeoutError as e:
+            logger.warning(f"{e}; using the latest answer text")
+            return e.last_value
+
+    def _scrape_stable_content(self, session_id: str) -> str | None:
+        """
+        Scrape page markdown once it stops changing between scrapes.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            str | None: Scraped markdown, or None if nothing could be scraped
+        """
+        try:
+            return wait_for_stable_text(
+                lambda: self._scrape_page_content(session_id, format="markdown"),
+                self.config.wait_for_response_timeout,
+                step="scrape",
+                stable_polls=self.config.stable_polls,
+            )
+        except ReadinessTimeoutError as e:
+            logger.warning(f"{e}; using the latest scraped content")
+            return e.last_value
+
+    def close(self) -> None:
+        """Release pooled sessions and wait for pending artifact writes."""
+        if self.session_pool is not None:
+            logger.info(f"Closing Steel session pool: {self.session_pool.stats()}")
+            self.session_pool.close()
+        if self.blob_store is not None:
+            logger.debug(f"Closing artifact blob store: {self.blob_store.stats()}")
+            self.blob_store.close()
+
     def _take_screenshot(self, session_id: str, intent_id: str) -> str | None:
         """
         Capture screenshot using Steel SDK screenshot API.
@@ -230,6 +488,8 @@ class SteelBaseRunner:
 
         Note:
             Uses Steel's screenshot API which captures the current page state.
+            With the blob store the returned path is the screenshot's blob,
+            which may still be being written (see close()).
         """
         if not self.config.take_screenshots:
             return None
@@ -266,6 +526,11 @@ class SteelBaseRunner:
                 logger.warning(f"Unexpected screenshot data type: {type(screenshot_data)}")
                 return None
 
+            if self.blob_store is not None:
+                blob_path = self.blob_store.put_screenshot(image_bytes)
+                logger.info(f"Queued screenshot blob: {blob_path}")
+                return blob_path
+
             # Save screenshot
             output_dir = Path(self.config.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -289,7 +554,8 @@ class SteelBaseRunner:
             intent_id: Intent identifier (for filename)
 
         Returns:
-            str | None: Path to saved HTML file, or None if save failed
+            str | None: Path to saved HTML file (a compressed blob when the
+                blob store is enabled), or None if save failed
         """
         if not self.config.save_html_snapshot:
             return None
@@ -313,6 +579,11 @@ class SteelBaseRunner:
                 logger.warning("Scrape response missing HTML content")
                 return None
 
+            if self.blob_store is not None:
+                blob_path = self.blob_store.put_html(str(html_content))
+                logger.info(f"Queued HTML snapshot blob: {blob_path}")
+                return blob_path
+
             # Save HTML
             output_dir = Path(self.config.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -421,6 +692,7 @@ class SteelBaseRunner:
     def __del__(self):
         """Cleanup: release any active sessions."""
         try:
+            self.close()
             if self.session_id and self._current_session:
                 logger.debug(f"Cleanup: Releasing session {self.session_id}")
                 self._steel_client.sessions.release(self.session_id)
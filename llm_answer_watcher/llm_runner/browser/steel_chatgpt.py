@@ -31,10 +31,29 @@ import time
 
 from ..intent_runner import IntentResult
 from ..plugin_registry import RunnerRegistry
-from .steel_base import SteelBaseRunner, SteelConfig
+from .readiness import PhaseTimer, ReadinessTimeoutError, timed, wait_until
+from .steel_base import SteelBaseRunner, SteelConfig, validate_steel_options
 
 logger = logging.getLogger(__name__)
 
+# Prompt input, newest ChatGPT markup first
+INPUT_SELECTORS = [
+    'textarea[placeholder*="Message"]',
+    'textarea[id*="prompt"]',
+    "textarea",
+    "#prompt-textarea",
+]
+
+# Last assistant message
+RESPONSE_SELECTORS = [
+    '[data-message-author-role="assistant"]:last-of-type',
+    ".markdown:last-of-type",
+    '[data-testid*="conversation-turn"]:last-child',
+]
+
+# Visible while ChatGPT is still streaming
+STOP_BUTTON = 'button:has-text("Stop generating")'
+
 
 class SteelChatGPTRunner(SteelBaseRunner):
     """
@@ -85,52 +104,58 @@ class SteelChatGPTRunner(SteelBaseRunner):
             ...     print(f"Error: {result.error_message}")
         """
         start_time = time.time()
+        timer = PhaseTimer()
 
         try:
-            # Create Steel browser session
-            session = self._create_session()
-            self.session_id = session["id"]
-
-            logger.info(f"ChatGPT session created: {self.session_id}")
-
-            # Navigate to ChatGPT and submit prompt
-            self._navigate_and_submit(session, prompt)
-
-            # Wait for response completion
-            answer_text = self._extract_answer(session)
-
-            # Extract web search results if present (future enhancement)
-            web_search_results = self._extract_web_sources(session)
-            web_search_count = len(web_search_results) if web_search_results else 0
-
-            # Take screenshot if enabled
-            screenshot_path = self._take_screenshot(self.session_id, "chatgpt")
-
-            # Save HTML snapshot if enabled
-            html_snapshot_path = self._save_html(self.session_id, "chatgpt")
-
-            # Estimate cost (placeholder for now)
-            cost_usd = self._estimate_cost(session, start_time)
-
-            # Import timestamp utility
-            from ...utils.time import utc_timestamp
-
-            return IntentResult(
-                answer_text=answer_text,
-                runner_type="browser",
-                runner_name="steel-chatgpt",
-                provider="chatgpt-web",
-                model_name="chatgpt-unknown",  # Can't determine model from UI
-                timestamp_utc=utc_timestamp(),
-                cost_usd=cost_usd,
-                tokens_used=0,  # Browser-based, no token tracking
-                screenshot_path=screenshot_path,
-                html_snapshot_path=html_snapshot_path,
-                session_id=self.session_id,
-                web_search_results=web_search_results,
-                web_search_count=web_search_count,
-                success=True,
-            )
+            # Lease a pooled session (or create one for this intent)
+            with timer, self._session() as session:
+                session_id = session["id"]
+
+                logger.info(f"ChatGPT session ready: {session_id}")
+
+                # Navigate to ChatGPT and submit prompt
+                with timed("navigate"):
+                    self._navigate_and_submit(session, prompt)
+
+                # Wait for response completion
+                with timed("extract"):
+                    answer_text = self._extract_answer(session)
+
+                # Extract web search results if present (future enhancement)
+                with timed("sources"):
+                    web_search_results = self._extract_web_sources(session)
+                web_search_count = len(web_search_results) if web_search_results else 0
+
+                with timed("artifacts"):
+                    # Take screenshot if enabled
+                    screenshot_path = self._take_screenshot(session_id, "chatgpt")
+
+                    # Save HTML snapshot if enabled
+                    html_snapshot_path = self._save_html(session_id, "chatgpt")
+
+                # Estimate cost (placeholder for now)
+                cost_usd = self._estimate_cost(session, start_time)
+
+                # Import timestamp utility
+                from ...utils.time import utc_timestamp
+
+                return IntentResult(
+                    answer_text=answer_text,
+                    runner_type="browser",
+                    runner_name="steel-chatgpt",
+                    provider="chatgpt-web",
+                    model_name="chatgpt-unknown",  # Can't determine model from UI
+                    timestamp_utc=utc_timestamp(),
+                    cost_usd=cost_usd,
+                    tokens_used=0,  # Browser-based, no token tracking
+                    screenshot_path=screenshot_path,
+                    html_snapshot_path=html_snapshot_path,
+                    session_id=session_id,
+                    web_search_results=web_search_results,
+                    web_search_count=web_search_count,
+                    phase_timings=timer.timings,
+                    success=True,
+                )
 
         except Exception as e:
             logger.error(f"ChatGPT runner failed: {e}", exc_info=True)
@@ -145,15 +170,11 @@ class SteelChatGPTRunner(SteelBaseRunner):
                 model_name="chatgpt-unknown",
                 timestamp_utc=utc_timestamp(),
                 cost_usd=0.0,
+                phase_timings=timer.timings or None,
                 success=False,
                 error_message=str(e),
             )
 
-        finally:
-            # Cleanup: release session if not reusing
-            if self.session_id and not self.config.session_reuse:
-                self._release_session(self.session_id)
-
     def _navigate_and_submit(self, session: dict, prompt: str) -> None:
         """
         Navigate to ChatGPT and submit prompt using Playwright.
@@ -181,7 +202,7 @@ class SteelChatGPTRunner(SteelBaseRunner):
 
             if not ws_url:
                 logger.warning("No websocket URL available, falling back to simple navigation")
-                time.sleep(5)  # Wait for page to load
+                self._wait_for_session_live(session)
                 return
 
             logger.info(f"Connecting to Steel session via websocket: {ws_url}")
@@ -192,37 +213,29 @@ class SteelChatGPTRunner(SteelBaseRunner):
                 context = browser.contexts[0] if browser.contexts else browser.new_context()
                 page = context.pages[0] if context.pages else context.new_page()
 
-                # Navigate to target URL
-                logger.info(f"Navigating to {self.config.target_url}")
-                page.goto(self.config.target_url)
+                # Navigate to target URL (a reset pooled session is already there)
+                if page.url.rstrip("/") != self.config.target_url.rstrip("/"):
+                    logger.info(f"Navigating to {self.config.target_url}")
+                    page.goto(self.config.target_url)
 
                 # Wait for page to be ready
-                page.wait_for_load_state("domcontentloaded")
+                page.wait_for_load_state(
+                    "domcontentloaded", timeout=self.config.page_load_timeout * 1000
+                )
                 logger.debug("ChatGPT page loaded")
 
                 # Find and fill the message textarea
                 logger.info(f"Submitting prompt to ChatGPT: {prompt[:50]}...")
 
-                # Try multiple selectors for ChatGPT input
-                selectors = [
-                    'textarea[placeholder*="Message"]',
-                    'textarea[id*="prompt"]',
-                    'textarea',
-                    '#prompt-textarea',
-                ]
-
-                text_area = None
-                for selector in selectors:
-                    try:
-                        text_area = page.wait_for_selector(selector, timeout=5000)
-                        if text_area:
-                            logger.debug(f"Found input using selector: {selector}")
-                            break
-                    except Exception:
-                        continue
-
-                if not text_area:
-                    raise RuntimeError("Could not find ChatGPT message input field")
+                # Poll for any of the known ChatGPT input selectors
+                try:
+                    text_area = wait_until(
+                        lambda: self._first_element(page, INPUT_SELECTORS),
+                        self.config.input_timeout,
+                        step="input",
+                    )
+                except ReadinessTimeoutError as e:
+                    raise RuntimeError("Could not find ChatGPT message input field") from e
 
                 # Type the prompt
                 text_area.fill(prompt)
@@ -233,17 +246,24 @@ class SteelChatGPTRunner(SteelBaseRunner):
                 text_area.press("Enter")
                 logger.debug("Submitted prompt with Enter key")
 
-                # Wait for response to start (look for assistant message)
+                # Wait for response to start (assistant message or stop button)
                 logger.debug("Waiting for ChatGPT response to start...")
-                page.wait_for_timeout(2000)  # Initial delay for response to start
+                try:
+                    wait_until(
+                        lambda: self._first_element(page, RESPONSE_SELECTORS + [STOP_BUTTON]),
+                        self.config.response_start_timeout,
+                        step="response_start",
+                    )
+                except ReadinessTimeoutError as e:
+                    # Extraction still polls for the answer (and falls back to scraping)
+                    logger.warning(str(e))
 
                 logger.info("Prompt submitted successfully")
 
         except Exception as e:
             logger.error(f"Failed to navigate and submit: {e}", exc_info=True)
-            # Fallback: just wait and hope the session is navigated correctly
-            logger.warning("Falling back to simple wait")
-            time.sleep(5)
+            # Fallback: extraction polls the page (or scrape API) for an answer
+            logger.warning("Continuing to answer extraction")
 
     def _extract_answer(self, session: dict) -> str:
         """
@@ -262,10 +282,6 @@ class SteelChatGPTRunner(SteelBaseRunner):
 
         logger.debug(f"Waiting for ChatGPT response in session {session_id}")
 
-        # Wait for response to complete
-        timeout = self.config.wait_for_response_timeout
-        start_time = time.time()
-
         answer_text = None
 
         try:
@@ -285,39 +301,18 @@ class SteelChatGPTRunner(SteelBaseRunner):
                     context = browser.contexts[0] if browser.contexts else browser.new_context()
                     page = context.pages[0] if context.pages else context.new_page()
 
-                    # Wait for streaming to complete
-                    # Look for absence of "Stop generating" button or similar indicators
+                    # Poll the last assistant message until it stops growing
+                    # and the "Stop generating" button is gone
                     logger.debug("Waiting for response to complete...")
 
-                    while time.time() - start_time < timeout:
-                        # Check if still generating
-                        stop_button = page.query_selector('button:has-text("Stop generating")')
-                        if not stop_button:
-                            logger.debug("Response appears complete (no stop button)")
-                            break
-
-                        time.sleep(2)
+                    def read_answer() -> str | None:
+                        element = self._first_element(page, RESPONSE_SELECTORS)
+                        return element.inner_text() if element else None
 
-                    # Extract the last assistant message
-                    logger.debug("Extracting answer text")
-
-                    # Try multiple selectors for ChatGPT response
-                    response_selectors = [
-                        '[data-message-author-role="assistant"]:last-of-type',
-                        '.markdown:last-of-type',
-                        '[data-testid*="conversation-turn"]:last-child',
-                    ]
-
-                    for selector in response_selectors:
-                        try:
-                            element = page.query_selector(selector)
-                            if element:
-                                answer_text = element.inner_text()
-                                logger.debug(f"Found response using selector: {selector}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Selector {selector} failed: {e}")
-                            continue
+                    answer_text = self._wait_for_answer_text(
+                        read_answer,
+                        busy=lambda: page.query_selector(STOP_BUTTON) is not None,
+                    )
 
             else:
                 logger.warning("No websocket URL available for Playwright extraction")
@@ -330,11 +325,8 @@ class SteelChatGPTRunner(SteelBaseRunner):
             logger.info("Falling back to Steel scrape API for content extraction")
 
             try:
-                # Wait a bit more for content to stabilize
-                time.sleep(5)
-
-                # Use base class method to scrape page content
-                markdown_content = self._scrape_page_content(session_id, format="markdown")
+                # Scrape until the content stops changing between scrapes
+                markdown_content = self._scrape_stable_content(session_id)
 
                 if markdown_content:
                     answer_text = markdown_content
@@ -425,11 +417,22 @@ class SteelChatGPTPlugin:
         - target_url: ChatGPT URL (default: https://chat.openai.com)
         - session_timeout: Max session duration in seconds (default: 300)
         - wait_for_response_timeout: Max wait for response (default: 60)
+        - page_load_timeout: Max wait for the page to load (default: 15)
+        - input_timeout: Max wait for the prompt input (default: 10)
+        - response_start_timeout: Max wait for the answer to start (default: 15)
+        - stable_polls: Identical polls that mark the answer complete (default: 3)
         - take_screenshots: Capture screenshots (default: True)
         - save_html_snapshot: Save HTML snapshots (default: True)
         - session_reuse: Reuse sessions across intents (default: True)
         - solver: CAPTCHA solver (default: "capsolver")
         - proxy: Optional proxy config (default: None)
+        - base_url: Steel API base URL (default: Steel SDK default)
+        - session_pool_size: Warm sessions reused across intents (default: 0 = off)
+        - session_max_age_seconds: Recycle pooled sessions after this age (default: 600)
+        - session_max_errors: Recycle pooled sessions after this many errors (default: 3)
+        - artifact_blobs: Store artifacts in the deduplicating blob store (default: True)
+        - screenshot_format: "png" or "webp" (webp requires Pillow, default: "png")
+        - screenshot_max_width: Downscale wider screenshots (requires Pillow, default: None)
 
     Example:
         >>> config = {
@@ -467,12 +470,23 @@ class SteelChatGPTPlugin:
             target_url=config.get("target_url", "https://chat.openai.com"),
             session_timeout=config.get("session_timeout", 300),
             wait_for_response_timeout=config.get("wait_for_response_timeout", 60),
+            page_load_timeout=config.get("page_load_timeout", 15.0),
+            input_timeout=config.get("input_timeout", 10.0),
+            response_start_timeout=config.get("response_start_timeout", 15.0),
+            stable_polls=config.get("stable_polls", 3),
             take_screenshots=config.get("take_screenshots", True),
             save_html_snapshot=config.get("save_html_snapshot", True),
             session_reuse=config.get("session_reuse", True),
             solver=config.get("solver", "capsolver"),
             proxy=config.get("proxy"),
             output_dir=config.get("output_dir", "./output"),
+            base_url=config.get("base_url"),
+            session_pool_size=config.get("session_pool_size", 0),
+            session_max_age_seconds=config.get("session_max_age_seconds", 600),
+            session_max_errors=config.get("session_max_errors", 3),
+            artifact_blobs=config.get("artifact_blobs", True),
+            screenshot_format=config.get("screenshot_format", "png"),
+            screenshot_max_width=config.get("screenshot_max_width"),
         )
         return SteelChatGPTRunner(steel_config)
 
@@ -493,6 +507,10 @@ class SteelChatGPTPlugin:
         if not config["steel_api_key"] or config["steel_api_key"].isspace():
             return False, "steel_api_key cannot be empty"
 
+        option_error = validate_steel_options(config)
+        if option_error:
+            return False, option_error
+
         return True, ""
 
     @classmethod
@@ -31,10 +31,43 @@ import time
 
 from ..intent_runner import IntentResult
 from ..plugin_registry import RunnerRegistry
-from .steel_base import SteelBaseRunner, SteelConfig
+from .readiness import PhaseTimer, ReadinessTimeoutError, timed, wait_until
+from .steel_base import SteelBaseRunner, SteelConfig, validate_steel_options
 
 logger = logging.getLogger(__name__)
 
+# Search input
+INPUT_SELECTORS = [
+    'textarea[placeholder*="Ask"]',
+    'textarea[placeholder*="Search"]',
+    "textarea",
+    'input[type="text"]',
+]
+
+# Answer body
+ANSWER_SELECTORS = [
+    '[data-testid="answer"]',
+    ".prose",
+    '[class*="answer"]',
+    "article",
+]
+
+# Shown while Perplexity is still searching or writing
+LOADING_SELECTOR = '[data-testid*="loading"]'
+
+# Source citations
+SOURCE_SELECTORS = [
+    '[data-testid*="citation"]',
+    '[data-testid*="source"]',
+    "cite a",
+    ".citation a",
+    '[class*="source"] a',
+]
+
+# Sources usually render right after the answer; don't hold a finished
+# answer back for long if a page has none
+SOURCES_WAIT_SECONDS = 5.0
+
 
 class SteelPerplexityRunner(SteelBaseRunner):
     """
@@ -85,52 +118,58 @@ class SteelPerplexityRunner(SteelBaseRunner):
             ...     print(f"Error: {result.error_message}")
         """
         start_time = time.time()
+        timer = PhaseTimer()
 
         try:
-            # Create Steel browser session
-            session = self._create_session()
-            self.session_id = session["id"]
-
-            logger.info(f"Perplexity session created: {self.session_id}")
-
-            # Navigate to Perplexity and submit query
-            self._navigate_and_submit(session, prompt)
-
-            # Wait for response completion
-            answer_text = self._extract_answer(session)
-
-            # Extract web sources (always present in Perplexity)
-            web_search_results = self._extract_web_sources(session)
-            web_search_count = len(web_search_results) if web_search_results else 0
-
-            # Take screenshot if enabled
-            screenshot_path = self._take_screenshot(self.session_id, "perplexity")
-
-            # Save HTML snapshot if enabled
-            html_snapshot_path = self._save_html(self.session_id, "perplexity")
-
-            # Estimate cost (placeholder for now)
-            cost_usd = self._estimate_cost(session, start_time)
-
-            # Import timestamp utility
-            from ...utils.time import utc_timestamp
-
-            return IntentResult(
-                answer_text=answer_text,
-                runner_type="browser",
-                runner_name="steel-perplexity",
-                provider="perplexity-web",
-                model_name="perplexity-unknown",  # Can't determine model from UI
-                timestamp_utc=utc_timestamp(),
-                cost_usd=cost_usd,
-                tokens_used=0,  # Browser-based, no token tracking
-                screenshot_path=screenshot_path,
-                html_snapshot_path=html_snapshot_path,
-                session_id=self.session_id,
-                web_search_results=web_search_results,
-                web_search_count=web_search_count,
-                success=True,
-            )
+            # Lease a pooled session (or create one for this intent)
+            with timer, self._session() as session:
+                session_id = session["id"]
+
+                logger.info(f"Perplexity session ready: {session_id}")
+
+                # Navigate to Perplexity and submit query
+                with timed("navigate"):
+                    self._navigate_and_submit(session, prompt)
+
+                # Wait for response completion
+                with timed("extract"):
+                    answer_text = self._extract_answer(session)
+
+                # Extract web sources (always present in Perplexity)
+                with timed("sources"):
+                    web_search_results = self._extract_web_sources(session)
+                web_search_count = len(web_search_results) if web_search_results else 0
+
+                with timed("artifacts"):
+                    # Take screenshot if enabled
+                    screenshot_path = self._take_screenshot(session_id, "perplexity")
+
+                    # Save HTML snapshot if enabled
+                    html_snapshot_path = self._save_html(session_id, "perplexity")
+
+                # Estimate cost (placeholder for now)
+                cost_usd = self._estimate_cost(session, start_time)
+
+                # Import timestamp utility
+                from ...utils.time import utc_timestamp
+
+                return IntentResult(
+                    answer_text=answer_text,
+                    runner_type="browser",
+                    runner_name="steel-perplexity",
+                    provider="perplexity-web",
+                    model_name="perplexity-unknown",  # Can't determine model from UI
+                    timestamp_utc=utc_timestamp(),
+                    cost_usd=cost_usd,
+                    tokens_used=0,  # Browser-based, no token tracking
+                    screenshot_path=screenshot_path,
+                    html_snapshot_path=html_snapshot_path,
+                    session_id=session_id,
+                    web_search_results=web_search_results,
+                    web_search_count=web_search_count,
+                    phase_timings=timer.timings,
+                    success=True,
+                )
 
         except Exception as e:
             logger.error(f"Perplexity runner failed: {e}", exc_info=True)
@@ -145,15 +184,11 @@ class SteelPerplexityRunner(SteelBaseRunner):
                 model_name="perplexity-unknown",
                 timestamp_utc=utc_timestamp(),
                 cost_usd=0.0,
+                phase_timings=timer.timings or None,
                 success=False,
                 error_message=str(e),
             )
 
-        finally:
-            # Cleanup: release session if not reusing
-            if self.session_id and not self.config.session_reuse:
-                self._release_session(self.session_id)
-
     def _navigate_and_submit(self, session: dict, prompt: str) -> None:
         """
         Navigate to Perplexity and submit query using Playwright.
@@ -181,7 +216,7 @@ class SteelPerplexityRunner(SteelBaseRunner):
 
             if not ws_url:
                 logger.warning("No websocket URL available, falling back to simple navigation")
-                time.sleep(5)  # Wait for page to load
+                self._wait_for_session_live(session)
                 return
 
             logger.info(f"Connecting to Steel session via websocket: {ws_url}")
@@ -192,37 +227,29 @@ class SteelPerplexityRunner(SteelBaseRunner):
                 context = browser.contexts[0] if browser.contexts else browser.new_context()
                 page = context.pages[0] if context.pages else context.new_page()
 
-                # Navigate to target URL
-                logger.info(f"Navigating to {self.config.target_url}")
-                page.goto(self.config.target_url)
+                # Navigate to target URL (a reset pooled session is already there)
+                if page.url.rstrip("/") != self.config.target_url.rstrip("/"):
+                    logger.info(f"Navigating to {self.config.target_url}")
+                    page.goto(self.config.target_url)
 
                 # Wait for page to be ready
-                page.wait_for_load_state("domcontentloaded")
+                page.wait_for_load_state(
+                    "domcontentloaded", timeout=self.config.page_load_timeout * 1000
+                )
                 logger.debug("Perplexity page loaded")
 
                 # Find and fill the search textarea
                 logger.info(f"Submitting query to Perplexity: {prompt[:50]}...")
 
-                # Try multiple selectors for Perplexity search input
-                selectors = [
-                    'textarea[placeholder*="Ask"]',
-                    'textarea[placeholder*="Search"]',
-                    'textarea',
-                    'input[type="text"]',
-                ]
-
-                search_input = None
-                for selector in selectors:
-                    try:
-                        search_input = page.wait_for_selector(selector, timeout=5000)
-                        if search_input:
-                            logger.debug(f"Found input using selector: {selector}")
-                            break
-                    except Exception:
-                        continue
-
-                if not search_input:
-                    raise RuntimeError("Could not find Perplexity search input field")
+                # Poll for any of the known Perplexity input selectors
+                try:
+                    search_input = wait_until(
+                        lambda: self._first_element(page, INPUT_SELECTORS),
+                        self.config.input_timeout,
+                        step="input",
+                    )
+                except ReadinessTimeoutError as e:
+                    raise RuntimeError("Could not find Perplexity search input field") from e
 
                 # Type the query
                 search_input.fill(prompt)
@@ -232,17 +259,24 @@ class SteelPerplexityRunner(SteelBaseRunner):
                 search_input.press("Enter")
                 logger.debug("Submitted query with Enter key")
 
-                # Wait for search to start (page navigation or loading indicator)
+                # Wait for search to start (loading indicator or answer)
                 logger.debug("Waiting for Perplexity search to start...")
-                page.wait_for_timeout(2000)  # Initial delay for search to start
+                try:
+                    wait_until(
+                        lambda: self._first_element(page, [LOADING_SELECTOR, *ANSWER_SELECTORS]),
+                        self.config.response_start_timeout,
+                        step="response_start",
+                    )
+                except ReadinessTimeoutError as e:
+                    # Extraction still polls for the answer (and falls back to scraping)
+                    logger.warning(str(e))
 
                 logger.info("Query submitted successfully")
 
         except Exception as e:
             logger.error(f"Failed to navigate and submit: {e}", exc_info=True)
-            # Fallback: just wait and hope the session is navigated correctly
-            logger.warning("Falling back to simple wait")
-            time.sleep(5)
+            # Fallback: extraction polls the page (or scrape API) for an answer
+            logger.warning("Continuing to answer extraction")
 
     def _extract_answer(self, session: dict) -> str:
         """
@@ -261,10 +295,6 @@ class SteelPerplexityRunner(SteelBaseRunner):
 
         logger.debug(f"Waiting for Perplexity response in session {session_id}")
 
-        # Wait for response to complete
-        timeout = self.config.wait_for_response_timeout
-        start_time = time.time()
-
         answer_text = None
 
         try:
@@ -284,43 +314,28 @@ class SteelPerplexityRunner(SteelBaseRunner):
                     context = browser.contexts[0] if browser.contexts else browser.new_context()
                     page = context.pages[0] if context.pages else context.new_page()
 
-                    # Wait for response to complete
-                    # Perplexity shows loading indicators while searching
+                    # Poll the answer until it stops growing and the loading
+                    # indicators are gone
                     logger.debug("Waiting for response to complete...")
 
-                    while time.time() - start_time < timeout:
-                        # Check if still loading (look for loading spinner or similar)
-                        loading_indicators = page.query_selector_all('[data-testid*="loading"]')
-                        if not loading_indicators:
-                            logger.debug("Response appears complete (no loading indicators)")
-                            break
-
-                        time.sleep(2)
+                    def read_answer() -> str | None:
+                        element = self._first_element(page, ANSWER_SELECTORS)
+                        return element.inner_text() if element else None
 
-                    # Additional wait for sources to load
-                    time.sleep(3)
+                    answer_text = self._wait_for_answer_text(
+                        read_answer,
+                        busy=lambda: page.query_selector(LOADING_SELECTOR) is not None,
+                    )
 
-                    # Extract the answer text
-                    logger.debug("Extracting answer text")
-
-                    # Try multiple selectors for Perplexity answer
-                    answer_selectors = [
-                        '[data-testid="answer"]',
-                        '.prose',
-                        '[class*="answer"]',
-                        'article',
-                    ]
-
-                    for selector in answer_selectors:
-                        try:
-                            element = page.query_selector(selector)
-                            if element:
-                                answer_text = element.inner_text()
-                                logger.debug(f"Found answer using selector: {selector}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Selector {selector} failed: {e}")
-                            continue
+                    # Give source citations a moment to render
+                    try:
+                        wait_until(
+                            lambda: self._first_element(page, SOURCE_SELECTORS),
+                            SOURCES_WAIT_SECONDS,
+                            step="sources_render",
+                        )
+                    except ReadinessTimeoutError:
+                        logger.debug("No source citations rendered")
 
             else:
                 logger.warning("No websocket URL available for Playwright extraction")
@@ -333,11 +348,8 @@ class SteelPerplexityRunner(SteelBaseRunner):
             logger.info("Falling back to Steel scrape API for content extraction")
 
             try:
-                # Wait a bit more for content to stabilize
-                time.sleep(5)
-
-                # Use base class method to scrape page content
-                markdown_content = self._scrape_page_content(session_id, format="markdown")
+                # Scrape until the content stops changing between scrapes
+                markdown_content = self._scrape_stable_content(session_id)
 
                 if markdown_content:
                     answer_text = markdown_content
@@ -397,15 +409,7 @@ class SteelPerplexityRunner(SteelBaseRunner):
                     page = context.pages[0] if context.pages else context.new_page()
 
                     # Look for source citations - Perplexity typically shows them as numbered links
-                    source_selectors = [
-                        '[data-testid*="citation"]',
-                        '[data-testid*="source"]',
-                        'cite a',
-                        '.citation a',
-                        '[class*="source"] a',
-                    ]
-
-                    for selector in source_selectors:
+                    for selector in SOURCE_SELECTORS:
                         try:
                             elements = page.query_selector_all(selector)
                             for elem in elements:
@@ -452,11 +456,22 @@ class SteelPerplexityPlugin:
         - target_url: Perplexity URL (default: https://www.perplexity.ai)
         - session_timeout: Max session duration in seconds (default: 300)
         - wait_for_response_timeout: Max wait for response (default: 60)
+        - page_load_timeout: Max wait for the page to load (default: 15)
+        - input_timeout: Max wait for the prompt input (default: 10)
+        - response_start_timeout: Max wait for the answer to start (default: 15)
+        - stable_polls: Identical polls that mark the answer complete (default: 3)
         - take_screenshots: Capture screenshots (default: True)
         - save_html_snapshot: Save HTML snapshots (default: True)
         - session_reuse: Reuse sessions across intents (default: True)
         - solver: CAPTCHA solver (default: "capsolver")
         - proxy: Optional proxy config (default: None)
+        - base_url: Steel API base URL (default: Steel SDK default)
+        - session_pool_size: Warm sessions reused across intents (default: 0 = off)
+        - session_max_age_seconds: Recycle pooled sessions after this age (default: 600)
+        - session_max_errors: Recycle pooled sessions after this many errors (default: 3)
+        - artifact_blobs: Store artifacts in the deduplicating blob store (default: True)
+        - screenshot_format: "png" or "webp" (webp requires Pillow, default: "png")
+        - screenshot_max_width: Downscale wider screenshots (requires Pillow, default: None)
 
     Example:
         >>> config = {
@@ -494,12 +509,23 @@ class SteelPerplexityPlugin:
             target_url=config.get("target_url", "https://www.perplexity.ai"),
             session_timeout=config.get("session_timeout", 300),
             wait_for_response_timeout=config.get("wait_for_response_timeout", 60),
+            page_load_timeout=config.get("page_load_timeout", 15.0),
+            input_timeout=config.get("input_timeout", 10.0),
+            response_start_timeout=config.get("response_start_timeout", 15.0),
+            stable_polls=config.get("stable_polls", 3),
             take_screenshots=config.get("take_screenshots", True),
             save_html_snapshot=config.get("save_html_snapshot", True),
             session_reuse=config.get("session_reuse", True),
             solver=config.get("solver", "capsolver"),
             proxy=config.get("proxy"),
             output_dir=config.get("output_dir", "./output"),
+            base_url=config.get("base_url"),
+            session_pool_size=config.get("session_pool_size", 0),
+            session_max_age_seconds=config.get("session_max_age_seconds", 600),
+            session_max_errors=config.get("session_max_errors", 3),
+            artifact_blobs=config.get("artifact_blobs", True),
+            screenshot_format=config.get("screenshot_format", "png"),
+            screenshot_max_width=config.get("screenshot_max_width"),
         )
         return SteelPerplexityRunner(steel_config)
 
@@ -520,6 +546,10 @@ class SteelPerplexityPlugin:
         if not config["steel_api_key"] or config["steel_api_key"].isspace():
             return False, "steel_api_key cannot be empty"
 
+        option_error = validate_steel_options(config)
+        if option_error:
+            return False, option_error
+
         return True, ""
 
     @classmethod
@@ -0,0 +1,258 @@
+"""
+Per-model circuit breakers and a run-wide retry budget.
+
+Every LLM client method is wrapped in the tenacity decorator from
+retry_config (3 attempts, exponential backoff up to 60s). During a provider
+outage each query still burns all of its attempts, so one bad provider can
+stretch a run by tens of minutes. With run_settings.circuit_breaker
+enabled, run_all keeps one CircuitBreaker per (provider, model):
+
+    closed     Requests flow. Once at least min_calls outcomes are in the
+               window and the failure rate reaches failure_rate_threshold,
+               the breaker opens.
+    open       Requests fail fast with LLMCircuitOpenError, or go to the
+               model's configured fallback. After open_seconds the breaker
+               becomes half-open.
+    half_open  Up to half_open_max_calls probe requests are let through.
+               A success closes the breaker, a failure re-opens it.
+
+Retries are charged to a run-wide RetryBudget. The tenacity retry predicate
+(retry_if_permitted) reads the current unit's RetryGuard from a context
+variable, records each failed attempt in the breaker, and stops retrying
+when the breaker has opened or the budget is spent. Outside run_all (no
+guard set) retry behaviour is unchanged.
+
+Example:
+    >>> breakers = BreakerRegistry(CircuitBreakerConfig())
+    >>> breaker = breakers.get("openai", "gpt-4o")
+    >>> if breaker.allow_request():
+    ...     with retry_guard(RetryGuard(breaker, budget)):
+    ...         response = await client.generate_answer(prompt)
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from tenacity import RetryCallState
+from tenacity.retry import retry_base
+
+from ..config.schema import CircuitBreakerConfig
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one (provider, model).
+
+    run_all runs on a single event loop, so state changes need no locking.
+
+    Attributes:
+        name: "provider/model" label for logs and run_meta
+        settings: Breaker thresholds
+        opened_count: Times the breaker has opened
+        rejected: Requests refused while open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        settings: CircuitBreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.settings = settings
+        self.opened_count = 0
+        self.rejected = 0
+        self._clock = clock
+        self._state = CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=settings.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open after open_seconds."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.settings.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit half-open for {self.name}, probing")
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Reserve a request slot; False means fail fast or reroute."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.settings.half_open_max_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        if self.state == HALF_OPEN:
+            self._close()
+            return
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed request (or failed attempt)."""
+        state = self.state
+        if state == HALF_OPEN:
+            self._open("probe failed")
+            return
+        if state == OPEN:
+            return
+        self._outcomes.append(False)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self.settings.min_calls
+            and failures / len(self._outcomes) >= self.settings.failure_rate_threshold
+        ):
+            self._open(f"{failures}/{len(self._outcomes)} recent calls failed")
+
+    def snapshot(self) -> dict:
+        """State summary for run_meta."""
+        return {
+            "state": self.state,
+            "recent_failures": self._outcomes.count(False),
+            "recent_calls": len(self._outcomes),
+            "opened_count": self.opened_count,
+            "rejected": self.rejected,
+        }
+
+    def _open(self, reason: str) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.opened_count += 1
+        logger.warning(
+            f"Circuit opened for {self.name} ({reason}); failing fast for "
+            f"{self.settings.open_seconds:g}s"
+        )
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        logger.info(f"Circuit closed for {self.name}")
+
+
+class BreakerRegistry:
+    """
+    Circuit breakers keyed by (provider, model), created on first use.
+
+    Attributes:
+        settings: Thresholds shared by all breakers
+        breakers: Breakers by "provider/model"
+    """
+
+    def __init__(
+        self,
+        settings: CircuitBreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.settings = settings
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._clock = clock
+
+    def get(self, provider: str, model_name: str) -> CircuitBreaker:
+        """Breaker for a model, created closed if new."""
+        name = f"{provider}/{model_name}"
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(name, self.settings, clock=self._clock)
+        return self.breakers[name]
+
+    def snapshot(self) -> dict[str, dict]:
+        """State summary of every breaker."""
+        return {name: breaker.snapshot() for name, breaker in sorted(self.breakers.items())}
+
+
+@dataclass
+class RetryBudget:
+    """
+    Retries allowed across a whole run.
+
+    Attributes:
+        limit: Maximum retries (None = unlimited)
+        used: Retries granted so far
+        denied: Retries refused because the budget was spent
+    """
+
+    limit: int | None
+    used: int = 0
+    denied: int = 0
+
+    def try_consume(self) -> bool:
+        """Take one retry from the budget if any is left."""
+        if self.limit is not None and self.used >= self.limit:
+            self.denied += 1
+            return False
+        self.used += 1
+        return True
+
+
+@dataclass
+class RetryGuard:
+    """
+    Retry policy for the (intent, model) unit currently being queried.
+
+    Attributes:
+        breaker: The model's circuit breaker
+        budget: Run-wide retry budget
+        failures: Failed attempts recorded for this unit
+    """
+
+    breaker: CircuitBreaker
+    budget: RetryBudget
+    failures: int = 0
+
+    def on_attempt_failed(self, final: bool) -> bool:
+        """Record a failed attempt; True if another attempt may be made."""
+        self.failures += 1
+        self.breaker.record_failure()
+        if final:
+            return True  # tenacity's stop condition ends the call
+        if self.breaker.state == OPEN:
+            return False
+        return self.budget.try_consume()
+
+
+_current_guard: ContextVar[RetryGuard | None] = ContextVar("retry_guard", default=None)
+
+
+@contextmanager
+def retry_guard(guard: RetryGuard) -> Iterator[RetryGuard]:
+    """Apply a RetryGuard to client calls made inside the block."""
+    token = _current_guard.set(guard)
+    try:
+        yield guard
+    finally:
+        _current_guard.reset(token)
+
+
+class retry_if_permitted(retry_base):
+    """
+    Tenacity retry condition that defers to the current RetryGuard.
+
+    Combine with an exception-type condition so only transient errors are
+    counted: retry_if_exception_type(...) & retry_if_permitted(MAX_ATTEMPTS).
+    """
+
+    def __init__(self, max_attempts: int):
+        self.max_attempts = max_attempts
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        guard = _current_guard.get()
+        if guard is None:
+            return True
+        return guard.on_attempt_failed(final=retry_state.attempt_number >= self.max_attempts)
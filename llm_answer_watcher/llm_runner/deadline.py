@@ -0,0 +1,91 @@
+"""
+Run-wide and per-unit deadlines with cooperative cancellation.
+
+The active deadline is an absolute time.monotonic() value held in a context
+variable. run_all sets it from run_settings.deadline_seconds, and each API
+unit narrows it with its model's timeout_seconds. Tasks inherit the context
+they were created in, so everything a unit awaits sees the same deadline:
+
+    - unit_deadline() cancels the unit's work (request, retries, extraction,
+      operations) when the deadline passes, raising TimeoutError
+    - stop_before_deadline stops tenacity retries whose next backoff would
+      end after the deadline, so the unit fails with the provider's error
+      instead of sleeping into its timeout
+
+Example:
+    >>> with deadline_scope(3600):
+    ...     async with unit_deadline(90):
+    ...         response = await client.generate_answer(prompt)
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+from tenacity import RetryCallState
+from tenacity.stop import stop_base
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> float | None:
+    """Active deadline as a time.monotonic() value, or None."""
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    """Seconds until the active deadline (negative once passed), or None."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """True if a deadline is active and has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[float | None]:
+    """
+    Narrow the active deadline to at most `seconds` from now.
+
+    An outer deadline that ends sooner is kept. None leaves it unchanged.
+
+    Yields:
+        The effective deadline (time.monotonic() value or None)
+    """
+    deadline = _deadline.get()
+    if seconds is not None:
+        ends = time.monotonic() + seconds
+        deadline = ends if deadline is None else min(deadline, ends)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+@asynccontextmanager
+async def unit_deadline(seconds: float | None = None) -> AsyncIterator[None]:
+    """
+    Cancel the enclosed work when the (narrowed) deadline passes.
+
+    Raises:
+        TimeoutError: When the deadline passes inside the block
+    """
+    with deadline_scope(seconds):
+        async with asyncio.timeout(remaining()):
+            yield
+
+
+class stop_before_deadline(stop_base):
+    """Tenacity stop condition: stop if the next wait would pass the deadline."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        left = remaining()
+        if left is None:
+            return False
+        return (retry_state.upcoming_sleep or 0.0) >= left
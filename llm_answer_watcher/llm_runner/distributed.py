@@ -0,0 +1,643 @@
+"""
+Coordinator/worker execution of a run through a WorkQueue.
+
+run_all executes a whole run in one process, so throughput is bounded by one
+event loop and one machine's provider rate limits. A distributed run splits
+the same work into units of one intent x one model (or runner):
+
+- run_coordinator() estimates and validates the budget, creates the run
+  directory and runs row, enqueues the units, waits for workers and
+  aggregates their results into the runs row and run_meta.json.
+- run_worker() leases units, executes each with run_all restricted to that
+  intent and model (record_run=False, same run_id), renews leases with
+  heartbeats and reports the unit's summary back to the queue.
+
+Workers load the same config file as the coordinator (units reference
+models by provider/model_name and runners by position) and write answers,
+extractions and error files to the same SQLite database and output
+directory, so hosts other than the coordinator's need both on a shared
+filesystem.
+
+Delivery is at-least-once: a unit whose lease expires (worker crashed, hung
+or lost contact) is executed again by another worker, up to max_attempts
+leases. Re-executed answers are deduplicated by the answers_raw unique key.
+
+Run-level settings map onto units as follows:
+- deadline_seconds: the coordinator fixes the deadline when enqueueing;
+  each unit runs with the remaining time, and units still pending at the
+  deadline are cancelled and reported as timed_out.
+- budget.max_per_run_usd: the coordinator cancels pending units once the
+  actual cost reported by completed units reaches the limit.
+- Intent classification runs once per intent, on the intent's first unit.
+- scheduling is ignored; units are leased in intent order.
+
+Example:
+    >>> queue = SQLiteWorkQueue("./output/queue.db")
+    >>> # On each worker host
+    >>> await run_worker(config, queue, run_id="2025-11-02T08-00-00Z")
+    >>> # On the coordinator
+    >>> results = await run_coordinator(config, queue, run_id="2025-11-02T08-00-00Z")
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from ..config.schema import DistributedConfig, Intent, RuntimeConfig
+from ..extractor.memo import ExtractionMemo
+from ..storage.db import insert_run, update_run_cost
+from ..storage.writer import create_run_directory, write_error, write_run_meta
+from ..utils.time import run_id_from_timestamp, utc_timestamp
+from .runner import (
+    TIMEOUT_RUN_DEADLINE,
+    BudgetExceededError,
+    estimate_run_cost,
+    run_all,
+    validate_budget,
+)
+from .work_queue import (
+    STATE_CANCELLED,
+    STATE_DONE,
+    STATE_FAILED,
+    STATE_LEASED,
+    STATE_PENDING,
+    Lease,
+    SQLiteWorkQueue,
+    WorkQueue,
+    WorkUnit,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keys of run_all's summary a worker reports for each unit
+UNIT_RESULT_KEYS = (
+    "success_count",
+    "error_count",
+    "total_cost_usd",
+    "total_operations_cost_usd",
+    "errors",
+    "skipped",
+    "timed_out",
+    "stop_reason",
+)
+
+
+def distributed_settings(config: RuntimeConfig) -> DistributedConfig:
+    """run_settings.distributed, or the defaults when it is not configured."""
+    return config.run_settings.distributed or DistributedConfig()
+
+
+def open_queue(config: RuntimeConfig) -> SQLiteWorkQueue:
+    """
+    Open the SQLite work queue configured for a run.
+
+    Args:
+        config: Runtime configuration
+
+    Returns:
+        Queue at run_settings.distributed.queue_path, or
+        "{output_dir}/queue.db" when no path is configured
+    """
+    settings = distributed_settings(config)
+    path = settings.queue_path or str(Path(config.run_settings.output_dir) / "queue.db")
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return SQLiteWorkQueue(path, max_attempts=settings.max_attempts)
+
+
+def default_worker_id() -> str:
+    """Worker identifier unique across hosts: "<hostname>-<pid>"."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def start_local_workers(
+    config_path: str, run_id: str, count: int, verbose: bool = False
+) -> list[subprocess.Popen]:
+    """
+    Start worker processes for one run on this host.
+
+    Each process runs `llm-answer-watcher worker --run-id <run_id>` and exits
+    once the run has no pending or leased units left.
+
+    Args:
+        config_path: Config file the workers load (same as the coordinator's)
+        run_id: Run the workers serve
+        count: Number of processes
+        verbose: Enable debug logging in the workers
+
+    Returns:
+        The started processes
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "llm_answer_watcher",
+        "worker",
+        "--config",
+        config_path,
+        "--run-id",
+        run_id,
+    ]
+    if verbose:
+        command.append("--verbose")
+    return [
+        subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(count)
+    ]
+
+
+def _unit_label(payload: dict) -> tuple[str, str]:
+    """(model_provider, model_name) of a unit, as run_all reports it."""
+    if "runner_index" in payload:
+        return payload["runner_plugin"], "runner"
+    return payload["provider"], payload["model_name"]
+
+
+def build_units(config: RuntimeConfig, deadline_at: float | None) -> Iterator[dict]:
+    """
+    Split a run into unit payloads in intent order.
+
+    Intents are read lazily from config.iter_intents(), so a streamed
+    intents_source is enqueued without loading it into memory.
+
+    Args:
+        config: Runtime configuration
+        deadline_at: Epoch time at which the run's deadline expires, if any
+
+    Yields:
+        One JSON-serializable payload per (intent, model) and (intent, runner)
+    """
+    targets = [
+        {"provider": model.provider, "model_name": model.model_name}
+        for model in config.models or []
+    ] + [
+        {"runner_index": index, "runner_plugin": runner.runner_plugin}
+        for index, runner in enumerate(config.runner_configs or [])
+    ]
+    for intent in config.iter_intents():
+        intent_payload = intent.model_dump(mode="json")
+        for position, target in enumerate(targets):
+            yield {
+                "intent": intent_payload,
+                **target,
+                # Classify each intent once, with its first unit
+                "classify": position == 0,
+                "deadline_at": deadline_at,
+            }
+
+
+def unit_config(config: RuntimeConfig, payload: dict) -> RuntimeConfig:
+    """
+    Restrict a config to one unit for run_all.
+
+    Args:
+        config: The worker's runtime configuration
+        payload: Unit payload from build_units()
+
+    Returns:
+        Config with the unit's intent and model (or runner) only
+
+    Raises:
+        ValueError: If the unit's model or runner is not in this config
+    """
+    if "runner_index" in payload:
+        runners = config.runner_configs or []
+        index = payload["runner_index"]
+        if index >= len(runners) or runners[index].runner_plugin != payload["runner_plugin"]:
+            raise ValueError(
+                f"Runner #{index} ({payload['runner_plugin']}) is not configured on this worker"
+            )
+        models, runner_configs = [], [runners[index]]
+    else:
+        model = next(
+            (
+                m
+                for m in config.models
+                if m.provider == payload["provider"] and m.model_name == payload["model_name"]
+            ),
+            None,
+        )
+        if model is None:
+            raise ValueError(
+                f"Model {payload['provider']}/{payload['model_name']} "
+                "is not configured on this worker"
+            )
+        models, runner_configs = [model], None
+
+    extraction_settings = config.extraction_settings
+    if extraction_settings is not None and not payload["classify"]:
+        extraction_settings = extraction_settings.model_copy(
+            update={"enable_intent_classification": False}
+        )
+
+    deadline_seconds = None
+    if payload["deadline_at"] is not None:
+        # A unit leased after the deadline times out immediately
+        deadline_seconds = max(payload["deadline_at"] - time.time(), 0.001)
+
+    return config.model_copy(
+        update={
+            "run_settings": config.run_settings.model_copy(
+                update={"scheduling": None, "deadline_seconds": deadline_seconds}
+            ),
+            "extraction_settings": extraction_settings,
+            "intents": [Intent.model_validate(payload["intent"])],
+            "intents_source": None,
+            "models": models,
+            "runner_configs": runner_configs,
+        }
+    )
+
+
+async def run_worker(
+    config: RuntimeConfig,
+    queue: WorkQueue,
+    worker_id: str | None = None,
+    run_id: str | None = None,
+    idle_seconds: float | None = None,
+) -> dict:
+    """
+    Lease and execute units until the work runs out.
+
+    Up to run_settings.max_concurrent_requests units run at once. Leases are
+    renewed every heartbeat_seconds; a unit whose lease was lost (taken over
+    after expiry) is cancelled without reporting. Queue operations block on
+    I/O and locks, so they run in worker threads to keep the units going.
+
+    Args:
+        config: Runtime configuration (the same config file as the coordinator)
+        queue: Shared work queue
+        worker_id: Identifier recorded on leases (default: "<hostname>-<pid>")
+        run_id: Serve only this run, and exit once it has no pending or
+            leased units left (default: serve every run)
+        idle_seconds: Exit after this long without work (default: never,
+            unless run_id is given)
+
+    Returns:
+        Worker summary: {"worker_id", "completed", "failed", "lost"}
+    """
+    settings = distributed_settings(config)
+    worker_id = worker_id or default_worker_id()
+    max_in_flight = config.run_settings.max_concurrent_requests
+    stats = {"worker_id": worker_id, "completed": 0, "failed": 0, "lost": 0}
+
+    # One memo for all units, so the in-memory tier stays warm across them
+    cache_config = config.run_settings.extraction_cache
+    memo = (
+        ExtractionMemo.from_config(cache_config, config.run_settings.sqlite_db_path)
+        if cache_config is not None and cache_config.enabled
+        else None
+    )
+
+    async def _execute(lease: Lease) -> dict:
+        summary = await run_all(
+            unit_config(config, lease.payload),
+            memo=memo,
+            run_id=lease.run_id,
+            record_run=False,
+        )
+        return {key: summary[key] for key in UNIT_RESULT_KEYS}
+
+    logger.info(f"Worker {worker_id} started" + (f" for run {run_id}" if run_id else ""))
+    in_flight: dict[asyncio.Task, Lease] = {}
+    lost: set[asyncio.Task] = set()
+    idle_since = time.monotonic()
+    last_heartbeat = time.monotonic()
+
+    try:
+        while True:
+            while len(in_flight) < max_in_flight:
+                lease = await asyncio.to_thread(
+                    queue.lease, worker_id, settings.lease_seconds, run_id=run_id
+                )
+                if lease is None:
+                    break
+                logger.debug(f"Leased unit {lease.run_id}#{lease.seq} (attempt {lease.attempt})")
+                in_flight[asyncio.create_task(_execute(lease))] = lease
+
+            if not in_flight:
+                if run_id is not None:
+                    counts = await asyncio.to_thread(queue.progress, run_id)
+                    if any(counts.values()) and not (counts[STATE_PENDING] or counts[STATE_LEASED]):
+                        break
+                if idle_seconds is not None and time.monotonic() - idle_since >= idle_seconds:
+                    break
+                await asyncio.sleep(settings.poll_seconds)
+                continue
+
+            done, _ = await asyncio.wait(
+                in_flight,
+                timeout=min(settings.poll_seconds, settings.heartbeat_seconds),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                lease = in_flight.pop(task)
+                if task in lost:
+                    lost.discard(task)
+                    continue
+                if task.exception() is not None:
+                    error_message = f"{type(task.exception()).__name__}: {task.exception()}"
+                    logger.error(
+                        f"Unit {lease.run_id}#{lease.seq} failed on attempt "
+                        f"{lease.attempt}: {error_message}"
+                    )
+                    await asyncio.to_thread(queue.fail, lease, error_message)
+                    stats["failed"] += 1
+                elif await asyncio.to_thread(queue.complete, lease, task.result()):
+                    stats["completed"] += 1
+                else:
+                    logger.warning(
+                        f"Lease on unit {lease.run_id}#{lease.seq} was lost before "
+                        "completion; result discarded"
+                    )
+                    stats["lost"] += 1
+
+            if time.monotonic() - last_heartbeat >= settings.heartbeat_seconds:
+                for task, lease in list(in_flight.items()):
+                    if task in lost:
+                        continue
+                    if not await asyncio.to_thread(queue.heartbeat, lease, settings.lease_seconds):
+                        logger.warning(
+                            f"Lease on unit {lease.run_id}#{lease.seq} was lost; cancelling"
+                        )
+                        task.cancel()
+                        lost.add(task)
+                        stats["lost"] += 1
+                last_heartbeat = time.monotonic()
+            idle_since = time.monotonic()
+    finally:
+        # Units still running are released by lease expiry
+        for task in in_flight:
+            task.cancel()
+
+    logger.info(
+        f"Worker {worker_id} finished: {stats['completed']} completed, "
+        f"{stats['failed']} failed, {stats['lost']} lost"
+    )
+    return stats
+
+
+def _aggregate(units: list[WorkUnit], run_dir: str) -> dict:
+    """
+    Combine unit results in enqueue order.
+
+    Failed, cancelled and never-finished units are written as error files;
+    units cancelled at the deadline count as timed_out, the rest as errors.
+    """
+    totals = {
+        "success_count": 0,
+        "error_count": 0,
+        "total_cost_usd": 0.0,
+        "total_operations_cost_usd": 0.0,
+        "errors": [],
+        "skipped": [],
+        "timed_out": [],
+        "stop_reason": None,
+    }
+    for unit in units:
+        if unit.state == STATE_DONE:
+            result = unit.result
+            for key in (
+                "success_count",
+                "error_count",
+                "total_cost_usd",
+                "total_operations_cost_usd",
+            ):
+                totals[key] += result[key]
+            for key in ("errors", "skipped", "timed_out"):
+                totals[key].extend(result[key])
+            totals["stop_reason"] = totals["stop_reason"] or result["stop_reason"]
+            continue
+
+        provider, model_name = _unit_label(unit.payload)
+        intent_id = unit.payload["intent"]["id"]
+        if unit.state == STATE_CANCELLED and unit.error == TIMEOUT_RUN_DEADLINE:
+            message = f"timed_out: {TIMEOUT_RUN_DEADLINE}"
+            totals["timed_out"].append(
+                {
+                    "intent_id": intent_id,
+                    "model_provider": provider,
+                    "model_name": model_name,
+                    "reason": TIMEOUT_RUN_DEADLINE,
+                }
+            )
+        else:
+            if unit.state == STATE_FAILED:
+                message = f"Unit failed after {unit.attempts} attempts: {unit.error}"
+            else:
+                message = f"Not run: {unit.error or 'coordinator stopped waiting'}"
+            totals["error_count"] += 1
+            totals["errors"].append(
+                {
+                    "intent_id": intent_id,
+                    "model_provider": provider,
+                    "model_name": model_name,
+                    "error_message": message,
+                }
+            )
+        write_error(
+            run_dir=run_dir,
+            intent_id=intent_id,
+            provider=provider,
+            model=model_name,
+            error_message=message,
+        )
+    return totals
+
+
+async def run_coordinator(
+    config: RuntimeConfig,
+    queue: WorkQueue,
+    *,
+    progress_callback: Callable[[], None] | None = None,
+    config_filename: str | None = None,
+    run_id: str | None = None,
+    workers: list[subprocess.Popen] | None = None,
+) -> dict:
+    """
+    Enqueue a run's units, wait for workers and aggregate their results.
+
+    Args:
+        config: Runtime configuration
+        queue: Work queue shared with the workers
+        progress_callback: Optional callback invoked as units finish (as for run_all)
+        config_filename: Optional config file name recorded in run metadata
+        run_id: Optional run identifier (default: derived from the current UTC second)
+        workers: Local worker processes; if all of them exit before the run
+            finishes, the coordinator stops waiting and reports the
+            remaining units as not run
+
+    Returns:
+        Summary dictionary with the same structure as run_all's
+
+    Raises:
+        BudgetExceededError: If estimated cost exceeds configured budget limits
+        OSError: If output directory cannot be created
+    """
+    settings = distributed_settings(config)
+    run_id = run_id or run_id_from_timestamp()
+    timestamp_utc = utc_timestamp()
+
+    cost_estimate = estimate_run_cost(config)
+    total_intents = cost_estimate["total_intents"]
+    try:
+        validate_budget(config, cost_estimate)
+    except BudgetExceededError as e:
+        logger.error(f"Budget exceeded: {e}")
+        raise
+
+    run_dir = create_run_directory(config.run_settings.output_dir, run_id)
+    total_execution_units = len(config.models or []) + len(config.runner_configs or [])
+    try:
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            insert_run(
+                conn=conn,
+                run_id=run_id,
+                timestamp_utc=timestamp_utc,
+                total_intents=total_intents,
+                total_models=total_execution_units,
+            )
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to insert run record into database: {e}", exc_info=True)
+
+    deadline_seconds = config.run_settings.deadline_seconds
+    deadline_at = time.time() + deadline_seconds if deadline_seconds is not None else None
+    await asyncio.to_thread(queue.enqueue, run_id, build_units(config, deadline_at))
+    total_units = sum((await asyncio.to_thread(queue.progress, run_id)).values())
+    logger.info(
+        f"Coordinating run {run_id}: {total_units} units enqueued "
+        f"(lease {settings.lease_seconds}s, max {settings.max_attempts} attempts)"
+    )
+
+    budget = config.run_settings.budget
+    limit_usd = (
+        budget.max_per_run_usd
+        if budget is not None and budget.enabled and budget.max_per_run_usd is not None
+        else None
+    )
+    stop_reason = None
+    reported = dict.fromkeys((STATE_DONE, STATE_FAILED, STATE_CANCELLED), 0)
+    done_seen = 0
+    started = time.perf_counter()
+
+    async def _report_progress(counts: dict[str, int]) -> None:
+        """Report units that finished since the last poll; only done units succeed."""
+        for state, seen in reported.items():
+            for n in range(seen, counts[state]):
+                if progress_callback is None:
+                    break
+                if hasattr(progress_callback, "complete_query"):
+                    await progress_callback.complete_query(
+                        f"{run_id}#{state}-{n}", success=state == STATE_DONE
+                    )
+                else:
+                    progress_callback()
+            reported[state] = counts[state]
+
+    while True:
+        counts = await asyncio.to_thread(queue.progress, run_id)
+        finished = counts[STATE_DONE] + counts[STATE_FAILED] + counts[STATE_CANCELLED]
+        await _report_progress(counts)
+        if finished >= total_units:
+            break
+
+        if deadline_at is not None and time.time() >= deadline_at and counts[STATE_PENDING]:
+            cancelled = await asyncio.to_thread(queue.cancel, run_id, TIMEOUT_RUN_DEADLINE)
+            logger.warning(f"Deadline reached: cancelled {cancelled} pending units")
+
+        if limit_usd is not None and stop_reason is None and counts[STATE_DONE] > done_seen:
+            done_seen = counts[STATE_DONE]
+            spent = await asyncio.to_thread(queue.done_cost, run_id)
+            if spent >= limit_usd:
+                stop_reason = f"max_per_run_usd ${limit_usd:.4f} reached: spent ${spent:.4f}"
+                cancelled = await asyncio.to_thread(queue.cancel, run_id, stop_reason)
+                logger.warning(
+                    f"Budget reached, cancelled {cancelled} pending units: {stop_reason}"
+                )
+
+        if workers and all(process.poll() is not None for process in workers):
+            logger.error(f"All local workers exited with {total_units - finished} units unfinished")
+            stop_reason = stop_reason or "all local workers exited"
+            await asyncio.to_thread(queue.cancel, run_id, stop_reason)
+            await _report_progress(await asyncio.to_thread(queue.progress, run_id))
+            break
+
+        await asyncio.sleep(settings.poll_seconds)
+
+    units = await asyncio.to_thread(queue.results, run_id)
+    totals = _aggregate(units, run_dir)
+    total_cost_usd = totals["total_cost_usd"]
+    total_operations_cost_usd = totals["total_operations_cost_usd"]
+    stop_reason = stop_reason or totals["stop_reason"]
+    total_queries = total_intents * total_execution_units
+
+    try:
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            update_run_cost(conn, run_id, round(total_cost_usd, 6))
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to update run cost in database: {e}", exc_info=True)
+
+    summary = {
+        "run_id": run_id,
+        "timestamp_utc": timestamp_utc,
+        "output_dir": run_dir,
+        "total_intents": total_intents,
+        "total_models": len(config.models),
+        "total_queries": total_queries,
+        "success_count": totals["success_count"],
+        "error_count": totals["error_count"],
+        "skipped_count": len(totals["skipped"]),
+        "timed_out_count": len(totals["timed_out"]),
+        "total_cost_usd": round(total_cost_usd, 6),
+        "total_llm_cost_usd": round(total_cost_usd - total_operations_cost_usd, 6),
+        "total_operations_cost_usd": round(total_operations_cost_usd, 6),
+    }
+    run_meta = {
+        **{key: summary[key] for key in ("run_id", "timestamp_utc")},
+        "config_filename": config_filename,
+        **{key: value for key, value in summary.items() if key not in ("run_id", "timestamp_utc")},
+        "my_brands": config.brands.mine,
+        "competitors": config.brands.competitors,
+        "database_path": config.run_settings.sqlite_db_path,
+        "distributed": {
+            "queue_path": getattr(queue, "path", None),
+            "units": len(units),
+            "states": dict(Counter(unit.state for unit in units)),
+            "workers": dict(Counter(unit.worker_id for unit in units if unit.state == STATE_DONE)),
+            "total_attempts": sum(unit.attempts for unit in units),
+            "retried_units": sum(1 for unit in units if unit.attempts > 1),
+            "lease_seconds": settings.lease_seconds,
+            "max_attempts": settings.max_attempts,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+        },
+    }
+    if deadline_seconds is not None or totals["timed_out"]:
+        run_meta["deadline"] = {
+            "deadline_seconds": deadline_seconds,
+            "timed_out": totals["timed_out"],
+        }
+    if stop_reason is not None:
+        run_meta["stop_reason"] = stop_reason
+    write_run_meta(run_dir=run_dir, meta=run_meta)
+
+    logger.info(
+        f"Run {run_id} complete: {summary['success_count']}/{total_queries} successful "
+        f"across {len(run_meta['distributed']['workers'])} workers, "
+        f"total_cost=${total_cost_usd:.6f}"
+    )
+    return {
+        **summary,
+        "errors": totals["errors"],
+        "skipped": totals["skipped"],
+        "timed_out": totals["timed_out"],
+        "stop_reason": stop_reason,
+    }
@@ -27,15 +27,20 @@ from typing import Any
 
 import httpx
 
-from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
+from llm_answer_watcher.llm_runner.models import DecodedResponse, LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
 from llm_answer_watcher.utils.time import utc_timestamp
 
+try:
+    from llm_answer_watcher.llm_runner.response_schemas import decode_gemini_response
+except ImportError:  # msgspec not installed: stdlib json and dict extraction
+    decode_gemini_response = None
+
 # Suppress HTTPX request logging to prevent test interference
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
@@ -275,7 +280,7 @@ class GeminiClient:
 
         # Make HTTP request with context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     api_url,
                     json=payload,
@@ -321,20 +326,15 @@ class GeminiClient:
             logger.error(f"Gemini API timeout: model={self.model_name}, error={e}")
             raise
 
-        # Parse response JSON
-        try:
-            data = response.json()
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse Gemini response JSON: {e}") from e
-
-        # Extract answer text
-        answer_text = self._extract_answer_text(data)
-
-        # Extract token usage
-        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
-
-        # Extract grounding metadata (Google Search results if tools enabled)
-        web_search_results, web_search_count = self._extract_grounding_metadata(data)
+        # Extract answer text, token usage and grounding metadata (Google
+        # Search results if tools enabled)
+        decoded = self._decode_response(response)
+        answer_text = decoded.answer_text
+        tokens_used = decoded.tokens_used
+        prompt_tokens = decoded.prompt_tokens
+        completion_tokens = decoded.completion_tokens
+        web_search_results = decoded.web_search_results
+        web_search_count = decoded.web_search_count
 
         # Calculate cost
         usage_meta = {
@@ -360,6 +360,39 @@ class GeminiClient:
             web_search_count=web_search_count,
         )
 
+    def _decode_response(self, response: httpx.Response) -> DecodedResponse:
+        """
+        Decode answer text, token usage and web search results from a response.
+
+        Well-formed bodies are decoded straight into typed structs when msgspec
+        is installed (see response_schemas); anything else goes through stdlib
+        json and the defensive dict extraction below.
+
+        Raises:
+            RuntimeError: If the body is not JSON or the answer is missing
+        """
+        if decode_gemini_response is not None:
+            decoded = decode_gemini_response(response.content)
+            if decoded is not None:
+                return decoded
+
+        try:
+            data = response.json()
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse Gemini response JSON: {e}") from e
+
+        answer_text = self._extract_answer_text(data)
+        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
+        web_search_results, web_search_count = self._extract_grounding_metadata(data)
+        return DecodedResponse(
+            answer_text=answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
         """
         Extract answer text from Gemini API response.
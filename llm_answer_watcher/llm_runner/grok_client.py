@@ -31,10 +31,10 @@ from typing import Any
 
 import httpx
 
-from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
+from llm_answer_watcher.llm_runner.models import LLMResponse, split_batch_usage
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
@@ -206,6 +206,35 @@ class GrokClient:
             If a non-retryable error occurs (e.g., 401), it checks the status
             code and raises immediately without retry.
         """
+        return (await self._complete(prompt, n=1))[0]
+
+    @create_retry_decorator()
+    async def generate_answers(self, prompt: str, n: int) -> list[LLMResponse]:
+        """
+        Request n samples for one prompt in a single API call.
+
+        Uses the Chat Completions `n` parameter, so prompt tokens are billed
+        once for the whole batch. Token usage is split across the returned
+        samples with split_batch_usage(); the first sample carries the prompt
+        tokens. Retry and error behavior match generate_answer().
+
+        Args:
+            prompt: User intent prompt to send to the LLM
+            n: Number of samples to request (>= 1)
+
+        Returns:
+            list[LLMResponse]: One response per returned choice, in order
+
+        Raises:
+            ValueError: If prompt is empty or n < 1
+            RuntimeError: On permanent failures or malformed responses
+        """
+        if n < 1:
+            raise ValueError(f"n must be at least 1 (got: {n})")
+        return await self._complete(prompt, n)
+
+    async def _complete(self, prompt: str, n: int) -> list[LLMResponse]:
+        """Send one Chat Completions request for n choices and build responses."""
         # Validate prompt is not empty
         if not prompt or prompt.isspace():
             raise ValueError("Prompt cannot be empty")
@@ -227,6 +256,8 @@ class GrokClient:
             ],
             "temperature": 0.7,  # Default temperature for consistency
         }
+        if n > 1:
+            payload["n"] = n  # Several samples, prompt billed once
 
         # Build headers (NEVER log api_key)
         headers = {
@@ -239,7 +270,7 @@ class GrokClient:
 
         # Make HTTP request with async context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     GROK_API_URL,
                     json=payload,
@@ -290,35 +321,48 @@ class GrokClient:
         except Exception as e:
             raise RuntimeError(f"Failed to parse Grok response JSON: {e}") from e
 
-        # Extract answer text
-        answer_text = self._extract_answer_text(data)
+        # Extract answer text (one per choice when sampling)
+        if n > 1:
+            answer_texts = self._extract_answer_texts(data, n)
+        else:
+            answer_texts = [self._extract_answer_text(data)]
 
         # Extract token usage (prompt and completion)
         tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
 
-        # Calculate cost
-        usage_meta = {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-        }
-        cost_usd = estimate_cost("grok", self.model_name, usage_meta)
-
         # Get current timestamp
         timestamp = utc_timestamp()
 
-        # Build and return response
-        return LLMResponse(
-            answer_text=answer_text,
-            tokens_used=tokens_used,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cost_usd=cost_usd,
-            provider="grok",
-            model_name=self.model_name,
-            timestamp_utc=timestamp,
-            web_search_results=None,  # Web search not supported in v1
-            web_search_count=0,
-        )
+        # Build one response per sample; the prompt is attributed to the first
+        responses = []
+        for answer_text, (sample_prompt_tokens, sample_completion_tokens) in zip(
+            answer_texts,
+            split_batch_usage(prompt_tokens, completion_tokens, len(answer_texts)),
+            strict=True,
+        ):
+            usage_meta = {
+                "prompt_tokens": sample_prompt_tokens,
+                "completion_tokens": sample_completion_tokens,
+            }
+            responses.append(
+                LLMResponse(
+                    answer_text=answer_text,
+                    tokens_used=(
+                        tokens_used
+                        if n == 1
+                        else sample_prompt_tokens + sample_completion_tokens
+                    ),
+                    prompt_tokens=sample_prompt_tokens,
+                    completion_tokens=sample_completion_tokens,
+                    cost_usd=estimate_cost("grok", self.model_name, usage_meta),
+                    provider="grok",
+                    model_name=self.model_name,
+                    timestamp_utc=timestamp,
+                    web_search_results=None,  # Web search not supported in v1
+                    web_search_count=0,
+                )
+            )
+        return responses
 
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
         """
@@ -359,6 +403,31 @@ class GrokClient:
         except (KeyError, IndexError, TypeError) as e:
             raise RuntimeError(f"Invalid Grok response structure: {e}") from e
 
+    def _extract_answer_texts(self, data: dict[str, Any], n: int) -> list[str]:
+        """
+        Extract every choice's answer text from a multi-sample response.
+
+        Args:
+            data: Parsed JSON response requested with `n`
+            n: Number of choices requested
+
+        Returns:
+            list[str]: Answer texts in choice order (may be fewer than n if
+                the API returned fewer choices)
+
+        Raises:
+            RuntimeError: If the response has no choices or a choice is invalid
+        """
+        choices = data.get("choices")
+        if not choices or not isinstance(choices, list):
+            raise RuntimeError("Grok response missing 'choices' array")
+        if len(choices) < n:
+            logger.warning(
+                f"Grok returned {len(choices)} of {n} requested samples "
+                f"for model={self.model_name}"
+            )
+        return [self._extract_answer_text({"choices": [choice]}) for choice in choices[:n]]
+
     def _extract_token_usage(self, data: dict[str, Any]) -> tuple[int, int, int]:
         """
         Extract token usage breakdown from Grok Chat Completions API response.
@@ -0,0 +1,272 @@
+"""
+Hedged LLM requests to cut tail latency.
+
+On some providers the slowest 1% of requests take ten times the median, and
+those stragglers decide when a run finishes. A hedged request waits until
+the original request has been outstanding longer than the model's usual
+latency (a percentile of its recent latencies), then sends a duplicate.
+The first answer wins and the other request is cancelled.
+
+Thresholds start from the latency_ms of each model's recent answers in
+answers_raw and keep learning from latencies observed during the run.
+Hedges are rationed per model (max_hedge_rate of its requests) and per run
+(max_extra_cost_usd). A cancelled request may already be billed, so each
+hedge is charged as one extra answer at the winner's cost; the charge is
+returned as LLMResponse.hedge_cost_usd.
+
+Example:
+    >>> policy = HedgePolicy.from_config(config)
+    >>> client = HedgedLLMClient(build_client(...), policy, "openai", "gpt-4o")
+    >>> response = await client.generate_answer("What are the best CRM tools?")
+    >>> response.hedge_outcome, response.hedge_cost_usd
+    ('hedge', 0.00042)
+"""
+
+import asyncio
+import logging
+import sqlite3
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+
+from ..config.schema import HedgingConfig, RuntimeConfig
+from ..utils.stats import percentile
+from .models import LLMClient, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# hedge_outcome values: which request's answer was used
+OUTCOME_PRIMARY = "primary"
+OUTCOME_HEDGE = "hedge"
+
+
+@dataclass
+class ModelHedgeState:
+    """
+    Latency history and hedge accounting for one model.
+
+    Attributes:
+        latencies: Recent latencies in seconds (history, then this run)
+        expected_cost_usd: Mean cost of a recent answer, used for the cost cap
+        requests: Requests made through the hedging client this run
+        hedges: Duplicate requests sent
+        hedge_wins: Hedges that answered before the original request
+        extra_cost_usd: Estimated extra spend on hedges
+    """
+
+    latencies: deque[float]
+    expected_cost_usd: float = 0.0
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    extra_cost_usd: float = 0.0
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Per-model hedge thresholds and run-wide hedge limits.
+
+    Shared by every HedgedLLMClient in a run; run_all runs on one event
+    loop, so the counters need no locking.
+
+    Attributes:
+        settings: Hedging configuration
+        models: State per (provider, model_name)
+    """
+
+    settings: HedgingConfig
+    models: dict[tuple[str, str], ModelHedgeState] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: RuntimeConfig) -> "HedgePolicy":
+        """Seed latency windows from answers_raw for every configured model."""
+        settings = config.run_settings.hedging
+        policy = cls(settings)
+        keys = {(m.provider, m.model_name) for m in config.models or []}
+        keys |= {
+            (m.fallback.provider, m.fallback.model_name)
+            for m in config.models or []
+            if m.fallback is not None
+        }
+        try:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                for provider, model_name in sorted(keys):
+                    rows = conn.execute(
+                        """
+                        SELECT latency_ms, estimated_cost_usd FROM answers_raw
+                        WHERE model_provider = ? AND model_name = ?
+                          AND latency_ms IS NOT NULL
+                        ORDER BY timestamp_utc DESC
+                        LIMIT ?
+                        """,
+                        (provider, model_name, settings.latency_window),
+                    ).fetchall()
+                    state = policy.state(provider, model_name)
+                    # Oldest first, so in-run latencies push out the oldest history
+                    state.latencies.extend(latency / 1000 for latency, _ in reversed(rows))
+                    if rows:
+                        state.expected_cost_usd = statistics.fmean(cost or 0.0 for _, cost in rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot read latency history, hedging starts cold: {e}")
+        return policy
+
+    @property
+    def extra_cost_usd(self) -> float:
+        """Estimated extra spend on hedges across all models."""
+        return sum(state.extra_cost_usd for state in self.models.values())
+
+    def state(self, provider: str, model_name: str) -> ModelHedgeState:
+        """State for a model, created empty if new."""
+        key = (provider, model_name)
+        if key not in self.models:
+            self.models[key] = ModelHedgeState(latencies=deque(maxlen=self.settings.latency_window))
+        return self.models[key]
+
+    def hedge_delay(self, provider: str, model_name: str) -> float | None:
+        """Seconds to wait before hedging, or None while history is too short."""
+        latencies = self.state(provider, model_name).latencies
+        if len(latencies) < self.settings.min_samples:
+            return None
+        return percentile(list(latencies), self.settings.latency_percentile)
+
+    def try_hedge(self, provider: str, model_name: str) -> bool:
+        """Claim a hedge if the model's hedge rate and the run's cost cap allow it."""
+        state = self.state(provider, model_name)
+        if state.hedges + 1 > self.settings.max_hedge_rate * state.requests:
+            return False
+        cap = self.settings.max_extra_cost_usd
+        if cap is not None and self.extra_cost_usd + state.expected_cost_usd > cap:
+            return False
+        state.hedges += 1
+        return True
+
+    def snapshot(self) -> dict:
+        """Hedge statistics for run_meta."""
+        return {
+            "latency_percentile": self.settings.latency_percentile,
+            "extra_cost_usd": round(self.extra_cost_usd, 6),
+            "models": {
+                f"{provider}/{model_name}": {
+                    "requests": state.requests,
+                    "hedges": state.hedges,
+                    "hedge_wins": state.hedge_wins,
+                    "extra_cost_usd": round(state.extra_cost_usd, 6),
+                    "threshold_seconds": (
+                        round(threshold, 3)
+                        if (threshold := self.hedge_delay(provider, model_name)) is not None
+                        else None
+                    ),
+                }
+                for (provider, model_name), state in sorted(self.models.items())
+                if state.requests
+            },
+        }
+
+
+@dataclass
+class HedgedLLMClient:
+    """
+    LLMClient wrapper that hedges slow requests.
+
+    Only generate_answer is hedged. The wrapper deliberately does not expose
+    generate_answers, so callers needing native multi-sample requests should
+    use the base client.
+
+    Attributes:
+        base_client: Client for the model
+        policy: Run-wide hedge policy
+        provider: Provider of base_client's model
+        model_name: Model of base_client
+    """
+
+    base_client: LLMClient
+    policy: HedgePolicy
+    provider: str
+    model_name: str
+
+    async def generate_answer(self, prompt: str) -> LLMResponse:
+        """
+        Generate an answer, sending a duplicate request if the first is slow.
+
+        Args:
+            prompt: User intent prompt
+
+        Returns:
+            LLMResponse from whichever request answered first, with
+            hedge_outcome and hedge_cost_usd set if a hedge was sent
+
+        Raises:
+            Exception: The original request's error if every request failed
+        """
+        state = self.policy.state(self.provider, self.model_name)
+        state.requests += 1
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(self.base_client.generate_answer(prompt))
+
+        delay = self.policy.hedge_delay(self.provider, self.model_name)
+        if delay is not None:
+            try:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+            except BaseException:
+                # asyncio.wait does not cancel its tasks when the caller is
+                # cancelled (e.g. by the unit deadline), so stop them here
+                _cancel_pending(primary)
+                raise
+            if not done and self.policy.try_hedge(self.provider, self.model_name):
+                logger.info(f"Hedging {self.provider}/{self.model_name} request after {delay:.2f}s")
+                hedge = asyncio.ensure_future(self.base_client.generate_answer(prompt))
+                return await self._race(primary, hedge, state, started)
+
+        response = await primary
+        state.latencies.append(time.perf_counter() - started)
+        return response
+
+    async def _race(
+        self,
+        primary: asyncio.Future,
+        hedge: asyncio.Future,
+        state: ModelHedgeState,
+        started: float,
+    ) -> LLMResponse:
+        """First successful response of the two; cancels the other."""
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the original request if both finished together
+                for task in (primary, hedge):
+                    if task in done and task.exception() is None:
+                        return self._won(task, primary, state, started)
+        finally:
+            # Cancels the loser, or both requests if the caller was cancelled
+            _cancel_pending(primary, hedge)
+
+        # Both failed: surface the original request's error
+        hedge.exception()  # mark retrieved
+        raise primary.exception()
+
+    def _won(
+        self,
+        task: asyncio.Future,
+        primary: asyncio.Future,
+        state: ModelHedgeState,
+        started: float,
+    ) -> LLMResponse:
+        response: LLMResponse = task.result()
+        state.latencies.append(time.perf_counter() - started)
+        state.extra_cost_usd += response.cost_usd
+        outcome = OUTCOME_PRIMARY if task is primary else OUTCOME_HEDGE
+        if outcome == OUTCOME_HEDGE:
+            state.hedge_wins += 1
+        return replace(response, hedge_outcome=outcome, hedge_cost_usd=response.cost_usd)
+
+
+def _cancel_pending(*tasks: asyncio.Future) -> None:
+    """Cancel unfinished tasks and mark finished tasks' errors as retrieved."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
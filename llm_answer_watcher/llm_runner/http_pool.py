@@ -0,0 +1,94 @@
+"""
+Shared HTTP connection pool for LLM provider clients.
+
+By default each provider request opens (and closes) its own
+httpx.AsyncClient, which is the right trade-off for one-shot CLI runs: no
+client outlives the event loop that created it. Long-running processes
+(`serve` mode) instead run inside connection_pool(), which installs one
+AsyncClient for the duration of the block so TCP/TLS connections to
+provider APIs are reused across queries and across scheduled runs.
+
+The pool is carried in a ContextVar, so it is visible to every task
+spawned inside the block (asyncio.gather copies the current context) and
+invisible to unrelated code running on other loops or threads.
+
+Example:
+    >>> async with connection_pool():
+    ...     await run_all(config)  # Provider clients reuse pooled connections
+    ...     await run_all(config)  # Still warm
+
+    >>> # Inside a provider client
+    >>> async with pooled_client() as client:
+    ...     response = await client.post(url, json=payload, headers=headers)
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import httpx
+
+from llm_answer_watcher.llm_runner.retry_config import REQUEST_TIMEOUT
+
+# Keep-alive limits for the shared pool (per host, across all providers)
+POOL_MAX_CONNECTIONS = 50
+POOL_MAX_KEEPALIVE_CONNECTIONS = 20
+POOL_KEEPALIVE_EXPIRY = 120.0
+
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "llm_answer_watcher_http_client", default=None
+)
+
+
+@asynccontextmanager
+async def connection_pool() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Install a shared AsyncClient for all provider requests in this context.
+
+    Nested calls reuse the outer pool instead of creating a second one.
+
+    Yields:
+        The shared httpx.AsyncClient
+    """
+    existing = _shared_client.get()
+    if existing is not None:
+        yield existing
+        return
+
+    limits = httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+@asynccontextmanager
+async def pooled_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Get an AsyncClient for a single provider request.
+
+    Returns the shared client when running inside connection_pool() (and
+    leaves it open), otherwise opens a per-request client and closes it
+    afterwards.
+
+    Yields:
+        httpx.AsyncClient configured with REQUEST_TIMEOUT
+    """
+    shared = _shared_client.get()
+    if shared is not None:
+        yield shared
+        return
+
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        yield client
+
+
+def pool_active() -> bool:
+    """Return True if a shared connection pool is installed in this context."""
+    return _shared_client.get() is not None
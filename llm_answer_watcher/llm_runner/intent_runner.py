@@ -66,6 +66,11 @@ class IntentResult:
         web_search_results: Optional list of web search results with URLs/snippets
         web_search_count: Number of web searches performed (0 if none)
 
+        # Timing (browser runners)
+        phase_timings: Optional seconds spent per phase ("session", "navigate",
+            "page_load", "input", "response_start", "extract", "answer", ...);
+            waits are nested inside the phase they belong to
+
         # Error handling
         success: Whether execution succeeded (True) or failed (False)
         error_message: Optional error details if success=False
@@ -127,6 +132,9 @@ class IntentResult:
     web_search_results: list[dict] | None = None
     web_search_count: int = 0
 
+    # Timing (optional)
+    phase_timings: dict[str, float] | None = None
+
     # Error handling
     success: bool = True
     error_message: str | None = None
@@ -0,0 +1,157 @@
+"""
+Live cost ledger that enforces max_per_run_usd while a run is executing.
+
+validate_budget only checks a pre-run estimate built from average token
+counts. Web search, long answers and operations can push actual spend well
+past it. The ledger tracks actual spend as it happens:
+
+    1. Before a unit is dispatched, its estimated cost is reserved. If spend
+       plus outstanding reservations plus the estimate would exceed the
+       limit, the reservation is refused and the run stops scheduling.
+    2. As the unit's answer, extraction, sampling and operations complete,
+       their actual costs are charged against the reservation.
+    3. When the unit finishes, whatever it did not use of its reservation
+       is released.
+
+A reservation only holds back budget; a unit whose actual cost exceeds its
+estimate is still charged in full, so spend can end slightly above the
+limit when estimates are low. The first refusal is kept as stop_reason.
+
+Example:
+    >>> ledger = CostLedger(limit_usd=1.00)
+    >>> reservation = ledger.reserve(0.02, "best-crm openai/gpt-4o")
+    >>> reservation.charge(0.015)
+    >>> reservation.settle()
+    >>> ledger.spent_usd
+    0.015
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Reservation:
+    """
+    Budget held for one unit of work.
+
+    Attributes:
+        ledger: Ledger the reservation belongs to
+        amount_usd: Estimated cost reserved
+        charged_usd: Actual cost charged so far
+        settled: True once the unit finished and the remainder was released
+    """
+
+    ledger: "CostLedger"
+    amount_usd: float
+    charged_usd: float = 0.0
+    settled: bool = False
+
+    @property
+    def outstanding_usd(self) -> float:
+        """Reserved budget not yet covered by charges."""
+        if self.settled:
+            return 0.0
+        return max(0.0, self.amount_usd - self.charged_usd)
+
+    def charge(self, cost_usd: float) -> None:
+        """Record actual spend for this unit."""
+        self.ledger._charge(self, cost_usd)
+
+    def settle(self) -> None:
+        """Release the unused part of the reservation (idempotent)."""
+        self.ledger._settle(self)
+
+
+class CostLedger:
+    """
+    Running record of actual and reserved spend for one run.
+
+    Updates take a lock so charges from concurrent units (and any worker
+    threads they use) are applied atomically.
+
+    Attributes:
+        limit_usd: max_per_run_usd (None = track spend without a limit)
+        spent_usd: Actual spend charged so far
+        reserved_usd: Budget held by unsettled reservations, net of charges
+        refused: Reservations refused because of the limit
+        stop_reason: Why scheduling stopped (None while it has not)
+    """
+
+    def __init__(self, limit_usd: float | None):
+        self.limit_usd = limit_usd
+        self.spent_usd = 0.0
+        self.reserved_usd = 0.0
+        self.refused = 0
+        self.stop_reason: str | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def stopped(self) -> bool:
+        """True once a reservation has been refused."""
+        return self.stop_reason is not None
+
+    def reserve(self, estimate_usd: float, label: str) -> Reservation | None:
+        """
+        Reserve budget for a unit before dispatching it.
+
+        Args:
+            estimate_usd: Estimated cost of the unit
+            label: Unit description for the stop reason and logs
+
+        Returns:
+            Reservation, or None if the limit would be exceeded (after which
+            every later reservation is refused too)
+        """
+        with self._lock:
+            committed = self.spent_usd + self.reserved_usd
+            if self.stopped or (
+                self.limit_usd is not None and committed + estimate_usd > self.limit_usd
+            ):
+                self.refused += 1
+                if self.stop_reason is None:
+                    self.stop_reason = (
+                        f"max_per_run_usd ${self.limit_usd:.4f} would be exceeded by {label}: "
+                        f"spent ${self.spent_usd:.4f} + reserved ${self.reserved_usd:.4f} "
+                        f"+ estimate ${estimate_usd:.4f}"
+                    )
+                    logger.warning(
+                        f"Budget reached, not scheduling further queries: {self.stop_reason}"
+                    )
+                return None
+            self.reserved_usd += estimate_usd
+            return Reservation(self, estimate_usd)
+
+    def spend(self, cost_usd: float) -> None:
+        """Record actual spend that has no reservation (e.g. intent classification)."""
+        with self._lock:
+            self.spent_usd += cost_usd
+
+    def snapshot(self) -> dict:
+        """Ledger state for run_meta."""
+        with self._lock:
+            return {
+                "limit_usd": self.limit_usd,
+                "spent_usd": round(self.spent_usd, 6),
+                "reserved_usd": round(self.reserved_usd, 6),
+                "refused_units": self.refused,
+                "stopped_early": self.stopped,
+                "stop_reason": self.stop_reason,
+            }
+
+    def _charge(self, reservation: Reservation, cost_usd: float) -> None:
+        with self._lock:
+            before = reservation.outstanding_usd
+            reservation.charged_usd += cost_usd
+            self.reserved_usd -= before - reservation.outstanding_usd
+            self.spent_usd += cost_usd
+
+    def _settle(self, reservation: Reservation) -> None:
+        with self._lock:
+            self.reserved_usd -= reservation.outstanding_usd
+            reservation.settled = True
+            if abs(self.reserved_usd) < 1e-12:
+                self.reserved_usd = 0.0
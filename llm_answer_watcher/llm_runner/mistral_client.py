@@ -27,10 +27,10 @@ from typing import Any
 
 import httpx
 
-from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
+from llm_answer_watcher.llm_runner.models import LLMResponse, split_batch_usage
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
@@ -203,6 +203,35 @@ class MistralClient:
             If a non-retryable error occurs (e.g., 401), it checks the status
             code and raises immediately without retry.
         """
+        return (await self._complete(prompt, n=1))[0]
+
+    @create_retry_decorator()
+    async def generate_answers(self, prompt: str, n: int) -> list[LLMResponse]:
+        """
+        Request n samples for one prompt in a single API call.
+
+        Uses the Chat Completions `n` parameter, so prompt tokens are billed
+        once for the whole batch. Token usage is split across the returned
+        samples with split_batch_usage(); the first sample carries the prompt
+        tokens. Retry and error behavior match generate_answer().
+
+        Args:
+            prompt: User intent prompt to send to the LLM
+            n: Number of samples to request (>= 1)
+
+        Returns:
+            list[LLMResponse]: One response per returned choice, in order
+
+        Raises:
+            ValueError: If prompt is empty or n < 1
+            RuntimeError: On permanent failures or malformed responses
+        """
+        if n < 1:
+            raise ValueError(f"n must be at least 1 (got: {n})")
+        return await self._complete(prompt, n)
+
+    async def _complete(self, prompt: str, n: int) -> list[LLMResponse]:
+        """Send one Chat Completions request for n choices and build responses."""
         # Validate prompt is not empty
         if not prompt or prompt.isspace():
             raise ValueError("Prompt cannot be empty")
@@ -225,6 +254,8 @@ class MistralClient:
             ],
             "temperature": 0.7,  # Default temperature for consistency
         }
+        if n > 1:
+            payload["n"] = n  # Several samples, prompt billed once
 
         # Build headers (NEVER log api_key)
         headers = {
@@ -237,7 +268,7 @@ class MistralClient:
 
         # Make async HTTP request with context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     MISTRAL_API_URL,
                     json=payload,
@@ -288,35 +319,48 @@ class MistralClient:
         except Exception as e:
             raise RuntimeError(f"Failed to parse Mistral response JSON: {e}") from e
 
-        # Extract answer text
-        answer_text = self._extract_answer_text(data)
+        # Extract answer text (one per choice when sampling)
+        if n > 1:
+            answer_texts = self._extract_answer_texts(data, n)
+        else:
+            answer_texts = [self._extract_answer_text(data)]
 
         # Extract token usage (prompt and completion)
         tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
 
-        # Calculate cost
-        usage_meta = {
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-        }
-        cost_usd = estimate_cost("mistral", self.model_name, usage_meta)
-
         # Get current timestamp
         timestamp = utc_timestamp()
 
-        # Build and return response
-        return LLMResponse(
-            answer_text=answer_text,
-            tokens_used=tokens_used,
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cost_usd=cost_usd,
-            provider="mistral",
-            model_name=self.model_name,
-            timestamp_utc=timestamp,
-            web_search_results=None,  # Web search not supported in v1
-            web_search_count=0,
-        )
+        # Build one response per sample; the prompt is attributed to the first
+        responses = []
+        for answer_text, (sample_prompt_tokens, sample_completion_tokens) in zip(
+            answer_texts,
+            split_batch_usage(prompt_tokens, completion_tokens, len(answer_texts)),
+            strict=True,
+        ):
+            usage_meta = {
+                "prompt_tokens": sample_prompt_tokens,
+                "completion_tokens": sample_completion_tokens,
+            }
+            responses.append(
+                LLMResponse(
+                    answer_text=answer_text,
+                    tokens_used=(
+                        tokens_used
+                        if n == 1
+                        else sample_prompt_tokens + sample_completion_tokens
+                    ),
+                    prompt_tokens=sample_prompt_tokens,
+                    completion_tokens=sample_completion_tokens,
+                    cost_usd=estimate_cost("mistral", self.model_name, usage_meta),
+                    provider="mistral",
+                    model_name=self.model_name,
+                    timestamp_utc=timestamp,
+                    web_search_results=None,  # Web search not supported in v1
+                    web_search_count=0,
+                )
+            )
+        return responses
 
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
         """
@@ -355,6 +399,31 @@ class MistralClient:
         except (KeyError, IndexError, TypeError) as e:
             raise RuntimeError(f"Invalid Mistral response structure: {e}") from e
 
+    def _extract_answer_texts(self, data: dict[str, Any], n: int) -> list[str]:
+        """
+        Extract every choice's answer text from a multi-sample response.
+
+        Args:
+            data: Parsed JSON response requested with `n`
+            n: Number of choices requested
+
+        Returns:
+            list[str]: Answer texts in choice order (may be fewer than n if
+                the API returned fewer choices)
+
+        Raises:
+            RuntimeError: If the response has no choices or a choice is invalid
+        """
+        choices = data.get("choices")
+        if not choices or not isinstance(choices, list):
+            raise RuntimeError("Mistral response missing 'choices' array")
+        if len(choices) < n:
+            logger.warning(
+                f"Mistral returned {len(choices)} of {n} requested samples "
+                f"for model={self.model_name}"
+            )
+        return [self._extract_answer_text({"choices": [choice]}) for choice in choices[:n]]
+
     def _extract_token_usage(self, data: dict[str, Any]) -> tuple[int, int, int]:
         """
         Extract token usage breakdown from Mistral Chat Completions API response.
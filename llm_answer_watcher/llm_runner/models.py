@@ -9,6 +9,7 @@ Key components:
 - LLMResponse: Structured dataclass holding LLM response data
 - LLMClient: Protocol defining provider-agnostic interface
 - build_client: Factory function to create appropriate client instances
+- split_batch_usage: Per-sample token usage for multi-sample (`n`) requests
 
 The design follows the Protocol pattern for extensibility, allowing new
 providers to be added without modifying existing code, while maintaining
@@ -47,6 +48,8 @@ class LLMResponse:
         timestamp_utc: ISO 8601 timestamp with 'Z' suffix when response was received
         web_search_results: Optional list of web search results if tools were used
         web_search_count: Number of web searches performed (0 if no web search)
+        hedge_outcome: "primary" or "hedge" when a hedge was sent, else None
+        hedge_cost_usd: Estimated extra spend on the hedge (not included in cost_usd)
 
     Example:
         >>> response = LLMResponse(
@@ -77,6 +80,34 @@ class LLMResponse:
     completion_tokens: int = 0
     web_search_results: list[dict] | None = None
     web_search_count: int = 0
+    hedge_outcome: str | None = None
+    hedge_cost_usd: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedResponse:
+    """
+    Fields a provider client reads from a successful response body.
+
+    Produced either by the typed msgspec decoders in response_schemas or by
+    a client's dict extraction; cost and metadata are added afterwards to
+    build the LLMResponse.
+
+    Attributes:
+        answer_text: The LLM's response text
+        tokens_used: Total tokens reported by the provider
+        prompt_tokens: Tokens in the prompt/input
+        completion_tokens: Tokens in the completion/output
+        web_search_results: Web search results if tools were used, else None
+        web_search_count: Number of web searches performed
+    """
+
+    answer_text: str
+    tokens_used: int
+    prompt_tokens: int
+    completion_tokens: int
+    web_search_results: list[dict] | None = None
+    web_search_count: int = 0
 
 
 class LLMClient(Protocol):
@@ -92,6 +123,11 @@ class LLMClient(Protocol):
     Methods:
         generate_answer: Execute LLM query asynchronously and return structured response
 
+    Clients for providers with a native `n` parameter may also implement
+    `async generate_answers(prompt, n) -> list[LLMResponse]`, returning n
+    samples from a single request (see split_batch_usage). Adaptive
+    sampling uses it when present.
+
     Example implementation:
         >>> class OpenAIClient:
         ...     def __init__(self, model_name: str, api_key: str):
@@ -151,6 +187,33 @@ class LLMClient(Protocol):
         ...
 
 
+def split_batch_usage(
+    prompt_tokens: int, completion_tokens: int, n: int
+) -> list[tuple[int, int]]:
+    """
+    Split one request's token usage across its n returned samples.
+
+    A request with `n` choices bills the prompt once, so prompt tokens are
+    attributed to the first sample only. Completion tokens are reported as a
+    single total and are split evenly, with any remainder on the first
+    sample. Summing the per-sample costs reproduces the request's cost.
+
+    Args:
+        prompt_tokens: Prompt tokens billed for the request
+        completion_tokens: Completion tokens across all choices
+        n: Number of samples returned
+
+    Returns:
+        (prompt_tokens, completion_tokens) per sample, in choice order
+
+    Example:
+        >>> split_batch_usage(120, 1001, 3)
+        [(120, 335), (0, 333), (0, 333)]
+    """
+    share, remainder = divmod(completion_tokens, n)
+    return [(prompt_tokens, share + remainder)] + [(0, share)] * (n - 1)
+
+
 def build_client(
     provider: str,
     model_name: str,
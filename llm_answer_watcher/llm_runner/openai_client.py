@@ -29,14 +29,19 @@ import httpx
 
 from llm_answer_watcher.config.capabilities import get_model_capabilities
 from llm_answer_watcher.config.constants import MAX_PROMPT_LENGTH
-from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
+from llm_answer_watcher.llm_runner.models import DecodedResponse, LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.time import utc_timestamp
 
+try:
+    from llm_answer_watcher.llm_runner.response_schemas import decode_openai_response
+except ImportError:  # msgspec not installed: stdlib json and dict extraction
+    decode_openai_response = None
+
 # Default temperature for models that support it
 DEFAULT_TEMPERATURE = 0.7
 
@@ -231,9 +236,12 @@ class OpenAIClient:
         capabilities = get_model_capabilities()
         if capabilities.supports_temperature("openai", self.model_name):
             payload["temperature"] = DEFAULT_TEMPERATURE
-            logger.debug(f"Using temperature {DEFAULT_TEMPERATURE} for model: {self.model_name}")
+            logger.debug("Using temperature %s for model: %s", DEFAULT_TEMPERATURE, self.model_name)
         else:
-            logger.debug(f"Using default temperature for model: {self.model_name} (custom temperature not supported)")
+            logger.debug(
+                "Using default temperature for model: %s (custom temperature not supported)",
+                self.model_name,
+            )
 
         # Add tools configuration if provided (direct passthrough to OpenAI API)
         # OpenAI format: [{"type": "web_search"}] with tool_choice control
@@ -242,9 +250,7 @@ class OpenAIClient:
         if self.tools:
             payload["tools"] = self.tools
             payload["tool_choice"] = self.tool_choice
-            logger.debug(
-                f"Enabled tools: {self.tools} with tool_choice={self.tool_choice}"
-            )
+            logger.debug("Enabled tools: %s with tool_choice=%s", self.tools, self.tool_choice)
 
         # GPT-5 models don't support max_tokens parameter, but we generally don't use it anyway
         # This is just for documentation - no changes needed since we don't set max_tokens
@@ -256,11 +262,11 @@ class OpenAIClient:
         }
 
         # Log request (NEVER log api_key or headers)
-        logger.debug(f"Sending request to OpenAI: model={self.model_name}")
+        logger.debug("Sending request to OpenAI: model=%s", self.model_name)
 
         # Make async HTTP request with context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     OPENAI_API_URL,
                     json=payload,
@@ -305,24 +311,14 @@ class OpenAIClient:
             logger.error(f"OpenAI API timeout: model={self.model_name}, error={e}")
             raise
 
-        # Parse response JSON
-        try:
-            data = response.json()
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse OpenAI response JSON: {e}") from e
-
-        # Debug: Log the entire response structure to understand token usage format
-        logger.debug(f"OpenAI Responses API response keys: {data.keys()}")
-        logger.debug(f"OpenAI usage field content: {data.get('usage', 'MISSING')}")
-
-        # Extract answer text
-        answer_text = self._extract_answer_text(data)
-
-        # Extract token usage (total, prompt, completion)
-        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
-
-        # Extract web search results (if tools were used)
-        web_search_results, web_search_count = self._extract_web_search_results(data)
+        # Extract answer text, token usage and web search results (if tools were used)
+        decoded = self._decode_response(response)
+        answer_text = decoded.answer_text
+        tokens_used = decoded.tokens_used
+        prompt_tokens = decoded.prompt_tokens
+        completion_tokens = decoded.completion_tokens
+        web_search_results = decoded.web_search_results
+        web_search_count = decoded.web_search_count
 
         # Calculate cost (including web search if applicable)
         # Build usage_meta in the format expected by cost estimation functions
@@ -378,6 +374,43 @@ class OpenAIClient:
             web_search_count=web_search_count,
         )
 
+    def _decode_response(self, response: httpx.Response) -> DecodedResponse:
+        """
+        Decode answer text, token usage and web search results from a response.
+
+        Well-formed bodies are decoded straight into typed structs when msgspec
+        is installed (see response_schemas); anything else goes through stdlib
+        json and the defensive dict extraction below.
+
+        Raises:
+            RuntimeError: If the body is not JSON or the answer is missing
+        """
+        if decode_openai_response is not None:
+            decoded = decode_openai_response(response.content)
+            if decoded is not None:
+                return decoded
+
+        try:
+            data = response.json()
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse OpenAI response JSON: {e}") from e
+
+        # Debug: Log the entire response structure to understand token usage format
+        logger.debug("OpenAI Responses API response keys: %s", data.keys())
+        logger.debug("OpenAI usage field content: %s", data.get("usage", "MISSING"))
+
+        answer_text = self._extract_answer_text(data)
+        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
+        web_search_results, web_search_count = self._extract_web_search_results(data)
+        return DecodedResponse(
+            answer_text=answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
         """
         Extract answer text from OpenAI Responses API response.
@@ -511,8 +544,8 @@ class OpenAIClient:
             return 0, 0, 0
 
         # Debug: Log what fields are in the usage object
-        logger.debug(f"Usage object keys for {self.model_name}: {list(usage.keys())}")
-        logger.debug(f"Usage object content: {usage}")
+        logger.debug("Usage object keys for %s: %s", self.model_name, list(usage.keys()))
+        logger.debug("Usage object content: %s", usage)
 
         # OpenAI Responses API uses input_tokens/output_tokens
         # Older Chat Completions API used prompt_tokens/completion_tokens
@@ -525,8 +558,11 @@ class OpenAIClient:
 
         # Log the extracted values
         logger.info(
-            f"Extracted token usage for {self.model_name}: "
-            f"total={total_tokens}, prompt={prompt_tokens}, completion={completion_tokens}"
+            "Extracted token usage for %s: total=%s, prompt=%s, completion=%s",
+            self.model_name,
+            total_tokens,
+            prompt_tokens,
+            completion_tokens,
         )
 
         return (
@@ -557,12 +593,14 @@ class OpenAIClient:
             if not output or not isinstance(output, list):
                 return None, 0
 
-            # Debug logging to understand response structure
-            output_types = [
-                item.get("type") if isinstance(item, dict) else type(item).__name__
-                for item in output
-            ]
-            logger.debug(f"Response output types: {output_types}")
+            # Debug logging to understand response structure (the list is
+            # only built when DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                output_types = [
+                    item.get("type") if isinstance(item, dict) else type(item).__name__
+                    for item in output
+                ]
+                logger.debug("Response output types: %s", output_types)
 
             web_search_results = []
             for item in output:
@@ -570,7 +608,7 @@ class OpenAIClient:
                     continue
 
                 item_type = item.get("type")
-                logger.debug(f"Processing output item type: {item_type}")
+                logger.debug("Processing output item type: %s", item_type)
 
                 # Check for web_search types (web_search_call, web_search, web_search_result)
                 if item_type in ("web_search_call", "web_search", "web_search_result"):
@@ -578,36 +616,30 @@ class OpenAIClient:
                     searches = item.get("searches", [])
                     if searches:
                         web_search_results.extend(searches)
-                        logger.debug(
-                            f"Found {len(searches)} searches in '{item_type}' item"
-                        )
+                        logger.debug("Found %d searches in '%s' item", len(searches), item_type)
 
                     # Also check for results field
                     results = item.get("results", [])
                     if results:
                         web_search_results.extend(results)
-                        logger.debug(
-                            f"Found {len(results)} results in '{item_type}' item"
-                        )
+                        logger.debug("Found %d results in '%s' item", len(results), item_type)
 
                     # Store the entire item if no sub-items found
                     if not searches and not results:
                         web_search_results.append(item)
-                        logger.debug(f"Stored full '{item_type}' item as search result")
+                        logger.debug("Stored full '%s' item as search result", item_type)
 
                 # Also check if item has search_results field (alternative structure)
                 if "search_results" in item:
                     search_results = item.get("search_results", [])
                     web_search_results.extend(search_results)
-                    logger.debug(
-                        f"Found search_results with {len(search_results)} results"
-                    )
+                    logger.debug("Found search_results with %d results", len(search_results))
 
             if not web_search_results:
                 logger.debug("No web search results found in response")
                 return None, 0
 
-            logger.debug(f"Extracted {len(web_search_results)} web search results")
+            logger.debug("Extracted %d web search results", len(web_search_results))
             return web_search_results, len(web_search_results)
 
         except (KeyError, TypeError) as e:
@@ -19,8 +19,8 @@ Key responsibilities:
 Architecture:
     OperationContext: Data container for template rendering
     OperationResult: Structured result from operation execution
-    render_template(): Template variable substitution
-    evaluate_condition(): Conditional execution logic
+    render_template(): Single-pass substitution over a precompiled template
+    evaluate_condition(): Conditional execution logic (precompiled conditions)
     execute_operation(): Execute single operation
     execute_operations_with_dependencies(): Execute multiple operations with DAG resolution
 
@@ -35,17 +35,35 @@ Example:
 """
 
 import logging
-import re
+import operator
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 from ..config.schema import RuntimeConfig, RuntimeOperation
+from ..config.templates import (
+    NOT_FOUND,
+    OPERATION_NAMESPACE,
+    CompiledCondition,
+    CompiledTemplate,
+    compile_condition,
+    compile_template,
+)
 from ..llm_runner.models import LLMResponse, build_client
 from ..utils.time import utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+_COMPARISONS: dict[str, Callable[[int, int], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
 
 @dataclass
 class OperationContext:
@@ -99,13 +117,13 @@ class OperationContext:
             self.operation_results = {}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationResult:
     """
     Structured result from operation execution.
 
     Contains the operation output along with metadata needed for
-    storage and cost tracking.
+    storage and cost tracking. Immutable; to_dict() gives the JSON artifact.
 
     Attributes:
         operation_id: Operation identifier
@@ -133,8 +151,55 @@ class OperationResult:
     skipped: bool = False
     error: str | None = None
 
+    def to_dict(self) -> dict:
+        """Convert to the operation result JSON structure (no deep copy)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-def render_template(template: str, context: OperationContext) -> str:
+def _join(key: str) -> Callable[[OperationContext], str]:
+    """Build a resolver that comma-joins a list from extraction_data."""
+    return lambda context: ", ".join(context.extraction_data.get(key, []))
+
+
+def _resolve_rank(context: OperationContext) -> str:
+    """Render my brand's rank, or "not found" if it was not ranked."""
+    my_rank = context.extraction_data.get("my_rank")
+    return str(my_rank) if my_rank is not None else NOT_FOUND
+
+
+# One resolver per template variable; only variables a template uses are computed
+_VARIABLE_RESOLVERS: dict[str, Callable[[OperationContext], str]] = {
+    "brand:mine": lambda context: context.extraction_data.get("my_brand", "unknown"),
+    "brand:mine_all": _join("my_brand_aliases"),
+    "brand:competitors": _join("competitors"),
+    "competitors:mentioned": _join("competitors_mentioned"),
+    "intent:id": lambda context: context.intent_data.get("id", ""),
+    "intent:prompt": lambda context: context.intent_data.get("prompt", ""),
+    "intent:response": lambda context: context.intent_data.get("response", ""),
+    "rank:mine": _resolve_rank,
+    "mentions:mine": _join("my_mentions"),
+    "mentions:competitors": _join("competitor_mentions"),
+    "model:provider": lambda context: context.model_info.get("provider", ""),
+    "model:name": lambda context: context.model_info.get("name", ""),
+    "run:id": lambda context: context.run_metadata.get("run_id", ""),
+    "run:timestamp": lambda context: context.run_metadata.get("timestamp", ""),
+}
+
+
+def _resolve_values(template: CompiledTemplate, context: OperationContext) -> dict[str, str]:
+    """Compute substitution values for the variables used by a template."""
+    values = {}
+    for key in template.variables:
+        resolver = _VARIABLE_RESOLVERS.get(key)
+        if resolver is not None:
+            values[key] = resolver(context)
+    for op_id in template.operation_refs:
+        if op_id in context.operation_results:
+            values[f"{OPERATION_NAMESPACE}:{op_id}"] = context.operation_results[op_id]
+    return values
+
+
+def render_template(template: str | CompiledTemplate, context: OperationContext) -> str:
     """
     Render operation prompt template with variable substitution.
 
@@ -155,76 +220,34 @@ def render_template(template: str, context: OperationContext) -> str:
         {run:id} - Run ID
         {run:timestamp} - UTC timestamp
 
+    Rendering is a single pass over the precompiled token list: substituted
+    values are never re-scanned, so an LLM response containing text like
+    "{rank:mine}" is passed through unchanged. References to operations that
+    have not produced a result are left as-is.
+
     Args:
-        template: Prompt template with variable placeholders
+        template: Prompt template, either precompiled (RuntimeOperation.compiled_prompt)
+                  or a raw string (compiled on first use and cached)
         context: Operation context with data for substitution
 
     Returns:
         Rendered prompt string with all variables substituted
 
+    Raises:
+        ValueError: If a raw template string contains unknown variables
+
     Example:
         >>> template = "Analyze {brand:mine} (rank {rank:mine}) in: {intent:response}"
         >>> rendered = render_template(template, context)
         >>> print(rendered)
         Analyze Instantly.ai (rank 3) in: Here are the top tools...
     """
-    rendered = template
-
-    # Brand variables
-    my_brand = context.extraction_data.get("my_brand", "unknown")
-    my_brand_aliases = context.extraction_data.get("my_brand_aliases", [])
-    competitors = context.extraction_data.get("competitors", [])
-    competitors_mentioned = context.extraction_data.get("competitors_mentioned", [])
-
-    rendered = rendered.replace("{brand:mine}", my_brand)
-    rendered = rendered.replace("{brand:mine_all}", ", ".join(my_brand_aliases))
-    rendered = rendered.replace("{brand:competitors}", ", ".join(competitors))
-    rendered = rendered.replace(
-        "{competitors:mentioned}", ", ".join(competitors_mentioned)
-    )
-
-    # Intent variables
-    rendered = rendered.replace("{intent:id}", context.intent_data.get("id", ""))
-    rendered = rendered.replace(
-        "{intent:prompt}", context.intent_data.get("prompt", "")
-    )
-    rendered = rendered.replace(
-        "{intent:response}", context.intent_data.get("response", "")
-    )
-
-    # Rank and mention variables
-    my_rank = context.extraction_data.get("my_rank")
-    rank_str = str(my_rank) if my_rank is not None else "not found"
-    rendered = rendered.replace("{rank:mine}", rank_str)
-
-    my_mentions = context.extraction_data.get("my_mentions", [])
-    competitor_mentions = context.extraction_data.get("competitor_mentions", [])
-    rendered = rendered.replace("{mentions:mine}", ", ".join(my_mentions))
-    rendered = rendered.replace(
-        "{mentions:competitors}", ", ".join(competitor_mentions)
-    )
-
-    # Model variables
-    rendered = rendered.replace(
-        "{model:provider}", context.model_info.get("provider", "")
-    )
-    rendered = rendered.replace("{model:name}", context.model_info.get("name", ""))
+    if isinstance(template, str):
+        template = compile_template(template)
+    return template.render(_resolve_values(template, context))
 
-    # Run metadata variables
-    rendered = rendered.replace("{run:id}", context.run_metadata.get("run_id", ""))
-    rendered = rendered.replace(
-        "{run:timestamp}", context.run_metadata.get("timestamp", "")
-    )
-
-    # Operation chaining variables
-    for op_id, op_result in context.operation_results.items():
-        placeholder = f"{{operation:{op_id}}}"
-        rendered = rendered.replace(placeholder, op_result)
-
-    return rendered
 
-
-def evaluate_condition(condition: str, context: OperationContext) -> bool:
+def evaluate_condition(condition: str | CompiledCondition, context: OperationContext) -> bool:
     """
     Evaluate conditional expression for operation execution.
 
@@ -235,11 +258,14 @@ def evaluate_condition(condition: str, context: OperationContext) -> bool:
         {competitors:mentioned} contains "HubSpot"
 
     Args:
-        condition: Condition string with variables
+        condition: Condition, either precompiled (RuntimeOperation.compiled_condition)
+                   or a raw string (compiled on first use and cached)
         context: Operation context for variable substitution
 
     Returns:
-        True if condition evaluates to true, False otherwise
+        True if condition evaluates to true, False otherwise. Conditions that
+        cannot be evaluated (unsupported syntax, non-numeric comparison
+        values) return True so the operation still runs.
 
     Example:
         >>> condition = "{rank:mine} > 3"
@@ -247,46 +273,35 @@ def evaluate_condition(condition: str, context: OperationContext) -> bool:
         >>> print(result)
         True
     """
-    # First render the condition template
-    rendered = render_template(condition, context)
-
-    # Handle null checks
-    if "== null" in rendered:
-        return "not found == null" in rendered
-
-    # Handle numeric comparisons
-    match = re.match(r"(\d+|not found)\s*(==|!=|>|<|>=|<=)\s*(\d+)", rendered)
-    if match:
-        left, op, right = match.groups()
-        if left == "not found":
-            return False  # Can't compare non-numeric
-
-        left_val = int(left)
-        right_val = int(right)
-
-        # Use operator mapping to reduce return statements
-        comparisons = {
-            "==": lambda left, right: left == right,
-            "!=": lambda left, right: left != right,
-            ">": lambda left, right: left > right,
-            "<": lambda left, right: left < right,
-            ">=": lambda left, right: left >= right,
-            "<=": lambda left, right: left <= right,
-        }
-        if op in comparisons:
-            return comparisons[op](left_val, right_val)
-
-    # Handle string contains checks
-    if " contains " in rendered:
-        parts = rendered.split(" contains ")
-        if len(parts) == 2:
-            haystack = parts[0].strip()
-            needle = parts[1].strip().strip('"').strip("'")
-            return needle in haystack
-
-    # Default: condition not understood, don't skip
-    logger.warning(f"Could not evaluate condition: {condition} (rendered: {rendered})")
-    return True
+    if isinstance(condition, str):
+        try:
+            condition = compile_condition(condition)
+        except ValueError as e:
+            logger.warning(f"Could not evaluate condition: {condition} ({e})")
+            return True
+
+    left = render_template(condition.left, context).strip()
+
+    if condition.kind == "null":
+        return left.endswith(NOT_FOUND)
+
+    right = render_template(condition.right, context).strip()
+
+    if condition.kind == "contains":
+        needle = right.strip('"').strip("'")
+        return needle in left
+
+    # Numeric comparison
+    if left == NOT_FOUND:
+        return False  # Can't compare non-numeric
+    if not left.isdigit() or not right.isdigit():
+        logger.warning(
+            f"Could not evaluate condition: {condition.source} "
+            f"(rendered: {left} {condition.operator} {right})"
+        )
+        return True
+
+    return _COMPARISONS[condition.operator](int(left), int(right))
 
 
 async def execute_operation(
@@ -341,8 +356,9 @@ async def execute_operation(
             skipped=True,
         )
 
-    # Evaluate condition if specified
-    if operation.condition and not evaluate_condition(operation.condition, context):
+    # Evaluate condition if specified (precompiled at config load when available)
+    condition = operation.compiled_condition or operation.condition
+    if condition and not evaluate_condition(condition, context):
         logger.info(
             f"Operation '{operation.id}' condition not met, skipping: {operation.condition}"
         )
@@ -359,8 +375,8 @@ async def execute_operation(
             skipped=True,
         )
 
-    # Render template
-    rendered_prompt = render_template(operation.prompt, context)
+    # Render template (precompiled at config load when available)
+    rendered_prompt = render_template(operation.compiled_prompt or operation.prompt, context)
 
     # Select model (priority: explicit override > operation_models > models)
     if operation.runtime_model:
@@ -28,15 +28,20 @@ from typing import Any
 
 import httpx
 
-from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
+from llm_answer_watcher.llm_runner.models import DecodedResponse, LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
 from llm_answer_watcher.utils.time import utc_timestamp
 
+try:
+    from llm_answer_watcher.llm_runner.response_schemas import decode_perplexity_response
+except ImportError:  # msgspec not installed: stdlib json and dict extraction
+    decode_perplexity_response = None
+
 # Suppress HTTPX request logging to prevent test interference
 httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
@@ -243,7 +248,7 @@ class PerplexityClient:
 
         # Make async HTTP request with context manager for proper cleanup
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     PERPLEXITY_API_URL,
                     json=payload,
@@ -288,17 +293,12 @@ class PerplexityClient:
             logger.error(f"Perplexity API timeout: model={self.model_name}, error={e}")
             raise
 
-        # Parse response JSON
-        try:
-            data = response.json()
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse Perplexity response JSON: {e}") from e
-
-        # Extract answer text
-        answer_text = self._extract_answer_text(data)
-
-        # Extract token usage (prompt and completion)
-        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
+        # Extract answer text and token usage (prompt and completion)
+        decoded = self._decode_response(response)
+        answer_text = decoded.answer_text
+        tokens_used = decoded.tokens_used
+        prompt_tokens = decoded.prompt_tokens
+        completion_tokens = decoded.completion_tokens
 
         # Calculate cost
         usage_meta = {
@@ -324,6 +324,36 @@ class PerplexityClient:
             web_search_count=0,
         )
 
+    def _decode_response(self, response: httpx.Response) -> DecodedResponse:
+        """
+        Decode answer text, token usage and web search results from a response.
+
+        Well-formed bodies are decoded straight into typed structs when msgspec
+        is installed (see response_schemas); anything else goes through stdlib
+        json and the defensive dict extraction below.
+
+        Raises:
+            RuntimeError: If the body is not JSON or the answer is missing
+        """
+        if decode_perplexity_response is not None:
+            decoded = decode_perplexity_response(response.content)
+            if decoded is not None:
+                return decoded
+
+        try:
+            data = response.json()
+        except Exception as e:
+            raise RuntimeError(f"Failed to parse Perplexity response JSON: {e}") from e
+
+        answer_text = self._extract_answer_text(data)
+        tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
+        return DecodedResponse(
+            answer_text=answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
         """
         Extract answer text from Perplexity Chat Completions API response.
@@ -16,6 +16,10 @@ Architecture:
     instances on demand. This design supports both built-in runners (API, Steel)
     and future external plugins via entry points.
 
+    Built-in plugin modules are discovered lazily: they are imported on the
+    first registry lookup, not when llm_runner is imported, so code paths that
+    never create a runner (CLI --help, validate, prices) skip the Steel SDK.
+
 Example:
     >>> # Define a plugin
     >>> @RunnerRegistry.register
@@ -47,6 +51,7 @@ Example:
     >>> result = runner.run_intent("What are the best CRM tools?")
 """
 
+import importlib
 import logging
 from typing import Protocol
 
@@ -54,6 +59,13 @@ from .intent_runner import IntentRunner
 
 logger = logging.getLogger(__name__)
 
+# Modules whose @RunnerRegistry.register decorators define the built-in plugins
+BUILTIN_PLUGIN_MODULES = (
+    "llm_answer_watcher.llm_runner.api_runner",
+    "llm_answer_watcher.llm_runner.browser.steel_chatgpt",
+    "llm_answer_watcher.llm_runner.browser.steel_perplexity",
+)
+
 
 class RunnerPlugin(Protocol):
     """
@@ -216,6 +228,7 @@ class RunnerRegistry:
 
     Class attributes:
         _plugins: Dictionary mapping plugin names to plugin classes
+        _discovered: Whether BUILTIN_PLUGIN_MODULES have been imported
 
     Class methods:
         register: Decorator to auto-register plugin classes
@@ -253,6 +266,31 @@ class RunnerRegistry:
 
     # Global registry of plugin name -> plugin class
     _plugins: dict[str, type] = {}
+    _discovered: bool = False
+
+    @classmethod
+    def discover(cls) -> None:
+        """
+        Import the built-in plugin modules so they register themselves.
+
+        Called automatically by every lookup method; runs once per process.
+        A plugin module that fails to import (e.g. a missing optional SDK) is
+        logged and skipped so the remaining plugins stay available.
+
+        Example:
+            >>> RunnerRegistry.discover()
+            >>> RunnerRegistry.is_registered("steel-chatgpt")
+            True
+        """
+        if cls._discovered:
+            return
+        cls._discovered = True
+
+        for module_name in BUILTIN_PLUGIN_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                logger.warning(f"Skipping runner plugins from {module_name}: {e}")
 
     @classmethod
     def register(cls, plugin_class: type) -> type:
@@ -348,6 +386,8 @@ class RunnerRegistry:
             - Config validation is performed before runner creation
             - API keys in config should never be logged
         """
+        cls.discover()
+
         # Check if plugin exists
         if plugin_name not in cls._plugins:
             available = ", ".join(cls._plugins.keys()) if cls._plugins else "none"
@@ -393,6 +433,7 @@ class RunnerRegistry:
             steel-chatgpt (browser)
               Requires: STEEL_API_KEY
         """
+        cls.discover()
         return [
             {
                 "name": name,
@@ -422,6 +463,7 @@ class RunnerRegistry:
             >>> plugin.runner_type()
             'api'
         """
+        cls.discover()
         if plugin_name not in cls._plugins:
             raise ValueError(f"Unknown plugin: '{plugin_name}'")
         return cls._plugins[plugin_name]
@@ -443,4 +485,5 @@ class RunnerRegistry:
             >>> RunnerRegistry.is_registered("unknown-plugin")
             False
         """
+        cls.discover()
         return plugin_name in cls._plugins
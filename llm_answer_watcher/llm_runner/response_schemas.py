@@ -0,0 +1,293 @@
+"""
+Typed response schemas for provider APIs, decoded with msgspec.
+
+Provider clients decode response bodies straight into these structs instead
+of building dicts for the whole response with response.json() and walking
+them by hand. Fields no extractor reads (message annotations, safety
+ratings, citations, search snippets...) are skipped by the decoder without
+allocating Python objects.
+
+The schemas describe well-formed responses only. Each decode_* function
+returns None when the body is not valid JSON, does not match the schema, or
+needs the defensive handling in the client (missing usage, no text content,
+function calls, blocked Gemini candidates). The client then falls back to
+stdlib json and its dict extraction, which keeps every existing error and
+warning. Importing this module raises ImportError when msgspec is not
+installed; clients use the same fallback then.
+
+Examples:
+    >>> decoded = decode_perplexity_response(response.content)
+    >>> decoded.answer_text if decoded is not None else "use dict extraction"
+"""
+
+from typing import Any
+
+import msgspec
+
+from .models import DecodedResponse
+
+# OpenAI output item types carrying web search data
+OPENAI_WEB_SEARCH_ITEM_TYPES = ("web_search_call", "web_search", "web_search_result")
+
+
+# --- OpenAI Responses API ---
+
+
+class _OpenAIContentPart(msgspec.Struct):
+    type: str | None = None
+    text: str | None = None
+
+
+class _OpenAIOutputItem(msgspec.Struct):
+    type: str | None = None
+    content: list[_OpenAIContentPart] | str | None = None
+    searches: list[Any] = []
+    results: list[Any] = []
+    search_results: list[Any] = []
+
+
+class _OpenAIUsage(msgspec.Struct):
+    total_tokens: int | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+
+
+class _OpenAIResponse(msgspec.Struct):
+    # Raw items: web search items without sub-results are stored verbatim
+    output: list[msgspec.Raw] = []
+    usage: _OpenAIUsage | None = None
+
+
+# --- Gemini generateContent API ---
+
+
+class _GeminiPart(msgspec.Struct):
+    text: str | None = None
+
+
+class _GeminiContent(msgspec.Struct):
+    parts: list[_GeminiPart] = []
+
+
+class _GeminiWeb(msgspec.Struct):
+    uri: str = ""
+    title: str = ""
+
+
+class _GeminiChunk(msgspec.Struct):
+    web: _GeminiWeb | None = None
+
+
+class _GeminiGrounding(msgspec.Struct, rename="camel"):
+    web_search_queries: list[Any] = []
+    grounding_chunks: list[_GeminiChunk] = []
+    grounding_supports: list[Any] = []
+
+
+class _GeminiCandidate(msgspec.Struct, rename="camel"):
+    content: _GeminiContent | None = None
+    finish_reason: str | None = None
+    grounding_metadata: _GeminiGrounding | None = None
+
+
+class _GeminiUsage(msgspec.Struct, rename="camel"):
+    prompt_token_count: int | None = None
+    candidates_token_count: int | None = None
+    total_token_count: int | None = None
+
+
+class _GeminiResponse(msgspec.Struct, rename="camel"):
+    candidates: list[_GeminiCandidate] = []
+    usage_metadata: _GeminiUsage | None = None
+
+
+# --- Perplexity Chat Completions API ---
+
+
+class _PerplexityMessage(msgspec.Struct):
+    content: str | None = None
+
+
+class _PerplexityChoice(msgspec.Struct):
+    message: _PerplexityMessage | None = None
+
+
+class _PerplexityUsage(msgspec.Struct):
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    total_tokens: int | None = None
+
+
+class _PerplexityResponse(msgspec.Struct):
+    choices: list[_PerplexityChoice] = []
+    usage: _PerplexityUsage | None = None
+
+
+# Decoders are reusable and cheaper than msgspec.json.decode(type=...) per call
+_openai_decoder = msgspec.json.Decoder(_OpenAIResponse)
+_openai_item_decoder = msgspec.json.Decoder(_OpenAIOutputItem)
+_gemini_decoder = msgspec.json.Decoder(_GeminiResponse)
+_perplexity_decoder = msgspec.json.Decoder(_PerplexityResponse)
+
+
+def _openai_message_text(item: _OpenAIOutputItem) -> str | None:
+    """First non-empty text of a message item (as _extract_answer_text finds it)."""
+    if isinstance(item.content, str):
+        return item.content or None
+    for part in item.content or ():
+        if part.type == "output_text" and part.text:
+            return part.text
+    return None
+
+
+def decode_openai_response(content: bytes) -> DecodedResponse | None:
+    """
+    Decode an OpenAI Responses API body, or None to use dict extraction.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        DecodedResponse, or None if the body needs the client's fallback path
+    """
+    try:
+        response = _openai_decoder.decode(content)
+        items = [(raw, _openai_item_decoder.decode(raw)) for raw in response.output]
+    except (msgspec.DecodeError, TypeError):
+        return None
+
+    usage = response.usage
+    if not items or usage is None or usage == _OpenAIUsage():
+        return None
+    # Function calls are formatted for function_extractor by the client
+    if any(item.type == "function_call" for _, item in items):
+        return None
+
+    answer_text = None
+    web_search_results: list = []
+    for raw, item in items:
+        if answer_text is None and (not item.type or item.type == "message"):
+            answer_text = _openai_message_text(item)
+        if item.type in OPENAI_WEB_SEARCH_ITEM_TYPES:
+            web_search_results.extend(item.searches)
+            web_search_results.extend(item.results)
+            if not item.searches and not item.results:
+                web_search_results.append(msgspec.json.decode(raw))
+        web_search_results.extend(item.search_results)
+    if answer_text is None:
+        return None
+
+    prompt_tokens = usage.input_tokens or usage.prompt_tokens or 0
+    completion_tokens = usage.output_tokens or usage.completion_tokens or 0
+    return DecodedResponse(
+        answer_text=answer_text,
+        tokens_used=usage.total_tokens or 0,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        web_search_results=web_search_results or None,
+        web_search_count=len(web_search_results),
+    )
+
+
+def _gemini_grounding_results(
+    grounding: _GeminiGrounding | None,
+) -> tuple[list[dict] | None, int]:
+    """Web search results as _extract_grounding_metadata builds them."""
+    if grounding is None:
+        return None, 0
+
+    web_search_results: list[dict] = [
+        {"type": "web_search_query", "query": str(query)} for query in grounding.web_search_queries
+    ]
+    web_search_results.extend(
+        {"type": "web_search_source", "uri": chunk.web.uri, "title": chunk.web.title}
+        for chunk in grounding.grounding_chunks
+        if chunk.web is not None
+    )
+    if grounding.grounding_supports:
+        web_search_results.append(
+            {"type": "grounding_supports", "supports": grounding.grounding_supports}
+        )
+    if not web_search_results:
+        return None, 0
+    return web_search_results, len(grounding.web_search_queries)
+
+
+def decode_gemini_response(content: bytes) -> DecodedResponse | None:
+    """
+    Decode a Gemini generateContent body, or None to use dict extraction.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        DecodedResponse, or None if the body needs the client's fallback path
+    """
+    try:
+        response = _gemini_decoder.decode(content)
+    except (msgspec.DecodeError, TypeError):
+        return None
+
+    usage = response.usage_metadata
+    if not response.candidates or usage is None or usage == _GeminiUsage():
+        return None
+    candidate = response.candidates[0]
+    if candidate.finish_reason and candidate.finish_reason != "STOP":
+        return None
+    if candidate.content is None or not candidate.content.parts:
+        return None
+    answer_text = candidate.content.parts[0].text
+    if answer_text is None:
+        return None
+
+    prompt_tokens = usage.prompt_token_count or 0
+    completion_tokens = usage.candidates_token_count or 0
+    total_tokens = usage.total_token_count
+    if total_tokens is None:
+        total_tokens = prompt_tokens + completion_tokens
+    web_search_results, web_search_count = _gemini_grounding_results(candidate.grounding_metadata)
+    return DecodedResponse(
+        answer_text=answer_text,
+        tokens_used=total_tokens,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        web_search_results=web_search_results,
+        web_search_count=web_search_count,
+    )
+
+
+def decode_perplexity_response(content: bytes) -> DecodedResponse | None:
+    """
+    Decode a Perplexity Chat Completions body, or None to use dict extraction.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        DecodedResponse, or None if the body needs the client's fallback path
+    """
+    try:
+        response = _perplexity_decoder.decode(content)
+    except (msgspec.DecodeError, TypeError):
+        return None
+
+    usage = response.usage
+    if not response.choices or usage is None or usage == _PerplexityUsage():
+        return None
+    message = response.choices[0].message
+    if message is None or message.content is None:
+        return None
+
+    prompt_tokens = usage.prompt_tokens or 0
+    completion_tokens = usage.completion_tokens or 0
+    total_tokens = usage.total_tokens
+    if total_tokens is None:
+        total_tokens = prompt_tokens + completion_tokens
+    return DecodedResponse(
+        answer_text=message.content,
+        tokens_used=total_tokens,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
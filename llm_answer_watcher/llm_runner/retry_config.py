@@ -34,6 +34,9 @@ from tenacity import (
     wait_exponential,
 )
 
+from .circuit_breaker import retry_if_permitted
+from .deadline import stop_before_deadline
+
 # ============================================================================
 # RETRY CONSTANTS
 # ============================================================================
@@ -67,6 +70,8 @@ NO_RETRY_STATUS_CODES = frozenset([401, 400, 404])
 # Applies to each individual request attempt
 # Protects against hung connections
 # Increased for GPT-5 models which may take longer to respond
+# Requests still in flight at a run or model deadline are cancelled sooner
+# (see deadline.unit_deadline)
 REQUEST_TIMEOUT = 120.0
 
 # ============================================================================
@@ -106,6 +111,13 @@ def create_retry_decorator():
         - httpx.ConnectError (network issues)
         - httpx.TimeoutException (request timeouts)
 
+        Inside run_all, retries also need the model's circuit breaker to be
+        closed and the run-wide retry budget to have retries left (see
+        circuit_breaker.retry_if_permitted). Elsewhere nothing changes.
+
+        Retrying also stops when the next backoff would end after the
+        active deadline (see deadline.stop_before_deadline).
+
     Design rationale:
         - Uses wait_exponential with multiplier=1 for simple 2^n backoff
         - Starts at MIN_WAIT_SECONDS (1s) to give servers time to recover
@@ -113,7 +125,7 @@ def create_retry_decorator():
         - Reraises exception after all attempts to preserve stack trace
     """
     return retry(
-        stop=stop_after_attempt(MAX_ATTEMPTS),
+        stop=stop_after_attempt(MAX_ATTEMPTS) | stop_before_deadline(),
         wait=wait_exponential(
             multiplier=1,
             min=MIN_WAIT_SECONDS,
@@ -125,6 +137,7 @@ def create_retry_decorator():
                 httpx.ConnectError,
                 httpx.TimeoutException,
             )
-        ),
+        )
+        & retry_if_permitted(MAX_ATTEMPTS),
         reraise=True,
     )
@@ -35,20 +35,33 @@ Architecture:
 import asyncio
 import json
 import logging
+import os
 import sqlite3
+import time
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
 
 from ..config.schema import RuntimeConfig
-from ..exceptions import BudgetExceededError
+from ..exceptions import BudgetExceededError, LLMCircuitOpenError
 from ..extractor.intent_classifier import classify_intent
+from ..extractor.memo import ExtractionMemo
 from ..extractor.parser import parse_answer
 from ..storage.db import (
     insert_answer_raw,
+    insert_answer_sample,
     insert_intent_classification,
     insert_mention,
     insert_operation,
+    insert_query_skip,
     insert_run,
+    insert_sample_aggregate,
+)
+from ..storage.layout import (
+    get_parsed_answer_filename,
+    get_raw_answer_filename,
+    get_run_directory,
 )
 from ..storage.writer import (
     create_run_directory,
@@ -59,18 +72,36 @@ from ..storage.writer import (
     write_run_meta,
 )
 from ..utils.time import run_id_from_timestamp, utc_timestamp
-from .intent_runner import IntentResult
+from .circuit_breaker import BreakerRegistry, RetryBudget, RetryGuard, retry_guard
+from .deadline import deadline_scope, expired, unit_deadline
+from .hedging import HedgedLLMClient, HedgePolicy
+from .intent_runner import IntentResult, IntentRunner
+from .ledger import CostLedger
 from .models import build_client
 from .operation_executor import (
     OperationContext,
     execute_operations_with_dependencies,
 )
 from .plugin_registry import RunnerRegistry
+from .sampling import (
+    STOP_CONVERGED,
+    SamplingResult,
+    UnitSample,
+    request_samples,
+    sample_until_confident,
+)
+from .scheduler import LatencyScheduler, WorkUnit
+from .stability import SkipDecision, StabilityPolicy
 
 logger = logging.getLogger(__name__)
 
+# Reasons recorded for timed_out units
+TIMEOUT_RUN_DEADLINE = "run_deadline"
+TIMEOUT_MODEL = "model_timeout"
+TIMEOUT_NOT_STARTED = "not_started"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RawAnswerRecord:
     """
     Intermediate data structure for raw LLM response.
@@ -78,6 +109,10 @@ class RawAnswerRecord:
     Holds the raw answer from an LLM along with metadata before writing
     to JSON and database. Used in run_all() orchestration.
 
+    Immutable and slotted. to_dict() gives the raw answer JSON artifact and
+    db_params() the insert_answer_raw() arguments; neither copies the answer
+    text, usage or web search data.
+
     Attributes:
         intent_id: Intent query identifier (e.g., "email-warmup")
         prompt: The actual prompt text sent to LLM
@@ -95,6 +130,10 @@ class RawAnswerRecord:
         screenshot_path: Optional path to screenshot file (browser runners only)
         html_snapshot_path: Optional path to HTML snapshot file (browser runners only)
         session_id: Optional browser session ID (browser runners only)
+        latency_ms: Wall time of the request (or runner execution) in milliseconds
+        hedge_outcome: "primary" or "hedge" if a hedged request was sent, else None
+        hedge_cost_usd: Estimated extra spend on the hedge (included in estimated_cost_usd)
+        phase_timings: Seconds per browser runner phase (from IntentResult), else None
 
     Example:
         >>> # API runner example
@@ -148,10 +187,48 @@ class RawAnswerRecord:
     screenshot_path: str | None = None
     html_snapshot_path: str | None = None
     session_id: str | None = None
+    latency_ms: int | None = None
+    hedge_outcome: str | None = None
+    hedge_cost_usd: float = 0.0
+    phase_timings: dict[str, float] | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to the raw answer JSON structure (no deep copy)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def db_params(self) -> dict:
+        """
+        Keyword arguments for insert_answer_raw() (besides conn and run_id).
+
+        usage_meta and web_search_results are JSON-encoded here, once per
+        answer. The decoded web_search_results are passed along too, so
+        sources are extracted without decoding the JSON again.
+        """
+        return {
+            "intent_id": self.intent_id,
+            "model_provider": self.model_provider,
+            "model_name": self.model_name,
+            "timestamp_utc": self.timestamp_utc,
+            "prompt": self.prompt,
+            "answer_text": self.answer_text,
+            "usage_meta_json": json.dumps(self.usage_meta),
+            "estimated_cost_usd": self.estimated_cost_usd,
+            "web_search_count": self.web_search_count,
+            "web_search_results_json": json.dumps(self.web_search_results)
+            if self.web_search_results
+            else None,
+            "web_search_results": self.web_search_results,
+            "runner_type": self.runner_type,
+            "runner_name": self.runner_name,
+            "screenshot_path": self.screenshot_path,
+            "html_snapshot_path": self.html_snapshot_path,
+            "session_id": self.session_id,
+            "latency_ms": self.latency_ms,
+        }
 
 
 def intent_result_to_raw_record(
-    result: IntentResult, intent_id: str, prompt: str
+    result: IntentResult, intent_id: str, prompt: str, latency_ms: int | None = None
 ) -> RawAnswerRecord:
     """
     Convert IntentResult (from browser/custom runner) to RawAnswerRecord.
@@ -164,6 +241,7 @@ def intent_result_to_raw_record(
         result: IntentResult from runner.run_intent()
         intent_id: Intent query identifier
         prompt: The actual prompt text sent to runner
+        latency_ms: Wall time of the runner execution in milliseconds
 
     Returns:
         RawAnswerRecord ready for JSON serialization and database storage
@@ -226,9 +304,136 @@ def intent_result_to_raw_record(
         screenshot_path=result.screenshot_path,
         html_snapshot_path=result.html_snapshot_path,
         session_id=result.session_id,
+        latency_ms=latency_ms,
+        phase_timings=result.phase_timings,
     )
 
 
+def _release_runner_thread(
+    slots: asyncio.Semaphore, threads: set[asyncio.Future], thread: asyncio.Future
+) -> None:
+    """Free a finished run_intent thread's slot on its runner."""
+    slots.release()
+    threads.discard(thread)
+    if not thread.cancelled():
+        thread.exception()  # mark retrieved when the waiting unit timed out
+
+
+def _my_rank(extraction) -> int | None:
+    """Rank of my brand in an extraction's ranked list, if it was ranked."""
+    mine = {m.normalized_name for m in extraction.my_mentions}
+    for ranked in extraction.ranked_list:
+        if ranked.brand_name in mine:
+            return ranked.rank_position
+    return None
+
+
+def _store_sampling_result(
+    db_path: str,
+    run_id: str,
+    intent_id: str,
+    model_config,
+    result: SamplingResult,
+) -> None:
+    """
+    Store per-sample rows and the unit's mention-rate estimate.
+
+    Database errors are logged, not raised, like other run writes.
+    """
+    rate, low, high = result.tracker.mine_interval()
+    total_cost = sum(
+        s.response.cost_usd + s.extraction.extraction_cost_usd for s in result.samples
+    )
+    try:
+        with sqlite3.connect(db_path) as conn:
+            for sample in result.samples:
+                insert_answer_sample(
+                    conn=conn,
+                    run_id=run_id,
+                    intent_id=intent_id,
+                    model_provider=model_config.provider,
+                    model_name=model_config.model_name,
+                    sample_index=sample.index,
+                    timestamp_utc=sample.response.timestamp_utc,
+                    answer_text=sample.response.answer_text,
+                    appeared_mine=sample.extraction.appeared_mine,
+                    competitors=sorted(
+                        {m.normalized_name for m in sample.extraction.competitor_mentions}
+                    ),
+                    my_rank=_my_rank(sample.extraction),
+                    prompt_tokens=sample.response.prompt_tokens,
+                    completion_tokens=sample.response.completion_tokens,
+                    cost_usd=sample.response.cost_usd,
+                    request_samples=sample.request_samples,
+                )
+            insert_sample_aggregate(
+                conn=conn,
+                run_id=run_id,
+                intent_id=intent_id,
+                model_provider=model_config.provider,
+                model_name=model_config.model_name,
+                timestamp_utc=utc_timestamp(),
+                sample_count=len(result.samples),
+                request_count=result.requests,
+                mention_rate=round(rate, 4),
+                ci_low=round(low, 4),
+                ci_high=round(high, 4),
+                confidence=result.tracker.confidence,
+                brand_rates=result.tracker.brand_rates(),
+                stop_reason=result.stop_reason,
+                total_cost_usd=total_cost,
+            )
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to insert sampling results into database: {e}", exc_info=True)
+
+    logger.info(
+        f"Sampled intent={intent_id}, model={model_config.model_name}: "
+        f"{len(result.samples)} samples in {result.requests} requests "
+        f"({result.stop_reason}), mention_rate={rate:.2f} [{low:.2f}, {high:.2f}]"
+    )
+
+
+def _carry_forward_answer(
+    output_dir: str,
+    run_dir: str,
+    intent_id: str,
+    provider: str,
+    model_name: str,
+    *,
+    decision: SkipDecision,
+) -> bool:
+    """
+    Copy a skipped unit's latest raw and parsed answers into this run.
+
+    The copies gain a carried_from_run_id field so reports and summaries
+    can show the answer without it being mistaken for a fresh one.
+
+    Returns:
+        False if the previous run's artifacts are gone, in which case the
+        unit must be queried instead
+    """
+    previous_dir = get_run_directory(output_dir, decision.carried_from_run_id)
+    artifacts = []
+    for filename in (
+        get_raw_answer_filename(intent_id, provider, model_name),
+        get_parsed_answer_filename(intent_id, provider, model_name),
+    ):
+        try:
+            with open(os.path.join(previous_dir, filename), encoding="utf-8") as f:
+                artifacts.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Cannot carry forward {filename} from {previous_dir}: {e}")
+            return False
+
+    raw, parsed = artifacts
+    for data in (raw, parsed):
+        data["carried_from_run_id"] = decision.carried_from_run_id
+    write_raw_answer(run_dir, intent_id, provider, model_name, raw)
+    write_parsed_answer(run_dir, intent_id, provider, model_name, parsed)
+    return True
+
+
 def estimate_run_cost(config: RuntimeConfig) -> dict:
     """
     Estimate total cost for a run before execution.
@@ -237,6 +442,7 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
     - Input tokens: 150 per query (prompt + system)
     - Output tokens: 500 per query (answer)
     - Web search: $0.01 per call if tools enabled
+    - Adaptive sampling: every query costs max_samples answers
 
     Adds 20% buffer for safety.
 
@@ -246,10 +452,15 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
     Returns:
         dict: Cost estimate with breakdown:
             - total_estimated_cost: Total estimated cost in USD
-            - per_intent_costs: Dict mapping intent_id to estimated cost
+            - total_intents: Intents counted (inline + intents_source rows)
+            - per_intent_costs: Dict mapping inline intent_id to estimated cost
+            - max_intent_cost: Highest estimated cost of any single intent
+            - source_rows_skipped: intents_source rows rejected as invalid
             - per_model_costs: List of dicts with per-model breakdown
             - total_queries: Total number of queries
             - buffer_percentage: Safety buffer applied (20%)
+            - max_samples_per_query: Samples budgeted per query (sampling.max_samples,
+              1 without adaptive sampling)
 
     Example:
         >>> estimate = estimate_run_cost(config)
@@ -265,64 +476,61 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
     AVG_OUTPUT_TOKENS = 500  # Response
     BUFFER_PERCENTAGE = 0.20  # 20% safety buffer
 
-    total_cost = 0.0
-    per_intent_costs = {}
-    per_model_costs = []
-
-    for intent in config.intents:
-        intent_cost = 0.0
-
-        for model in config.models:
-            # Get pricing for this model
-            try:
-                pricing = get_pricing(model.provider, model.model_name)
-                input_rate = pricing.input / 1_000_000  # Convert to per-token
-                output_rate = pricing.output / 1_000_000
-            except (PricingNotAvailableError, Exception) as e:
-                logger.warning(
-                    f"Cannot estimate cost for {model.provider}/{model.model_name}: {e}. "
-                    "Using $0.002 fallback."
-                )
-                # Fallback: assume ~$0.002 per query (gpt-4o-mini ballpark)
-                input_rate = 0.00000015  # $0.15/1M
-                output_rate = 0.0000006  # $0.60/1M
-
-            # Calculate token cost
-            query_cost = (AVG_INPUT_TOKENS * input_rate) + (
-                AVG_OUTPUT_TOKENS * output_rate
-            )
-
-            # Add web search cost if tools enabled
-            if model.tools:
-                # Assume 1 web search per query
-                web_search_cost = 0.01  # $10/1k = $0.01 per call
-                query_cost += web_search_cost
-
-            intent_cost += query_cost
-
-        per_intent_costs[intent.id] = round(intent_cost, 6)
-        total_cost += intent_cost
-
-    # Calculate per-model breakdown (cost across all intents)
+    # Price each model once; every intent is sent to every model
+    model_query_costs = []
     for model in config.models:
         # Get pricing for this model
         try:
             pricing = get_pricing(model.provider, model.model_name)
-            input_rate = pricing.input / 1_000_000
+            input_rate = pricing.input / 1_000_000  # Convert to per-token
             output_rate = pricing.output / 1_000_000
-        except (PricingNotAvailableError, Exception):
-            input_rate = 0.00000015
-            output_rate = 0.0000006
+        except (PricingNotAvailableError, Exception) as e:
+            logger.warning(
+                f"Cannot estimate cost for {model.provider}/{model.model_name}: {e}. "
+                "Using $0.002 fallback."
+            )
+            # Fallback: assume ~$0.002 per query (gpt-4o-mini ballpark)
+            input_rate = 0.00000015  # $0.15/1M
+            output_rate = 0.0000006  # $0.60/1M
 
-        # Calculate cost per query
+        # Calculate token cost
         query_cost = (AVG_INPUT_TOKENS * input_rate) + (AVG_OUTPUT_TOKENS * output_rate)
 
         # Add web search cost if tools enabled
         if model.tools:
-            query_cost += 0.01
+            # Assume 1 web search per query
+            web_search_cost = 0.01  # $10/1k = $0.01 per call
+            query_cost += web_search_cost
+
+        model_query_costs.append(query_cost)
+
+    # Adaptive sampling may take up to max_samples answers per query; budget
+    # for the worst case (prompt billing saved by native `n` is ignored)
+    sampling = config.run_settings.sampling
+    samples_per_query = sampling.max_samples if sampling and sampling.enabled else 1
+    model_query_costs = [cost * samples_per_query for cost in model_query_costs]
+
+    intent_cost = sum(model_query_costs)
+
+    # Single streaming pass over intents (inline + intents_source). Per-intent
+    # costs are only kept for inline intents so a large source stays unmaterialized.
+    total_cost = 0.0
+    per_intent_costs = {}
+    inline_ids = {intent.id for intent in config.intents}
+    intent_operations = 0
+    intents = config.iter_intents()
+    for intent in intents:
+        if intent.id in inline_ids:
+            per_intent_costs[intent.id] = round(intent_cost, 6)
+        intent_operations += len(intent.operations)
+        total_cost += intent_cost
+    total_intents = intents.count
 
+    # Calculate per-model breakdown (cost across all intents)
+    per_model_costs = []
+    for model, query_cost in zip(config.models, model_query_costs, strict=True):
         # Total cost for this model across all intents
-        model_total = query_cost * len(config.intents)
+        model_total = query_cost * total_intents
 
         per_model_costs.append(
             {
@@ -330,7 +538,7 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
                 "model_name": model.model_name,
                 "cost_per_query": round(query_cost, 6),
                 "total_cost": round(model_total, 6),
-                "num_queries": len(config.intents),
+                "num_queries": total_intents,
                 "has_web_search": bool(model.tools),
             }
         )
@@ -367,12 +575,10 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
 
             # Count total operation executions
             # Each intent runs: len(global_operations) + len(intent.operations)
-            ops_per_intent = len(config.global_operations)
-            for intent in config.intents:
-                ops_per_intent += len(intent.operations)
+            ops_per_intent = len(config.global_operations) + intent_operations
 
             # Total operations across all intents
-            num_operations = ops_per_intent * len(config.intents)
+            num_operations = ops_per_intent * total_intents
             total_operations += num_operations
 
             # Calculate total cost for this operation model
@@ -394,13 +600,17 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
 
     return {
         "total_estimated_cost": round(total_with_buffer, 6),
-        "total_queries": len(config.intents) * len(config.models),
+        "total_intents": total_intents,
+        "total_queries": total_intents * len(config.models),
         "total_operations": total_operations,
         "per_intent_costs": per_intent_costs,
+        "max_intent_cost": round(intent_cost, 6) if total_intents else 0.0,
+        "source_rows_skipped": intents.rows_skipped,
         "per_model_costs": per_model_costs,
         "per_operation_model_costs": per_operation_model_costs,
         "buffer_percentage": BUFFER_PERCENTAGE,
         "base_cost": round(total_cost, 6),
+        "max_samples_per_query": samples_per_query,
     }
 
 
@@ -457,6 +667,18 @@ def validate_budget(config: RuntimeConfig, cost_estimate: dict) -> None:
                     budget_type="per_intent",
                 )
 
+        # intents_source rows are not listed individually; they cost the same
+        max_intent_cost = cost_estimate.get("max_intent_cost", 0.0)
+        if config.intents_source is not None and max_intent_cost > budget.max_per_intent_usd:
+            raise BudgetExceededError(
+                f"Estimated cost per intent from intents_source (${max_intent_cost:.4f}) "
+                f"exceeds max_per_intent_usd budget of ${budget.max_per_intent_usd:.2f}. "
+                f"Use --force to override or increase budget limit.",
+                estimated_cost=max_intent_cost,
+                budget_limit=budget.max_per_intent_usd,
+                budget_type="per_intent",
+            )
+
     # Check warning threshold
     if budget.warn_threshold_usd is not None and total_cost > budget.warn_threshold_usd:
         logger.warning(
@@ -469,6 +691,10 @@ async def run_all(
     config: RuntimeConfig,
     progress_callback: Callable[[], None] | None = None,
     config_filename: str | None = None,
+    memo: ExtractionMemo | None = None,
+    run_id: str | None = None,
+    *,
+    record_run: bool = True,
 ) -> dict:
     """
     Execute complete LLM query workflow with parallel execution and return results.
@@ -484,6 +710,20 @@ async def run_all(
         config: Runtime configuration with intents, models, API keys, paths
         progress_callback: Optional callback function to call after each query
             completes (successful or failed). Used by CLI to update progress bar.
+            Tracker objects may instead define async start_query(),
+            complete_query() and start_run(total_queries) hooks; start_run
+            receives the number of queries the run will report, including
+            intents streamed from intents_source.
+        config_filename: Optional config file name recorded in run metadata
+        memo: Optional extraction memo to use instead of building one from
+            run_settings.extraction_cache. Long-running callers (`serve`) pass
+            the same memo to every run so its in-memory tier stays warm.
+        run_id: Optional run identifier (default: derived from the current UTC
+            second). Callers that may start several runs within one second
+            (the HTTP service) must pass unique IDs.
+        record_run: Insert the runs row and write run_meta.json (default).
+            Distributed workers run single units of a coordinator's run with
+            False; the coordinator owns both.
 
     Returns:
         Summary dictionary with structure:
@@ -496,6 +736,8 @@ async def run_all(
             "total_queries": 6,
             "success_count": 5,
             "error_count": 1,
+            "skipped_count": 0,
+            "timed_out_count": 0,
             "total_cost_usd": 0.0123,
             "errors": [
                 {
@@ -504,7 +746,10 @@ async def run_all(
                     "model_name": "gpt-4o",
                     "error_message": "API rate limit exceeded"
                 }
-            ]
+            ],
+            "skipped": [],  # units skipped by run_settings.stability
+            "timed_out": [],  # units cancelled by a deadline or model timeout
+            "stop_reason": None  # why scheduling stopped early (budget), if it did
         }
 
     Raises:
@@ -529,11 +774,16 @@ async def run_all(
         - Intent classification runs sequentially per intent before parallel execution
         - Each query failure is logged but doesn't stop execution
         - Error files are written for failed queries
+        - Stable units (run_settings.stability) are skipped; their last answer
+          is copied into the run directory and they count as neither success
+          nor error
+        - With run_settings.scheduling, work is dispatched by intent priority
+          and expected latency instead of intent order
         - Database operations remain synchronous (SQLite is fast for local ops)
         - Cost is estimated, not exact (depends on provider pricing)
     """
     # Generate run identifier from current UTC timestamp
-    run_id = run_id_from_timestamp()
+    run_id = run_id or run_id_from_timestamp()
     timestamp_utc = utc_timestamp()
 
     # Count execution units (models + runners)
@@ -542,13 +792,18 @@ async def run_all(
     total_execution_units = num_models + num_runners
 
     logger.info(f"Starting run {run_id}")
+    source = config.intents_source
     logger.info(
-        f"Config: {len(config.intents)} intents, {num_models} models, "
-        f"{num_runners} runners, output_dir={config.run_settings.output_dir}"
+        f"Config: {len(config.intents)} intents"
+        + (f" + {source.format} source {source.path}" if source else "")
+        + f", {num_models} models, {num_runners} runners, "
+        f"output_dir={config.run_settings.output_dir}"
     )
 
-    # Estimate cost and validate budget (if configured)
+    # Estimate cost and validate budget (if configured). This pass over the
+    # intents also counts intents_source rows for the totals below.
     cost_estimate = estimate_run_cost(config)
+    total_intents = cost_estimate["total_intents"]
     logger.info(
         f"Estimated cost: ${cost_estimate['total_estimated_cost']:.4f} "
         f"for {cost_estimate['total_queries']} queries "
@@ -566,7 +821,9 @@ async def run_all(
     logger.info(f"Created run directory: {run_dir}")
 
     # Initialize tracking variables
-    total_queries = len(config.intents) * total_execution_units
+    total_queries = total_intents * total_execution_units
+    if progress_callback and hasattr(progress_callback, "start_run"):
+        await progress_callback.start_run(total_queries)
     success_count = 0
     error_count = 0
     total_cost_usd = 0.0
@@ -575,20 +832,122 @@ async def run_all(
 
     # Insert run record into database
     try:
-        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-            insert_run(
-                conn=conn,
-                run_id=run_id,
-                timestamp_utc=timestamp_utc,
-                total_intents=len(config.intents),
-                total_models=total_execution_units,  # Models + runners
-            )
-            conn.commit()
-        logger.debug(f"Inserted run record: run_id={run_id}")
+        if record_run:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                insert_run(
+                    conn=conn,
+                    run_id=run_id,
+                    timestamp_utc=timestamp_utc,
+                    total_intents=total_intents,
+                    total_models=total_execution_units,  # Models + runners
+                )
+                conn.commit()
+            logger.debug(f"Inserted run record: run_id={run_id}")
     except Exception as e:
         logger.error(f"Failed to insert run record into database: {e}", exc_info=True)
         # Continue execution - database is not critical
 
+    # Memoize extraction of identical answers (opt-in via run_settings.extraction_cache)
+    cache_config = config.run_settings.extraction_cache
+    if memo is None and cache_config is not None and cache_config.enabled:
+        memo = ExtractionMemo.from_config(cache_config, config.run_settings.sqlite_db_path)
+    # A caller-supplied memo may carry counters from earlier runs
+    memo_baseline = memo.stats() if memo is not None else None
+
+    # Adaptive multi-sample querying (API models only)
+    sampling = config.run_settings.sampling
+    if sampling is not None and not sampling.enabled:
+        sampling = None
+    sampling_stats = {"units": 0, "samples": 0, "requests": 0, "converged": 0}
+
+    # Stability-aware skipping of units with unchanging rankings (API models only)
+    stability = config.run_settings.stability
+    stability_policy = (
+        StabilityPolicy(config.run_settings.sqlite_db_path, stability)
+        if stability is not None and stability.enabled
+        else None
+    )
+    skipped: list[dict] = []
+
+    # Latency-aware ordering of work (opt-in via run_settings.scheduling)
+    scheduling = config.run_settings.scheduling
+    scheduler = LatencyScheduler.from_config(config) if scheduling is not None else None
+    buffered: list[WorkUnit] = []
+
+    # Per-model circuit breakers and run-wide retry budget (API models only)
+    circuit = config.run_settings.circuit_breaker
+    if circuit is not None and not circuit.enabled:
+        circuit = None
+    breakers = BreakerRegistry(circuit) if circuit is not None else None
+    retry_budget = RetryBudget(circuit.max_retries_per_run) if circuit is not None else None
+    rerouted: list[dict] = []
+    fast_failed: list[dict] = []
+
+    # Units stopped by run_settings.deadline_seconds or a model's timeout_seconds
+    timed_out: list[dict] = []
+
+    # Runner instances by id(runner_config), created on first use. Runners
+    # keep per-call state (session_id), so each gets a semaphore admitting
+    # one run_intent thread per pooled session (one without a pool), and
+    # threads still in flight are awaited before the runners are closed.
+    runners: dict[int, IntentRunner] = {}
+    runner_slots: dict[int, asyncio.Semaphore] = {}
+    runner_threads: set[asyncio.Future] = set()
+
+    # Live enforcement of max_per_run_usd: each unit reserves its estimated
+    # cost (from the pre-run estimate, buffer included) before dispatch.
+    # Without a limit the ledger only tracks spend, so a unit that pays for
+    # an answer and then errors or times out still counts in total_cost_usd.
+    budget = config.run_settings.budget
+    ledger = CostLedger(budget.max_per_run_usd if budget is not None and budget.enabled else None)
+    unit_estimates = {
+        (m["provider"], m["model_name"]): m["cost_per_query"]
+        * (1 + cost_estimate["buffer_percentage"])
+        for m in cost_estimate["per_model_costs"]
+    }
+
+    # Hedged requests for slow answers (single-answer queries only)
+    hedging = config.run_settings.hedging
+    hedge_policy = (
+        HedgePolicy.from_config(config) if hedging is not None and hedging.enabled else None
+    )
+
+    def _route(intent, model_config):
+        """
+        Pick the model to query given circuit breaker state.
+
+        Returns:
+            tuple: (model to query, RetryGuard or None without breakers)
+
+        Raises:
+            LLMCircuitOpenError: If the model's breaker is open and there is
+                no fallback whose breaker allows the request
+        """
+        if breakers is None:
+            return model_config, None
+        breaker = breakers.get(model_config.provider, model_config.model_name)
+        if breaker.allow_request():
+            return model_config, RetryGuard(breaker, retry_budget)
+
+        fallback = model_config.fallback
+        if fallback is not None:
+            fallback_breaker = breakers.get(fallback.provider, fallback.model_name)
+            if fallback_breaker.allow_request():
+                logger.warning(
+                    f"Circuit open for {breaker.name}, rerouting intent={intent.id} "
+                    f"to fallback {fallback_breaker.name}"
+                )
+                rerouted.append(
+                    {"intent_id": intent.id, "from": breaker.name, "to": fallback_breaker.name}
+                )
+                return fallback, RetryGuard(fallback_breaker, retry_budget)
+
+        fast_failed.append({"intent_id": intent.id, "model": breaker.name})
+        raise LLMCircuitOpenError(
+            f"Circuit open for {breaker.name}, failing fast"
+            + (" (fallback circuit also open)" if fallback is not None else "")
+        )
+
     # Initialize semaphore for rate limiting concurrent requests
     max_concurrent = config.run_settings.max_concurrent_requests
     semaphore = asyncio.Semaphore(max_concurrent)
@@ -597,29 +956,36 @@ async def run_all(
     # Define async wrapper for executing single query with semaphore
     async def _execute_query_with_semaphore(
         intent,
+        reservation,
         model_config=None,
         runner_config=None,
     ):
         """
         Execute single query with semaphore rate limiting.
 
+        Actual costs are charged to the unit's ledger reservation as the
+        answer, extraction, operations and samples complete.
+
         Returns:
             tuple: (success: bool, cost_usd: float, error_dict: dict | None)
         """
-        async with semaphore:
+        # Per-model timeout covers the request, retries, extraction and operations
+        unit_timeout = model_config.timeout_seconds if model_config else None
+        async with semaphore, unit_deadline(unit_timeout):
             # Determine if this is an API model or runner
             if model_config:
                 provider = model_config.provider
                 model_name = model_config.model_name
                 logger.info(
-                    f"Processing: intent={intent.id}, provider={provider}, model={model_name}"
+                    "Processing: intent=%s, provider=%s, model=%s",
+                    intent.id,
+                    provider,
+                    model_name,
                 )
             else:
                 provider = runner_config.runner_plugin
                 model_name = "runner"
-                logger.info(
-                    f"Processing runner: intent={intent.id}, plugin={provider}"
-                )
+                logger.info("Processing runner: intent=%s, plugin=%s", intent.id, provider)
 
             # Construct query key for progress tracking
             query_key = f"{intent.id}_{provider}_{model_name}"
@@ -631,22 +997,53 @@ async def run_all(
             try:
                 # Process API model
                 if model_config:
-                    # Build LLM client for this model
-                    client = build_client(
-                        provider=model_config.provider,
-                        model_name=model_config.model_name,
-                        api_key=model_config.api_key,
-                        system_prompt=model_config.system_prompt,
-                        tools=model_config.tools,
-                        tool_choice=model_config.tool_choice,
-                    )
+                    # Fail fast or reroute to the fallback while the breaker is open
+                    model_config, guard = _route(intent, model_config)
 
-                    # Generate answer with retry logic (await the async call)
-                    response = await client.generate_answer(intent.prompt)
+                    try:
+                        # Build LLM client for this model
+                        client = build_client(
+                            provider=model_config.provider,
+                            model_name=model_config.model_name,
+                            api_key=model_config.api_key,
+                            system_prompt=model_config.system_prompt,
+                            tools=model_config.tools,
+                            tool_choice=model_config.tool_choice,
+                        )
+                        if hedge_policy is not None and sampling is None:
+                            client = HedgedLLMClient(
+                                client, hedge_policy, model_config.provider, model_config.model_name
+                            )
+
+                        # Generate answer with retry logic (await the async call).
+                        # With adaptive sampling, providers with native `n` return
+                        # the first batch of samples from this same request.
+                        request_started = time.perf_counter()
+                        with retry_guard(guard) if guard is not None else nullcontext():
+                            if sampling is not None:
+                                first_batch = await request_samples(
+                                    client,
+                                    intent.prompt,
+                                    min(sampling.batch_size, sampling.max_samples),
+                                )
+                                response, prefetched = first_batch[0], first_batch[1:]
+                            else:
+                                response = await client.generate_answer(intent.prompt)
+                    except BaseException:
+                        # Retried attempts were already recorded by the guard. Any
+                        # other outcome (client setup error, deadline cancellation)
+                        # counts as a failure so a half-open probe slot is released.
+                        if guard is not None and guard.failures == 0:
+                            guard.breaker.record_failure()
+                        raise
+                    if guard is not None:
+                        guard.breaker.record_success()
+                    latency_ms = round((time.perf_counter() - request_started) * 1000)
 
                     # Extract response data
                     answer_text = response.answer_text
-                    cost_usd = response.cost_usd
+                    cost_usd = response.cost_usd + response.hedge_cost_usd
+                    reservation.charge(cost_usd)
 
                     # Create usage metadata for storage with actual token breakdown
                     usage_meta = {
@@ -668,6 +1065,9 @@ async def run_all(
                         estimated_cost_usd=cost_usd,
                         web_search_results=response.web_search_results,
                         web_search_count=response.web_search_count,
+                        latency_ms=latency_ms,
+                        hedge_outcome=response.hedge_outcome,
+                        hedge_cost_usd=response.hedge_cost_usd,
                     )
 
                     # Write raw answer JSON
@@ -676,35 +1076,14 @@ async def run_all(
                         intent_id=intent.id,
                         provider=model_config.provider,
                         model=model_config.model_name,
-                        data=asdict(raw_record),
+                        data=raw_record.to_dict(),
                     )
 
                     # Insert raw answer into database
                     try:
-                        # Serialize web search results to JSON if present
-                        web_search_json = None
-                        if response.web_search_results:
-                            web_search_json = json.dumps(response.web_search_results)
-
                         with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
                             insert_answer_raw(
-                                conn=conn,
-                                run_id=run_id,
-                                intent_id=intent.id,
-                                model_provider=model_config.provider,
-                                model_name=model_config.model_name,
-                                timestamp_utc=raw_record.timestamp_utc,
-                                prompt=intent.prompt,
-                                answer_text=answer_text,
-                                usage_meta_json=json.dumps(usage_meta),
-                                estimated_cost_usd=cost_usd,
-                                web_search_count=response.web_search_count,
-                                web_search_results_json=web_search_json,
-                                runner_type=raw_record.runner_type,
-                                runner_name=raw_record.runner_name,
-                                screenshot_path=raw_record.screenshot_path,
-                                html_snapshot_path=raw_record.html_snapshot_path,
-                                session_id=raw_record.session_id,
+                                conn=conn, run_id=run_id, **raw_record.db_params()
                             )
                             conn.commit()
                     except Exception as e:
@@ -721,48 +1100,17 @@ async def run_all(
                         model_name=model_config.model_name,
                         timestamp_utc=raw_record.timestamp_utc,
                         extraction_settings=config.extraction_settings,
+                        memo=memo,
                     )
+                    reservation.charge(extraction_result.extraction_cost_usd)
 
                     # Write parsed answer JSON
-                    parsed_data = {
-                        "appeared_mine": extraction_result.appeared_mine,
-                        "my_mentions": [
-                            {
-                                "original_text": m.original_text,
-                                "normalized_name": m.normalized_name,
-                                "brand_category": m.brand_category,
-                                "match_position": m.match_position,
-                            }
-                            for m in extraction_result.my_mentions
-                        ],
-                        "competitor_mentions": [
-                            {
-                                "original_text": m.original_text,
-                                "normalized_name": m.normalized_name,
-                                "brand_category": m.brand_category,
-                                "match_position": m.match_position,
-                            }
-                            for m in extraction_result.competitor_mentions
-                        ],
-                        "ranked_list": [
-                            {
-                                "brand_name": r.brand_name,
-                                "rank_position": r.rank_position,
-                                "confidence": r.confidence,
-                            }
-                            for r in extraction_result.ranked_list
-                        ],
-                        "rank_extraction_method": extraction_result.rank_extraction_method,
-                        "rank_confidence": extraction_result.rank_confidence,
-                        "extraction_cost_usd": extraction_result.extraction_cost_usd,
-                    }
-
                     write_parsed_answer(
                         run_dir=run_dir,
                         intent_id=intent.id,
                         provider=model_config.provider,
                         model=model_config.model_name,
-                        data=parsed_data,
+                        data=extraction_result.to_dict(),
                     )
 
                     # Insert mentions into database
@@ -810,7 +1158,7 @@ async def run_all(
                     # Execute operations if configured
                     operations_cost_usd = 0.0
                     if intent.operations or config.global_operations:
-                        logger.info(f"Executing operations for intent={intent.id}")
+                        logger.info("Executing operations for intent=%s", intent.id)
 
                         # Combine intent-specific and global operations
                         all_operations = list(intent.operations) + list(
@@ -870,14 +1218,13 @@ async def run_all(
                             operations_cost_usd += op_result.cost_usd
 
                             # Write JSON artifact
-                            operation_data = asdict(op_result)
                             write_operation_result(
                                 run_dir=run_dir,
                                 intent_id=intent.id,
                                 operation_id=op_id,
                                 provider=op_result.model_provider,
                                 model=op_result.model_name,
-                                data=operation_data,
+                                data=op_result.to_dict(),
                             )
 
                             # Insert into database
@@ -919,28 +1266,81 @@ async def run_all(
                                 )
 
                         logger.info(
-                            f"Completed {len(operation_results)} operations, cost=${operations_cost_usd:.6f}"
+                            "Completed %d operations, cost=$%.6f",
+                            len(operation_results),
+                            operations_cost_usd,
+                        )
+                        reservation.charge(operations_cost_usd)
+
+                    # Keep sampling until mention rates are estimated precisely enough
+                    sampling_cost_usd = 0.0
+                    if sampling is not None:
+                        sampling_result = await sample_until_confident(
+                            client=client,
+                            prompt=intent.prompt,
+                            settings=sampling,
+                            parse=lambda text: parse_answer(
+                                answer_text=text,
+                                brands=config.brands,
+                                intent_id=intent.id,
+                                provider=model_config.provider,
+                                model_name=model_config.model_name,
+                                timestamp_utc=utc_timestamp(),
+                                extraction_settings=config.extraction_settings,
+                                memo=memo,
+                            ),
+                            first=UnitSample(
+                                0, response, extraction_result, len(first_batch)
+                            ),
+                            prefetched=prefetched,
                         )
+                        sampling_cost_usd = sampling_result.extra_cost_usd
+                        reservation.charge(sampling_cost_usd)
+                        _store_sampling_result(
+                            config.run_settings.sqlite_db_path,
+                            run_id,
+                            intent.id,
+                            model_config,
+                            sampling_result,
+                        )
+                        sampling_stats["units"] += 1
+                        sampling_stats["samples"] += len(sampling_result.samples)
+                        sampling_stats["requests"] += sampling_result.requests
+                        if sampling_result.stop_reason == STOP_CONVERGED:
+                            sampling_stats["converged"] += 1
 
                     # Calculate total cost for this query
-                    total_query_cost = cost_usd + extraction_result.extraction_cost_usd + operations_cost_usd
+                    total_query_cost = (
+                        cost_usd
+                        + extraction_result.extraction_cost_usd
+                        + operations_cost_usd
+                        + sampling_cost_usd
+                    )
 
                     # Log with extraction cost breakdown if applicable
                     if extraction_result.extraction_cost_usd > 0:
                         logger.info(
-                            f"Success: intent={intent.id}, provider={model_config.provider}, "
-                            f"model={model_config.model_name}, "
-                            f"answer_cost=${cost_usd:.6f}, "
-                            f"extraction_cost=${extraction_result.extraction_cost_usd:.6f}, "
-                            f"total=${cost_usd + extraction_result.extraction_cost_usd:.6f}, "
-                            f"appeared_mine={extraction_result.appeared_mine}, "
-                            f"extraction_method={extraction_result.rank_extraction_method}"
+                            "Success: intent=%s, provider=%s, model=%s, "
+                            "answer_cost=$%.6f, extraction_cost=$%.6f, total=$%.6f, "
+                            "appeared_mine=%s, extraction_method=%s",
+                            intent.id,
+                            model_config.provider,
+                            model_config.model_name,
+                            cost_usd,
+                            extraction_result.extraction_cost_usd,
+                            cost_usd + extraction_result.extraction_cost_usd,
+                            extraction_result.appeared_mine,
+                            extraction_result.rank_extraction_method,
                         )
                     else:
                         logger.info(
-                            f"Success: intent={intent.id}, provider={model_config.provider}, "
-                            f"model={model_config.model_name}, cost=${cost_usd:.6f}, "
-                            f"appeared_mine={extraction_result.appeared_mine}"
+                            "Success: intent=%s, provider=%s, model=%s, cost=$%.6f, "
+                            "appeared_mine=%s",
+                            intent.id,
+                            model_config.provider,
+                            model_config.model_name,
+                            cost_usd,
+                            extraction_result.appeared_mine,
                         )
 
                     # Call progress callback if provided
@@ -953,14 +1353,30 @@ async def run_all(
                     return (True, total_query_cost, None, operations_cost_usd)
 
                 # Process browser/custom runner
-                # Create runner instance via plugin registry
-                runner = RunnerRegistry.create_runner(
-                    plugin_name=runner_config.runner_plugin,
-                    config=runner_config.config,
-                )
-
-                # Execute intent via runner
-                result = runner.run_intent(intent.prompt)
+                # One runner instance per configured runner, so state such as
+                # a warm browser session pool is shared across intents
+                runner = runners.get(id(runner_config))
+                if runner is None:
+                    runner = RunnerRegistry.create_runner(
+                        plugin_name=runner_config.runner_plugin,
+                        config=runner_config.config,
+                    )
+                    runners[id(runner_config)] = runner
+                    pool_size = runner_config.config.get("session_pool_size") or 0
+                    runner_slots[id(runner_config)] = asyncio.Semaphore(max(1, pool_size))
+
+                # Execute intent via runner (blocking browser automation runs
+                # in a worker thread so other units keep going)
+                slots = runner_slots[id(runner_config)]
+                await slots.acquire()
+                runner_started = time.perf_counter()
+                thread = asyncio.ensure_future(asyncio.to_thread(runner.run_intent, intent.prompt))
+                runner_threads.add(thread)
+                thread.add_done_callback(partial(_release_runner_thread, slots, runner_threads))
+                # A unit timeout cancels only this wait: the thread holds its
+                # slot until run_intent returns
+                result = await asyncio.shield(thread)
+                latency_ms = round((time.perf_counter() - runner_started) * 1000)
 
                 # Check if execution was successful
                 if not result.success:
@@ -970,7 +1386,10 @@ async def run_all(
 
                 # Convert IntentResult to RawAnswerRecord
                 raw_record = intent_result_to_raw_record(
-                    result=result, intent_id=intent.id, prompt=intent.prompt
+                    result=result,
+                    intent_id=intent.id,
+                    prompt=intent.prompt,
+                    latency_ms=latency_ms,
                 )
 
                 # Write raw answer JSON
@@ -979,36 +1398,13 @@ async def run_all(
                     intent_id=intent.id,
                     provider=result.provider,
                     model=result.model_name,
-                    data=asdict(raw_record),
+                    data=raw_record.to_dict(),
                 )
 
                 # Insert raw answer into database
                 try:
-                    # Serialize web search results to JSON if present
-                    web_search_json = None
-                    if result.web_search_results:
-                        web_search_json = json.dumps(result.web_search_results)
-
                     with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-                        insert_answer_raw(
-                            conn=conn,
-                            run_id=run_id,
-                            intent_id=intent.id,
-                            model_provider=result.provider,
-                            model_name=result.model_name,
-                            timestamp_utc=raw_record.timestamp_utc,
-                            prompt=intent.prompt,
-                            answer_text=result.answer_text,
-                            usage_meta_json=json.dumps(raw_record.usage_meta),
-                            estimated_cost_usd=result.cost_usd,
-                            web_search_count=raw_record.web_search_count,
-                            web_search_results_json=web_search_json,
-                            runner_type=result.runner_type,
-                            runner_name=result.runner_name,
-                            screenshot_path=result.screenshot_path,
-                            html_snapshot_path=result.html_snapshot_path,
-                            session_id=result.session_id,
-                        )
+                        insert_answer_raw(conn=conn, run_id=run_id, **raw_record.db_params())
                         conn.commit()
                 except Exception as e:
                     logger.error(
@@ -1025,6 +1421,7 @@ async def run_all(
                     model_name=result.model_name,
                     timestamp_utc=raw_record.timestamp_utc,
                     extraction_settings=config.extraction_settings,
+                    memo=memo,
                 )
 
                 # Write parsed answer JSON
@@ -1033,7 +1430,7 @@ async def run_all(
                     intent_id=intent.id,
                     provider=result.provider,
                     model=result.model_name,
-                    data=asdict(extraction_result),
+                    data=extraction_result.to_dict(),
                 )
 
                 # Insert mentions into database
@@ -1080,21 +1477,27 @@ async def run_all(
 
                 # Calculate total cost for this query
                 total_query_cost = result.cost_usd + extraction_result.extraction_cost_usd
+                reservation.charge(total_query_cost)
 
                 # Log success
                 if extraction_result.extraction_cost_usd > 0:
                     logger.info(
-                        f"Success: intent={intent.id}, runner={runner_config.runner_plugin}, "
-                        f"runner_cost=${result.cost_usd:.6f}, "
-                        f"extraction_cost=${extraction_result.extraction_cost_usd:.6f}, "
-                        f"total=${result.cost_usd + extraction_result.extraction_cost_usd:.6f}, "
-                        f"appeared_mine={extraction_result.appeared_mine}"
+                        "Success: intent=%s, runner=%s, runner_cost=$%.6f, "
+                        "extraction_cost=$%.6f, total=$%.6f, appeared_mine=%s",
+                        intent.id,
+                        runner_config.runner_plugin,
+                        result.cost_usd,
+                        extraction_result.extraction_cost_usd,
+                        result.cost_usd + extraction_result.extraction_cost_usd,
+                        extraction_result.appeared_mine,
                     )
                 else:
                     logger.info(
-                        f"Success: intent={intent.id}, runner={runner_config.runner_plugin}, "
-                        f"cost=${result.cost_usd:.6f}, "
-                        f"appeared_mine={extraction_result.appeared_mine}"
+                        "Success: intent=%s, runner=%s, cost=$%.6f, appeared_mine=%s",
+                        intent.id,
+                        runner_config.runner_plugin,
+                        result.cost_usd,
+                        extraction_result.appeared_mine,
                     )
 
                 # Call progress callback if provided
@@ -1164,103 +1567,349 @@ async def run_all(
 
                 return (False, 0.0, error_dict, 0.0)
 
-    # Build list of tasks for all (intent x model) and (intent x runner) combinations
-    tasks = []
+    # Stream (intent x model) and (intent x runner) queries through a bounded
+    # window of tasks, so intents_source rows are read as slots free up rather
+    # than materializing every coroutine up front. The semaphore still caps
+    # concurrent requests; the window only bounds queued work.
+    max_pending = max_concurrent * 4
+    pending: dict[asyncio.Task, int] = {}
+    indexed_errors: list[tuple[int, dict]] = []
+    next_index = 0
+
+    def _record(index: int, task: asyncio.Task) -> None:
+        nonlocal success_count, error_count, total_cost_usd, total_operations_cost_usd
+        if task.exception() is not None:
+            logger.error(f"Task {index} failed with exception: {task.exception()}")
+            error_count += 1
+            return
 
-    for intent in config.intents:
-        # Classify intent before running queries (if enabled)
-        intent_classification_cost = 0.0
-        if (
-            config.extraction_settings
-            and config.extraction_settings.enable_intent_classification
+        result = task.result()
+        if result[0] is None:  # Timed out, already recorded; count what it spent
+            total_cost_usd += result[1]
+            return
+        if result[0]:  # Success
+            success_count += 1
+        else:  # Returned error
+            error_count += 1
+            if result[2]:
+                indexed_errors.append((index, result[2]))
+        total_cost_usd += result[1]
+        total_operations_cost_usd += result[3]  # Operations cost tracked even on error
+
+    async def _drain(limit: int) -> None:
+        """Wait until at most `limit` tasks are pending, recording finished ones."""
+        while len(pending) > limit:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                _record(pending.pop(task), task)
+
+    def _schedule(coro) -> None:
+        nonlocal next_index
+        pending[asyncio.create_task(coro)] = next_index
+        next_index += 1
+
+    async def _try_skip(intent, model_config) -> bool:
+        """Skip a stable unit, carrying its last answer forward."""
+        provider = model_config.provider
+        model_name = model_config.model_name
+        decision = stability_policy.decide(intent.id, provider, model_name)
+        if not decision.skip or not _carry_forward_answer(
+            config.run_settings.output_dir,
+            run_dir,
+            intent.id,
+            provider,
+            model_name,
+            decision=decision,
         ):
-            try:
-                logger.info(f"Classifying intent: {intent.id}")
-                classification_result = await classify_intent(
-                    query=intent.prompt,
-                    extraction_settings=config.extraction_settings,
+            return False
+
+        try:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                insert_query_skip(
+                    conn=conn,
+                    run_id=run_id,
                     intent_id=intent.id,
-                    db_path=config.run_settings.sqlite_db_path,
+                    model_provider=provider,
+                    model_name=model_name,
+                    timestamp_utc=utc_timestamp(),
+                    reason=decision.reason,
+                    rank_distance=decision.rank_distance,
+                    history_runs=decision.history_runs,
+                    runs_since_query=decision.runs_since_query,
+                    query_interval=decision.query_interval,
+                    carried_from_run_id=decision.carried_from_run_id,
                 )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to insert query skip into database: {e}", exc_info=True)
 
-                # Store classification in database
-                try:
-                    with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-                        insert_intent_classification(
-                            conn=conn,
-                            run_id=run_id,
-                            intent_id=intent.id,
-                            intent_type=classification_result.intent_type,
-                            buyer_stage=classification_result.buyer_stage,
-                            urgency_signal=classification_result.urgency_signal,
-                            classification_confidence=classification_result.classification_confidence,
-                            timestamp_utc=utc_timestamp(),
-                            reasoning=classification_result.reasoning,
-                            extraction_cost_usd=classification_result.extraction_cost_usd,
-                        )
-                        conn.commit()
-                    logger.info(
-                        f"Intent classification stored: {intent.id} -> "
-                        f"{classification_result.intent_type}/{classification_result.buyer_stage}/"
-                        f"{classification_result.urgency_signal} "
-                        f"(confidence={classification_result.classification_confidence:.2f})"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to insert intent classification into database: {e}",
-                        exc_info=True,
-                    )
-
-                # Track classification cost
-                intent_classification_cost = classification_result.extraction_cost_usd
-                total_cost_usd += intent_classification_cost
+        skipped.append(
+            {
+                "intent_id": intent.id,
+                "model_provider": provider,
+                "model_name": model_name,
+                "reason": decision.reason,
+                "rank_distance": decision.rank_distance,
+                "query_interval": decision.query_interval,
+                "carried_from_run_id": decision.carried_from_run_id,
+            }
+        )
+        logger.info(
+            f"Skipped stable unit: intent={intent.id}, provider={provider}, "
+            f"model={model_name}, rank_distance={decision.rank_distance}, "
+            f"run {decision.runs_since_query}/{decision.query_interval}, "
+            f"carried from {decision.carried_from_run_id}"
+        )
 
-            except Exception as e:
-                logger.warning(
-                    f"Intent classification failed for {intent.id}: {e}",
-                    exc_info=True,
+        if progress_callback:
+            if hasattr(progress_callback, "complete_query"):
+                await progress_callback.complete_query(
+                    f"{intent.id}_{provider}_{model_name}", success=True
                 )
-                # Continue execution - classification is not critical
-
-        # Create tasks for API models (if configured)
-        if config.models:
-            for model_config in config.models:
-                task = _execute_query_with_semaphore(
-                    intent=intent,
-                    model_config=model_config,
-                    runner_config=None,
+            else:
+                progress_callback()
+        return True
+
+    async def _report_not_completed(intent, provider: str, model_name: str) -> None:
+        """Count a unit a deadline or the budget stopped as a failed query."""
+        if progress_callback:
+            if hasattr(progress_callback, "complete_query"):
+                await progress_callback.complete_query(
+                    f"{intent.id}_{provider}_{model_name}", success=False
                 )
-                tasks.append(task)
+            else:
+                progress_callback()
+
+    async def _mark_timed_out(intent, model_config, runner_config, reason: str) -> None:
+        """Record a unit that a deadline stopped before it finished."""
+        if model_config is not None:
+            provider, model_name = model_config.provider, model_config.model_name
+        else:
+            provider, model_name = runner_config.runner_plugin, "runner"
+        message = f"timed_out: {reason}"
+        logger.warning(
+            f"Timed out: intent={intent.id}, provider={provider}, model={model_name} ({reason})"
+        )
+        write_error(
+            run_dir=run_dir,
+            intent_id=intent.id,
+            provider=provider,
+            model=model_name,
+            error_message=message,
+        )
+        timed_out.append(
+            {
+                "intent_id": intent.id,
+                "model_provider": provider,
+                "model_name": model_name,
+                "reason": reason,
+            }
+        )
+        await _report_not_completed(intent, provider, model_name)
+
+    async def _run_unit(intent, reservation, model_config=None, runner_config=None):
+        """
+        Execute one unit.
 
-        # Create tasks for browser/custom runners (if configured)
-        if config.runner_configs:
-            for runner_config in config.runner_configs:
-                task = _execute_query_with_semaphore(
+        Failed and timed-out units report what was charged to their
+        reservation before they stopped (e.g. an answer whose extraction
+        failed), so the run total matches the ledger. A timed-out unit
+        returns success None; it is already recorded as timed_out.
+        """
+        try:
+            # Also covers time spent waiting for the semaphore
+            async with unit_deadline():
+                result = await _execute_query_with_semaphore(
                     intent=intent,
-                    model_config=None,
+                    model_config=model_config,
                     runner_config=runner_config,
+                    reservation=reservation,
                 )
-                tasks.append(task)
+        except TimeoutError:
+            reason = TIMEOUT_RUN_DEADLINE if expired() else TIMEOUT_MODEL
+            await _mark_timed_out(intent, model_config, runner_config, reason)
+            return (None, reservation.charged_usd, None, 0.0)
+        finally:
+            reservation.settle()
+        success, cost_usd, error_dict, operations_cost_usd = result
+        if not success:
+            cost_usd = reservation.charged_usd
+        return (success, cost_usd, error_dict, operations_cost_usd)
+
+    async def _mark_over_budget(intent, model_config, runner_config) -> None:
+        """Record a unit that was not scheduled because the run budget is spent."""
+        nonlocal error_count, next_index
+        if model_config is not None:
+            provider, model_name = model_config.provider, model_config.model_name
+        else:
+            provider, model_name = runner_config.runner_plugin, "runner"
+        message = f"Not run: {ledger.stop_reason}"
+        write_error(
+            run_dir=run_dir,
+            intent_id=intent.id,
+            provider=provider,
+            model=model_name,
+            error_message=message,
+        )
+        error_count += 1
+        indexed_errors.append(
+            (
+                next_index,
+                {
+                    "intent_id": intent.id,
+                    "model_provider": provider,
+                    "model_name": model_name,
+                    "error_message": message,
+                },
+            )
+        )
+        next_index += 1
+        await _report_not_completed(intent, provider, model_name)
+
+    async def _dispatch(intent, model_config=None, runner_config=None) -> bool:
+        """Schedule one unit unless it is skipped as stable; True if scheduled."""
+        if expired():
+            # Past the run deadline: record the unit without starting it
+            await _mark_timed_out(intent, model_config, runner_config, TIMEOUT_NOT_STARTED)
+            return False
+        if (
+            model_config is not None
+            and stability_policy is not None
+            and await _try_skip(intent, model_config)
+        ):
+            return False
+        if model_config is not None:
+            key = (model_config.provider, model_config.model_name)
+            label = f"{intent.id} {key[0]}/{key[1]}"
+        else:
+            key = (runner_config.runner_plugin, "runner")
+            label = f"{intent.id} {key[0]}"
+        reservation = ledger.reserve(unit_estimates.get(key, 0.0), label)
+        if reservation is None:
+            await _mark_over_budget(intent, model_config, runner_config)
+            return False
+        _schedule(
+            _run_unit(
+                intent=intent,
+                model_config=model_config,
+                runner_config=runner_config,
+                reservation=reservation,
+            )
+        )
+        return True
 
-    # Execute all tasks in parallel with semaphore limiting concurrency
-    logger.info(f"Executing {len(tasks)} queries in parallel...")
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _flush_buffered() -> None:
+        """Dispatch the buffered window of units in scheduler order."""
+        for unit in scheduler.order(buffered):
+            if await _dispatch(unit.intent, unit.model_config, unit.runner_config):
+                scheduler.record_dispatch(unit)
+                await _drain(max_pending)
+        buffered.clear()
 
-    # Process results
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.error(f"Task {i} failed with exception: {result}")
-            error_count += 1
-        elif result[0]:  # Success
-            success_count += 1
-            total_cost_usd += result[1]
-            total_operations_cost_usd += result[3]  # Track operations cost separately
-        else:  # Returned error
-            error_count += 1
-            total_cost_usd += result[1]
-            total_operations_cost_usd += result[3]  # Track operations cost even on error
-            if result[2]:
-                errors.append(result[2])
+    logger.info(
+        f"Executing {total_queries} queries (max {max_concurrent} concurrent requests)..."
+    )
+    intents = config.iter_intents()
+    dispatch_started = time.perf_counter()
+    with deadline_scope(config.run_settings.deadline_seconds):
+        try:
+            for intent in intents:
+                # Classify intent before running queries (if enabled)
+                intent_classification_cost = 0.0
+                if (
+                    config.extraction_settings
+                    and config.extraction_settings.enable_intent_classification
+                    and not expired()
+                    and not ledger.stopped
+                ):
+                    try:
+                        logger.info("Classifying intent: %s", intent.id)
+                        classification_result = await classify_intent(
+                            query=intent.prompt,
+                            extraction_settings=config.extraction_settings,
+                            intent_id=intent.id,
+                            db_path=config.run_settings.sqlite_db_path,
+                        )
+
+                        # Store classification in database
+                        try:
+                            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                                insert_intent_classification(
+                                    conn=conn,
+                                    run_id=run_id,
+                                    intent_id=intent.id,
+                                    intent_type=classification_result.intent_type,
+                                    buyer_stage=classification_result.buyer_stage,
+                                    urgency_signal=classification_result.urgency_signal,
+                                    classification_confidence=classification_result.classification_confidence,
+                                    timestamp_utc=utc_timestamp(),
+                                    reasoning=classification_result.reasoning,
+                                    extraction_cost_usd=classification_result.extraction_cost_usd,
+                                )
+                                conn.commit()
+                            logger.info(
+                                "Intent classification stored: %s -> %s/%s/%s (confidence=%.2f)",
+                                intent.id,
+                                classification_result.intent_type,
+                                classification_result.buyer_stage,
+                                classification_result.urgency_signal,
+                                classification_result.classification_confidence,
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to insert intent classification into database: {e}",
+                                exc_info=True,
+                            )
+
+                        # Track classification cost
+                        intent_classification_cost = classification_result.extraction_cost_usd
+                        ledger.spend(intent_classification_cost)
+                        total_cost_usd += intent_classification_cost
+
+                    except Exception as e:
+                        logger.warning(
+                            f"Intent classification failed for {intent.id}: {e}",
+                            exc_info=True,
+                        )
+                        # Continue execution - classification is not critical
+
+                if scheduler is not None:
+                    # Buffer a window of units and dispatch it in scheduler order
+                    buffered.extend(scheduler.unit(intent, model_config=m) for m in config.models or [])
+                    buffered.extend(
+                        scheduler.unit(intent, runner_config=r) for r in config.runner_configs or []
+                    )
+                    if len(buffered) >= scheduling.window_units:
+                        await _flush_buffered()
+                    continue
+
+                # Create tasks for API models (if configured)
+                for model_config in config.models or []:
+                    await _dispatch(intent, model_config=model_config)
+
+                # Create tasks for browser/custom runners (if configured)
+                for runner_config in config.runner_configs or []:
+                    await _dispatch(intent, runner_config=runner_config)
+
+                await _drain(max_pending)
+
+            if buffered:
+                await _flush_buffered()
+            await _drain(0)
+        finally:
+            # Only non-empty if the run is cancelled or the intent stream fails
+            for task in pending:
+                task.cancel()
+            if runner_threads:
+                await asyncio.gather(*runner_threads, return_exceptions=True)
+            for runner in runners.values():
+                if hasattr(runner, "close"):
+                    await asyncio.to_thread(runner.close)
+
+    makespan_seconds = time.perf_counter() - dispatch_started
+
+    # Report errors in scheduling order regardless of completion order
+    errors.extend(error for _, error in sorted(indexed_errors, key=lambda item: item[0]))
 
     # Generate run metadata summary
     run_meta = {
@@ -1268,11 +1917,13 @@ async def run_all(
         "timestamp_utc": timestamp_utc,
         "config_filename": config_filename,
         "output_dir": run_dir,
-        "total_intents": len(config.intents),
+        "total_intents": total_intents,
         "total_models": len(config.models),
         "total_queries": total_queries,
         "success_count": success_count,
         "error_count": error_count,
+        "skipped_count": len(skipped),
+        "timed_out_count": len(timed_out),
         "total_cost_usd": round(total_cost_usd, 6),
         "total_llm_cost_usd": round(total_cost_usd - total_operations_cost_usd, 6),
         "total_operations_cost_usd": round(total_operations_cost_usd, 6),
@@ -1281,12 +1932,117 @@ async def run_all(
         "database_path": config.run_settings.sqlite_db_path,
     }
 
+    if source is not None:
+        run_meta["intents_source"] = {
+            "path": source.path,
+            "format": source.format,
+            "rows_read": intents.rows_read,
+            "rows_skipped": intents.rows_skipped,
+        }
+
+    if sampling is not None:
+        run_meta["sampling"] = {
+            **sampling_stats,
+            "avg_samples": round(sampling_stats["samples"] / sampling_stats["units"], 2)
+            if sampling_stats["units"]
+            else 0.0,
+            "target_ci_width": sampling.target_ci_width,
+            "confidence": sampling.confidence,
+        }
+
+    if stability_policy is not None:
+        run_meta["stability"] = {
+            "lookback_runs": stability.lookback_runs,
+            "max_rank_distance": stability.max_rank_distance,
+            "skipped": skipped,
+        }
+
+    if scheduler is not None:
+        run_meta["scheduling"] = {
+            "strategy": scheduler.strategy,
+            "max_concurrent": max_concurrent,
+            "dispatched_units": scheduler.dispatched_count,
+            "predicted_makespan_seconds": round(scheduler.predicted_makespan(max_concurrent), 2),
+            "intent_order_makespan_seconds": round(
+                scheduler.intent_order_makespan(max_concurrent), 2
+            ),
+            "actual_makespan_seconds": round(makespan_seconds, 2),
+            "estimates": {
+                "/".join(part for part in key[1:] if part): {
+                    "expected_seconds": round(estimate.seconds, 3),
+                    "expected_cost_usd": round(estimate.cost_usd, 6),
+                    "history_answers": estimate.samples,
+                }
+                for key, estimate in scheduler.estimates.items()
+            },
+        }
+        logger.info(
+            f"Makespan: predicted {run_meta['scheduling']['predicted_makespan_seconds']}s "
+            f"({scheduler.strategy}), actual {makespan_seconds:.2f}s"
+        )
+
+    if hedge_policy is not None:
+        run_meta["hedging"] = hedge_policy.snapshot()
+        hedges = sum(state.hedges for state in hedge_policy.models.values())
+        if hedges:
+            logger.info(
+                f"Hedging: {hedges} hedged requests, "
+                f"{sum(s.hedge_wins for s in hedge_policy.models.values())} won, "
+                f"extra spend ${hedge_policy.extra_cost_usd:.6f}"
+            )
+
+    if breakers is not None:
+        run_meta["circuit_breakers"] = {
+            "models": breakers.snapshot(),
+            "retry_budget": {
+                "limit": retry_budget.limit,
+                "used": retry_budget.used,
+                "denied": retry_budget.denied,
+            },
+            "rerouted": rerouted,
+            "fast_failed": fast_failed,
+        }
+        open_circuits = [
+            name for name, state in run_meta["circuit_breakers"]["models"].items()
+            if state["opened_count"]
+        ]
+        if open_circuits or fast_failed:
+            logger.warning(
+                f"Circuit breakers: opened for {', '.join(open_circuits) or 'none'}; "
+                f"{len(fast_failed)} queries failed fast, {len(rerouted)} rerouted, "
+                f"{retry_budget.used} retries used"
+            )
+
+    if ledger.limit_usd is not None:
+        run_meta["budget"] = ledger.snapshot()
+
+    if config.run_settings.deadline_seconds is not None or timed_out:
+        run_meta["deadline"] = {
+            "deadline_seconds": config.run_settings.deadline_seconds,
+            "timed_out": timed_out,
+        }
+        if timed_out:
+            logger.warning(
+                f"{len(timed_out)} queries timed out "
+                f"(deadline {config.run_settings.deadline_seconds}s)"
+            )
+
+    if memo is not None:
+        memo.prune()
+        memo_stats = memo.stats(since=memo_baseline)
+        run_meta["extraction_cache"] = memo_stats
+        logger.info(
+            f"Extraction cache: {memo_stats['hits']} hits, {memo_stats['misses']} misses, "
+            f"saved=${memo_stats['cost_saved_usd']:.6f}"
+        )
+
     # Write run metadata JSON
-    write_run_meta(run_dir=run_dir, meta=run_meta)
+    if record_run:
+        write_run_meta(run_dir=run_dir, meta=run_meta)
 
     logger.info(
         f"Run {run_id} complete: {success_count}/{total_queries} successful, "
-        f"total_cost=${total_cost_usd:.6f}"
+        f"{len(skipped)} skipped as stable, total_cost=${total_cost_usd:.6f}"
     )
 
     # Return summary dict (for API contract)
@@ -1294,13 +2050,18 @@ async def run_all(
         "run_id": run_id,
         "timestamp_utc": timestamp_utc,
         "output_dir": run_dir,
-        "total_intents": len(config.intents),
+        "total_intents": total_intents,
         "total_models": len(config.models),
         "total_queries": total_queries,
         "success_count": success_count,
         "error_count": error_count,
+        "skipped_count": len(skipped),
+        "timed_out_count": len(timed_out),
         "total_cost_usd": round(total_cost_usd, 6),
         "total_llm_cost_usd": round(total_cost_usd - total_operations_cost_usd, 6),
         "total_operations_cost_usd": round(total_operations_cost_usd, 6),
         "errors": errors,
+        "skipped": skipped,
+        "timed_out": timed_out,
+        "stop_reason": ledger.stop_reason,
     }
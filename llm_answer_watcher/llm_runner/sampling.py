@@ -0,0 +1,262 @@
+"""
+Adaptive multi-sample querying with confidence-based early stopping.
+
+A single answer per (intent, model) says little about how often a model
+actually recommends a brand. With run_settings.sampling enabled, run_all
+keeps sampling each unit and tracks every brand's mention rate with a
+Wilson score interval. A unit stops as soon as the widest interval is at
+most target_ci_width (after min_samples), so stable units cost a few
+samples and only uncertain ones go up to max_samples.
+
+Clients that implement `generate_answers(prompt, n)` (providers with a
+native `n` parameter) return a whole batch from one request, billing the
+prompt once. Other clients are sampled one request at a time. Samples
+that were already paid for are always used, so the stopping rule is
+checked between requests rather than between samples.
+
+Example:
+    >>> tracker = MentionRateTracker(confidence=0.9)
+    >>> for extraction in extractions:
+    ...     tracker.add(extraction)
+    >>> tracker.mine_interval()
+    (0.42, 0.21, 0.66)
+    >>> tracker.max_width() <= 0.4
+    False
+"""
+
+import logging
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+from ..config.schema import SamplingConfig
+from ..extractor.parser import ExtractionResult
+from .models import LLMClient, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# stop_reason values recorded in sample_aggregates
+STOP_CONVERGED = "converged"
+STOP_MAX_SAMPLES = "max_samples"
+STOP_ERROR = "error"
+
+
+def wilson_interval(successes: int, trials: int, confidence: float) -> tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Unlike the normal approximation, the interval stays inside [0, 1] and
+    has a sensible width at rates of 0 or 1, which are common for brand
+    mentions over a handful of samples.
+
+    Args:
+        successes: Samples in which the brand was mentioned
+        trials: Total samples
+        confidence: Two-sided confidence level (e.g. 0.9)
+
+    Returns:
+        (low, high) bounds; (0.0, 1.0) when there are no trials
+
+    Example:
+        >>> wilson_interval(5, 5, 0.9)
+        (0.6488..., 1.0)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    z2 = z * z
+    rate = successes / trials
+    denominator = 1 + z2 / trials
+    center = (rate + z2 / (2 * trials)) / denominator
+    half_width = (
+        z * math.sqrt(rate * (1 - rate) / trials + z2 / (4 * trials * trials)) / denominator
+    )
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+@dataclass
+class MentionRateTracker:
+    """
+    Online mention counts for one (intent, model) unit.
+
+    Competitors that never appear are not tracked: a rate of 0 has the same
+    interval width as a rate of 1, which is never wider than the widest
+    tracked interval, so they cannot delay stopping.
+
+    Attributes:
+        confidence: Confidence level for intervals
+        samples: Samples added so far
+        mine: Samples in which my brand appeared
+        competitors: Samples in which each competitor (normalized name) appeared
+    """
+
+    confidence: float
+    samples: int = 0
+    mine: int = 0
+    competitors: dict[str, int] = field(default_factory=dict)
+
+    def add(self, extraction: ExtractionResult) -> None:
+        """Count one sample's mentions (each brand at most once per sample)."""
+        self.samples += 1
+        if extraction.appeared_mine:
+            self.mine += 1
+        for name in {m.normalized_name for m in extraction.competitor_mentions}:
+            self.competitors[name] = self.competitors.get(name, 0) + 1
+
+    def mine_interval(self) -> tuple[float, float, float]:
+        """Return (rate, low, high) for my brand."""
+        return self._interval(self.mine)
+
+    def max_width(self) -> float:
+        """Widest interval across my brand and all competitors seen so far."""
+        widths = []
+        for count in (self.mine, *self.competitors.values()):
+            _, low, high = self._interval(count)
+            widths.append(high - low)
+        return max(widths)
+
+    def brand_rates(self) -> dict[str, dict]:
+        """Per-competitor rate and interval, for storage."""
+        rates = {}
+        for name, count in sorted(self.competitors.items()):
+            rate, low, high = self._interval(count)
+            rates[name] = {
+                "count": count,
+                "rate": round(rate, 4),
+                "ci_low": round(low, 4),
+                "ci_high": round(high, 4),
+            }
+        return rates
+
+    def _interval(self, count: int) -> tuple[float, float, float]:
+        rate = count / self.samples if self.samples else 0.0
+        low, high = wilson_interval(count, self.samples, self.confidence)
+        return rate, low, high
+
+
+@dataclass
+class UnitSample:
+    """
+    One sampled answer and its extraction.
+
+    Attributes:
+        index: Sample position within the unit (0 = the stored canonical answer)
+        response: Provider response (usage and cost already split per sample)
+        extraction: Parsed mentions and rankings
+        request_samples: Samples returned by the request that produced this one
+    """
+
+    index: int
+    response: LLMResponse
+    extraction: ExtractionResult
+    request_samples: int
+
+
+@dataclass
+class SamplingResult:
+    """
+    Outcome of sampling one (intent, model) unit.
+
+    Attributes:
+        samples: All samples in order, starting with the canonical answer
+        tracker: Final mention counts and intervals
+        requests: Provider requests made (including the first)
+        stop_reason: "converged", "max_samples", or "error"
+    """
+
+    samples: list[UnitSample]
+    tracker: MentionRateTracker
+    requests: int
+    stop_reason: str
+
+    @property
+    def extra_cost_usd(self) -> float:
+        """Answer and extraction cost of every sample after the first."""
+        return sum(s.response.cost_usd + s.extraction.extraction_cost_usd for s in self.samples[1:])
+
+
+def supports_native_n(client: LLMClient) -> bool:
+    """True if the client can return several samples from one request."""
+    return callable(getattr(client, "generate_answers", None))
+
+
+async def request_samples(client: LLMClient, prompt: str, n: int) -> list[LLMResponse]:
+    """
+    Request up to n samples in one provider call.
+
+    Returns n responses from clients with native `n` support, otherwise a
+    single response.
+    """
+    if n > 1 and supports_native_n(client):
+        return await client.generate_answers(prompt, n=n)
+    return [await client.generate_answer(prompt)]
+
+
+async def sample_until_confident(
+    client: LLMClient,
+    prompt: str,
+    settings: SamplingConfig,
+    parse: Callable[[str], Awaitable[ExtractionResult]],
+    first: UnitSample,
+    *,
+    prefetched: list[LLMResponse] | None = None,
+) -> SamplingResult:
+    """
+    Keep sampling a unit until its mention-rate intervals are narrow enough.
+
+    Args:
+        client: LLM client for the unit's model
+        prompt: Intent prompt
+        settings: Sampling configuration
+        parse: Extracts mentions from an answer text
+        first: Canonical answer, already parsed and stored by the caller
+        prefetched: Remaining responses from the first request's batch
+
+    Returns:
+        SamplingResult with every sample, including `first`
+
+    Note:
+        A failed follow-up request ends sampling with stop_reason "error";
+        the samples collected so far are kept.
+    """
+    tracker = MentionRateTracker(confidence=settings.confidence)
+    tracker.add(first.extraction)
+    samples = [first]
+    requests = 1
+    queue = deque((response, first.request_samples) for response in prefetched or [])
+
+    while True:
+        # Use every sample that has been paid for before deciding to stop
+        while queue and len(samples) < settings.max_samples:
+            response, request_size = queue.popleft()
+            extraction = await parse(response.answer_text)
+            tracker.add(extraction)
+            samples.append(UnitSample(len(samples), response, extraction, request_size))
+
+        if len(samples) >= settings.max_samples:
+            stop_reason = STOP_MAX_SAMPLES
+            break
+        if len(samples) >= settings.min_samples and tracker.max_width() <= settings.target_ci_width:
+            stop_reason = STOP_CONVERGED
+            break
+
+        n = min(settings.batch_size, settings.max_samples - len(samples))
+        try:
+            batch = await request_samples(client, prompt, n)
+        except Exception as e:
+            logger.warning(f"Sampling stopped after {len(samples)} samples: {e}")
+            stop_reason = STOP_ERROR
+            break
+        requests += 1
+        queue.extend((response, len(batch)) for response in batch)
+
+    logger.debug(
+        f"Sampled {len(samples)} answers in {requests} requests ({stop_reason}), "
+        f"max CI width {tracker.max_width():.3f}"
+    )
+    return SamplingResult(
+        samples=samples, tracker=tracker, requests=requests, stop_reason=stop_reason
+    )
@@ -0,0 +1,249 @@
+"""
+Latency-aware ordering of run work to shorten the makespan.
+
+run_all streams work in intent order: every model for the first intent,
+then every model for the second, and so on. When a few units are much
+slower than the rest (web search models, browser runners), whichever slow
+units are dispatched last decide when the run ends. Dispatching the
+longest expected units first (LPT list scheduling) lets the short ones
+fill the gaps around them.
+
+Expected durations come from the latency_ms of each model's (or runner's)
+most recent answers in answers_raw. Models without history use a default
+per runner type. Intent priorities from the config take precedence over
+duration.
+
+Example:
+    >>> scheduler = LatencyScheduler.from_config(config)
+    >>> units = [scheduler.unit(intent, model_config=m) for m in config.models]
+    >>> for unit in scheduler.order(units):
+    ...     scheduler.record_dispatch(unit)
+    ...     dispatch(unit)
+    >>> scheduler.predicted_makespan(workers=10)
+    42.5
+"""
+
+import heapq
+import logging
+import sqlite3
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ..config.schema import Intent, ModelConfig, RunnerConfig, RuntimeConfig
+
+logger = logging.getLogger(__name__)
+
+# Expected seconds per unit for models and runners without latency history
+DEFAULT_API_SECONDS = 10.0
+DEFAULT_RUNNER_SECONDS = 60.0
+
+
+@dataclass
+class LatencyEstimate:
+    """
+    Expected duration and cost of one model's (or runner's) answer.
+
+    Attributes:
+        seconds: Median latency of recent answers
+        cost_usd: Mean estimated cost of recent answers
+        samples: Answers with a recorded latency (0 = default estimate)
+    """
+
+    seconds: float
+    cost_usd: float = 0.0
+    samples: int = 0
+
+
+@dataclass
+class WorkUnit:
+    """
+    One (intent, model) or (intent, runner) unit of run work.
+
+    Attributes:
+        sequence: Position in intent order (tie-breaker, keeps order stable)
+        intent: Intent to query
+        model_config: API model (None for runners)
+        runner_config: Browser/custom runner (None for API models)
+        estimate: Expected duration and cost
+    """
+
+    sequence: int
+    intent: Intent
+    model_config: ModelConfig | None
+    runner_config: RunnerConfig | None
+    estimate: LatencyEstimate
+
+
+def simulate_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Makespan of list scheduling `durations` in order onto `workers` slots.
+
+    Each unit starts on the first slot to become free, like tasks waiting
+    on run_all's semaphore.
+
+    Args:
+        durations: Expected seconds per unit, in dispatch order
+        workers: Concurrent slots (max_concurrent_requests)
+
+    Returns:
+        Seconds until the last unit finishes (0.0 for no units)
+
+    Example:
+        >>> simulate_makespan([1, 1, 1, 3], workers=2)  # 3 runs last
+        4.0
+        >>> simulate_makespan([3, 1, 1, 1], workers=2)  # longest first
+        3.0
+    """
+    slots = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heappush(slots, heapq.heappop(slots) + duration)
+    return float(max(slots))
+
+
+def _runner_key(runner_config: RunnerConfig) -> tuple[str, str, str]:
+    """answers_raw lookup for a runner: ("model", provider, model) or ("runner", name)."""
+    config = runner_config.config or {}
+    if runner_config.runner_plugin == "api" and config.get("provider"):
+        return ("model", config["provider"], config.get("model_name", ""))
+    return ("runner", runner_config.runner_plugin, "")
+
+
+class LatencyScheduler:
+    """
+    Estimates unit durations from history and orders units for dispatch.
+
+    Estimates are loaded once per run, one query per configured model and
+    runner, using the idx_answers_model and idx_answers_runner_name indexes.
+
+    Attributes:
+        estimates: LatencyEstimate per model ("model", provider, model_name)
+                   and runner ("runner", plugin, "")
+        strategy: "longest_first" or "intent_order"
+    """
+
+    def __init__(
+        self,
+        estimates: dict[tuple[str, str, str], LatencyEstimate],
+        strategy: str = "longest_first",
+    ):
+        self.estimates = estimates
+        self.strategy = strategy
+        self._sequence = 0
+        # (sequence, expected seconds) of dispatched units, in dispatch order
+        self._dispatched: list[tuple[int, float]] = []
+
+    @classmethod
+    def from_config(cls, config: RuntimeConfig) -> "LatencyScheduler":
+        """Load latency estimates for every model and runner in the config."""
+        settings = config.run_settings.scheduling
+        keys = [("model", m.provider, m.model_name) for m in config.models or []]
+        keys += [_runner_key(r) for r in config.runner_configs or []]
+
+        estimates = {}
+        try:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                for key in keys:
+                    estimate = _load_estimate(conn, key, settings.latency_window)
+                    if estimate is not None:
+                        estimates[key] = estimate
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot read latency history, using defaults: {e}")
+            estimates = {}
+
+        for key in keys:
+            estimates.setdefault(
+                key,
+                LatencyEstimate(
+                    DEFAULT_API_SECONDS if key[0] == "model" else DEFAULT_RUNNER_SECONDS
+                ),
+            )
+        return cls(estimates, strategy=settings.strategy)
+
+    @property
+    def dispatched_count(self) -> int:
+        """Units recorded with record_dispatch()."""
+        return len(self._dispatched)
+
+    def unit(
+        self,
+        intent: Intent,
+        model_config: ModelConfig | None = None,
+        runner_config: RunnerConfig | None = None,
+    ) -> WorkUnit:
+        """Create the next unit in intent order, with its estimate."""
+        if model_config is not None:
+            key = ("model", model_config.provider, model_config.model_name)
+        else:
+            key = _runner_key(runner_config)
+        unit = WorkUnit(
+            sequence=self._sequence,
+            intent=intent,
+            model_config=model_config,
+            runner_config=runner_config,
+            estimate=self.estimates[key],
+        )
+        self._sequence += 1
+        return unit
+
+    def order(self, units: list[WorkUnit]) -> list[WorkUnit]:
+        """
+        Order units for dispatch.
+
+        With "longest_first": higher intent priority first, then longest and
+        costliest expected units. With "intent_order" units keep their order.
+        """
+        if self.strategy != "longest_first":
+            return list(units)
+        return sorted(
+            units,
+            key=lambda u: (
+                -u.intent.priority,
+                -u.estimate.seconds,
+                -u.estimate.cost_usd,
+                u.sequence,
+            ),
+        )
+
+    def record_dispatch(self, unit: WorkUnit) -> None:
+        """Note that a unit was dispatched (skipped units are not recorded)."""
+        self._dispatched.append((unit.sequence, unit.estimate.seconds))
+
+    def predicted_makespan(self, workers: int) -> float:
+        """Predicted makespan of the dispatched units in dispatch order."""
+        return simulate_makespan((seconds for _, seconds in self._dispatched), workers)
+
+    def intent_order_makespan(self, workers: int) -> float:
+        """Predicted makespan had the same units been dispatched in intent order."""
+        return simulate_makespan((seconds for _, seconds in sorted(self._dispatched)), workers)
+
+
+def _load_estimate(
+    conn: sqlite3.Connection, key: tuple[str, str, str], window: int
+) -> LatencyEstimate | None:
+    """Median latency and mean cost of the latest `window` answers for a key."""
+    kind, name, model_name = key
+    if kind == "model":
+        where = "model_provider = ? AND model_name = ?"
+        params: tuple = (name, model_name)
+    else:
+        where = "runner_name = ?"
+        params = (name,)
+
+    rows = conn.execute(
+        f"""
+        SELECT latency_ms, estimated_cost_usd FROM answers_raw
+        WHERE {where} AND latency_ms IS NOT NULL
+        ORDER BY timestamp_utc DESC
+        LIMIT ?
+        """,
+        (*params, window),
+    ).fetchall()
+    if not rows:
+        return None
+
+    return LatencyEstimate(
+        seconds=statistics.median(latency for latency, _ in rows) / 1000,
+        cost_usd=statistics.fmean(cost or 0.0 for _, cost in rows),
+        samples=len(rows),
+    )
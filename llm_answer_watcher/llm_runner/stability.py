@@ -0,0 +1,230 @@
+"""
+Stability-aware skipping of (intent, model) queries.
+
+Most intents get the same brand ranking from a model run after run, and
+re-asking them buys nothing but cost. With run_settings.stability enabled,
+run_all asks a StabilityPolicy before scheduling each API query. The policy
+reads the unit's last lookback_runs answered runs from SQLite and measures
+volatility as the mean normalized edit distance between the ranked brand
+lists of consecutive runs:
+
+    - 0.0 means every run ranked the same brands in the same order
+    - 1.0 means consecutive runs had nothing in common
+
+Units above max_rank_distance are volatile and queried every run. Stable
+units get a query interval that grows as their volatility falls, up to
+1 + max_skip_runs runs for a unit whose rankings never changed. Between
+queries the unit is skipped and its last answer is carried forward.
+
+Example:
+    >>> policy = StabilityPolicy(db_path, StabilityConfig())
+    >>> decision = policy.decide("best-crm", "openai", "gpt-4o-mini")
+    >>> decision.skip, decision.reason, decision.query_interval
+    (True, 'stable', 4)
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from itertools import pairwise
+
+from ..config.schema import StabilityConfig
+
+logger = logging.getLogger(__name__)
+
+# reason values recorded in run_meta and query_skips
+REASON_STABLE = "stable"
+REASON_VOLATILE = "volatile"
+REASON_REFRESH_DUE = "refresh_due"
+REASON_INSUFFICIENT_HISTORY = "insufficient_history"
+
+
+def rank_edit_distance(a: list[str], b: list[str]) -> float:
+    """
+    Levenshtein distance between two ranked brand lists, normalized to 0-1.
+
+    Insertions, deletions and substitutions of a brand each cost 1, so a
+    swapped pair costs 2 and a new brand at the end costs 1. The result is
+    divided by the longer list's length.
+
+    Args:
+        a: Brand names in rank order
+        b: Brand names in rank order
+
+    Returns:
+        Normalized distance (0.0 when both lists are empty)
+
+    Example:
+        >>> rank_edit_distance(["hubspot", "warmly"], ["warmly", "hubspot"])
+        1.0
+        >>> rank_edit_distance(["hubspot", "warmly"], ["hubspot", "warmly", "zoho"])
+        0.333...
+    """
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 0.0
+
+    previous = list(range(len(b) + 1))
+    for i, name in enumerate(a, start=1):
+        current = [i]
+        for j, other in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (name != other),
+                )
+            )
+        previous = current
+    return previous[-1] / longest
+
+
+@dataclass
+class SkipDecision:
+    """
+    Whether to query an (intent, model) unit in this run.
+
+    Attributes:
+        skip: True if the unit should not be queried
+        reason: "stable", "volatile", "refresh_due" or "insufficient_history"
+        history_runs: Answered runs the decision was based on
+        rank_distance: Mean normalized rank-list edit distance (None without history)
+        query_interval: Runs between queries for this unit (1 = every run)
+        runs_since_query: Runs since the unit was last answered, including this one
+        carried_from_run_id: Latest answered run, whose answer a skip carries forward
+    """
+
+    skip: bool
+    reason: str
+    history_runs: int
+    rank_distance: float | None = None
+    query_interval: int = 1
+    runs_since_query: int = 1
+    carried_from_run_id: str | None = None
+
+
+class StabilityPolicy:
+    """
+    Decides per unit whether a query can be skipped, from SQLite history.
+
+    Each decision reads at most lookback_runs answers and their mentions,
+    using the (intent_id, model_provider, model_name, timestamp_utc) indexes
+    on answers_raw and query_skips.
+
+    Attributes:
+        db_path: SQLite database with run history
+        settings: Stability configuration
+    """
+
+    def __init__(self, db_path: str, settings: StabilityConfig):
+        self.db_path = db_path
+        self.settings = settings
+
+    def decide(self, intent_id: str, provider: str, model_name: str) -> SkipDecision:
+        """
+        Decide whether to query a unit in the current run.
+
+        Args:
+            intent_id: Intent identifier
+            provider: LLM provider
+            model_name: Model identifier
+
+        Returns:
+            SkipDecision; units with unreadable history are always queried
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                runs = self._answered_runs(conn, intent_id, provider, model_name)
+                if len(runs) < self.settings.min_history:
+                    return SkipDecision(
+                        skip=False,
+                        reason=REASON_INSUFFICIENT_HISTORY,
+                        history_runs=len(runs),
+                    )
+                rankings = self._rankings(conn, runs, intent_id, provider, model_name)
+                skipped = self._skips_since(conn, runs[0][1], intent_id, provider, model_name)
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot read stability history for {intent_id}/{model_name}: {e}")
+            return SkipDecision(skip=False, reason=REASON_INSUFFICIENT_HISTORY, history_runs=0)
+
+        distance = sum(rank_edit_distance(newer, older) for newer, older in pairwise(rankings)) / (
+            len(rankings) - 1
+        )
+
+        decision = SkipDecision(
+            skip=False,
+            reason=REASON_VOLATILE,
+            history_runs=len(runs),
+            rank_distance=round(distance, 4),
+            runs_since_query=skipped + 1,
+            carried_from_run_id=runs[0][0],
+        )
+        if distance > self.settings.max_rank_distance:
+            return decision
+
+        # Linear in how far below the threshold the unit is: identical
+        # rankings wait the full max_skip_runs, borderline units almost none
+        threshold = self.settings.max_rank_distance
+        headroom = 1 - distance / threshold if threshold else 1.0
+        decision.query_interval = 1 + round(headroom * self.settings.max_skip_runs)
+        decision.skip = decision.runs_since_query < decision.query_interval
+        decision.reason = REASON_STABLE if decision.skip else REASON_REFRESH_DUE
+        return decision
+
+    def _answered_runs(
+        self, conn: sqlite3.Connection, intent_id: str, provider: str, model_name: str
+    ) -> list[tuple[str, str]]:
+        """(run_id, timestamp_utc) of the latest answers, newest first."""
+        return conn.execute(
+            """
+            SELECT run_id, timestamp_utc FROM answers_raw
+            WHERE intent_id = ? AND model_provider = ? AND model_name = ?
+            ORDER BY timestamp_utc DESC
+            LIMIT ?
+            """,
+            (intent_id, provider, model_name, self.settings.lookback_runs),
+        ).fetchall()
+
+    def _rankings(
+        self,
+        conn: sqlite3.Connection,
+        runs: list[tuple[str, str]],
+        intent_id: str,
+        provider: str,
+        model_name: str,
+    ) -> list[list[str]]:
+        """Ranked brand list per run, in the order of `runs`."""
+        run_ids = [run_id for run_id, _ in runs]
+        placeholders = ", ".join("?" * len(run_ids))
+        rows = conn.execute(
+            f"""
+            SELECT run_id, normalized_name FROM mentions
+            WHERE intent_id = ? AND model_provider = ? AND model_name = ?
+              AND run_id IN ({placeholders})
+            ORDER BY rank_position IS NULL, rank_position, first_position, normalized_name
+            """,
+            (intent_id, provider, model_name, *run_ids),
+        ).fetchall()
+
+        by_run: dict[str, list[str]] = {run_id: [] for run_id in run_ids}
+        for run_id, name in rows:
+            by_run[run_id].append(name)
+        return [by_run[run_id] for run_id in run_ids]
+
+    def _skips_since(
+        self,
+        conn: sqlite3.Connection,
+        since_utc: str,
+        intent_id: str,
+        provider: str,
+        model_name: str,
+    ) -> int:
+        """Runs that skipped the unit after its latest answer."""
+        return conn.execute(
+            """
+            SELECT COUNT(*) FROM query_skips
+            WHERE intent_id = ? AND model_provider = ? AND model_name = ?
+              AND timestamp_utc > ?
+            """,
+            (intent_id, provider, model_name, since_utc),
+        ).fetchone()[0]
@@ -0,0 +1,447 @@
+"""
+Durable work-unit queue for running one run across several worker processes.
+
+A distributed run is split into units (one intent x one model or runner).
+The coordinator enqueues them; workers lease units, execute them and report
+a result. A lease expires unless the worker renews it with heartbeats, so
+units held by a crashed or hung worker are leased again by another worker:
+
+    pending --lease--> leased --complete--> done
+                         |  \\--fail (attempts left)--> pending
+                         |   \\-fail (no attempts left)--> failed
+                         \\--lease expired--> leased again / failed after max_attempts
+    pending --cancel--> cancelled
+
+Every lease increments the unit's attempt counter. heartbeat(), complete()
+and fail() are fenced by (worker_id, attempt): a worker whose lease expired
+and was taken over cannot overwrite the new holder's state, and its
+complete() returns False.
+
+WorkQueue is the interface the coordinator and workers use; SQLiteWorkQueue
+implements it on a SQLite file. A queue service can be plugged in by
+implementing the same methods.
+
+SQLite notes:
+    Each operation is one short BEGIN IMMEDIATE transaction on a fresh
+    connection, with busy_timeout to wait out concurrent writers. Workers on
+    other hosts need the queue file on a filesystem with working POSIX
+    locks (the default rollback journal is used; WAL does not work across
+    network filesystems). Lease expiry compares wall-clock timestamps, so
+    hosts need roughly synchronized clocks (well within lease_seconds).
+
+Example:
+    >>> queue = SQLiteWorkQueue("./output/queue.db")
+    >>> queue.enqueue("2025-11-02T08-00-00Z", [{"intent": {...}, "model_name": "gpt-4o"}])
+    >>> lease = queue.lease("host-a-1234", lease_seconds=300)
+    >>> queue.complete(lease, {"success_count": 1})
+    True
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import batched
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+# Unit states
+STATE_PENDING = "pending"
+STATE_LEASED = "leased"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+STATE_CANCELLED = "cancelled"
+UNIT_STATES = (STATE_PENDING, STATE_LEASED, STATE_DONE, STATE_FAILED, STATE_CANCELLED)
+
+# How long an operation waits for another process's transaction
+BUSY_TIMEOUT_MS = 30_000
+
+# Units inserted per enqueue transaction, so workers can lease the first
+# units of a large run while the rest are still being added
+ENQUEUE_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_units (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    payload_json TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    result_json TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_work_units_state ON work_units(state, lease_expires_at);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Lease:
+    """
+    A worker's claim on one unit.
+
+    Attributes:
+        run_id: Run the unit belongs to
+        seq: Position of the unit in the run (0-based enqueue order)
+        attempt: Attempt number of this lease (1 for the first lease)
+        worker_id: Worker holding the lease
+        payload: Unit description as enqueued
+    """
+
+    run_id: str
+    seq: int
+    attempt: int
+    worker_id: str
+    payload: dict
+
+
+@dataclass(frozen=True, slots=True)
+class WorkUnit:
+    """
+    Final or current state of one unit, as read by the coordinator.
+
+    Attributes:
+        seq: Position of the unit in the run
+        payload: Unit description as enqueued
+        state: One of UNIT_STATES
+        attempts: Number of times the unit was leased
+        worker_id: Last worker that leased the unit
+        result: Result reported by complete(), if done
+        error: Last failure, expiry or cancel reason
+    """
+
+    seq: int
+    payload: dict
+    state: str
+    attempts: int
+    worker_id: str | None
+    result: dict | None
+    error: str | None
+
+
+class WorkQueue(Protocol):
+    """
+    Interface of the queue shared by a distributed run's coordinator and workers.
+
+    Implementations must make lease() atomic across processes (a unit is
+    held by at most one unexpired lease) and fence heartbeat(), complete()
+    and fail() by the lease's worker_id and attempt.
+    """
+
+    def enqueue(self, run_id: str, payloads: Iterable[dict]) -> int:
+        """Add a run's units in order; returns the number added (re-enqueue is a no-op)."""
+        ...
+
+    def lease(
+        self, worker_id: str, lease_seconds: float, run_id: str | None = None
+    ) -> Lease | None:
+        """Lease the next pending or expired unit, or None if there is none."""
+        ...
+
+    def heartbeat(self, lease: Lease, lease_seconds: float) -> bool:
+        """Extend a lease; False if it was lost to another worker or the unit ended."""
+        ...
+
+    def complete(self, lease: Lease, result: dict) -> bool:
+        """Record a unit's result; False if the lease was lost."""
+        ...
+
+    def fail(self, lease: Lease, error: str) -> bool:
+        """Release a unit after an error, to be retried while attempts remain."""
+        ...
+
+    def cancel(self, run_id: str, reason: str) -> int:
+        """Cancel a run's pending units; returns the number cancelled."""
+        ...
+
+    def progress(self, run_id: str) -> dict[str, int]:
+        """Count a run's units by state (every state in UNIT_STATES is present)."""
+        ...
+
+    def results(self, run_id: str) -> list[WorkUnit]:
+        """All units of a run in enqueue order."""
+        ...
+
+    def done_cost(self, run_id: str) -> float:
+        """Sum of total_cost_usd reported by a run's done units."""
+        ...
+
+
+class SQLiteWorkQueue:
+    """
+    WorkQueue stored in a SQLite file.
+
+    Attributes:
+        path: Queue database file (created on first use)
+        max_attempts: Leases per unit before an expiry or failure is final
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Autocommit connection; each operation runs its own BEGIN IMMEDIATE."""
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.isolation_level = None
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        return conn
+
+    def _write(self, sql: str, params: tuple) -> int:
+        """Run one write statement in a short transaction; returns rowcount."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rowcount = conn.execute(sql, params).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return rowcount
+        finally:
+            conn.close()
+
+    def _expire(self, conn: sqlite3.Connection, now: float, run_id: str | None) -> None:
+        """Fail expired leases that have no attempts left."""
+        cursor = conn.execute(
+            """
+            UPDATE work_units
+            SET state = 'failed', lease_expires_at = NULL, updated_at = ?,
+                error = 'Lease expired on worker ' || worker_id
+            WHERE state = 'leased' AND lease_expires_at < ? AND attempts >= ?
+              AND (? IS NULL OR run_id = ?)
+            """,
+            (now, now, self.max_attempts, run_id, run_id),
+        )
+        if cursor.rowcount:
+            logger.warning(f"{cursor.rowcount} work units failed: lease expired on last attempt")
+
+    def enqueue(self, run_id: str, payloads: Iterable[dict]) -> int:
+        """
+        Add a run's units in order; returns the number added (re-enqueue is a no-op).
+
+        payloads is consumed lazily and inserted ENQUEUE_BATCH_SIZE units per
+        transaction, so a streamed run is never held in memory as a whole.
+        """
+        added = 0
+        conn = self._connect()
+        try:
+            for batch in batched(enumerate(payloads), ENQUEUE_BATCH_SIZE):
+                now = time.time()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    before = conn.total_changes
+                    conn.executemany(
+                        """
+                        INSERT OR IGNORE INTO work_units (run_id, seq, payload_json, updated_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        [(run_id, seq, json.dumps(payload), now) for seq, payload in batch],
+                    )
+                    added += conn.total_changes - before
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        finally:
+            conn.close()
+        logger.debug(f"Enqueued {added} work units for run {run_id}")
+        return added
+
+    def lease(
+        self, worker_id: str, lease_seconds: float, run_id: str | None = None
+    ) -> Lease | None:
+        """
+        Lease the next pending or expired unit, or None if there is none.
+
+        Units are handed out in (run_id, seq) order, so the oldest run's
+        units go first.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(conn, now, run_id)
+                row = conn.execute(
+                    """
+                    SELECT run_id, seq, payload_json, attempts FROM work_units
+                    WHERE (state = 'pending' OR (state = 'leased' AND lease_expires_at < ?))
+                      AND (? IS NULL OR run_id = ?)
+                    ORDER BY run_id, seq
+                    LIMIT 1
+                    """,
+                    (now, run_id, run_id),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        """
+                        UPDATE work_units
+                        SET state = 'leased', attempts = attempts + 1, worker_id = ?,
+                            lease_expires_at = ?, updated_at = ?
+                        WHERE run_id = ? AND seq = ?
+                        """,
+                        (worker_id, now + lease_seconds, now, row[0], row[1]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        unit_run_id, seq, payload_json, attempts = row
+        if attempts:
+            logger.info(f"Re-leasing work unit {unit_run_id}#{seq} (attempt {attempts + 1})")
+        return Lease(
+            run_id=unit_run_id,
+            seq=seq,
+            attempt=attempts + 1,
+            worker_id=worker_id,
+            payload=json.loads(payload_json),
+        )
+
+    def heartbeat(self, lease: Lease, lease_seconds: float) -> bool:
+        """Extend a lease; False if it was lost to another worker or the unit ended."""
+        now = time.time()
+        return (
+            self._write(
+                """
+                UPDATE work_units SET lease_expires_at = ?, updated_at = ?
+                WHERE run_id = ? AND seq = ? AND state = 'leased'
+                  AND worker_id = ? AND attempts = ?
+                """,
+                (now + lease_seconds, now, lease.run_id, lease.seq, lease.worker_id, lease.attempt),
+            )
+            == 1
+        )
+
+    def complete(self, lease: Lease, result: dict) -> bool:
+        """Record a unit's result; False if the lease was lost."""
+        return (
+            self._write(
+                """
+                UPDATE work_units
+                SET state = 'done', result_json = ?, lease_expires_at = NULL, updated_at = ?
+                WHERE run_id = ? AND seq = ? AND state = 'leased'
+                  AND worker_id = ? AND attempts = ?
+                """,
+                (
+                    json.dumps(result),
+                    time.time(),
+                    lease.run_id,
+                    lease.seq,
+                    lease.worker_id,
+                    lease.attempt,
+                ),
+            )
+            == 1
+        )
+
+    def fail(self, lease: Lease, error: str) -> bool:
+        """Release a unit after an error, to be retried while attempts remain."""
+        return (
+            self._write(
+                """
+                UPDATE work_units
+                SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    error = ?, lease_expires_at = NULL, updated_at = ?
+                WHERE run_id = ? AND seq = ? AND state = 'leased'
+                  AND worker_id = ? AND attempts = ?
+                """,
+                (
+                    self.max_attempts,
+                    error,
+                    time.time(),
+                    lease.run_id,
+                    lease.seq,
+                    lease.worker_id,
+                    lease.attempt,
+                ),
+            )
+            == 1
+        )
+
+    def cancel(self, run_id: str, reason: str) -> int:
+        """Cancel a run's pending units; returns the number cancelled."""
+        return self._write(
+            """
+            UPDATE work_units SET state = 'cancelled', error = ?, updated_at = ?
+            WHERE run_id = ? AND state = 'pending'
+            """,
+            (reason, time.time(), run_id),
+        )
+
+    def progress(self, run_id: str) -> dict[str, int]:
+        """Count a run's units by state (every state in UNIT_STATES is present)."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(conn, time.time(), run_id)
+                rows = conn.execute(
+                    "SELECT state, COUNT(*) FROM work_units WHERE run_id = ? GROUP BY state",
+                    (run_id,),
+                ).fetchall()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        return dict.fromkeys(UNIT_STATES, 0) | dict(rows)
+
+    def results(self, run_id: str) -> list[WorkUnit]:
+        """All units of a run in enqueue order."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """
+                SELECT seq, payload_json, state, attempts, worker_id, result_json, error
+                FROM work_units WHERE run_id = ? ORDER BY seq
+                """,
+                (run_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            WorkUnit(
+                seq=seq,
+                payload=json.loads(payload_json),
+                state=state,
+                attempts=attempts,
+                worker_id=worker_id,
+                result=json.loads(result_json) if result_json is not None else None,
+                error=error,
+            )
+            for seq, payload_json, state, attempts, worker_id, result_json, error in rows
+        ]
+
+    def done_cost(self, run_id: str) -> float:
+        """Sum of total_cost_usd reported by a run's done units, summed in SQL."""
+        conn = self._connect()
+        try:
+            (total,) = conn.execute(
+                """
+                SELECT COALESCE(SUM(json_extract(result_json, '$.total_cost_usd')), 0.0)
+                FROM work_units WHERE run_id = ? AND state = 'done'
+                """,
+                (run_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return total
@@ -7,13 +7,15 @@ with inline CSS, no external dependencies, and XSS protection via Jinja2 autoesc
 Key exports:
     - generate_report: Generate HTML string from run data
     - write_report: Generate and write HTML report to disk
+    - build_result_rows: Build write_report() rows from a run summary
     - format_cost_usd: Format cost values for display
 """
 
 from .cost_formatter import format_cost_summary, format_cost_usd
-from .generator import generate_report, write_report
+from .generator import build_result_rows, generate_report, write_report
 
 __all__ = [
+    "build_result_rows",
     "format_cost_summary",
     "format_cost_usd",
     "generate_report",
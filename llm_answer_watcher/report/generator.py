@@ -163,6 +163,64 @@ def write_report(
     logger.info(f"HTML report written to: {run_dir}/report.html")
 
 
+def build_result_rows(config: RuntimeConfig, summary: dict) -> list[dict]:
+    """
+    Build the per-query result rows write_report() expects from a run summary.
+
+    Args:
+        config: Runtime configuration the run executed
+        summary: Summary dict returned by run_all() (or the distributed
+            coordinator), with errors, skipped and timed_out unit lists
+
+    Returns:
+        One row per (intent, model) with status "success", "error",
+        "skipped" or "timed_out". Successful rows share the run's average
+        cost per successful query; intents streamed from intents_source are
+        not included.
+
+    Example:
+        >>> summary = await run_all(config)
+        >>> write_report(summary["output_dir"], config, build_result_rows(config, summary))
+    """
+
+    def units(key: str) -> set[tuple[str, str, str]]:
+        return {
+            (unit["intent_id"], unit["model_provider"], unit["model_name"])
+            for unit in summary.get(key, [])
+        }
+
+    timed_out = units("timed_out")
+    skipped = units("skipped")
+    failed = units("errors")
+    success_count = summary["success_count"]
+    avg_cost = summary["total_cost_usd"] / success_count if success_count > 0 else 0.0
+
+    rows = []
+    for intent in config.intents:
+        for model in config.models:
+            unit = (intent.id, model.provider, model.model_name)
+            if unit in timed_out:
+                status = "timed_out"
+            elif unit in skipped:
+                # Stable unit: the answer was carried forward, not queried
+                status = "skipped"
+            elif unit in failed:
+                status = "error"
+            else:
+                status = "success"
+            rows.append(
+                {
+                    "intent_id": intent.id,
+                    "provider": model.provider,
+                    "model_name": model.model_name,
+                    "status": status,
+                    "cost_usd": avg_cost if status == "success" else 0.0,
+                    "timestamp_utc": summary["timestamp_utc"],
+                }
+            )
+    return rows
+
+
 def _calculate_visibility_scores(intents_data: list[dict]) -> dict:
     """
     Calculate visibility scores for all brands across all intents.
@@ -468,13 +526,14 @@ def _load_model_result(
         Dictionary with model result data for template, or None if loading fails
 
     Note:
-        - Returns None for failed results (status != success)
+        - Returns None for failed results (status other than success/skipped)
+        - Skipped units show the answer carried forward from an earlier run
         - Logs warnings for missing/invalid JSON files but doesn't crash
         - Sorts mentions by position for consistent display
         - Formats cost with format_cost_usd()
     """
-    # Skip failed results
-    if result.get("status") != "success":
+    # Skip failed results (skipped units have a carried-forward answer)
+    if result.get("status") not in ("success", "skipped"):
         logger.warning(
             f"Skipping failed result: {intent_id} / "
             f"{result.get('provider')}/{result.get('model_name')}"
@@ -607,6 +666,7 @@ def _load_model_result(
         "answer_length": answer_length,
         "web_search_count": web_search_count,
         "has_web_search": web_search_count > 0,
+        "carried_from_run_id": parsed_data.get("carried_from_run_id"),
         "operations": operations,
         "operations_cost_usd": operations_cost_usd,
         "operations_cost_formatted": format_cost_usd(operations_cost_usd),
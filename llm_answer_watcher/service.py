@@ -0,0 +1,594 @@
+"""
+HTTP job API for run_all (optional ASGI service).
+
+run_all() is documented as the internal API contract; this module exposes
+it over HTTP so internal tools can trigger many small runs without spawning
+a CLI process per run. It is a plain ASGI application with no web framework
+dependency, so it can be hosted by any ASGI server (e.g. uvicorn, used by
+the `api` CLI command) and tested in-process with httpx.ASGITransport.
+
+Endpoints:
+    POST /runs              Queue a run: {"config": "name", "intent_ids": [...], "tenant": "..."}
+    GET  /runs              List known jobs (most recent last)
+    GET  /runs/{id}         Job status, progress counters, and run summary
+    GET  /runs/{id}/events  Server-sent events: query_started, query_completed, status
+    GET  /health            Queue depth and running job count
+
+Execution model:
+- Configs are loaded once at startup and referenced by name (file stem).
+- Jobs wait in a bounded FIFO queue; a full queue returns 429.
+- At most max_concurrent_jobs run at once, and at most max_jobs_per_tenant
+  per tenant (X-Tenant header or "tenant" field). Jobs from a tenant at its
+  cap are skipped over, so one busy tenant cannot block the others.
+- Jobs share the service's HTTP connection pool (installed during ASGI
+  lifespan startup) and one ExtractionMemo per config, and every database
+  is initialized once at startup rather than per run.
+- Progress is reported through run_all's start_query/complete_query
+  progress-callback hooks, the same ones the CLI progress bar uses.
+
+Example:
+    >>> service = RunService({"watcher": load_config("watcher.config.yaml")})
+    >>> app = ServiceApp(service)
+    >>> # uvicorn.run(app, host="127.0.0.1", port=8000)
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+
+from llm_answer_watcher.config.schema import RuntimeConfig
+from llm_answer_watcher.extractor.memo import ExtractionMemo
+from llm_answer_watcher.llm_runner.http_pool import connection_pool
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.utils.time import run_id_from_timestamp, utc_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+FINISHED_STATES = frozenset({JOB_COMPLETED, JOB_FAILED})
+
+DEFAULT_TENANT = "default"
+
+# Largest accepted POST /runs body
+MAX_BODY_BYTES = 64 * 1024
+
+Scope = dict
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+
+class ServiceError(Exception):
+    """Request rejected by the service; mapped to an HTTP error response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class RunJob:
+    """
+    One queued or executed run.
+
+    Attributes:
+        job_id: Unique job identifier
+        config_name: Name of the registered config to run
+        tenant: Tenant the job counts against for concurrency limits
+        intent_ids: Subset of intents to run (None = all intents)
+        status: queued, running, completed, or failed
+        submitted_at: UTC timestamp when queued
+        started_at: UTC timestamp when execution began
+        finished_at: UTC timestamp when execution ended
+        run_id: run_id assigned when execution began
+        total_queries: Expected number of queries
+        completed_queries: Queries that finished (success or failure)
+        failed_queries: Queries that failed
+        result: run_all() summary on completion
+        error: Error message on failure
+        events: (event, data) pairs streamed to SSE subscribers
+    """
+
+    job_id: str
+    config_name: str
+    tenant: str
+    intent_ids: list[str] | None
+    submitted_at: str
+    status: str = JOB_QUEUED
+    started_at: str | None = None
+    finished_at: str | None = None
+    run_id: str | None = None
+    total_queries: int = 0
+    completed_queries: int = 0
+    failed_queries: int = 0
+    result: dict | None = None
+    error: str | None = None
+    events: list[tuple[str, dict]] = field(default_factory=list, repr=False)
+    _updated: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a terminal state."""
+        return self.status in FINISHED_STATES
+
+    def emit(self, event: str, data: dict) -> None:
+        """Record an event and wake SSE subscribers."""
+        self.events.append((event, data))
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+    async def wait_for_events(self, cursor: int) -> None:
+        """Wait until there are events past cursor or the job finished."""
+        while len(self.events) <= cursor and not self.finished:
+            await self._updated.wait()
+
+    def set_status(self, status: str) -> None:
+        """Change status and emit a status event."""
+        self.status = status
+        self.emit("status", self.to_dict())
+
+    def to_dict(self) -> dict:
+        """JSON representation returned by the API."""
+        return {
+            "job_id": self.job_id,
+            "config": self.config_name,
+            "tenant": self.tenant,
+            "intent_ids": self.intent_ids,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "run_id": self.run_id,
+            "progress": {
+                "total_queries": self.total_queries,
+                "completed_queries": self.completed_queries,
+                "failed_queries": self.failed_queries,
+            },
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobProgress:
+    """
+    run_all() progress callback that turns query hooks into job events.
+
+    Implements the same start_query/complete_query interface as the CLI
+    progress tracker.
+    """
+
+    def __init__(self, job: RunJob):
+        self.job = job
+
+    async def start_run(self, total_queries: int):
+        """Record the number of queries run_all will report."""
+        self.job.total_queries = total_queries
+        self.job.emit("status", self.job.to_dict())
+
+    async def start_query(self, intent_id: str, provider: str, model: str):
+        """Record that a query started."""
+        self.job.emit(
+            "query_started", {"intent_id": intent_id, "provider": provider, "model": model}
+        )
+
+    async def complete_query(self, query_key: str, success: bool = True):
+        """Record that a query finished and update counters."""
+        self.job.completed_queries += 1
+        if not success:
+            self.job.failed_queries += 1
+        self.job.emit(
+            "query_completed",
+            {
+                "query_key": query_key,
+                "success": success,
+                "completed_queries": self.job.completed_queries,
+                "total_queries": self.job.total_queries,
+            },
+        )
+
+
+class RunService:
+    """
+    Bounded job queue that executes run_all() for registered configs.
+
+    Attributes:
+        configs: Registered runtime configs by name
+        max_queue_size: Maximum queued (not yet running) jobs
+        max_concurrent_jobs: Maximum jobs running at once
+        max_jobs_per_tenant: Maximum running jobs per tenant
+        max_history: Finished jobs kept for GET /runs/{id}
+
+    Example:
+        >>> service = RunService({"watcher": config}, max_jobs_per_tenant=1)
+        >>> job = service.submit({"config": "watcher"}, tenant="team-a")
+        >>> job.status
+        'queued'
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[str, RuntimeConfig],
+        max_queue_size: int = 100,
+        max_concurrent_jobs: int = 4,
+        max_jobs_per_tenant: int = 2,
+        max_history: int = 1000,
+    ):
+        if not configs:
+            raise ValueError("At least one config must be registered")
+        for name, value in (
+            ("max_queue_size", max_queue_size),
+            ("max_concurrent_jobs", max_concurrent_jobs),
+            ("max_jobs_per_tenant", max_jobs_per_tenant),
+            ("max_history", max_history),
+        ):
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got: {value}")
+
+        self.configs = dict(configs)
+        self.max_queue_size = max_queue_size
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_jobs_per_tenant = max_jobs_per_tenant
+        self.max_history = max_history
+
+        self.jobs: OrderedDict[str, RunJob] = OrderedDict()
+        self._pending: deque[RunJob] = deque()
+        self._running: dict[str, asyncio.Task] = {}
+        self._tenant_running: dict[str, int] = {}
+        self._memos: dict[str, ExtractionMemo] = {}
+        self._last_run_second: str | None = None
+        self._run_id_counter = 0
+        self._exit_stack: AsyncExitStack | None = None
+        self._context: contextvars.Context | None = None
+
+        initialized = set()
+        for name, config in self.configs.items():
+            db_path = config.run_settings.sqlite_db_path
+            if db_path not in initialized:
+                init_db_if_needed(db_path)
+                initialized.add(db_path)
+            cache_config = config.run_settings.extraction_cache
+            if cache_config is not None and cache_config.enabled:
+                self._memos[name] = ExtractionMemo.from_config(cache_config, db_path)
+
+    async def start(self) -> None:
+        """Open the shared HTTP connection pool used by all jobs."""
+        if self._exit_stack is not None:
+            return
+        self._exit_stack = AsyncExitStack()
+        await self._exit_stack.enter_async_context(connection_pool())
+        # Jobs run in copies of this context so they see the shared pool
+        self._context = contextvars.copy_context()
+
+    async def shutdown(self) -> None:
+        """Wait for running jobs, then close the shared connection pool."""
+        if self._running:
+            logger.info(f"Waiting for {len(self._running)} running jobs to finish")
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._context = None
+
+    def submit(self, request: dict, tenant: str | None = None) -> RunJob:
+        """
+        Validate a run request and queue it.
+
+        Args:
+            request: Parsed POST /runs body
+            tenant: Tenant from the X-Tenant header (overrides body field)
+
+        Returns:
+            The queued (or already started) job
+
+        Raises:
+            ServiceError: 400 for invalid requests, 404 for unknown configs,
+                429 when the queue is full
+        """
+        if not isinstance(request, dict):
+            raise ServiceError(400, "Request body must be a JSON object")
+
+        config_name = request.get("config")
+        if config_name is None and len(self.configs) == 1:
+            config_name = next(iter(self.configs))
+        if config_name not in self.configs:
+            raise ServiceError(
+                404, f"Unknown config '{config_name}'. Available: {sorted(self.configs)}"
+            )
+        config = self.configs[config_name]
+
+        intent_ids = request.get("intent_ids")
+        if intent_ids is not None:
+            known = {intent.id for intent in config.intents}
+            if not isinstance(intent_ids, list) or not intent_ids:
+                raise ServiceError(400, "intent_ids must be a non-empty list")
+            unknown = [intent_id for intent_id in intent_ids if intent_id not in known]
+            if unknown:
+                raise ServiceError(400, f"Unknown intent_ids for '{config_name}': {unknown}")
+
+        tenant = tenant or request.get("tenant") or DEFAULT_TENANT
+        if not isinstance(tenant, str):
+            raise ServiceError(400, "tenant must be a string")
+
+        if len(self._pending) >= self.max_queue_size:
+            raise ServiceError(429, f"Job queue is full ({self.max_queue_size} queued)")
+
+        job = RunJob(
+            job_id=uuid.uuid4().hex,
+            config_name=config_name,
+            tenant=tenant,
+            intent_ids=intent_ids,
+            submitted_at=utc_timestamp(),
+        )
+        # Inline intents only; run_all corrects this through JobProgress.start_run
+        # once intents_source rows are counted
+        execution_units = len(config.models) + len(config.runner_configs or [])
+        job.total_queries = len(intent_ids or config.intents) * execution_units
+        job.emit("status", job.to_dict())
+
+        self.jobs[job.job_id] = job
+        self._pending.append(job)
+        self._trim_history()
+        self._dispatch()
+        return job
+
+    def health(self) -> dict:
+        """Queue depth and running job counts."""
+        return {
+            "status": "ok",
+            "queued": len(self._pending),
+            "running": len(self._running),
+            "running_by_tenant": {t: n for t, n in self._tenant_running.items() if n},
+        }
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while global and per-tenant capacity allows."""
+        if not self._pending:
+            return
+        still_pending: deque[RunJob] = deque()
+        while self._pending:
+            job = self._pending.popleft()
+            if len(self._running) >= self.max_concurrent_jobs or (
+                self._tenant_running.get(job.tenant, 0) >= self.max_jobs_per_tenant
+            ):
+                still_pending.append(job)
+                continue
+            self._tenant_running[job.tenant] = self._tenant_running.get(job.tenant, 0) + 1
+            job.run_id = self._next_run_id()
+            job.started_at = utc_timestamp()
+            job.set_status(JOB_RUNNING)
+            context = self._context.copy() if self._context is not None else None
+            self._running[job.job_id] = asyncio.create_task(self._execute(job), context=context)
+        self._pending = still_pending
+
+    async def _execute(self, job: RunJob) -> None:
+        """Run one job and record the outcome (never raises)."""
+        config = self.configs[job.config_name]
+        if job.intent_ids is not None:
+            wanted = set(job.intent_ids)
+            config = config.model_copy(
+                update={
+                    "intents": [i for i in config.intents if i.id in wanted],
+                    # intent_ids select inline intents only
+                    "intents_source": None,
+                }
+            )
+
+        try:
+            result = await run_all(
+                config,
+                progress_callback=JobProgress(job),
+                config_filename=job.config_name,
+                memo=self._memos.get(job.config_name),
+                run_id=job.run_id,
+            )
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            job.error = str(e)
+            status = JOB_FAILED
+        else:
+            job.result = result
+            status = JOB_COMPLETED
+        finally:
+            self._running.pop(job.job_id, None)
+            self._tenant_running[job.tenant] -= 1
+
+        job.finished_at = utc_timestamp()
+        job.set_status(status)
+        self._dispatch()
+
+    def _next_run_id(self) -> str:
+        """Timestamp run_id, suffixed when several jobs start in one second."""
+        base = run_id_from_timestamp()
+        if base != self._last_run_second:
+            self._last_run_second = base
+            self._run_id_counter = 0
+            return base
+        self._run_id_counter += 1
+        return f"{base[:-1]}-{self._run_id_counter:02d}Z"
+
+    def _trim_history(self) -> None:
+        """Forget the oldest finished jobs beyond max_history."""
+        excess = len(self.jobs) - self.max_history
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, job in self.jobs.items() if job.finished][:excess]:
+            del self.jobs[job_id]
+
+
+class ServiceApp:
+    """
+    ASGI application exposing a RunService over HTTP.
+
+    Handles the ASGI lifespan protocol (opening and closing the shared
+    connection pool) and routes HTTP requests to the service.
+
+    Example:
+        >>> app = ServiceApp(RunService({"watcher": config}))
+        >>> transport = httpx.ASGITransport(app=app)
+    """
+
+    def __init__(self, service: RunService):
+        self.service = service
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        method = scope["method"]
+        parts = [part for part in scope["path"].split("/") if part]
+
+        try:
+            if parts == ["health"] and method == "GET":
+                await _send_json(send, 200, self.service.health())
+            elif parts == ["runs"] and method == "POST":
+                request = await _read_json(receive)
+                tenant = _header(scope, b"x-tenant")
+                job = self.service.submit(request, tenant=tenant)
+                await _send_json(
+                    send,
+                    202,
+                    job.to_dict(),
+                    headers=[(b"location", f"/runs/{job.job_id}".encode())],
+                )
+            elif parts == ["runs"] and method == "GET":
+                await _send_json(
+                    send, 200, {"runs": [job.to_dict() for job in self.service.jobs.values()]}
+                )
+            elif len(parts) == 2 and parts[0] == "runs" and method == "GET":
+                await _send_json(send, 200, self._get_job(parts[1]).to_dict())
+            elif (
+                len(parts) == 3 and parts[0] == "runs" and parts[2] == "events" and method == "GET"
+            ):
+                job = self._get_job(parts[1])
+                await self._stream_events(job, scope, receive, send)
+            else:
+                raise ServiceError(404, f"No route for {method} {scope['path']}")
+        except ServiceError as e:
+            await _send_json(send, e.status, {"error": e.message})
+
+    def _get_job(self, job_id: str) -> RunJob:
+        job = self.service.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(404, f"Unknown job '{job_id}'")
+        return job
+
+    async def _stream_events(self, job: RunJob, scope: Scope, receive: Receive, send: Send):
+        """Stream job events as SSE until the job finishes or the client leaves."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                ],
+            }
+        )
+
+        # Resume after the last event the client saw (SSE reconnect)
+        last_event_id = _header(scope, b"last-event-id")
+        cursor = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+
+        disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+        try:
+            while True:
+                for index in range(cursor, len(job.events)):
+                    event, data = job.events[index]
+                    chunk = f"id: {index}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+                    await send(
+                        {"type": "http.response.body", "body": chunk.encode(), "more_body": True}
+                    )
+                cursor = len(job.events)
+                if job.finished:
+                    break
+
+                waiter = asyncio.ensure_future(job.wait_for_events(cursor))
+                await asyncio.wait({waiter, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnected.done():
+                    waiter.cancel()
+                    return
+        finally:
+            if not disconnected.done():
+                disconnected.cancel()
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.service.start()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.service.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    """Return a request header value (latin-1 decoded), or None."""
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+async def _read_json(receive: Receive) -> object:
+    """Read and parse a JSON request body (empty body = {})."""
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY_BYTES:
+            raise ServiceError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+        if not message.get("more_body", False):
+            break
+    if not body:
+        return {}
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError as e:
+        raise ServiceError(400, f"Invalid JSON body: {e}") from e
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    """Return once the client disconnects."""
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _send_json(
+    send: Send, status: int, payload: object, headers: list[tuple[bytes, bytes]] | None = None
+) -> None:
+    """Send a complete JSON response."""
+    body = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,402 @@
+"""
+Content-addressed storage for browser artifacts (screenshots, HTML snapshots).
+
+Browser runners used to write one PNG and one HTML file per intent, named
+after the intent and session, synchronously on the thread running the
+browser. Snapshots of the same page are often byte-identical (error pages,
+login walls, an unchanged answer), so the output directory filled with
+duplicates and every intent waited on disk writes.
+
+BlobStore keys each artifact by the SHA-256 of the captured bytes:
+
+    {output_dir}/blobs/
+        3f/
+            3f9a...e1.png           (screenshot)
+            3f0c...7b.html.gz       (HTML snapshot, .html.zst with zstandard)
+
+    - put_screenshot()/put_html() hash the bytes and return the blob path
+      immediately; encoding and writing happen on a background thread
+    - identical content maps to the same path and is written once
+    - HTML is compressed with zstd when `zstandard` is installed, gzip
+      otherwise; read() decompresses transparently
+    - screenshots can be downscaled to max_width and/or re-encoded as WebP
+      (requires Pillow)
+    - writes are atomic (temp file + rename), so a blob that exists is complete
+
+answers_raw.screenshot_path and html_snapshot_path hold the blob paths.
+Several rows may share one blob, so blobs are never deleted with a row;
+collect_garbage() deletes blobs no longer referenced by any row once they
+are older than a grace period (which protects blobs written by a run that
+has not inserted its rows yet; reusing a blob refreshes its mtime).
+`db maintain` runs it after applying retention.
+
+References are read from a single database, so configs with different
+sqlite_db_path values must not share an output_dir: garbage collection
+against one database would delete blobs that only the other references.
+
+Example:
+    >>> store = BlobStore("./output")
+    >>> path = store.put_html("<html>...</html>")
+    >>> path
+    './output/blobs/3f/3f0c...7b.html.gz'
+    >>> store.close()  # wait for pending writes
+    >>> store.read(path).decode("utf-8")
+    '<html>...</html>'
+"""
+
+import gzip
+import hashlib
+import io
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Directory under the output directory holding all blobs
+BLOB_DIR = "blobs"
+
+# Blobs younger than this are never garbage collected (seconds)
+DEFAULT_GC_GRACE_SECONDS = 3600
+
+# answers_raw columns that reference blobs
+BLOB_REFERENCE_COLUMNS = ("screenshot_path", "html_snapshot_path")
+
+SCREENSHOT_FORMATS = ("png", "webp")
+
+
+@dataclass
+class BlobGCReport:
+    """
+    Result of a blob garbage collection pass.
+
+    Attributes:
+        dry_run: True if nothing was deleted
+        blobs_scanned: Blob files found under the blob directory
+        blobs_referenced: Blob files still referenced by answers_raw
+        blobs_deleted: Orphaned blobs deleted (or that would be deleted)
+        bytes_freed: Size of the deleted blobs
+        blobs_in_grace: Orphaned blobs kept because they are too recent
+    """
+
+    dry_run: bool = False
+    blobs_scanned: int = 0
+    blobs_referenced: int = 0
+    blobs_deleted: int = 0
+    bytes_freed: int = 0
+    blobs_in_grace: int = 0
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation."""
+        return asdict(self)
+
+
+class BlobStore:
+    """
+    Deduplicating artifact store with background writes.
+
+    Thread-safe: several browser runners may share a store (and a pool of
+    runner threads may call put_* concurrently).
+
+    Attributes:
+        root: Blob directory ({output_dir}/blobs)
+        html_compression: "zstd" or "gzip"
+        screenshot_format: "png" (stored as captured) or "webp"
+        screenshot_max_width: Downscale wider screenshots to this width (None = keep)
+        written: Blobs written by this store
+        deduplicated: put_* calls served by an existing or pending blob
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        *,
+        screenshot_format: str = "png",
+        screenshot_max_width: int | None = None,
+        max_workers: int = 2,
+    ):
+        """
+        Initialize a store under output_dir (directories are created lazily).
+
+        Args:
+            output_dir: Base output directory
+            screenshot_format: "png" or "webp"
+            screenshot_max_width: Downscale screenshots wider than this
+            max_workers: Background writer threads
+
+        Raises:
+            ValueError: If screenshot_format is unknown
+            ImportError: If WebP or downscaling is requested without Pillow
+        """
+        if screenshot_format not in SCREENSHOT_FORMATS:
+            raise ValueError(
+                f"screenshot_format must be one of {SCREENSHOT_FORMATS}, got: {screenshot_format}"
+            )
+        if Image is None and (screenshot_format != "png" or screenshot_max_width):
+            raise ImportError(
+                "Screenshot downscaling and WebP conversion require Pillow. "
+                "Install it with: pip install pillow"
+            )
+
+        self.root = Path(output_dir) / BLOB_DIR
+        self.html_compression = "zstd" if zstandard is not None else "gzip"
+        self.screenshot_format = screenshot_format
+        self.screenshot_max_width = screenshot_max_width
+        self.written = 0
+        self.deduplicated = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blob-writer"
+        )
+        self._pending: dict[Path, Future] = {}
+        self._lock = threading.Lock()
+
+    def put_screenshot(self, image_bytes: bytes) -> str:
+        """
+        Store a screenshot (PNG bytes as captured).
+
+        Args:
+            image_bytes: Captured image
+
+        Returns:
+            Blob path (the file may still be being written; see flush())
+        """
+        ext = ".webp" if self.screenshot_format == "webp" else ".png"
+        if self.screenshot_format == "png" and not self.screenshot_max_width:
+            return self._put(image_bytes, ext, None)
+        return self._put(image_bytes, ext, self._encode_screenshot)
+
+    def put_html(self, html: str) -> str:
+        """
+        Store an HTML snapshot, compressed.
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            Blob path (the file may still be being written; see flush())
+        """
+        if self.html_compression == "zstd":
+            return self._put(html.encode("utf-8"), ".html.zst", _zstd_compress)
+        return self._put(html.encode("utf-8"), ".html.gz", _gzip_compress)
+
+    def path_for(self, digest: str, ext: str) -> Path:
+        """Blob path for a SHA-256 hex digest and extension."""
+        return self.root / digest[:2] / f"{digest}{ext}"
+
+    @staticmethod
+    def read(path: str | Path) -> bytes:
+        """
+        Read a blob, decompressing HTML snapshots.
+
+        Also reads uncompressed artifacts written before the blob store
+        existed (plain .html and .png files).
+
+        Raises:
+            OSError: If the file cannot be read
+            ImportError: If the blob is zstd-compressed and zstandard is missing
+        """
+        data = Path(path).read_bytes()
+        name = str(path)
+        if name.endswith(".gz"):
+            return gzip.decompress(data)
+        if name.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError(
+                    "Reading .zst snapshots requires zstandard. "
+                    "Install it with: pip install zstandard"
+                )
+            return zstandard.ZstdDecompressor().decompress(data)
+        return data
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait until every pending write has finished.
+
+        Args:
+            timeout: Seconds to wait per pending write (None = no limit)
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            # Write errors are logged by _write
+            future.exception(timeout=timeout)
+
+    def close(self) -> None:
+        """Finish pending writes and stop the writer threads."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """Store counters for logging."""
+        with self._lock:
+            return {
+                "written": self.written,
+                "deduplicated": self.deduplicated,
+                "pending": len(self._pending),
+            }
+
+    def _put(self, data: bytes, ext: str, encode) -> str:
+        path = self.path_for(hashlib.sha256(data).hexdigest(), ext)
+        with self._lock:
+            if path in self._pending or _touch(path):
+                self.deduplicated += 1
+                return str(path)
+            future = self._executor.submit(self._write, path, data, encode)
+            self._pending[path] = future
+        future.add_done_callback(lambda _: self._done(path))
+        return str(path)
+
+    def _done(self, path: Path) -> None:
+        with self._lock:
+            self._pending.pop(path, None)
+
+    def _write(self, path: Path, data: bytes, encode) -> None:
+        try:
+            payload = encode(data) if encode is not None else data
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            with self._lock:
+                self.written += 1
+            logger.debug(f"Wrote blob {path} ({len(data)} -> {len(payload)} bytes)")
+        except Exception as e:
+            logger.warning(f"Failed to write artifact blob {path}: {e}", exc_info=True)
+            raise
+
+    def _encode_screenshot(self, image_bytes: bytes) -> bytes:
+        with Image.open(io.BytesIO(image_bytes)) as source:
+            image = source
+            width, height = image.size
+            if self.screenshot_max_width and width > self.screenshot_max_width:
+                new_height = max(1, round(height * self.screenshot_max_width / width))
+                image = image.resize((self.screenshot_max_width, new_height))
+            out = io.BytesIO()
+            image.save(out, format=self.screenshot_format.upper())
+            return out.getvalue()
+
+
+def _touch(path: Path) -> bool:
+    """
+    Refresh an existing blob's mtime; False if there is no blob to reuse.
+
+    collect_garbage() keeps unreferenced blobs younger than its grace
+    period. A deduplicated blob may be old and referenced only by rows that
+    retention is about to delete, so touching it protects it until the
+    current run has inserted its own rows.
+    """
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    # mtime=0 keeps the output deterministic for identical input
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=10).compress(data)
+
+
+def referenced_blob_names(conn: sqlite3.Connection) -> set[str]:
+    """
+    File names of blobs referenced by answers_raw.
+
+    Names rather than full paths are compared because rows store whatever
+    path the runner was configured with (relative or absolute), while names
+    are unique content hashes.
+    """
+    names: set[str] = set()
+    for column in BLOB_REFERENCE_COLUMNS:
+        rows = conn.execute(f"SELECT DISTINCT {column} FROM answers_raw WHERE {column} IS NOT NULL")
+        names.update(Path(value).name for (value,) in rows)
+    return names
+
+
+def collect_garbage(
+    conn: sqlite3.Connection,
+    output_dir: str,
+    *,
+    dry_run: bool = False,
+    grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
+    now: float | None = None,
+) -> BlobGCReport:
+    """
+    Delete blobs no longer referenced by any answers_raw row.
+
+    Only conn's answers_raw is consulted. If several databases write blobs
+    under the same output_dir, blobs referenced only by the others are
+    treated as orphans, so keep one database per output_dir.
+
+    Args:
+        conn: Open connection to the watcher database
+        output_dir: Base output directory (blobs live in {output_dir}/blobs)
+        dry_run: Only count what would be deleted
+        grace_seconds: Keep orphaned blobs modified more recently than this
+        now: Reference epoch time (default: time.time())
+
+    Returns:
+        BlobGCReport with counts and freed bytes
+
+    Example:
+        >>> report = collect_garbage(conn, "./output")
+        >>> print(f"Freed {report.bytes_freed} bytes")
+    """
+    report = BlobGCReport(dry_run=dry_run)
+    root = Path(output_dir) / BLOB_DIR
+    if not root.is_dir():
+        return report
+
+    referenced = referenced_blob_names(conn)
+    cutoff = (now if now is not None else time.time()) - grace_seconds
+
+    for path in root.glob("*/*"):
+        if not path.is_file():
+            continue
+        report.blobs_scanned += 1
+        if path.name in referenced:
+            report.blobs_referenced += 1
+            continue
+        stat = path.stat()
+        if stat.st_mtime > cutoff:
+            report.blobs_in_grace += 1
+            continue
+        report.blobs_deleted += 1
+        report.bytes_freed += stat.st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
+
+    if not dry_run:
+        for shard in root.iterdir():
+            if shard.is_dir() and not any(shard.iterdir()):
+                shard.rmdir()
+
+    logger.info(
+        f"Blob GC: {report.blobs_scanned} scanned, {report.blobs_deleted} orphaned blobs "
+        f"{'would be ' if dry_run else ''}deleted ({report.bytes_freed} bytes)"
+    )
+    return report
@@ -8,6 +8,10 @@ The database tracks:
 - runs: Each CLI execution with metadata and totals
 - answers_raw: Full LLM responses with usage and cost data
 - mentions: Exploded brand mentions for analytics
+- answer_samples / sample_aggregates: Adaptive sampling results (v7)
+- query_skips: Units skipped by stability-aware scheduling (v8)
+- answers_raw.latency_ms: Answer latency for latency-aware scheduling (v9)
+- sources: Cited web sources per answer, normalized for citation analytics (v10)
 
 Schema versioning ensures safe upgrades as features evolve.
 
@@ -23,16 +27,18 @@ Security:
     - Connection context managers ensure proper cleanup
 """
 
+import json
 import logging
 import sqlite3
 from pathlib import Path
 
 from ..utils.time import utc_timestamp
+from .sources import extract_sources
 
 logger = logging.getLogger(__name__)
 
 # Current schema version - increment when migrations are added
-CURRENT_SCHEMA_VERSION = 5
+CURRENT_SCHEMA_VERSION = 10
 
 
 def init_db_if_needed(db_path: str) -> None:
@@ -76,6 +82,11 @@ def init_db_if_needed(db_path: str) -> None:
         # Enable foreign key constraints (disabled by default in SQLite)
         conn.execute("PRAGMA foreign_keys = ON")
 
+        # Use incremental auto_vacuum so `db maintain` can return freed pages
+        # without a full VACUUM. Only takes effect on a brand-new (empty) file;
+        # existing databases are converted with `db maintain --full-vacuum`.
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Initialize schema_version table if needed
         conn.execute("""
             CREATE TABLE IF NOT EXISTS schema_version (
@@ -194,9 +205,19 @@ def apply_migrations(
                 _migrate_to_v4(conn)
             elif target_version == 5:
                 _migrate_to_v5(conn)
+            elif target_version == 6:
+                _migrate_to_v6(conn)
+            elif target_version == 7:
+                _migrate_to_v7(conn)
+            elif target_version == 8:
+                _migrate_to_v8(conn)
+            elif target_version == 9:
+                _migrate_to_v9(conn)
+            elif target_version == 10:
+                _migrate_to_v10(conn)
             # Future migrations go here:
-            # elif target_version == 6:
-            #     _migrate_to_v6(conn)
+            # elif target_version == 11:
+            #     _migrate_to_v11(conn)
             else:
                 raise ValueError(f"No migration defined for version {target_version}")
 
@@ -657,6 +678,281 @@ def _migrate_to_v5(conn: sqlite3.Connection) -> None:
     logger.debug("Added browser runner metadata columns to answers_raw (schema v5)")
 
 
+def _migrate_to_v6(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 6.
+
+    Adds a persistent memo of extraction results so identical answers are
+    not re-parsed (or re-sent to a paid function-calling model) across runs.
+
+    Creates:
+    - extraction_cache table: Serialized ExtractionResult keyed by memo_key
+
+    Cache design:
+    - memo_key: SHA256 over answer hash + brands fingerprint + settings fingerprint
+    - answer_hash / brands_fingerprint / settings_fingerprint: Key components,
+      kept for debugging and targeted invalidation
+    - result_json: Extraction signals (mentions, ranked list, method, confidence)
+    - extraction_cost_usd: Cost of the original extraction (reported as saved on hit)
+    - hit_count, cached_at, last_accessed_at: For TTL and LRU eviction
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If table creation or index creation fails
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS extraction_cache (
+            memo_key TEXT PRIMARY KEY,
+            answer_hash TEXT NOT NULL,
+            brands_fingerprint TEXT NOT NULL,
+            settings_fingerprint TEXT NOT NULL,
+            result_json TEXT NOT NULL,
+            extraction_cost_usd REAL DEFAULT 0.0,
+            hit_count INTEGER DEFAULT 0,
+            cached_at TEXT NOT NULL,
+            last_accessed_at TEXT NOT NULL
+        )
+    """)
+
+    # Index for LRU eviction and retention cleanup
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_accessed
+        ON extraction_cache(last_accessed_at)
+    """)
+
+    # Index for invalidating entries of a previous brand list
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_extraction_cache_brands
+        ON extraction_cache(brands_fingerprint)
+    """)
+
+    logger.debug("Created extraction_cache table and indexes (schema v6)")
+
+
+def _migrate_to_v7(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 7.
+
+    Adds storage for adaptive multi-sample querying (run_settings.sampling).
+
+    Creates:
+    - answer_samples table: One row per sampled answer of an (intent, model) unit
+    - sample_aggregates table: Mention-rate estimates per unit
+
+    Table design:
+    - answer_samples.sample_index: 0 is the canonical answer also stored in
+      answers_raw; later samples only live here
+    - answer_samples.request_samples: Samples returned by the request that
+      produced the row (> 1 when the provider's native `n` was used)
+    - sample_aggregates.mention_rate / ci_low / ci_high: My brand's mention
+      rate and Wilson interval at the configured confidence
+    - sample_aggregates.brand_rates_json: Same estimates per competitor
+    - sample_aggregates.stop_reason: converged, max_samples, or error
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If table creation or index creation fails
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS answer_samples (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            sample_index INTEGER NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            answer_text TEXT NOT NULL,
+            appeared_mine INTEGER NOT NULL,
+            competitors_json TEXT,
+            my_rank INTEGER,
+            prompt_tokens INTEGER DEFAULT 0,
+            completion_tokens INTEGER DEFAULT 0,
+            cost_usd REAL DEFAULT 0.0,
+            request_samples INTEGER DEFAULT 1,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            UNIQUE(run_id, intent_id, model_provider, model_name, sample_index)
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sample_aggregates (
+            run_id TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            sample_count INTEGER NOT NULL,
+            request_count INTEGER NOT NULL,
+            mention_rate REAL NOT NULL,
+            ci_low REAL NOT NULL,
+            ci_high REAL NOT NULL,
+            confidence REAL NOT NULL,
+            brand_rates_json TEXT,
+            stop_reason TEXT NOT NULL,
+            total_cost_usd REAL DEFAULT 0.0,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            PRIMARY KEY (run_id, intent_id, model_provider, model_name)
+        )
+    """)
+
+    # Index for per-run retrieval and retention cleanup
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_answer_samples_run
+        ON answer_samples(run_id, intent_id)
+    """)
+
+    # Index for mention-rate trends per intent and model
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sample_aggregates_intent_model
+        ON sample_aggregates(intent_id, model_provider, model_name, timestamp_utc)
+    """)
+
+    logger.debug("Created answer_samples and sample_aggregates tables (schema v7)")
+
+
+def _migrate_to_v8(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 8.
+
+    Adds support for stability-aware query skipping (run_settings.stability).
+
+    Creates:
+    - query_skips table: (intent, model) units skipped in a run, with the
+      reason, the stability measurement, and the run whose answer was
+      carried forward
+    - idx_answers_unit index: Latest answered runs per (intent, model),
+      read for every unit when stability skipping is enabled
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If table creation or index creation fails
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS query_skips (
+            run_id TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            reason TEXT NOT NULL,
+            rank_distance REAL,
+            history_runs INTEGER NOT NULL,
+            runs_since_query INTEGER NOT NULL,
+            query_interval INTEGER NOT NULL,
+            carried_from_run_id TEXT,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            PRIMARY KEY (run_id, intent_id, model_provider, model_name)
+        )
+    """)
+
+    # Index for counting skips since a unit's last answer
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_query_skips_unit
+        ON query_skips(intent_id, model_provider, model_name, timestamp_utc)
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_answers_unit
+        ON answers_raw(intent_id, model_provider, model_name, timestamp_utc)
+    """)
+
+    logger.debug("Created query_skips table and unit indexes (schema v8)")
+
+
+def _migrate_to_v9(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 9.
+
+    Records how long each answer took, for latency-aware scheduling
+    (run_settings.scheduling).
+
+    Changes:
+    - Add latency_ms column to answers_raw (NULL for answers from older runs)
+    - Create idx_answers_model index for the latest answers per
+      (provider, model), which the scheduler reads at the start of a run
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If the column or index cannot be created
+    """
+    conn.execute("ALTER TABLE answers_raw ADD COLUMN latency_ms INTEGER")
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_answers_model
+        ON answers_raw(model_provider, model_name, timestamp_utc)
+    """)
+
+    logger.debug("Added latency_ms column to answers_raw (schema v9)")
+
+
+def _migrate_to_v10(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 10.
+
+    Normalizes cited web sources out of answers_raw.web_search_results_json
+    so citation analytics run as SQL instead of decoding every blob.
+
+    Creates:
+    - sources table: One row per (answer, normalized URL) with domain, title
+      and position. Run, intent and model columns are copied from the answer
+      (like mentions), so citations outlive answers_raw retention
+    - idx_sources_domain, idx_sources_run, idx_sources_intent indexes
+
+    Existing answers are backfilled (see backfill_sources).
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If table creation, index creation or backfill fails
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            answer_id INTEGER NOT NULL,
+            run_id TEXT NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            title TEXT,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            UNIQUE(answer_id, url)
+        )
+    """)
+
+    # Domain citation counts over time (optionally per intent)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sources_domain
+        ON sources(domain, timestamp_utc)
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sources_run
+        ON sources(run_id)
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sources_intent
+        ON sources(intent_id, domain)
+    """)
+
+    count = backfill_sources(conn)
+    logger.debug(f"Created sources table and backfilled {count} sources (schema v10)")
+
+
 # ============================================================================
 # Database Operations (CRUD)
 # ============================================================================
@@ -752,6 +1048,9 @@ def insert_answer_raw(
     screenshot_path: str | None = None,
     html_snapshot_path: str | None = None,
     session_id: str | None = None,
+    *,
+    latency_ms: int | None = None,
+    web_search_results: list | dict | None = None,
 ) -> None:
     """
     Insert a raw LLM answer into the answers_raw table.
@@ -781,6 +1080,10 @@ def insert_answer_raw(
         screenshot_path: Optional path to screenshot file (browser runners only)
         html_snapshot_path: Optional path to HTML snapshot file (browser runners only)
         session_id: Optional browser session ID (browser runners only)
+        latency_ms: Optional wall time of the request that produced the answer
+        web_search_results: Optional decoded web search results, used to
+            populate the sources table (answers stored with only the JSON
+            get their sources from backfill_sources())
 
     Raises:
         sqlite3.Error: If database operation fails
@@ -847,7 +1150,7 @@ def insert_answer_raw(
 
     answer_length = len(answer_text)
 
-    conn.execute(
+    cursor = conn.execute(
         """
         INSERT OR IGNORE INTO answers_raw (
             run_id,
@@ -866,8 +1169,9 @@ def insert_answer_raw(
             runner_name,
             screenshot_path,
             html_snapshot_path,
-            session_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            session_id,
+            latency_ms
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             run_id,
@@ -887,9 +1191,14 @@ def insert_answer_raw(
             screenshot_path,
             html_snapshot_path,
             session_id,
+            latency_ms,
         ),
     )
 
+    # Normalize cited sources of new answers for citation analytics
+    if web_search_results and cursor.rowcount == 1:
+        insert_sources(conn, cursor.lastrowid, web_search_results)
+
     # Log with web search info if applicable
     if web_search_count > 0:
         logger.debug(
@@ -1300,6 +1609,144 @@ def store_intent_classification_cache(
     )
 
 
+def lookup_extraction_cache(
+    conn: sqlite3.Connection, memo_key: str, min_cached_at: str | None = None
+) -> dict | None:
+    """
+    Look up a memoized extraction result by memo key.
+
+    On a hit, updates last_accessed_at and hit_count so that LRU eviction
+    and `db maintain` retention keep frequently reused entries.
+
+    Args:
+        conn: Active SQLite database connection
+        memo_key: Memo key from extractor.memo.compute_memo_key()
+        min_cached_at: Ignore entries cached before this ISO 8601 timestamp (TTL)
+
+    Returns:
+        dict with result_json and extraction_cost_usd if cache hit, None if miss
+
+    Example:
+        >>> cached = lookup_extraction_cache(conn, memo_key)
+        >>> if cached:
+        ...     print(f"Saved ${cached['extraction_cost_usd']:.6f}")
+    """
+    row = conn.execute(
+        """
+        SELECT result_json, extraction_cost_usd, cached_at
+        FROM extraction_cache
+        WHERE memo_key = ?
+        """,
+        (memo_key,),
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    if min_cached_at is not None and row[2] < min_cached_at:
+        return None
+
+    conn.execute(
+        """
+        UPDATE extraction_cache
+        SET last_accessed_at = ?, hit_count = hit_count + 1
+        WHERE memo_key = ?
+        """,
+        (utc_timestamp(), memo_key),
+    )
+
+    return {"result_json": row[0], "extraction_cost_usd": row[1]}
+
+
+def store_extraction_cache(
+    conn: sqlite3.Connection,
+    memo_key: str,
+    answer_hash: str,
+    brands_fingerprint: str,
+    settings_fingerprint: str,
+    *,
+    result_json: str,
+    extraction_cost_usd: float = 0.0,
+) -> None:
+    """
+    Store a memoized extraction result.
+
+    This function is idempotent - if the memo_key already exists, the insert
+    is skipped (due to PRIMARY KEY constraint on memo_key).
+
+    Args:
+        conn: Active SQLite database connection
+        memo_key: Memo key (unique)
+        answer_hash: SHA256 of the answer text
+        brands_fingerprint: Fingerprint of the Brands configuration
+        settings_fingerprint: Fingerprint of the extraction settings
+        result_json: Serialized extraction signals
+        extraction_cost_usd: Cost of the original extraction
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+    """
+    timestamp = utc_timestamp()
+
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO extraction_cache (
+            memo_key,
+            answer_hash,
+            brands_fingerprint,
+            settings_fingerprint,
+            result_json,
+            extraction_cost_usd,
+            cached_at,
+            last_accessed_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            memo_key,
+            answer_hash,
+            brands_fingerprint,
+            settings_fingerprint,
+            result_json,
+            extraction_cost_usd,
+            timestamp,
+            timestamp,
+        ),
+    )
+
+
+def prune_extraction_cache(conn: sqlite3.Connection, max_entries: int) -> int:
+    """
+    Evict least recently used extraction cache entries beyond max_entries.
+
+    Args:
+        conn: Active SQLite database connection
+        max_entries: Number of most recently accessed entries to keep
+
+    Returns:
+        Number of entries deleted
+
+    Note:
+        Always call conn.commit() afterwards to persist changes.
+    """
+    cursor = conn.execute(
+        """
+        DELETE FROM extraction_cache
+        WHERE memo_key NOT IN (
+            SELECT memo_key FROM extraction_cache
+            ORDER BY last_accessed_at DESC
+            LIMIT ?
+        )
+        """,
+        (max_entries,),
+    )
+    if cursor.rowcount:
+        logger.debug(f"Evicted {cursor.rowcount} extraction cache entries (LRU)")
+    return cursor.rowcount
+
+
 def insert_operation(
     conn: sqlite3.Connection,
     run_id: str,
@@ -1458,6 +1905,246 @@ def insert_operation(
         )
 
 
+def insert_answer_sample(
+    conn: sqlite3.Connection,
+    run_id: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    sample_index: int,
+    timestamp_utc: str,
+    answer_text: str,
+    appeared_mine: bool,
+    competitors: list[str],
+    my_rank: int | None = None,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cost_usd: float = 0.0,
+    request_samples: int = 1,
+) -> None:
+    """
+    Insert one sampled answer into the answer_samples table.
+
+    This function is idempotent - the UNIQUE constraint on (run_id,
+    intent_id, model_provider, model_name, sample_index) skips duplicates.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Run identifier (foreign key to runs.run_id)
+        intent_id: Intent query identifier
+        model_provider: LLM provider
+        model_name: Model identifier
+        sample_index: Position within the unit (0 = canonical answer)
+        timestamp_utc: ISO 8601 timestamp of the response
+        answer_text: Sampled answer text
+        appeared_mine: Whether my brand was mentioned
+        competitors: Normalized names of competitors mentioned
+        my_rank: Rank of my brand in the answer's ranked list, if any
+        prompt_tokens: Prompt tokens attributed to this sample
+        completion_tokens: Completion tokens attributed to this sample
+        cost_usd: Answer cost attributed to this sample
+        request_samples: Samples returned by the same request
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+    """
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO answer_samples (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            sample_index,
+            timestamp_utc,
+            answer_text,
+            appeared_mine,
+            competitors_json,
+            my_rank,
+            prompt_tokens,
+            completion_tokens,
+            cost_usd,
+            request_samples
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            sample_index,
+            timestamp_utc,
+            answer_text,
+            1 if appeared_mine else 0,
+            json.dumps(competitors),
+            my_rank,
+            prompt_tokens,
+            completion_tokens,
+            cost_usd,
+            request_samples,
+        ),
+    )
+
+
+def insert_sample_aggregate(
+    conn: sqlite3.Connection,
+    run_id: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    timestamp_utc: str,
+    sample_count: int,
+    request_count: int,
+    mention_rate: float,
+    ci_low: float,
+    ci_high: float,
+    confidence: float,
+    brand_rates: dict[str, dict],
+    stop_reason: str,
+    total_cost_usd: float = 0.0,
+) -> None:
+    """
+    Insert or replace the mention-rate estimate for one (intent, model) unit.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Run identifier (foreign key to runs.run_id)
+        intent_id: Intent query identifier
+        model_provider: LLM provider
+        model_name: Model identifier
+        timestamp_utc: ISO 8601 timestamp when sampling finished
+        sample_count: Samples collected
+        request_count: Provider requests made
+        mention_rate: Share of samples mentioning my brand
+        ci_low: Lower bound of the Wilson interval
+        ci_high: Upper bound of the Wilson interval
+        confidence: Confidence level of the interval
+        brand_rates: Per-competitor {count, rate, ci_low, ci_high}
+        stop_reason: "converged", "max_samples", or "error"
+        total_cost_usd: Answer and extraction cost of all samples
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+    """
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO sample_aggregates (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            timestamp_utc,
+            sample_count,
+            request_count,
+            mention_rate,
+            ci_low,
+            ci_high,
+            confidence,
+            brand_rates_json,
+            stop_reason,
+            total_cost_usd
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            timestamp_utc,
+            sample_count,
+            request_count,
+            mention_rate,
+            ci_low,
+            ci_high,
+            confidence,
+            json.dumps(brand_rates),
+            stop_reason,
+            total_cost_usd,
+        ),
+    )
+
+
+def insert_query_skip(
+    conn: sqlite3.Connection,
+    run_id: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    timestamp_utc: str,
+    reason: str,
+    rank_distance: float | None,
+    history_runs: int,
+    runs_since_query: int,
+    query_interval: int,
+    carried_from_run_id: str | None = None,
+) -> None:
+    """
+    Record that an (intent, model) unit was skipped in a run.
+
+    This function is idempotent - the primary key on (run_id, intent_id,
+    model_provider, model_name) skips duplicates.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Run in which the unit was skipped
+        intent_id: Intent query identifier
+        model_provider: LLM provider
+        model_name: Model identifier
+        timestamp_utc: ISO 8601 timestamp of the decision
+        reason: Why the unit was skipped (e.g. "stable")
+        rank_distance: Mean normalized rank-list edit distance over the history
+        history_runs: Answered runs the decision was based on
+        runs_since_query: Runs since the unit was last queried, including this one
+        query_interval: Runs between queries chosen for this unit
+        carried_from_run_id: Run whose answer was carried forward
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+    """
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO query_skips (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            timestamp_utc,
+            reason,
+            rank_distance,
+            history_runs,
+            runs_since_query,
+            query_interval,
+            carried_from_run_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            timestamp_utc,
+            reason,
+            rank_distance,
+            history_runs,
+            runs_since_query,
+            query_interval,
+            carried_from_run_id,
+        ),
+    )
+
+
 def update_run_cost(
     conn: sqlite3.Connection, run_id: str, total_cost_usd: float
 ) -> None:
@@ -1554,3 +2241,182 @@ def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
         "total_models": row[3],
         "total_cost_usd": row[4],
     }
+
+
+def insert_sources(
+    conn: sqlite3.Connection, answer_id: int, web_search_results: list | dict
+) -> int:
+    """
+    Insert the cited sources of one answer into the sources table.
+
+    Sources are extracted and normalized by storage.sources.extract_sources;
+    run, timestamp, intent and model columns are copied from the answers_raw
+    row. Called by insert_answer_raw() for new answers and by
+    backfill_sources() for existing ones.
+
+    Args:
+        conn: Active SQLite database connection
+        answer_id: answers_raw.id of the answer
+        web_search_results: Decoded web search results (any provider shape)
+
+    Returns:
+        Number of sources inserted (0 if already present)
+
+    Security:
+        Uses parameterized query to prevent SQL injection.
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+        Uses INSERT OR IGNORE to make operation idempotent.
+    """
+    sources = extract_sources(web_search_results)
+    if not sources:
+        return 0
+
+    before = conn.total_changes
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO sources (
+            answer_id,
+            run_id,
+            timestamp_utc,
+            intent_id,
+            model_provider,
+            model_name,
+            position,
+            url,
+            domain,
+            title
+        )
+        SELECT id, run_id, timestamp_utc, intent_id, model_provider, model_name,
+               ?, ?, ?, ?
+        FROM answers_raw
+        WHERE id = ?
+        """,
+        [
+            (source.position, source.url, source.domain, source.title, answer_id)
+            for source in sources
+        ],
+    )
+    inserted = conn.total_changes - before
+    logger.debug(f"Inserted {inserted} sources for answer {answer_id}")
+    return inserted
+
+
+def backfill_sources(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """
+    Populate the sources table from answers stored without it.
+
+    Scans answers_raw in id order for answers with web search results and
+    no sources rows. Answers whose results cannot be decoded are skipped
+    with a warning. Safe to run repeatedly.
+
+    Args:
+        conn: Active SQLite database connection
+        batch_size: Answers read per query
+
+    Returns:
+        Number of sources inserted
+
+    Example:
+        >>> with sqlite3.connect("watcher.db") as conn:
+        ...     backfill_sources(conn)
+        ...     conn.commit()
+        42
+
+    Note:
+        Always call conn.commit() afterwards to persist changes.
+    """
+    inserted = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            """
+            SELECT id, web_search_results_json FROM answers_raw
+            WHERE id > ?
+              AND web_search_results_json IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM sources WHERE sources.answer_id = answers_raw.id)
+            ORDER BY id
+            LIMIT ?
+            """,
+            (last_id, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+
+        for answer_id, results_json in rows:
+            try:
+                web_search_results = json.loads(results_json)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping sources of answer {answer_id}: {e}")
+                continue
+            inserted += insert_sources(conn, answer_id, web_search_results)
+        last_id = rows[-1][0]
+
+    logger.info(f"Backfilled {inserted} sources")
+    return inserted
+
+
+def get_source_domains(
+    conn: sqlite3.Connection,
+    run_id: str | None = None,
+    intent_id: str | None = None,
+    since_utc: str | None = None,
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Rank cited domains by how many answers cite them.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Optional run to restrict to
+        intent_id: Optional intent to restrict to
+        since_utc: Optional ISO 8601 lower bound on answer timestamps
+        limit: Maximum number of domains returned
+
+    Returns:
+        List of dicts with keys: domain, answers (answers citing it),
+        citations (distinct URLs cited), avg_position, ordered by answers
+
+    Example:
+        >>> get_source_domains(conn, intent_id="best-crm", limit=1)
+        [{"domain": "hubspot.com", "answers": 12, "citations": 19, "avg_position": 1.4}]
+
+    Security:
+        Uses parameterized query to prevent SQL injection.
+    """
+    query = """
+        SELECT
+            domain,
+            COUNT(DISTINCT answer_id) AS answers,
+            COUNT(*) AS citations,
+            AVG(position) AS avg_position
+        FROM sources
+        WHERE 1=1
+    """
+    params: list = []
+
+    if run_id:
+        query += " AND run_id = ?"
+        params.append(run_id)
+
+    if intent_id:
+        query += " AND intent_id = ?"
+        params.append(intent_id)
+
+    if since_utc:
+        query += " AND timestamp_utc >= ?"
+        params.append(since_utc)
+
+    query += " GROUP BY domain ORDER BY answers DESC, citations DESC, domain LIMIT ?"
+    params.append(limit)
+
+    return [
+        {
+            "domain": row[0],
+            "answers": row[1],
+            "citations": row[2],
+            "avg_position": round(row[3], 2),
+        }
+        for row in conn.execute(query, params)
+    ]
@@ -7,7 +7,10 @@ in ISO 8601 format with 'Z' suffix (UTC).
 
 The database tracks:
 - eval_runs: Each evaluation execution with summary statistics
-- eval_results: Detailed metric results for each test case
+- eval_results: Detailed metric results for each test case, tagged with the
+  test case hash used to reuse results of unchanged cases (schema v2).
+  Extraction latency/allocation measurements are stored as metrics named
+  with PERFORMANCE_METRIC_PREFIX.
 
 Schema versioning ensures safe upgrades as features evolve.
 
@@ -32,7 +35,13 @@ from ..utils.time import utc_timestamp
 logger = logging.getLogger(__name__)
 
 # Current schema version for eval database - increment when migrations are added
-EVAL_CURRENT_SCHEMA_VERSION = 1
+EVAL_CURRENT_SCHEMA_VERSION = 2
+
+# Metric name prefix of extraction performance measurements (latency, allocation)
+PERFORMANCE_METRIC_PREFIX = "perf_"
+
+# Maximum case hashes per lookup query (SQLite host parameter limit is 999)
+CASE_HASH_LOOKUP_CHUNK = 500
 
 
 def init_eval_db_if_needed(db_path: str) -> None:
@@ -183,9 +192,11 @@ def apply_eval_migrations(
 
             if target_version == 1:
                 _migrate_eval_to_v1(conn)
+            elif target_version == 2:
+                _migrate_eval_to_v2(conn)
             # Future migrations go here:
-            # elif target_version == 2:
-            #     _migrate_eval_to_v2(conn)
+            # elif target_version == 3:
+            #     _migrate_eval_to_v3(conn)
             else:
                 raise ValueError(
                     f"No eval migration defined for version {target_version}"
@@ -314,6 +325,30 @@ def _migrate_eval_to_v1(conn: sqlite3.Connection) -> None:
     logger.debug("Created eval schema v1 tables and indexes")
 
 
+def _migrate_eval_to_v2(conn: sqlite3.Connection) -> None:
+    """
+    Migrate eval database schema to version 2.
+
+    Adds eval_results.case_hash: SHA256 of the test case plus the extractor
+    code version (see evals.runner.compute_case_hash). run_eval_suite() looks
+    results up by this hash and skips cases that were already evaluated with
+    the same code. Rows written before v2 have NULL and never match.
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Raises:
+        sqlite3.Error: If the column or index cannot be created
+    """
+    conn.execute("ALTER TABLE eval_results ADD COLUMN case_hash TEXT")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_eval_results_case_hash
+        ON eval_results(case_hash)
+    """)
+
+    logger.debug("Added eval_results.case_hash column and index")
+
+
 # ============================================================================
 # Eval Database Operations (CRUD)
 # ============================================================================
@@ -403,6 +438,8 @@ def insert_eval_result(
     metric_value: float,
     metric_passed: bool,
     metric_details: dict[str, Any] | None = None,
+    *,
+    case_hash: str | None = None,
 ) -> None:
     """
     Insert a single evaluation metric result into the eval_results table.
@@ -419,6 +456,7 @@ def insert_eval_result(
         metric_value: Numeric value of the metric (0.0 to 1.0)
         metric_passed: Whether the metric meets passing criteria
         metric_details: Optional additional details about the metric
+        case_hash: Test case + extractor code hash (enables result reuse)
 
     Raises:
         sqlite3.Error: If database operation fails
@@ -463,8 +501,9 @@ def insert_eval_result(
             metric_value,
             metric_passed,
             metric_details_json,
-            created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            created_at,
+            case_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             eval_run_id,
@@ -475,6 +514,7 @@ def insert_eval_result(
             metric_passed_int,
             metric_details_json,
             timestamp,
+            case_hash,
         ),
     )
     logger.debug(
@@ -546,6 +586,24 @@ def store_eval_results(
                     metric_value=metric.value,
                     metric_passed=metric.passed,
                     metric_details=metric.details,
+                    case_hash=getattr(result, "case_hash", None),
+                )
+
+            # Performance measurements share the table; the unit is kept in details
+            for perf_metric in getattr(result, "performance", []):
+                insert_eval_result(
+                    conn,
+                    eval_run_id=run_id,
+                    test_description=test_description,
+                    overall_passed=overall_passed,
+                    metric_name=perf_metric.name,
+                    metric_value=perf_metric.value,
+                    metric_passed=perf_metric.passed,
+                    metric_details={
+                        **(perf_metric.details or {}),
+                        "unit": perf_metric.unit,
+                    },
+                    case_hash=getattr(result, "case_hash", None),
                 )
 
         logger.info(
@@ -561,6 +619,72 @@ def store_eval_results(
     return run_id
 
 
+def get_cached_eval_results(
+    conn: sqlite3.Connection, case_hashes: list[str]
+) -> dict[str, dict[str, Any]]:
+    """
+    Look up stored results for test cases by case hash.
+
+    When a case was stored by several eval runs, the most recently stored
+    run wins. Cases that failed with an exception store no metric rows and
+    are therefore never returned.
+
+    Args:
+        conn: Active SQLite database connection
+        case_hashes: Hashes from evals.runner.compute_case_hash()
+
+    Returns:
+        Mapping of case hash to a dictionary with test_description,
+        overall_passed and metrics (list of name/value/passed/details dicts,
+        in stored order). Hashes without stored results are absent.
+
+    Example:
+        >>> cached = get_cached_eval_results(conn, ["3f9a...", "b07c..."])
+        >>> len(cached)
+        1
+    """
+    import json
+
+    cached: dict[str, dict[str, Any]] = {}
+    run_of: dict[str, str] = {}
+    unique_hashes = list(dict.fromkeys(case_hashes))
+
+    for start in range(0, len(unique_hashes), CASE_HASH_LOOKUP_CHUNK):
+        chunk = unique_hashes[start : start + CASE_HASH_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"""
+            SELECT case_hash, eval_run_id, test_description, overall_passed,
+                   metric_name, metric_value, metric_passed, metric_details_json
+            FROM eval_results
+            WHERE case_hash IN ({placeholders})
+            ORDER BY id
+        """,
+            chunk,
+        )
+
+        for row in cursor.fetchall():
+            case_hash, eval_run_id = row[0], row[1]
+            if run_of.get(case_hash) != eval_run_id:
+                # Rows are ordered by id, so a new run id means a newer run
+                run_of[case_hash] = eval_run_id
+                cached[case_hash] = {
+                    "test_description": row[2],
+                    "overall_passed": bool(row[3]),
+                    "metrics": [],
+                }
+            cached[case_hash]["metrics"].append(
+                {
+                    "name": row[4],
+                    "value": row[5],
+                    "passed": bool(row[6]),
+                    "details": json.loads(row[7]) if row[7] else None,
+                }
+            )
+
+    return cached
+
+
 def get_recent_eval_runs(
     conn: sqlite3.Connection, limit: int = 10
 ) -> list[dict[str, Any]]:
@@ -625,7 +749,9 @@ def get_metric_trend(
         days: Number of days to look back (default: 30)
 
     Returns:
-        List of dictionaries with timestamp and average metric value
+        List of dictionaries with date, average, minimum and maximum metric
+        value and sample count. For performance metrics (latencies, where
+        lower is better) max_value is the slowest test case of the day.
 
     Example:
         >>> trend = get_metric_trend(conn, "mention_precision", days=7)
@@ -634,7 +760,8 @@ def get_metric_trend(
     """
     cursor = conn.execute(
         f"""
-        SELECT DATE(timestamp_utc) as date, AVG(metric_value) as avg_value, COUNT(*) as count
+        SELECT DATE(timestamp_utc) as date, AVG(metric_value) as avg_value, COUNT(*) as count,
+               MIN(metric_value) as min_value, MAX(metric_value) as max_value
         FROM eval_results er
         JOIN eval_runs r ON er.eval_run_id = r.run_id
         WHERE er.metric_name = ?
@@ -652,12 +779,47 @@ def get_metric_trend(
                 "date": row[0],
                 "avg_value": row[1],
                 "count": row[2],
+                "min_value": row[3],
+                "max_value": row[4],
             }
         )
 
     return trend
 
 
+def get_performance_trends(
+    conn: sqlite3.Connection, days: int = 30
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Get trend data for every extraction performance metric over time.
+
+    Args:
+        conn: Active SQLite database connection
+        days: Number of days to look back (default: 30)
+
+    Returns:
+        Mapping of performance metric name (e.g. "perf_extraction_p95_ms") to
+        its get_metric_trend() points
+
+    Example:
+        >>> trends = get_performance_trends(conn, days=14)
+        >>> for point in trends.get("perf_extraction_p95_ms", []):
+        ...     print(f"{point['date']}: avg {point['avg_value']:.2f} ms")
+    """
+    cursor = conn.execute(
+        """
+        SELECT DISTINCT metric_name
+        FROM eval_results
+        WHERE metric_name GLOB ? || '*'
+        ORDER BY metric_name
+    """,
+        (PERFORMANCE_METRIC_PREFIX,),
+    )
+    metric_names = [row[0] for row in cursor.fetchall()]
+
+    return {name: get_metric_trend(conn, name, days) for name in metric_names}
+
+
 def get_failing_tests(
     conn: sqlite3.Connection, run_id: str | None = None
 ) -> list[dict[str, Any]]:
@@ -7,6 +7,7 @@ Supports filtering by run_id, date range, and data type.
 Key features:
 - Export mentions (brand mentions with rankings)
 - Export runs (run summaries with costs)
+- Export sources (cited web sources with normalized URLs and domains)
 - CSV format for spreadsheet analysis
 - JSON format for programmatic processing
 - Date range filtering
@@ -382,3 +383,143 @@ def export_runs_json(output_path: str, db_path: str, days: int | None = None) ->
     except OSError as e:
         logger.error(f"File write error: {e}", exc_info=True)
         raise
+
+
+# Columns of exported sources, in file order
+SOURCE_COLUMNS = [
+    "run_id",
+    "timestamp_utc",
+    "intent_id",
+    "model_provider",
+    "model_name",
+    "position",
+    "url",
+    "domain",
+    "title",
+]
+
+
+def _query_sources(
+    db_path: str,
+    run_id: str | None,
+    days: int | None,
+    domain: str | None,
+) -> list[dict]:
+    """Fetch sources rows matching the export filters."""
+    query = f"SELECT {', '.join(SOURCE_COLUMNS)} FROM sources WHERE 1=1"
+    params = []
+
+    if run_id:
+        query += " AND run_id = ?"
+        params.append(run_id)
+
+    if days:
+        cutoff_date = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+        query += " AND timestamp_utc >= ?"
+        params.append(cutoff_date)
+
+    if domain:
+        query += " AND domain = ?"
+        params.append(domain.lower().removeprefix("www."))
+
+    query += " ORDER BY timestamp_utc DESC, run_id, intent_id, model_provider, model_name, position"
+
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        return [dict(row) for row in conn.execute(query, params)]
+
+
+def export_sources_csv(
+    output_path: str,
+    db_path: str,
+    run_id: str | None = None,
+    days: int | None = None,
+    domain: str | None = None,
+) -> int:
+    """
+    Export cited web sources to CSV file.
+
+    Exports the sources table: one row per cited URL of each answer, with
+    its normalized domain, title and position in the answer's results.
+
+    Args:
+        output_path: Path to output CSV file
+        db_path: Path to SQLite database
+        run_id: Optional run_id to filter by specific run
+        days: Optional number of days to include
+        domain: Optional domain to filter by (e.g., "g2.com")
+
+    Returns:
+        Number of rows exported
+
+    Example:
+        >>> count = export_sources_csv(
+        ...     "./sources.csv",
+        ...     "./output/watcher.db",
+        ...     domain="g2.com"
+        ... )
+    """
+    logger.info(f"Exporting sources to CSV: {output_path}")
+
+    try:
+        rows = _query_sources(db_path, run_id, days, domain)
+        if not rows:
+            logger.warning("No sources found matching criteria")
+
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=SOURCE_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        logger.info(f"Exported {len(rows)} sources to {output_path}")
+        return len(rows)
+
+    except sqlite3.Error as e:
+        logger.error(f"Database error during export: {e}", exc_info=True)
+        raise
+    except OSError as e:
+        logger.error(f"File write error: {e}", exc_info=True)
+        raise
+
+
+def export_sources_json(
+    output_path: str,
+    db_path: str,
+    run_id: str | None = None,
+    days: int | None = None,
+    domain: str | None = None,
+) -> int:
+    """
+    Export cited web sources to JSON file.
+
+    Args:
+        output_path: Path to output JSON file
+        db_path: Path to SQLite database
+        run_id: Optional run_id to filter by specific run
+        days: Optional number of days to include
+        domain: Optional domain to filter by (e.g., "g2.com")
+
+    Returns:
+        Number of records exported
+
+    Example:
+        >>> count = export_sources_json("./sources.json", "./output/watcher.db")
+    """
+    logger.info(f"Exporting sources to JSON: {output_path}")
+
+    try:
+        rows = _query_sources(db_path, run_id, days, domain)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+            f.write("\n")  # POSIX compliance
+
+        logger.info(f"Exported {len(rows)} sources to {output_path}")
+        return len(rows)
+
+    except sqlite3.Error as e:
+        logger.error(f"Database error during export: {e}", exc_info=True)
+        raise
+    except OSError as e:
+        logger.error(f"File write error: {e}", exc_info=True)
+        raise
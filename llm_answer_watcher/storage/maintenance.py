@@ -0,0 +1,716 @@
+"""
+Retention, archival, and vacuum maintenance for the watcher database.
+
+Nothing in the normal run path ever deletes data, so the SQLite database and
+the output directory grow without bound. This module implements the
+`db maintain` subsystem that applies retention policies (see
+config.schema.RetentionConfig) and keeps the database compact:
+
+1. Expired runs: every row belonging to the run (runs, answers_raw, mentions,
+   sources, operations, intent_classifications) is archived together with the
+   run's output directory, then deleted.
+2. Per-table retention: tables with a shorter retention window than runs
+   (e.g. answers_raw after 30 days) are archived and purged run by run.
+   Sources keep their own copy of the answer's run, intent and model, so
+   citation history survives until the sources window expires.
+3. Cache tables (intent_classification_cache, extraction_cache): entries
+   not accessed within the retention window are evicted (not archived).
+4. Artifact blobs (see storage.blobs) no longer referenced by answers_raw
+   are deleted once they are older than the GC grace period.
+5. PRAGMA incremental_vacuum, PRAGMA optimize and ANALYZE.
+
+Archive layout:
+    {archive_dir}/
+        {run_id}/
+            runs.ndjson.gz            (or .parquet)
+            answers_raw.ndjson.gz
+            mentions.ndjson.gz
+            ...
+            artifacts.tar.gz          (run output directory)
+
+Resumability and live writes:
+    Work is split into small units (one run, or one table of one run). Each
+    unit writes its archive file atomically (temp file + rename) BEFORE the
+    rows are deleted in a single short BEGIN IMMEDIATE transaction. If the
+    process dies between the two steps, the next invocation finds the same
+    rows still present, rewrites the identical archive and deletes them. Units
+    are selected with LIMIT-ed queries, so batches commit independently and
+    the writer lock is never held for long while runs are in progress.
+
+Example:
+    >>> from llm_answer_watcher.config.schema import RetentionConfig
+    >>> retention = RetentionConfig(max_age_days=90, tables={"answers_raw": 30})
+    >>> report = run_maintenance("./output/watcher.db", "./output", retention)
+    >>> report.runs_deleted
+    12
+
+Security:
+    - ALL queries use parameterized statements (table names come from a
+      fixed allow-list, never from user input)
+    - Archives are written with the same permissions as other artifacts
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tarfile
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from ..config.schema import RetentionConfig
+from ..utils.time import utc_now
+from .blobs import DEFAULT_GC_GRACE_SECONDS, collect_garbage
+from .layout import get_run_directory
+
+logger = logging.getLogger(__name__)
+
+# Tables keyed by run_id, in deletion order (children before runs)
+RUN_SCOPED_TABLES = (
+    "mentions",
+    "sources",
+    "operations",
+    "intent_classifications",
+    "answer_samples",
+    "sample_aggregates",
+    "query_skips",
+    "answers_raw",
+)
+
+# Cache tables evicted by last_accessed_at, mapped to their primary key column
+CACHE_TABLES = {
+    "intent_classification_cache": "query_hash",
+    "extraction_cache": "memo_key",
+}
+
+# Busy timeout (ms) so maintenance waits for in-flight run writes instead of failing
+BUSY_TIMEOUT_MS = 30_000
+
+# Pages released per PRAGMA incremental_vacuum call (0 = release all free pages)
+DEFAULT_VACUUM_PAGES = 0
+
+
+@dataclass
+class MaintenanceReport:
+    """
+    Summary of a `db maintain` invocation.
+
+    Attributes:
+        dry_run: True if nothing was written or deleted
+        runs_deleted: Number of whole runs archived and deleted
+        rows_archived: Rows written to archives, per table
+        rows_deleted: Rows deleted from the database, per table
+        run_dirs_removed: Number of run output directories archived and removed
+        archive_files: Archive files written during this invocation
+        cache_rows_deleted: Evicted cache entries (all cache tables)
+        blobs_deleted: Orphaned artifact blobs deleted
+        blob_bytes_freed: Size of the deleted blobs
+        pages_freed: Database pages returned to the filesystem by vacuum
+        auto_vacuum_mode: SQLite auto_vacuum mode (0=NONE, 1=FULL, 2=INCREMENTAL)
+    """
+
+    dry_run: bool = False
+    runs_deleted: int = 0
+    rows_archived: dict[str, int] = field(default_factory=dict)
+    rows_deleted: dict[str, int] = field(default_factory=dict)
+    run_dirs_removed: int = 0
+    archive_files: list[str] = field(default_factory=list)
+    cache_rows_deleted: int = 0
+    blobs_deleted: int = 0
+    blob_bytes_freed: int = 0
+    pages_freed: int = 0
+    auto_vacuum_mode: int | None = None
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation."""
+        return asdict(self)
+
+
+def resolve_retention_days(retention: RetentionConfig) -> dict[str, int]:
+    """
+    Resolve the effective retention window (in days) for every table.
+
+    Run-scoped tables inherit max_age_days unless overridden. An override
+    longer than the run retention is capped, because deleting a run always
+    deletes all of its rows.
+
+    Args:
+        retention: Retention configuration
+
+    Returns:
+        Mapping of table name to retention days. Tables without a policy are
+        omitted (kept forever).
+
+    Example:
+        >>> resolve_retention_days(RetentionConfig(max_age_days=90, tables={"answers_raw": 30}))
+        {'runs': 90, 'mentions': 90, 'sources': 90, 'operations': 90,
+         'intent_classifications': 90, 'answer_samples': 90,
+         'sample_aggregates': 90, 'query_skips': 90, 'answers_raw': 30}
+    """
+    days: dict[str, int] = {}
+    runs_days = retention.tables.get("runs", retention.max_age_days)
+
+    if runs_days is not None:
+        days["runs"] = runs_days
+
+    for table in RUN_SCOPED_TABLES:
+        table_days = retention.tables.get(table, runs_days)
+        if table_days is None:
+            continue
+        if runs_days is not None:
+            table_days = min(table_days, runs_days)
+        days[table] = table_days
+
+    for table in CACHE_TABLES:
+        cache_days = retention.tables.get(table)
+        if cache_days is not None:
+            days[table] = cache_days
+
+    return days
+
+
+def _cutoff_timestamp(now: datetime, days: int) -> str:
+    """Return the ISO 8601 'Z' timestamp `days` before `now`."""
+    return (now - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """
+    Open a connection suited to running alongside live writers.
+
+    Autocommit mode lets each unit of work manage its own short
+    BEGIN IMMEDIATE transaction; busy_timeout makes us wait for the runner's
+    writes instead of failing with "database is locked".
+    """
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
+    conn.isolation_level = None
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def _fetch_rows(conn: sqlite3.Connection, table: str, run_id: str) -> tuple[list[str], list[dict]]:
+    """Fetch all rows of a run-scoped table for one run as dicts."""
+    cursor = conn.execute(
+        f"SELECT * FROM {table} WHERE run_id = ? ORDER BY rowid",  # table from allow-list
+        (run_id,),
+    )
+    columns = [description[0] for description in cursor.description]
+    rows = [dict(row) for row in cursor.fetchall()]
+    return columns, rows
+
+
+def write_archive(
+    rows: list[dict], columns: list[str], dest_base: Path, archive_format: str
+) -> Path:
+    """
+    Write rows to a compressed archive file atomically.
+
+    Args:
+        rows: Rows to archive (list of column -> value dicts)
+        columns: Column names in table order (used for empty Parquet schemas)
+        dest_base: Destination path without extension
+        archive_format: "ndjson" (gzip-compressed JSON lines) or "parquet"
+
+    Returns:
+        Path of the written archive file
+
+    Raises:
+        ImportError: If archive_format is "parquet" and pyarrow is not installed
+        ValueError: If archive_format is unknown
+        OSError: If the archive cannot be written
+
+    Note:
+        Data is written to a temporary file in the destination directory and
+        renamed into place, so a crash never leaves a truncated archive.
+    """
+    dest_base.parent.mkdir(parents=True, exist_ok=True)
+
+    if archive_format == "ndjson":
+        dest = dest_base.with_name(dest_base.name + ".ndjson.gz")
+    elif archive_format == "parquet":
+        if pa is None:
+            raise ImportError(
+                "Parquet archives require pyarrow. Install it with: pip install pyarrow "
+                "or use archive_format: ndjson"
+            )
+        dest = dest_base.with_name(dest_base.name + ".parquet")
+    else:
+        raise ValueError(f"Unknown archive format: {archive_format}")
+
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        if archive_format == "ndjson":
+            with gzip.open(tmp_name, "wt", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False))
+                    f.write("\n")
+        else:
+            table = (
+                pa.Table.from_pylist(rows)
+                if rows
+                else pa.table({column: pa.array([], pa.null()) for column in columns})
+            )
+            pq.write_table(table, tmp_name, compression="zstd")
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return dest
+
+
+def archive_run_directory(run_dir: str, dest: Path) -> Path | None:
+    """
+    Archive a run output directory as a gzip-compressed tarball.
+
+    Args:
+        run_dir: Run output directory (e.g. "./output/2025-11-02T08-00-00Z")
+        dest: Destination tarball path
+
+    Returns:
+        Path of the written tarball, or None if run_dir does not exist
+    """
+    if not Path(run_dir).is_dir():
+        return None
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        with tarfile.open(tmp_name, "w:gz") as tar:
+            tar.add(run_dir, arcname=Path(run_dir).name)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    return dest
+
+
+def _bump(counter: dict[str, int], table: str, amount: int) -> None:
+    """Increment a per-table counter."""
+    if amount:
+        counter[table] = counter.get(table, 0) + amount
+
+
+def _purge_run_tables(
+    conn: sqlite3.Connection,
+    run_id: str,
+    tables: tuple[str, ...],
+    archive_dir: Path | None,
+    *,
+    archive_format: str,
+    report: MaintenanceReport,
+) -> None:
+    """
+    Archive and delete the given tables' rows for one run.
+
+    Archives are written first; deletes for all tables then run in a single
+    BEGIN IMMEDIATE transaction so the unit is all-or-nothing.
+    """
+    fetched: list[tuple[str, int]] = []
+
+    for table in tables:
+        columns, rows = _fetch_rows(conn, table, run_id)
+        if not rows:
+            continue
+        if archive_dir is not None:
+            path = write_archive(rows, columns, archive_dir / run_id / table, archive_format)
+            report.archive_files.append(str(path))
+            _bump(report.rows_archived, table, len(rows))
+        fetched.append((table, len(rows)))
+
+    if not fetched:
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for table, _ in fetched:
+            cursor = conn.execute(
+                f"DELETE FROM {table} WHERE run_id = ?",  # table from allow-list
+                (run_id,),
+            )
+            _bump(report.rows_deleted, table, cursor.rowcount)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _expire_runs(
+    conn: sqlite3.Connection,
+    output_dir: str,
+    cutoff: str,
+    retention: RetentionConfig,
+    *,
+    archive_dir: Path | None,
+    report: MaintenanceReport,
+) -> None:
+    """Archive and delete whole runs older than cutoff, oldest first, in batches."""
+    while True:
+        batch = conn.execute(
+            """
+            SELECT run_id FROM runs
+            WHERE timestamp_utc < ?
+            ORDER BY timestamp_utc, run_id
+            LIMIT ?
+            """,
+            (cutoff, retention.chunk_size),
+        ).fetchall()
+
+        if not batch:
+            return
+
+        for row in batch:
+            run_id = row["run_id"]
+            # Remove the directory before the rows: if this pass is
+            # interrupted, the runs row is still there for the next pass
+            # to finish the job, instead of an orphaned directory
+            run_dir = get_run_directory(output_dir, run_id)
+            if Path(run_dir).is_dir():
+                if archive_dir is not None:
+                    tarball = archive_run_directory(
+                        run_dir, archive_dir / run_id / "artifacts.tar.gz"
+                    )
+                    if tarball is not None:
+                        report.archive_files.append(str(tarball))
+                shutil.rmtree(run_dir)
+                report.run_dirs_removed += 1
+
+            _purge_run_tables(
+                conn,
+                run_id,
+                (*RUN_SCOPED_TABLES, "runs"),
+                archive_dir,
+                archive_format=retention.archive_format,
+                report=report,
+            )
+            report.runs_deleted += 1
+            logger.info(f"Archived and deleted run {run_id}")
+
+
+def _expire_table(
+    conn: sqlite3.Connection,
+    table: str,
+    cutoff: str,
+    retention: RetentionConfig,
+    *,
+    archive_dir: Path | None,
+    report: MaintenanceReport,
+) -> None:
+    """Archive and delete one run-scoped table's rows for runs older than cutoff."""
+    while True:
+        batch = conn.execute(
+            f"""
+            SELECT DISTINCT run_id FROM {table}
+            WHERE timestamp_utc < ?
+            LIMIT ?
+            """,  # table from allow-list
+            (cutoff, retention.chunk_size),
+        ).fetchall()
+
+        if not batch:
+            return
+
+        for row in batch:
+            _purge_run_tables(
+                conn,
+                row["run_id"],
+                (table,),
+                archive_dir,
+                archive_format=retention.archive_format,
+                report=report,
+            )
+
+        logger.debug(f"Purged {table} rows for {len(batch)} runs")
+
+
+def _evict_cache(
+    conn: sqlite3.Connection,
+    table: str,
+    cutoff: str,
+    chunk_size: int,
+    report: MaintenanceReport,
+) -> None:
+    """Evict cache table entries not accessed since cutoff."""
+    key = CACHE_TABLES[table]
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                f"""
+                DELETE FROM {table}
+                WHERE {key} IN (
+                    SELECT {key} FROM {table}
+                    WHERE last_accessed_at < ?
+                    LIMIT ?
+                )
+                """,  # table from allow-list
+                (cutoff, chunk_size),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        report.cache_rows_deleted += cursor.rowcount
+        _bump(report.rows_deleted, table, cursor.rowcount)
+        if cursor.rowcount < chunk_size:
+            return
+
+
+def _count_expired(
+    conn: sqlite3.Connection,
+    days: dict[str, int],
+    now: datetime,
+    report: MaintenanceReport,
+) -> None:
+    """Populate a dry-run report with the rows that would be deleted."""
+    runs_cutoff = _cutoff_timestamp(now, days["runs"]) if "runs" in days else None
+
+    if runs_cutoff is not None:
+        report.runs_deleted = conn.execute(
+            "SELECT COUNT(*) FROM runs WHERE timestamp_utc < ?", (runs_cutoff,)
+        ).fetchone()[0]
+        _bump(report.rows_deleted, "runs", report.runs_deleted)
+
+    for table in RUN_SCOPED_TABLES:
+        if table not in days:
+            continue
+        cutoff = _cutoff_timestamp(now, days[table])
+        count = conn.execute(
+            f"""
+            SELECT COUNT(*) FROM {table}
+            WHERE run_id IN (SELECT DISTINCT run_id FROM {table} WHERE timestamp_utc < ?)
+            """,  # table from allow-list
+            (cutoff,),
+        ).fetchone()[0]
+        _bump(report.rows_deleted, table, count)
+
+    for table in CACHE_TABLES:
+        if table not in days:
+            continue
+        cutoff = _cutoff_timestamp(now, days[table])
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE last_accessed_at < ?",  # table from allow-list
+            (cutoff,),
+        ).fetchone()[0]
+        report.cache_rows_deleted += count
+        _bump(report.rows_deleted, table, count)
+
+
+def vacuum_database(conn: sqlite3.Connection, max_pages: int = DEFAULT_VACUUM_PAGES) -> int:
+    """
+    Release free pages and refresh query planner statistics.
+
+    Runs PRAGMA incremental_vacuum (only effective when auto_vacuum is
+    INCREMENTAL), PRAGMA optimize and ANALYZE. None of these hold the write
+    lock for long, so they are safe to run next to live writers.
+
+    Args:
+        conn: Active SQLite database connection
+        max_pages: Maximum pages to release (0 = all free pages)
+
+    Returns:
+        Number of pages released to the filesystem
+
+    Note:
+        Databases created before auto_vacuum was enabled need a one-time
+        conversion with enable_incremental_vacuum() (full VACUUM).
+    """
+    auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    freed = 0
+
+    if auto_vacuum == 2:
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if max_pages:
+            conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
+        else:
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+        after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        freed = before - after
+    else:
+        logger.info(
+            "auto_vacuum is not INCREMENTAL; skipping incremental_vacuum. "
+            "Run `db maintain --full-vacuum` once to convert the database."
+        )
+
+    conn.execute("PRAGMA optimize")
+    conn.execute("ANALYZE")
+    logger.debug(f"Vacuum freed {freed} pages, statistics refreshed")
+    return freed
+
+
+def enable_incremental_vacuum(db_path: str) -> None:
+    """
+    Convert an existing database to auto_vacuum=INCREMENTAL.
+
+    Changing auto_vacuum on a non-empty database only takes effect after a
+    full VACUUM, which rewrites the file and takes an exclusive lock. Run it
+    once, outside of scheduled runs.
+
+    Args:
+        db_path: Path to SQLite database
+    """
+    conn = _connect(db_path)
+    try:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        logger.info(f"Converted {db_path} to auto_vacuum=INCREMENTAL")
+    finally:
+        conn.close()
+
+
+def _collect_blobs(
+    conn: sqlite3.Connection,
+    output_dir: str,
+    *,
+    dry_run: bool,
+    grace_seconds: float,
+    now: datetime,
+    report: MaintenanceReport,
+) -> None:
+    """Garbage collect artifact blobs orphaned by deleted answers_raw rows."""
+    gc_report = collect_garbage(
+        conn, output_dir, dry_run=dry_run, grace_seconds=grace_seconds, now=now.timestamp()
+    )
+    report.blobs_deleted = gc_report.blobs_deleted
+    report.blob_bytes_freed = gc_report.bytes_freed
+
+
+def run_maintenance(
+    db_path: str,
+    output_dir: str,
+    retention: RetentionConfig,
+    *,
+    dry_run: bool = False,
+    vacuum: bool = True,
+    now: datetime | None = None,
+    blob_grace_seconds: float = DEFAULT_GC_GRACE_SECONDS,
+) -> MaintenanceReport:
+    """
+    Apply retention policies, archive aged data, and compact the database.
+
+    Args:
+        db_path: Path to SQLite database
+        output_dir: Base output directory containing run directories
+        retention: Retention policy (see RetentionConfig)
+        dry_run: Only count what would be deleted; write and delete nothing
+        vacuum: Run incremental_vacuum/optimize/ANALYZE afterwards
+        now: Reference time for age calculations (default: current UTC time)
+        blob_grace_seconds: Keep orphaned artifact blobs younger than this
+
+    Returns:
+        MaintenanceReport summarizing archived and deleted data
+
+    Raises:
+        sqlite3.Error: If a database operation fails (completed units stay committed)
+        ImportError: If Parquet archives are requested without pyarrow
+        OSError: If archives cannot be written
+
+    Example:
+        >>> retention = RetentionConfig(max_age_days=180)
+        >>> report = run_maintenance("./output/watcher.db", "./output", retention)
+        >>> print(f"Deleted {report.runs_deleted} runs")
+    """
+    now = now or utc_now()
+    report = MaintenanceReport(dry_run=dry_run)
+
+    if not retention.enabled:
+        logger.info("Retention policies disabled; skipping purge")
+        days: dict[str, int] = {}
+    else:
+        days = resolve_retention_days(retention)
+
+    archive_dir: Path | None = None
+    if retention.archive:
+        archive_dir = Path(retention.archive_dir or os.path.join(output_dir, "archive"))
+        if retention.archive_format == "parquet" and pa is None and not dry_run:
+            raise ImportError(
+                "Parquet archives require pyarrow. Install it with: pip install pyarrow "
+                "or use archive_format: ndjson"
+            )
+
+    conn = _connect(db_path)
+    try:
+        report.auto_vacuum_mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+        if dry_run:
+            _count_expired(conn, days, now, report)
+            _collect_blobs(
+                conn,
+                output_dir,
+                dry_run=True,
+                grace_seconds=blob_grace_seconds,
+                now=now,
+                report=report,
+            )
+            return report
+
+        if "runs" in days:
+            _expire_runs(
+                conn,
+                output_dir,
+                _cutoff_timestamp(now, days["runs"]),
+                retention,
+                archive_dir=archive_dir,
+                report=report,
+            )
+
+        for table in RUN_SCOPED_TABLES:
+            if table in days and days[table] < days.get("runs", days[table] + 1):
+                _expire_table(
+                    conn,
+                    table,
+                    _cutoff_timestamp(now, days[table]),
+                    retention,
+                    archive_dir=archive_dir,
+                    report=report,
+                )
+
+        for table in CACHE_TABLES:
+            if table in days:
+                _evict_cache(
+                    conn,
+                    table,
+                    _cutoff_timestamp(now, days[table]),
+                    retention.chunk_size,
+                    report,
+                )
+
+        _collect_blobs(
+            conn,
+            output_dir,
+            dry_run=False,
+            grace_seconds=blob_grace_seconds,
+            now=now,
+            report=report,
+        )
+
+        if vacuum:
+            report.pages_freed = vacuum_database(conn)
+    finally:
+        conn.close()
+
+    logger.info(
+        f"Maintenance complete: {report.runs_deleted} runs deleted, "
+        f"{sum(report.rows_deleted.values())} rows deleted, "
+        f"{len(report.archive_files)} archive files written, "
+        f"{report.blobs_deleted} blobs deleted, "
+        f"{report.pages_freed} pages freed"
+    )
+    return report
@@ -0,0 +1,141 @@
+"""
+Source (citation) extraction from web search results.
+
+Web search results are stored per answer as provider-shaped JSON
+(answers_raw.web_search_results_json):
+- OpenAI: web_search_call items, or result dicts with "url" (and nested
+  action.sources lists)
+- Gemini grounding: {"type": "web_search_source", "uri": ..., "title": ...}
+- Perplexity browser runner: {"url": ..., "title": ..., "snippet": ...}
+
+This module flattens any of these into Source records with a normalized
+URL and domain, which storage.db writes to the sources table so citation
+analytics ("which domains get cited for intent X") run as SQL.
+
+Normalization:
+- Scheme and host lowercased, "www." and default ports dropped
+- Fragments and tracking parameters (utm_*, gclid, fbclid...) removed
+- Trailing slash removed from non-root paths
+- Duplicate URLs within one answer keep their first position
+
+Example:
+    >>> extract_sources([{"url": "https://www.HubSpot.com/crm/?utm_source=openai"}])
+    [Source(position=1, url='https://hubspot.com/crm', domain='hubspot.com', title=None)]
+"""
+
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Keys holding a result's URL, in order of preference
+URL_KEYS = ("url", "uri", "link")
+
+# Query parameters that only track the referrer, never identify the page
+TRACKING_PARAMS = frozenset({"gclid", "fbclid", "msclkid", "ref", "ref_src"})
+
+# Gemini grounding URIs point at a Google redirect; the title holds the
+# cited site's domain instead
+GROUNDING_REDIRECT_HOSTS = frozenset({"vertexaisearch.cloud.google.com"})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """
+    One cited web source of an answer.
+
+    Attributes:
+        position: 1-based order of first appearance in the answer's results
+        url: Normalized URL
+        domain: Lowercased host without "www."
+        title: Page title if the provider reported one
+    """
+
+    position: int
+    url: str
+    domain: str
+    title: str | None
+
+
+def normalize_url(url: str) -> tuple[str, str] | None:
+    """
+    Normalize an http(s) URL for grouping.
+
+    Args:
+        url: URL as reported by the provider
+
+    Returns:
+        (normalized_url, domain), or None if url is not an http(s) URL
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+
+    domain = host.removeprefix("www.")
+    netloc = domain if port in (None, _DEFAULT_PORTS[scheme]) else f"{domain}:{port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+        ]
+    )
+    return urlunsplit((scheme, netloc, path, query, "")), domain
+
+
+def _result_dicts(node: Any):
+    """Yield every dict in node that carries a URL (not descending into them)."""
+    if isinstance(node, dict):
+        if any(isinstance(node.get(key), str) for key in URL_KEYS):
+            yield node
+            return
+        for value in node.values():
+            yield from _result_dicts(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _result_dicts(item)
+
+
+def _redirect_domain(title: str | None) -> str | None:
+    """Domain named by a grounding redirect's title, if it looks like a host."""
+    if not title or " " in title or "." not in title:
+        return None
+    return title.lower().removeprefix("www.")
+
+
+def extract_sources(web_search_results: Any) -> list[Source]:
+    """
+    Extract the cited sources from one answer's web search results.
+
+    Args:
+        web_search_results: Decoded web_search_results_json (any provider shape)
+
+    Returns:
+        Sources in order of first appearance, one per normalized URL
+    """
+    sources: dict[str, Source] = {}
+    for result in _result_dicts(web_search_results):
+        raw_url = next(result[key] for key in URL_KEYS if isinstance(result.get(key), str))
+        normalized = normalize_url(raw_url)
+        if normalized is None:
+            continue
+        url, domain = normalized
+        if url in sources:
+            continue
+
+        title = result.get("title") or result.get("name")
+        title = title if isinstance(title, str) else None
+        if domain in GROUNDING_REDIRECT_HOSTS:
+            domain = _redirect_domain(title) or domain
+        sources[url] = Source(position=len(sources) + 1, url=url, domain=domain, title=title)
+
+    return list(sources.values())
@@ -23,11 +23,11 @@ Security:
     - Proper error handling (no data loss)
 """
 
-import json
 import logging
 import os
 from pathlib import Path
 
+from ..utils.fastjson import dumps_pretty
 from ..utils.time import utc_timestamp
 from .layout import (
     get_error_filename,
@@ -98,7 +98,8 @@ def write_json(filepath: str, data: dict | list) -> None:
     Write data to JSON file with UTF-8 encoding.
 
     Serializes data to JSON with pretty-printing (indent=2) and UTF-8 encoding.
-    Handles Unicode correctly with ensure_ascii=False.
+    Handles Unicode correctly with ensure_ascii=False. Encoding uses the fast
+    msgspec backend when installed (see utils.fastjson).
 
     Args:
         filepath: Full path to JSON file to write
@@ -119,10 +120,11 @@ def write_json(filepath: str, data: dict | list) -> None:
         - Atomic write (data fully written or not at all)
     """
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = dumps_pretty(data)
+        with open(filepath, "wb") as f:
+            f.write(payload)
             # Add newline at end of file for POSIX compliance
-            f.write("\n")
+            f.write(b"\n")
         logger.debug(f"Wrote JSON file: {filepath}")
     except TypeError as e:
         logger.error(f"Cannot serialize data to JSON: {e}", exc_info=True)
@@ -46,6 +46,7 @@ from typing import Any
 
 from rich import box
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -317,7 +318,8 @@ def error(message: str) -> None:
         # Agent: Buffers {"status": "error", "error": "..."}
     """
     if output_mode.is_human():
-        console_err.print(f"[red]\u2717[/red] {message}", style="red")
+        # Escaped so brackets in messages (e.g. pip extras) are not read as markup
+        console_err.print(f"[red]\u2717[/red] {escape(message)}", style="red")
     elif output_mode.is_agent():
         output_mode.add_json("status", "error")
         output_mode.add_json("error", message)
@@ -0,0 +1,43 @@
+"""
+Optional fast JSON backend for provider responses and artifacts.
+
+When msgspec is installed, artifacts are encoded with it and provider
+responses are decoded straight into typed structs (see
+llm_runner/response_schemas.py); otherwise the stdlib json module is used.
+
+Pretty-printed output from both backends parses to the same data. Only float
+formatting may differ (msgspec writes 1e-05 as 0.00001).
+
+Install the fast backend with:
+    pip install msgspec
+
+Examples:
+    >>> from utils.fastjson import dumps_pretty
+    >>> dumps_pretty({"a": 1})
+    b'{\\n  "a": 1\\n}'
+"""
+
+import json
+from typing import Any
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """
+    Encode data as UTF-8 JSON indented by 2 spaces (non-ASCII kept as-is).
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.format(msgspec.json.encode(data), indent=2)
+        except TypeError:
+            # Types msgspec rejects but json accepts (or that both reject,
+            # in which case json raises its usual TypeError)
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
@@ -11,6 +11,13 @@ Provides standardized logging with:
 All logs use Python's standard logging module with custom formatting.
 Log level defaults to INFO, use setup_logging(verbose=True) for DEBUG.
 
+Logging stays off the hot path: loggers hand records to a QueueHandler, and
+a QueueListener thread redacts, serializes to JSON and writes them. Only
+merging the message with its args happens on the calling thread. Hot-path
+callers should log lazily (logger.debug("x=%s", x), not f-strings) and guard
+expensive arguments with logger.isEnabledFor(). Call flush_logging() to wait
+for queued records.
+
 Examples:
     >>> from utils.logging import setup_logging, get_logger
     >>> setup_logging(verbose=True)
@@ -23,13 +30,19 @@ Security:
     - Only stderr is used (stdout reserved for user output)
 """
 
+import atexit
 import json
 import logging
+import queue
 import re
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
-from llm_answer_watcher.utils.time import utc_timestamp
+# Queue and listener thread of the active queued logging setup
+# ("queue", "listener"); empty when logging is synchronous or not configured
+_pipeline: dict[str, Any] = {}
 
 
 class JSONFormatter(logging.Formatter):
@@ -55,9 +68,10 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON string representing the log entry
         """
-        # Build base log entry
+        # Build base log entry (the record's creation time, not formatting
+        # time, since records may be formatted later on the listener thread)
         log_entry = {
-            "timestamp": utc_timestamp(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(record.created)),
             "level": record.levelname,
             "component": record.name,
             "message": record.getMessage(),
@@ -91,25 +105,42 @@ class SecretRedactingFilter(logging.Filter):
     Replaces full secrets with redacted versions showing only last 4 chars:
     "sk-proj-abcdef123456" -> "sk-...3456"
     "Bearer abc123xyz789" -> "Bearer ***xyz789"
+
+    All patterns are combined into one compiled alternation, so each string is
+    scanned once, and strings without any secret marker ("sk-", "Bearer") skip
+    the regex entirely. Arguments without secrets are left untouched (not
+    converted to strings), so %-style format specifiers keep working.
     """
 
-    # Pattern to match specific API key formats
+    # Pattern to match specific API key formats, most specific first (the
+    # combined pattern tries alternatives in this order at each position)
     # OpenAI: sk-proj- (48 chars), sk- (20 chars for legacy keys, 51 for new keys)
     # Anthropic: sk-ant-api03- (starts with sk-ant-api03-, typically 86+ chars total)
     # Generic bearer tokens with proper word boundary
     SECRET_PATTERNS = [
         # OpenAI project keys: sk-proj-XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX
         (re.compile(r"\bsk-proj-[a-zA-Z0-9_-]{48}\b"), "sk-proj-...{last4}"),
-        # OpenAI standard keys: sk-XXXXXXXXXXXXXXXXXXXXXXXX (51 chars for new keys) or sk-XXXXXXXXXXXXXXXXXXXX (20 chars for legacy)
-        (re.compile(r"\bsk-[a-zA-Z0-9_-]{20}\b"), "sk-...{last4}"),
-        (re.compile(r"\bsk-[a-zA-Z0-9_-]{51}\b"), "sk-...{last4}"),
         # Anthropic Claude API keys: sk-ant-REDACTED
         (re.compile(r"\bsk-ant-api03-[a-zA-Z0-9_-]{64,}\b"), "sk-ant-api03-...{last4}"),
+        # OpenAI standard keys: sk-XXXXXXXXXXXXXXXXXXXXXXXX (51 chars for new keys) or sk-XXXXXXXXXXXXXXXXXXXX (20 chars for legacy)
+        (re.compile(r"\bsk-[a-zA-Z0-9_-]{51}\b"), "sk-...{last4}"),
+        (re.compile(r"\bsk-[a-zA-Z0-9_-]{20}\b"), "sk-...{last4}"),
         # Generic bearer tokens (more conservative - require actual "Bearer " prefix)
         # Match the whole thing but be more specific about the format
         (re.compile(r"Bearer\s+[a-zA-Z0-9_-]{20,}"), "Bearer ***{last4}"),
     ]
 
+    # Substrings every secret pattern requires (cheap pre-check)
+    SECRET_MARKERS = ("sk-", "Bearer")
+
+    # All SECRET_PATTERNS as one alternation; group s{i} is pattern i
+    COMBINED_PATTERN = re.compile(
+        "|".join(
+            f"(?P<s{i}>{pattern.pattern})"
+            for i, (pattern, _) in enumerate(SECRET_PATTERNS)
+        )
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:
         """
         Redact secrets from log record message and args.
@@ -121,18 +152,16 @@ class SecretRedactingFilter(logging.Filter):
             True (always allow record, but with redacted content)
         """
         # Redact message
-        record.msg = self._redact_secrets(str(record.msg))
+        record.msg = self._redact_value(record.msg)
 
         # Redact args if present
         if record.args:
             if isinstance(record.args, dict):
                 record.args = {
-                    k: self._redact_secrets(str(v)) for k, v in record.args.items()
+                    k: self._redact_value(v) for k, v in record.args.items()
                 }
             elif isinstance(record.args, tuple):
-                record.args = tuple(
-                    self._redact_secrets(str(arg)) for arg in record.args
-                )
+                record.args = tuple(self._redact_value(arg) for arg in record.args)
 
         # Redact context if present
         if hasattr(record, "context") and isinstance(record.context, dict):
@@ -140,6 +169,18 @@ class SecretRedactingFilter(logging.Filter):
 
         return True
 
+    def _redact_value(self, value: Any) -> Any:
+        """
+        Redact a message or argument, returning it unchanged if it holds no secret.
+
+        Numbers and None are passed through without string conversion.
+        """
+        if value is None or isinstance(value, (int, float)):
+            return value
+        text = value if isinstance(value, str) else str(value)
+        redacted = self._redact_secrets(text)
+        return value if redacted == text else redacted
+
     def _redact_secrets(self, text: str) -> str:
         """
         Redact secrets in text, keeping only last 4 characters.
@@ -150,23 +191,21 @@ class SecretRedactingFilter(logging.Filter):
         Returns:
             String with secrets replaced by redacted versions
         """
-        for pattern, template in self.SECRET_PATTERNS:
-
-            def redact_match(match: re.Match) -> str:
-                matched = match.group(0)
-
-                # Special handling for Bearer tokens
-                if matched.startswith("Bearer "):
-                    token_part = matched[7:]  # Skip "Bearer "
-                    last4 = token_part[-4:]
-                    return f"Bearer ***{last4}"
-                # Standard handling for other patterns
-                last4 = matched[-4:]
-                return template.format(last4=last4)
-
-            text = pattern.sub(redact_match, text)
-
-        return text
+        if not any(marker in text for marker in self.SECRET_MARKERS):
+            return text
+        return self.COMBINED_PATTERN.sub(self._redact_match, text)
+
+    @classmethod
+    def _redact_match(cls, match: re.Match) -> str:
+        matched = match.group(0)
+
+        # Special handling for Bearer tokens
+        if matched.startswith("Bearer"):
+            last4 = matched[-4:]
+            return f"Bearer ***{last4}"
+        # Standard handling for other patterns
+        template = cls.SECRET_PATTERNS[int(match.lastgroup[1:])][1]
+        return template.format(last4=matched[-4:])
 
     def _redact_dict(self, data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -193,7 +232,66 @@ class SecretRedactingFilter(logging.Filter):
         return result
 
 
-def setup_logging(verbose: bool = False, quiet_logs: bool = False) -> None:
+class _QueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps records structured for JSONFormatter.
+
+    The stock QueueHandler.prepare() copies the record and formats it into
+    its message, folding tracebacks into the message text (it is built for
+    pickling records across processes). This queue never leaves the process,
+    so the record is only updated in place: msg and args are merged (args
+    may be mutated after the call returns), which leaves getMessage()
+    unchanged for any other handler. Tracebacks, redaction and JSON
+    serialization are left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class _StderrHandler(logging.StreamHandler):
+    """StreamHandler writing to the current sys.stderr (it may be swapped after setup)."""
+
+    def __init__(self) -> None:
+        super().__init__(sys.stderr)
+
+    @property
+    def stream(self):  # type: ignore[override]
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
+def flush_logging() -> None:
+    """
+    Wait until every queued log record has been written.
+
+    No-op when logging is synchronous or not configured.
+    """
+    if "queue" in _pipeline:
+        _pipeline["queue"].join()
+
+
+def _stop_listener() -> None:
+    if "listener" in _pipeline:
+        # stop() processes records still in the queue before returning
+        _pipeline["listener"].stop()
+    _pipeline.clear()
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(
+    verbose: bool = False,
+    quiet_logs: bool = False,
+    queued: bool = True,
+) -> None:
     """
     Configure structured JSON logging for the application.
 
@@ -203,11 +301,15 @@ def setup_logging(verbose: bool = False, quiet_logs: bool = False) -> None:
     - stderr output (stdout reserved for user-facing content)
     - Log level: DEBUG if verbose=True, INFO otherwise
     - Completely suppress logs if quiet_logs=True (unless verbose=True)
+    - A QueueListener thread doing redaction, formatting and writing
+      (unless queued=False)
 
     Args:
         verbose: If True, set log level to DEBUG and always show logs.
         quiet_logs: If True, suppress all logs (for clean human UI).
                     Overridden by verbose=True.
+        queued: If True, hand records to a background listener thread;
+                if False, redact, format and write on the calling thread.
 
     Example:
         >>> setup_logging(verbose=True)  # Show all logs
@@ -225,7 +327,9 @@ def setup_logging(verbose: bool = False, quiet_logs: bool = False) -> None:
     # Get root logger
     root_logger = logging.getLogger()
 
-    # Remove any existing handlers (prevents duplicate logs)
+    # Remove any existing handlers (prevents duplicate logs), draining the
+    # previous listener first so no queued record is lost
+    _stop_listener()
     root_logger.handlers.clear()
 
     # If quiet_logs is True and verbose is False, suppress all logging
@@ -238,7 +342,7 @@ def setup_logging(verbose: bool = False, quiet_logs: bool = False) -> None:
     root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
     # Create stderr handler
-    handler = logging.StreamHandler(sys.stderr)
+    handler = _StderrHandler()
     handler.setLevel(logging.DEBUG if verbose else logging.INFO)
 
     # Add JSON formatter
@@ -248,8 +352,16 @@ def setup_logging(verbose: bool = False, quiet_logs: bool = False) -> None:
     # Add secret redacting filter
     handler.addFilter(SecretRedactingFilter())
 
-    # Add handler to root logger
-    root_logger.addHandler(handler)
+    if not queued:
+        root_logger.addHandler(handler)
+        return
+
+    # Loggers only enqueue; the listener thread runs the stderr handler
+    log_queue: queue.Queue = queue.Queue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    _pipeline.update(queue=log_queue, listener=listener)
+    root_logger.addHandler(_QueueHandler(log_queue))
 
 
 def get_logger(component: str) -> logging.Logger:
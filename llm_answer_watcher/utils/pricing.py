@@ -31,8 +31,6 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import httpx
-
 from llm_answer_watcher.utils.time import utc_now
 
 logger = logging.getLogger(__name__)
@@ -48,6 +46,9 @@ OVERRIDES_FILE = PROJECT_ROOT / "config" / "pricing_overrides.json"
 # Cache duration (24 hours)
 CACHE_DURATION = timedelta(hours=24)
 
+# Parsed pricing JSON files keyed by path -> ((mtime_ns, size), data)
+_json_file_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+
 # Provider name mapping (our names -> llm-prices.com vendor names)
 PROVIDER_MAPPING = {
     "openai": "openai",
@@ -408,6 +409,33 @@ def list_available_models() -> list[dict[str, Any]]:
 # Private helper functions
 
 
+def _read_json_file(path: Path) -> Any:
+    """
+    Read a JSON file, reusing the parsed result while the file is unchanged.
+
+    Pricing lookups happen once per model per run (and per cost estimate),
+    so re-parsing the pricing cache on every call adds up, especially in
+    `serve` mode. Parsed data is kept in memory keyed by path and
+    (mtime_ns, size); any write to the file invalidates it.
+
+    Callers must treat the returned data as read-only.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(path) as f:
+        data = json.load(f)
+    _json_file_cache[path] = (signature, data)
+    return data
+
+
 def _load_overrides() -> dict[str, Any]:
     """Load local pricing overrides from JSON file."""
     if not OVERRIDES_FILE.exists():
@@ -415,10 +443,9 @@ def _load_overrides() -> dict[str, Any]:
         return {}
 
     try:
-        with open(OVERRIDES_FILE) as f:
-            data = json.load(f)
-            logger.debug(f"Loaded pricing overrides from {OVERRIDES_FILE}")
-            return data
+        data = _read_json_file(OVERRIDES_FILE)
+        logger.debug(f"Loaded pricing overrides from {OVERRIDES_FILE}")
+        return data
     except Exception as e:
         logger.warning(f"Failed to load pricing overrides: {e}")
         return {}
@@ -431,13 +458,12 @@ def _load_cache() -> dict[str, Any] | None:
         return None
 
     try:
-        with open(CACHE_FILE) as f:
-            data = json.load(f)
-            logger.debug(
-                f"Loaded pricing cache from {CACHE_FILE} "
-                f"(cached at {data.get('cached_at')})"
-            )
-            return data
+        data = _read_json_file(CACHE_FILE)
+        logger.debug(
+            f"Loaded pricing cache from {CACHE_FILE} "
+            f"(cached at {data.get('cached_at')})"
+        )
+        return data
     except Exception as e:
         logger.warning(f"Failed to load pricing cache: {e}")
         return None
@@ -488,6 +514,9 @@ def _is_cache_expired(cached_at: str | None) -> bool:
 
 def _fetch_remote_pricing(timeout: float = 10.0) -> dict[str, Any] | None:
     """Fetch pricing data from remote source."""
+    # Imported here so reading cached prices doesn't load the HTTP stack
+    import httpx
+
     try:
         with httpx.Client(timeout=timeout) as client:
             response = client.get(PRICING_URL)
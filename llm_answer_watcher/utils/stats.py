@@ -0,0 +1,35 @@
+"""
+Small statistics helpers shared by the runner and the eval suite.
+
+This module provides:
+- percentile(): Linearly interpolated percentile of a list of values
+
+Example:
+    >>> from utils.stats import percentile
+    >>> percentile([0.8, 1.2, 3.5, 0.9], 95)
+    3.155
+"""
+
+import math
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Linearly interpolated percentile of a non-empty list.
+
+    Args:
+        values: Sample values (any order)
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The interpolated value at pct
+
+    Example:
+        >>> percentile([1.0, 2.0, 3.0, 4.0], 50)
+        2.5
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,213 @@
+"""
+Tests for llm_runner.browser.readiness and its use in the Steel runners.
+
+Tests cover:
+- wait_until returning as soon as the condition holds, backing off
+  exponentially, treating exceptions as "not ready" and timing out
+- wait_for_stable_text waiting for streamed text to stop growing, for busy
+  indicators to clear, and returning the partial text on timeout
+- PhaseTimer collecting timed() blocks and wait steps
+- SteelChatGPTRunner recording phase timings in IntentResult without any
+  fixed sleeps
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_answer_watcher.llm_runner.browser.readiness import (
+    Backoff,
+    PhaseTimer,
+    ReadinessTimeoutError,
+    timed,
+    wait_for_stable_text,
+    wait_until,
+)
+
+
+class FakeTime:
+    """Clock and sleep that advance together without waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def _script(*values):
+    """Callable returning the given values in order, then the last one forever."""
+    remaining = list(values)
+
+    def read():
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    return read
+
+
+class TestWaitUntil:
+    """Condition polling."""
+
+    def test_returns_immediately_when_ready(self):
+        fake = FakeTime()
+
+        assert (
+            wait_until(lambda: "ready", 5, step="x", sleep=fake.sleep, clock=fake.clock) == "ready"
+        )
+        assert fake.sleeps == []
+
+    def test_backs_off_exponentially(self):
+        fake = FakeTime()
+        condition = _script(None, None, None, None, "element")
+
+        result = wait_until(
+            condition,
+            10,
+            step="input",
+            backoff=Backoff(initial=0.1, factor=2.0, maximum=0.3),
+            sleep=fake.sleep,
+            clock=fake.clock,
+        )
+
+        assert result == "element"
+        assert fake.sleeps == [0.1, 0.2, 0.3, 0.3]
+
+    def test_exceptions_count_as_not_ready(self):
+        fake = FakeTime()
+        calls = []
+
+        def condition():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("Execution context was destroyed")
+            return True
+
+        assert wait_until(condition, 5, step="x", sleep=fake.sleep, clock=fake.clock)
+        assert len(calls) == 3
+
+    def test_times_out(self):
+        fake = FakeTime()
+
+        with pytest.raises(ReadinessTimeoutError, match="input") as info:
+            wait_until(lambda: None, 1.0, step="input", sleep=fake.sleep, clock=fake.clock)
+
+        assert info.value.step == "input"
+        # Never sleeps past the timeout
+        assert fake.now == pytest.approx(1.0)
+
+
+class TestWaitForStableText:
+    """Answer-stability detection."""
+
+    def test_waits_for_text_to_stop_growing(self):
+        fake = FakeTime()
+        read = _script(
+            None, "1. Warmly", "1. Warmly\n2. HubSpot", "1. Warmly\n2. HubSpot\n3. Lemlist"
+        )
+
+        text = wait_for_stable_text(read, 30, stable_polls=3, sleep=fake.sleep, clock=fake.clock)
+
+        assert text == "1. Warmly\n2. HubSpot\n3. Lemlist"
+
+    def test_interval_restarts_when_text_changes(self):
+        fake = FakeTime()
+        read = _script("a", "a", "ab", "ab", "ab")
+
+        wait_for_stable_text(
+            read,
+            30,
+            stable_polls=3,
+            backoff=Backoff(initial=0.25, factor=2.0, maximum=2.0),
+            sleep=fake.sleep,
+            clock=fake.clock,
+        )
+
+        assert fake.sleeps == [0.25, 0.5, 0.25, 0.5]
+
+    def test_busy_page_is_not_complete(self):
+        fake = FakeTime()
+        busy = _script(True, True, True, True, False)
+
+        wait_for_stable_text(
+            lambda: "1. Warmly", 30, stable_polls=2, busy=busy, sleep=fake.sleep, clock=fake.clock
+        )
+
+        assert len(fake.sleeps) == 4
+
+    def test_timeout_keeps_partial_text(self):
+        fake = FakeTime()
+        counter = iter(range(1000))
+
+        with pytest.raises(ReadinessTimeoutError) as info:
+            wait_for_stable_text(
+                lambda: f"token {next(counter)}", 2.0, sleep=fake.sleep, clock=fake.clock
+            )
+
+        assert info.value.last_value.startswith("token ")
+
+    def test_empty_text_never_complete(self):
+        fake = FakeTime()
+
+        with pytest.raises(ReadinessTimeoutError):
+            wait_for_stable_text(lambda: "", 1.0, sleep=fake.sleep, clock=fake.clock)
+
+
+class TestPhaseTimer:
+    """Per-phase timing."""
+
+    def test_collects_timed_blocks_and_waits(self):
+        fake = FakeTime()
+
+        with PhaseTimer() as timer:
+            with timed("navigate"):
+                wait_until(_script(None, True), 5, step="input", sleep=fake.sleep, clock=fake.clock)
+            with timed("navigate"):
+                pass
+
+        assert set(timer.timings) == {"navigate", "input"}
+        assert timer.timings["input"] == pytest.approx(0.1)
+
+    def test_no_active_timer_is_fine(self):
+        with timed("navigate"):
+            pass
+        assert wait_until(lambda: 1, 1, step="x") == 1
+
+
+def test_chatgpt_runner_records_phase_timings():
+    pytest.importorskip("steel")
+    from llm_answer_watcher.llm_runner.browser.steel_base import SteelConfig
+    from llm_answer_watcher.llm_runner.browser.steel_chatgpt import SteelChatGPTRunner
+
+    runner = SteelChatGPTRunner(
+        SteelConfig(
+            steel_api_key="ste-test",
+            target_url="https://chat.openai.com",
+            take_screenshots=False,
+            save_html_snapshot=False,
+            stable_polls=2,
+        )
+    )
+    steel = MagicMock()
+    steel.sessions.create.return_value = SimpleNamespace(id="sess-1", status="live")
+    # No CDP URL: readiness comes from Steel status, the answer from scraping
+    steel.sessions.retrieve.return_value = SimpleNamespace(
+        id="sess-1", status="live", websocket_url=None
+    )
+    runner._steel_client = steel
+
+    scraped = ["1. Warmly", "1. Warmly\n2. HubSpot", "1. Warmly\n2. HubSpot"]
+    with patch.object(runner, "_scrape_page_content", side_effect=scraped):
+        result = runner.run_intent("Best CRM?")
+
+    assert result.success
+    assert result.answer_text == "1. Warmly\n2. HubSpot"
+    assert {"session", "navigate", "page_load", "extract", "scrape"} <= set(result.phase_timings)
+    # Page was ready immediately: no fixed 5s waits
+    assert result.phase_timings["navigate"] < 1
+    assert result.phase_timings["extract"] < 3
@@ -1815,3 +1815,177 @@ class TestConsoleOutputFunctions:
             successful=1,
             total=1,
         )
+
+
+# ============================================================================
+# Test DB Maintain Command
+# ============================================================================
+
+
+class TestDbMaintainCommand:
+    """Test 'db maintain' retention and vacuum command."""
+
+    @pytest.fixture
+    def old_run_db(self, tmp_path):
+        """Database containing one run from 2020."""
+        import sqlite3
+
+        from llm_answer_watcher.storage.db import init_db_if_needed, insert_run
+
+        db_path = tmp_path / "watcher.db"
+        init_db_if_needed(str(db_path))
+        conn = sqlite3.connect(db_path)
+        insert_run(conn, "2020-01-01T00-00-00Z", "2020-01-01T00:00:00Z", 1, 1)
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_requires_config_or_db(self, cli_runner, reset_output_mode):
+        """Without --config or --db the command should fail with config error."""
+        result = cli_runner.invoke(app, ["db", "maintain"])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+    def test_missing_database(self, cli_runner, tmp_path, reset_output_mode):
+        """Nonexistent database path should exit with DB error."""
+        result = cli_runner.invoke(
+            app, ["db", "maintain", "--db", str(tmp_path / "missing.db")]
+        )
+
+        assert result.exit_code == EXIT_DB_ERROR
+
+    def test_dry_run_json_output(self, cli_runner, old_run_db, reset_output_mode):
+        """--dry-run --format json should report counts without deleting."""
+        result = cli_runner.invoke(
+            app,
+            [
+                "db",
+                "maintain",
+                "--db",
+                str(old_run_db),
+                "--keep-days",
+                "30",
+                "--dry-run",
+                "--format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == EXIT_SUCCESS
+        data = json.loads(result.output)
+        assert data["maintenance"]["dry_run"] is True
+        assert data["maintenance"]["runs_deleted"] == 1
+
+    def test_deletes_expired_runs(self, cli_runner, old_run_db, reset_output_mode):
+        """--keep-days should delete runs older than the cutoff."""
+        import sqlite3
+
+        result = cli_runner.invoke(
+            app, ["db", "maintain", "--db", str(old_run_db), "--keep-days", "30"]
+        )
+
+        assert result.exit_code == EXIT_SUCCESS
+        with sqlite3.connect(old_run_db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 0
+
+    def test_invalid_archive_format(self, cli_runner, old_run_db, reset_output_mode):
+        """Unknown archive format should exit with config error."""
+        result = cli_runner.invoke(
+            app,
+            ["db", "maintain", "--db", str(old_run_db), "--archive-format", "csv"],
+        )
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+
+# ============================================================================
+# Test Serve Command
+# ============================================================================
+
+
+class TestServeCommand:
+    """Test 'serve' long-running scheduler command."""
+
+    @pytest.fixture
+    def scheduled_config_yaml(self, valid_config_yaml):
+        """Valid config with an hourly run_settings.schedule."""
+        config_data = yaml.safe_load(valid_config_yaml.read_text())
+        config_data["run_settings"]["schedule"] = {"cron": "0 * * * *"}
+        valid_config_yaml.write_text(yaml.dump(config_data))
+        return valid_config_yaml
+
+    def test_requires_schedule(
+        self, cli_runner, valid_config_yaml, monkeypatch, reset_output_mode
+    ):
+        """Configs without run_settings.schedule cannot be served."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        result = cli_runner.invoke(app, ["serve", "--config", str(valid_config_yaml)])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+    def test_invalid_config(self, cli_runner, invalid_config_yaml, reset_output_mode):
+        """Invalid YAML should exit with config error before serving."""
+        result = cli_runner.invoke(app, ["serve", "--config", str(invalid_config_yaml)])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+    def test_json_status_on_shutdown(
+        self, cli_runner, scheduled_config_yaml, monkeypatch, reset_output_mode
+    ):
+        """--format json should print per-config status when the loop ends."""
+        from unittest.mock import AsyncMock
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        with patch(
+            "llm_answer_watcher.daemon.WatcherDaemon.serve", new=AsyncMock()
+        ) as mock_serve:
+            result = cli_runner.invoke(
+                app,
+                ["serve", "--config", str(scheduled_config_yaml), "--format", "json"],
+            )
+
+        assert result.exit_code == EXIT_SUCCESS
+        mock_serve.assert_awaited_once()
+        data = json.loads(result.stdout)
+        assert data["configs"][0]["cron"] == "0 * * * *"
+        assert data["configs"][0]["runs_started"] == 0
+
+
+# ============================================================================
+# Test API Command
+# ============================================================================
+
+
+class TestApiCommand:
+    """Test 'api' HTTP job service command."""
+
+    def test_requires_uvicorn(self, cli_runner, valid_config_yaml, reset_output_mode):
+        """Without uvicorn installed the command exits with a config error."""
+        import sys
+
+        with patch.dict(sys.modules, {"uvicorn": None}):
+            result = cli_runner.invoke(app, ["api", "--config", str(valid_config_yaml)])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+        assert "llm-answer-watcher[api]" in result.output
+
+    def test_serves_loaded_configs(
+        self, cli_runner, valid_config_yaml, monkeypatch, reset_output_mode
+    ):
+        """Configs are loaded once and the ASGI app is handed to uvicorn."""
+        import sys
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        fake_uvicorn = MagicMock()
+
+        with patch.dict(sys.modules, {"uvicorn": fake_uvicorn}):
+            result = cli_runner.invoke(
+                app, ["api", "--config", str(valid_config_yaml), "--port", "9000"]
+            )
+
+        assert result.exit_code == EXIT_SUCCESS
+        served_app = fake_uvicorn.run.call_args.args[0]
+        assert list(served_app.service.configs) == ["watcher.config"]
+        assert fake_uvicorn.run.call_args.kwargs["port"] == 9000
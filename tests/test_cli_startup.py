@@ -0,0 +1,159 @@
+"""
+Cold-start regression tests for the CLI.
+
+Each command runs in a fresh interpreter under `python -X importtime`, so the
+measurement includes every module the command actually imports.
+
+Tests cover:
+- Heavy modules (runner, Steel SDK, Jinja2, httpx) stay out of light commands
+- Total import time of each command stays within its budget (slow, opt-in)
+- RunnerRegistry defers importing plugin modules until a lookup
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+# Modules that only `run` (and friends) should pay for
+HEAVY_MODULES = {
+    "llm_answer_watcher.llm_runner.runner",
+    "llm_answer_watcher.report.generator",
+    "llm_answer_watcher.evals.runner",
+    "steel",
+    "jinja2",
+    "httpx",
+}
+
+# Import-time budgets in microseconds (-X importtime totals). Wall-clock totals
+# are noisy under load, so they only run with -m slow; the HEAVY_MODULES checks
+# are the precise guard, the budgets catch gradual creep.
+COMMAND_BUDGETS_US = {
+    "help": 750_000,
+    "validate": 1_000_000,
+    "prices": 750_000,
+}
+
+
+def _import_profile(*args: str, env: dict | None = None) -> tuple[set[str], int]:
+    """
+    Run a CLI command under -X importtime.
+
+    Returns:
+        (imported module names, total import time in microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "llm_answer_watcher", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        timeout=120,
+        check=False,
+    )
+    modules = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        # Top-level imports (no nesting indent) add up to the whole cost
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return modules, total_us
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "watcher.config.yaml"
+    path.write_text(
+        yaml.dump(
+            {
+                "run_settings": {
+                    "output_dir": str(tmp_path / "output"),
+                    "sqlite_db_path": str(tmp_path / "watcher.db"),
+                    "models": [
+                        {
+                            "provider": "openai",
+                            "model_name": "gpt-4o-mini",
+                            "env_api_key": "OPENAI_API_KEY",
+                        }
+                    ],
+                },
+                "brands": {"mine": ["Warmly"], "competitors": ["HubSpot"]},
+                "intents": [{"id": "best-tools", "prompt": "What are the best tools?"}],
+            }
+        )
+    )
+    return path
+
+
+def _validate_args(config_path) -> tuple[str, ...]:
+    return ("validate", "--config", str(config_path), "--format", "json")
+
+
+VALIDATE_ENV = {"OPENAI_API_KEY": "sk-test"}
+
+
+class TestLightCommandImports:
+    """Light commands never import the heavy modules."""
+
+    def test_help(self):
+        modules, _ = _import_profile("--help")
+
+        assert "llm_answer_watcher.cli" in modules
+        assert not HEAVY_MODULES & modules
+        assert "pydantic" not in modules
+
+    def test_validate(self, config_path):
+        modules, _ = _import_profile(*_validate_args(config_path), env=VALIDATE_ENV)
+
+        assert "llm_answer_watcher.config.loader" in modules
+        assert not HEAVY_MODULES & modules
+
+    def test_prices_list(self):
+        modules, _ = _import_profile("prices", "list", "--format", "json")
+
+        assert "llm_answer_watcher.utils.pricing" in modules
+        assert not HEAVY_MODULES & modules
+
+
+@pytest.mark.slow
+class TestColdStartBudget:
+    """Total import time of light commands (timing-sensitive, run with -m slow)."""
+
+    def test_help(self):
+        _, total_us = _import_profile("--help")
+
+        assert total_us < COMMAND_BUDGETS_US["help"]
+
+    def test_validate(self, config_path):
+        _, total_us = _import_profile(*_validate_args(config_path), env=VALIDATE_ENV)
+
+        assert total_us < COMMAND_BUDGETS_US["validate"]
+
+    def test_prices_list(self):
+        _, total_us = _import_profile("prices", "list", "--format", "json")
+
+        assert total_us < COMMAND_BUDGETS_US["prices"]
+
+
+def test_registry_discovers_plugins_on_first_lookup():
+    script = (
+        "import sys\n"
+        "from llm_answer_watcher.llm_runner import RunnerRegistry\n"
+        "print('steel' in sys.modules)\n"
+        "print(sorted(p['name'] for p in RunnerRegistry.list_plugins()))\n"
+        "print('steel' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=120, check=True
+    )
+
+    assert result.stdout.splitlines() == [
+        "False",
+        "['api', 'steel-chatgpt', 'steel-perplexity']",
+        "True",
+    ]
@@ -513,6 +513,21 @@ class TestResolveApiKeys:
         assert models[0].api_key == "sk-test-key-12345"
         assert models[1].api_key == "sk-ant-test-key-67890"
 
+    def test_resolves_fallback_model(self, valid_config_dict, mock_env_vars):
+        """resolve_api_keys() should resolve a model's fallback the same way."""
+        valid_config_dict["run_settings"]["models"][0]["fallback"] = {
+            "provider": "anthropic",
+            "model_name": "claude-3-5-haiku-20241022",
+            "env_api_key": "ANTHROPIC_API_KEY",
+        }
+
+        watcher_config = WatcherConfig.model_validate(valid_config_dict)
+        models = resolve_api_keys(watcher_config)
+
+        assert len(models) == 1
+        assert models[0].fallback.api_key == "sk-ant-test-key-67890"
+        assert models[0].fallback.system_prompt
+
     def test_raises_on_missing_env_var(self, valid_config_dict, monkeypatch):
         """resolve_api_keys() should raise ValueError for missing env var."""
         # Don't set OPENAI_API_KEY
@@ -0,0 +1,114 @@
+"""
+Tests for config/schedule.py module.
+
+Tests cover:
+- Field expansion (wildcards, ranges, lists, steps, macros)
+- matches() and next_after() including the day-of-month/day-of-week OR rule
+- Rejection of malformed and never-firing expressions
+- ScheduleConfig validation in RunSettings
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schedule import parse_cron
+from llm_answer_watcher.config.schema import RunSettings, ScheduleConfig
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+class TestParseCron:
+    """Tests for parse_cron()."""
+
+    def test_field_expansion(self):
+        schedule = parse_cron("*/15 9-11 1,15 * 1-5")
+
+        assert schedule.minutes == {0, 15, 30, 45}
+        assert schedule.hours == {9, 10, 11}
+        assert schedule.days == {1, 15}
+        assert schedule.weekdays == {1, 2, 3, 4, 5}
+
+    def test_start_with_step_runs_to_end(self):
+        assert parse_cron("50/5 * * * *").minutes == {50, 55}
+
+    def test_sunday_as_seven(self):
+        assert parse_cron("0 0 * * 7").weekdays == {0}
+
+    def test_macro(self):
+        schedule = parse_cron("@daily")
+
+        assert schedule.minutes == {0}
+        assert schedule.hours == {0}
+        assert schedule.source == "@daily"
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "a * * * *", "@often"],
+    )
+    def test_invalid_expressions(self, expression):
+        with pytest.raises(ValueError):
+            parse_cron(expression)
+
+    def test_parse_is_cached(self):
+        assert parse_cron("0 * * * *") is parse_cron("0 * * * *")
+
+
+class TestNextAfter:
+    """Tests for CronSchedule.next_after() and matches()."""
+
+    def test_hourly(self):
+        schedule = parse_cron("0 * * * *")
+
+        assert schedule.next_after(_utc(2025, 11, 3, 10, 0)) == _utc(2025, 11, 3, 11, 0)
+        assert schedule.next_after(_utc(2025, 11, 3, 10, 59, 30)) == _utc(2025, 11, 3, 11, 0)
+
+    def test_weekdays_skip_weekend(self):
+        schedule = parse_cron("*/30 9-17 * * 1-5")
+
+        # Saturday noon -> Monday 09:00
+        assert schedule.next_after(_utc(2025, 11, 1, 12, 0)) == _utc(2025, 11, 3, 9, 0)
+
+    def test_month_rollover(self):
+        schedule = parse_cron("0 6 1 * *")
+
+        assert schedule.next_after(_utc(2025, 12, 15, 0, 0)) == _utc(2026, 1, 1, 6, 0)
+
+    def test_leap_day(self):
+        assert parse_cron("0 0 29 2 *").next_after(_utc(2025, 3, 1)) == _utc(2028, 2, 29)
+
+    def test_day_of_month_or_day_of_week(self):
+        schedule = parse_cron("0 0 13 * 5")
+
+        assert schedule.matches(_utc(2025, 11, 13))  # Thursday the 13th
+        assert schedule.matches(_utc(2025, 11, 14))  # Friday
+        assert not schedule.matches(_utc(2025, 11, 15))
+
+    def test_never_fires(self):
+        with pytest.raises(ValueError, match="never fires"):
+            parse_cron("0 0 31 2 *").next_after(_utc(2025, 1, 1))
+
+
+class TestScheduleConfig:
+    """ScheduleConfig validation via RunSettings."""
+
+    def test_valid_schedule(self):
+        settings = RunSettings(
+            output_dir="./output",
+            sqlite_db_path="./output/watcher.db",
+            schedule={"cron": "0 */6 * * *", "run_on_start": True},
+        )
+
+        assert settings.schedule.compiled.hours == {0, 6, 12, 18}
+        assert settings.schedule.run_on_start is True
+
+    def test_invalid_cron_rejected(self):
+        with pytest.raises(ValidationError, match="out of range"):
+            ScheduleConfig(cron="0 25 * * *")
+
+    def test_impossible_cron_rejected(self):
+        with pytest.raises(ValidationError, match="never fires"):
+            ScheduleConfig(cron="0 0 30 2 *")
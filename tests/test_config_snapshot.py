@@ -0,0 +1,179 @@
+"""
+Tests for config/snapshot.py and the snapshot path in load_config().
+
+Tests cover:
+- Snapshot hits skip YAML parsing and produce an identical RuntimeConfig
+- API keys re-resolved from the environment and never written to disk
+- Invalidation by mtime/size, content hash and schema fingerprint
+- Unusable snapshots falling back to a normal parse
+- Automatic enablement by file size
+- Load time against config size (benchmark)
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from llm_answer_watcher.config import snapshot as snapshot_module
+from llm_answer_watcher.config.loader import load_config
+from llm_answer_watcher.config.snapshot import (
+    CACHE_DIR_ENV,
+    SNAPSHOT_MIN_BYTES,
+    load_snapshot,
+    snapshot_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-first-key")
+
+
+def _write_config(path, intent_count=2, competitors=("HubSpot",)):
+    config = {
+        "run_settings": {
+            "output_dir": "./output",
+            "sqlite_db_path": "./output/watcher.db",
+            "models": [
+                {"provider": "openai", "model_name": "gpt-4o-mini", "env_api_key": "OPENAI_API_KEY"}
+            ],
+        },
+        "brands": {"mine": ["Warmly"], "competitors": list(competitors)},
+        "intents": [
+            {"id": f"intent-{i}", "prompt": f"What are the best tools for task {i}?"}
+            for i in range(intent_count)
+        ],
+    }
+    path.write_text(yaml.dump(config))
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    return _write_config(tmp_path / "watcher.config.yaml")
+
+
+class TestSnapshotLoad:
+    """load_config() with snapshot=True."""
+
+    def test_hit_skips_yaml_and_matches_parse(self, config_path):
+        parsed = load_config(config_path, snapshot=False)
+        load_config(config_path, snapshot=True)
+
+        with patch("llm_answer_watcher.config.loader.yaml.safe_load") as safe_load:
+            cached = load_config(config_path, snapshot=True)
+
+        safe_load.assert_not_called()
+        assert cached == parsed
+
+    def test_api_keys_reinjected_and_not_stored(self, config_path, monkeypatch):
+        load_config(config_path, snapshot=True)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-second-key")
+
+        config = load_config(config_path, snapshot=True)
+
+        assert config.models[0].api_key == "sk-second-key"
+        stored = snapshot_path(config_path).read_text()
+        assert "sk-first-key" not in stored
+        assert "OPENAI_API_KEY" in stored
+
+    def test_missing_key_still_fails_on_hit(self, config_path, monkeypatch):
+        load_config(config_path, snapshot=True)
+        monkeypatch.delenv("OPENAI_API_KEY")
+
+        with pytest.raises(Exception, match="OPENAI_API_KEY"):
+            load_config(config_path, snapshot=True)
+
+    def test_touched_file_with_same_content_reuses_snapshot(self, config_path):
+        load_config(config_path, snapshot=True)
+        _bump_mtime(config_path)
+
+        with patch("llm_answer_watcher.config.loader.yaml.safe_load") as safe_load:
+            load_config(config_path, snapshot=True)
+        safe_load.assert_not_called()
+
+        # The refreshed header makes the next load skip hashing too
+        with patch.object(snapshot_module, "content_hash") as content_hash:
+            assert load_snapshot(config_path) is not None
+        content_hash.assert_not_called()
+
+    def test_changed_content_invalidates(self, config_path):
+        load_config(config_path, snapshot=True)
+        _write_config(config_path, competitors=("HubSpot", "Salesforce"))
+        _bump_mtime(config_path)
+
+        config = load_config(config_path, snapshot=True)
+
+        assert config.brands.competitors == ["HubSpot", "Salesforce"]
+        assert load_snapshot(config_path).brands.competitors == ["HubSpot", "Salesforce"]
+
+    def test_other_fingerprint_ignored(self, config_path):
+        load_config(config_path, snapshot=True)
+
+        with patch.object(snapshot_module, "schema_fingerprint", return_value="other"):
+            assert load_snapshot(config_path) is None
+
+    def test_corrupt_snapshot_falls_back_to_parse(self, config_path):
+        load_config(config_path, snapshot=True)
+        snapshot_path(config_path).write_bytes(b"not a snapshot")
+
+        config = load_config(config_path, snapshot=True)
+
+        assert config.intents[0].id == "intent-0"
+        assert load_snapshot(config_path) is not None
+
+    def test_invalid_config_not_snapshotted(self, tmp_path):
+        path = tmp_path / "bad.yaml"
+        path.write_text("run_settings: {}\n")
+
+        with pytest.raises(Exception, match="validation failed"):
+            load_config(path, snapshot=True)
+        assert not snapshot_path(path).exists()
+
+
+class TestAutoEnable:
+    """Default snapshot=None decides by file size."""
+
+    def test_small_config_not_snapshotted(self, config_path):
+        load_config(config_path)
+
+        assert not snapshot_path(config_path).exists()
+
+    def test_large_config_snapshotted(self, tmp_path):
+        path = _write_config(tmp_path / "big.yaml", intent_count=1500)
+        assert path.stat().st_size >= SNAPSHOT_MIN_BYTES
+
+        load_config(path)
+
+        assert snapshot_path(path).exists()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("intent_count", [1_000, 4_000])
+def test_benchmark_load_time_by_config_size(tmp_path, intent_count):
+    competitors = [f"Competitor {i}" for i in range(intent_count // 10)]
+    path = _write_config(tmp_path / "big.yaml", intent_count, competitors)
+
+    start = time.perf_counter()
+    parsed = load_config(path, snapshot=True)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cached = load_config(path, snapshot=True)
+    warm = time.perf_counter() - start
+
+    print(
+        f"\n{intent_count} intents, {path.stat().st_size / 1024:.0f} KiB: "
+        f"parse {cold * 1000:.0f} ms, snapshot {warm * 1000:.0f} ms"
+    )
+    assert cached == parsed
+    assert warm * 3 < cold
@@ -0,0 +1,108 @@
+"""
+Tests for config/templates.py module.
+
+Tests cover:
+- Template tokenization and single-pass rendering
+- Placeholder validation (unknown variables in known namespaces)
+- Literal passthrough of non-placeholder braces
+- Condition compilation for null, comparison, and contains forms
+- Operation schema validation using compiled templates
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import Operation
+from llm_answer_watcher.config.templates import compile_condition, compile_template
+
+
+class TestCompileTemplate:
+    """Tests for compile_template()."""
+
+    def test_tokens_and_variables(self):
+        template = compile_template("Rank of {brand:mine}: {rank:mine}!")
+
+        assert template.tokens == ("Rank of ", "brand:mine", ": ", "rank:mine", "!")
+        assert template.slots == (1, 3)
+        assert template.variables == {"brand:mine", "rank:mine"}
+
+    def test_render_single_pass(self):
+        template = compile_template("{intent:response} / {rank:mine}")
+
+        # Substituted values are not re-scanned for placeholders
+        rendered = template.render({"intent:response": "{rank:mine}", "rank:mine": "2"})
+
+        assert rendered == "{rank:mine} / 2"
+
+    def test_operation_refs(self):
+        template = compile_template("Use {operation:gap-analysis} and {operation:other_op}")
+
+        assert template.operation_refs == {"gap-analysis", "other_op"}
+
+    def test_missing_value_left_as_placeholder(self):
+        template = compile_template("Prior: {operation:missing}")
+
+        assert template.render({}) == "Prior: {operation:missing}"
+
+    def test_unknown_variable_in_known_namespace_rejected(self):
+        with pytest.raises(ValueError, match=r"Unknown template variable '\{brand:mien\}'"):
+            compile_template("Analyze {brand:mien}")
+
+    def test_json_and_unknown_namespaces_are_literal(self):
+        source = 'Return {"rank": 1} and keep {custom:value} as-is'
+        template = compile_template(source)
+
+        assert template.slots == ()
+        assert template.render({}) == source
+
+    def test_compilation_is_cached(self):
+        assert compile_template("{intent:id}") is compile_template("{intent:id}")
+
+
+class TestCompileCondition:
+    """Tests for compile_condition()."""
+
+    def test_null_condition(self):
+        condition = compile_condition("{rank:mine} == null")
+
+        assert condition.kind == "null"
+        assert condition.left.variables == {"rank:mine"}
+
+    @pytest.mark.parametrize("op", ["==", "!=", ">", "<", ">=", "<="])
+    def test_comparison_operators(self, op):
+        condition = compile_condition(f"{{rank:mine}} {op} 3")
+
+        assert condition.kind == "compare"
+        assert condition.operator == op
+        assert condition.right.source == "3"
+
+    def test_contains_condition(self):
+        condition = compile_condition('{competitors:mentioned} contains "HubSpot"')
+
+        assert condition.kind == "contains"
+        assert condition.right.source == '"HubSpot"'
+
+    def test_unsupported_condition_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported condition"):
+            compile_condition("{rank:mine} is bad")
+
+    def test_unknown_variable_in_condition_rejected(self):
+        with pytest.raises(ValueError, match="Unknown template variable"):
+            compile_condition("{rank:theirs} > 3")
+
+
+class TestOperationValidation:
+    """Operation schema validates prompts and conditions at config load."""
+
+    def test_valid_operation(self):
+        op = Operation(id="gaps", prompt="Improve {brand:mine}", condition="{rank:mine} > 1")
+
+        assert op.condition == "{rank:mine} > 1"
+
+    def test_invalid_prompt_variable(self):
+        with pytest.raises(ValidationError, match="Unknown template variable"):
+            Operation(id="gaps", prompt="Improve {brand:mien}")
+
+    def test_invalid_condition(self):
+        with pytest.raises(ValidationError, match="Unsupported condition"):
+            Operation(id="gaps", prompt="Improve {brand:mine}", condition="rank is low")
@@ -0,0 +1,249 @@
+"""
+Tests for daemon.py (WatcherDaemon used by the `serve` command).
+
+Tests cover:
+- Startup loading and scheduling (run_on_start, cron next fire time)
+- Due runs started by tick(), with the per-config memo passed to run_all
+- Runs of the same config never overlap
+- Hot reload on file change, and keeping the previous config on a bad reload
+- Extraction memo kept warm across reloads
+- serve() loop shutdown waiting for in-flight runs
+"""
+
+import asyncio
+import os
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+
+from llm_answer_watcher.daemon import WatcherDaemon
+from llm_answer_watcher.exceptions import ConfigurationError
+
+NOW = datetime(2025, 11, 3, 10, 0, 30, tzinfo=UTC)
+
+RUN_SUMMARY = {
+    "run_id": "2025-11-03T11-00-00Z",
+    "timestamp_utc": "2025-11-03T11:00:00Z",
+    "output_dir": "./output/2025-11-03T11-00-00Z",
+    "total_queries": 1,
+    "success_count": 1,
+    "error_count": 0,
+    "total_cost_usd": 0.001,
+    "errors": [],
+}
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+
+
+def _write_config(path, tmp_path, schedule=None, extraction_cache=None):
+    run_settings = {
+        "output_dir": str(tmp_path / "output"),
+        "sqlite_db_path": str(tmp_path / "watcher.db"),
+        "models": [
+            {"provider": "openai", "model_name": "gpt-4o-mini", "env_api_key": "OPENAI_API_KEY"}
+        ],
+    }
+    if schedule is not None:
+        run_settings["schedule"] = schedule
+    if extraction_cache is not None:
+        run_settings["extraction_cache"] = extraction_cache
+
+    config = {
+        "run_settings": run_settings,
+        "brands": {"mine": ["Warmly"], "competitors": ["HubSpot"]},
+        "intents": [{"id": "best-tools", "prompt": "What are the best sales tools?"}],
+    }
+    previous = path.stat().st_mtime_ns if path.exists() else None
+    path.write_text(yaml.dump(config))
+    if previous is not None:
+        # Guarantee a new mtime even on filesystems with coarse timestamps
+        os.utime(path, ns=(previous + 1_000_000_000, previous + 1_000_000_000))
+    return path
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    return _write_config(tmp_path / "hourly.yaml", tmp_path, schedule={"cron": "0 * * * *"})
+
+
+def _daemon(*paths):
+    return WatcherDaemon(paths, write_reports=False, clock=lambda: NOW)
+
+
+class TestLoading:
+    """Tests for load_all()."""
+
+    def test_next_run_from_cron(self, config_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+
+        entry = daemon.watched[config_path.resolve()]
+        assert entry.next_run_at == datetime(2025, 11, 3, 11, 0, tzinfo=UTC)
+
+    def test_run_on_start(self, tmp_path):
+        path = _write_config(
+            tmp_path / "c.yaml", tmp_path, schedule={"cron": "@daily", "run_on_start": True}
+        )
+        daemon = _daemon(path)
+        daemon.load_all()
+
+        assert daemon.watched[path.resolve()].next_run_at == NOW
+
+    def test_requires_a_schedule(self, tmp_path):
+        daemon = _daemon(_write_config(tmp_path / "c.yaml", tmp_path))
+
+        with pytest.raises(ConfigurationError, match="schedule"):
+            daemon.load_all()
+
+    def test_duplicate_paths_watched_once(self, config_path):
+        assert len(_daemon(config_path, str(config_path)).watched) == 1
+
+
+@pytest.mark.asyncio
+class TestTick:
+    """Tests for tick() scheduling and overlap protection."""
+
+    async def test_due_run_started_with_memo(self, tmp_path):
+        path = _write_config(
+            tmp_path / "c.yaml",
+            tmp_path,
+            schedule={"cron": "0 * * * *", "run_on_start": True},
+            extraction_cache={"persist": False},
+        )
+        daemon = _daemon(path)
+        daemon.load_all()
+        entry = daemon.watched[path.resolve()]
+
+        with patch(
+            "llm_answer_watcher.daemon.run_all", new=AsyncMock(return_value=RUN_SUMMARY)
+        ) as run:
+            assert await daemon.tick(NOW) == [path.resolve()]
+            await entry.task
+            assert await daemon.tick(NOW) == []
+
+        assert run.await_args.kwargs["memo"] is entry.memo
+        assert entry.memo is not None
+        assert entry.last_run_id == RUN_SUMMARY["run_id"]
+        assert entry.next_run_at == datetime(2025, 11, 3, 11, 0, tzinfo=UTC)
+
+    async def test_runs_never_overlap(self, config_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+        entry = daemon.watched[config_path.resolve()]
+        release = asyncio.Event()
+
+        async def slow_run(*args, **kwargs):
+            await release.wait()
+            return RUN_SUMMARY
+
+        with patch("llm_answer_watcher.daemon.run_all", new=AsyncMock(side_effect=slow_run)) as run:
+            await daemon.tick(datetime(2025, 11, 3, 11, 0, 5, tzinfo=UTC))
+            await asyncio.sleep(0)
+            await daemon.tick(datetime(2025, 11, 3, 12, 0, 5, tzinfo=UTC))
+            release.set()
+            await entry.task
+
+        assert run.await_count == 1
+        assert entry.overlaps_skipped == 1
+        assert entry.next_run_at == datetime(2025, 11, 3, 13, 0, tzinfo=UTC)
+
+    async def test_failed_run_recorded(self, config_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+        entry = daemon.watched[config_path.resolve()]
+
+        with patch(
+            "llm_answer_watcher.daemon.run_all", new=AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            await daemon.tick(datetime(2025, 11, 3, 11, 0, tzinfo=UTC))
+            await entry.task
+
+        assert entry.runs_failed == 1
+        assert entry.last_error == "boom"
+
+
+class TestHotReload:
+    """Tests for reload_changed()."""
+
+    def test_changed_schedule_applied(self, config_path, tmp_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+
+        _write_config(config_path, tmp_path, schedule={"cron": "30 * * * *"})
+
+        assert daemon.reload_changed() == [config_path.resolve()]
+        entry = daemon.watched[config_path.resolve()]
+        assert entry.reloads == 1
+        assert entry.next_run_at == datetime(2025, 11, 3, 10, 30, tzinfo=UTC)
+
+    def test_unchanged_file_not_reloaded(self, config_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+
+        with patch("llm_answer_watcher.daemon.load_config") as load:
+            assert daemon.reload_changed() == []
+        load.assert_not_called()
+
+    def test_invalid_reload_keeps_previous_config(self, config_path):
+        daemon = _daemon(config_path)
+        daemon.load_all()
+        entry = daemon.watched[config_path.resolve()]
+        previous = entry.config
+
+        config_path.write_text("run_settings: [not valid")
+        os.utime(config_path, ns=(entry.signature[0] + 10**9, entry.signature[0] + 10**9))
+
+        assert daemon.reload_changed() == []
+        assert entry.config is previous
+        assert entry.last_error.startswith("Reload failed")
+
+    def test_memo_kept_across_reload(self, tmp_path):
+        path = tmp_path / "c.yaml"
+        cache = {"persist": False}
+        _write_config(path, tmp_path, schedule={"cron": "0 * * * *"}, extraction_cache=cache)
+        daemon = _daemon(path)
+        daemon.load_all()
+        entry = daemon.watched[path.resolve()]
+        memo = entry.memo
+
+        _write_config(path, tmp_path, schedule={"cron": "15 * * * *"}, extraction_cache=cache)
+        daemon.reload_changed()
+        assert entry.memo is memo
+
+        _write_config(
+            path,
+            tmp_path,
+            schedule={"cron": "15 * * * *"},
+            extraction_cache={"persist": False, "max_memory_entries": 8},
+        )
+        daemon.reload_changed()
+        assert entry.memo is not memo
+        assert entry.memo.max_memory_entries == 8
+
+
+@pytest.mark.asyncio
+async def test_serve_stops_after_in_flight_run(tmp_path):
+    path = _write_config(
+        tmp_path / "c.yaml", tmp_path, schedule={"cron": "@daily", "run_on_start": True}
+    )
+    daemon = WatcherDaemon([path], poll_interval=0.01, write_reports=False)
+    daemon.load_all()
+    stop_event = asyncio.Event()
+
+    async def run_then_stop(*args, **kwargs):
+        stop_event.set()
+        await asyncio.sleep(0.05)
+        return RUN_SUMMARY
+
+    with patch("llm_answer_watcher.daemon.run_all", new=AsyncMock(side_effect=run_then_stop)):
+        await asyncio.wait_for(daemon.serve(stop_event), timeout=5)
+
+    status = daemon.status()[0]
+    assert status["runs_started"] == 1
+    assert status["running"] is False
+    assert status["last_run_id"] == RUN_SUMMARY["run_id"]
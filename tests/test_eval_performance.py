@@ -0,0 +1,190 @@
+"""
+Tests for extraction performance metrics (llm_answer_watcher.evals.performance).
+
+Tests cover:
+- measure_extraction_performance() latency and allocation metrics
+- Performance metrics attached by evaluate_single_test_case()
+- Parallel suites time cases serially in the parent process
+- p95 latency thresholds in check_evaluation_thresholds()
+- Storage, cache round-trip and trends of performance metrics
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from llm_answer_watcher.evals import runner
+from llm_answer_watcher.evals.performance import (
+    EXTRACTION_P95_METRIC,
+    measure_extraction_performance,
+)
+from llm_answer_watcher.evals.runner import (
+    check_evaluation_thresholds,
+    evaluate_single_test_case,
+    load_test_cases,
+    run_eval_suite,
+    write_eval_results,
+)
+from llm_answer_watcher.evals.schema import (
+    EvalMetricScore,
+    EvalPerformanceMetric,
+    EvalResult,
+    EvalTestCase,
+)
+from llm_answer_watcher.storage.eval_db import get_performance_trends
+
+FIXTURES_PATH = "llm_answer_watcher/evals/testcases/fixtures.yaml"
+
+
+@pytest.fixture
+def test_case():
+    return EvalTestCase(
+        description="Timed case",
+        intent_id="best_crm",
+        llm_answer_text="1. HubSpot\n2. Salesforce\n3. Pipedrive",
+        brands_mine=["HubSpot"],
+        brands_competitors=["Salesforce", "Pipedrive"],
+        expected_my_mentions=["HubSpot"],
+        expected_competitor_mentions=["Salesforce", "Pipedrive"],
+        expected_ranked_list=["HubSpot", "Salesforce", "Pipedrive"],
+    )
+
+
+def _timed_result(description, p95_ms):
+    return EvalResult(
+        test_description=description,
+        metrics=[EvalMetricScore(name="mention_precision", value=1.0, passed=True)],
+        overall_passed=True,
+        performance=[EvalPerformanceMetric(name=EXTRACTION_P95_METRIC, value=p95_ms, unit="ms")],
+    )
+
+
+def test_measure_extraction_performance_metrics(test_case):
+    metrics = {m.name: m for m in measure_extraction_performance(test_case, 5)}
+
+    assert set(metrics) == {
+        "perf_detect_mentions_p50_ms",
+        "perf_detect_mentions_p95_ms",
+        "perf_detect_mentions_peak_alloc_kib",
+        "perf_rank_extraction_p50_ms",
+        "perf_rank_extraction_p95_ms",
+        "perf_rank_extraction_peak_alloc_kib",
+        EXTRACTION_P95_METRIC,
+    }
+    detect_p50 = metrics["perf_detect_mentions_p50_ms"]
+    detect_p95 = metrics["perf_detect_mentions_p95_ms"]
+    assert detect_p50.unit == "ms"
+    assert detect_p50.details["iterations"] == 5
+    assert 0 < detect_p50.value <= detect_p95.value <= detect_p95.details["max_ms"]
+    assert metrics["perf_detect_mentions_peak_alloc_kib"].unit == "KiB"
+    assert metrics[EXTRACTION_P95_METRIC].value > 0
+
+
+def test_measure_extraction_performance_rejects_zero_iterations(test_case):
+    with pytest.raises(ValueError, match="iterations"):
+        measure_extraction_performance(test_case, 0)
+
+
+def test_evaluate_single_test_case_timing_is_opt_in(test_case):
+    assert evaluate_single_test_case(test_case).performance == []
+
+    result = evaluate_single_test_case(test_case, timing_iterations=3)
+    gated = next(m for m in result.performance if m.name == EXTRACTION_P95_METRIC)
+    assert gated.passed is True
+    # Accuracy metrics are unaffected by timing
+    assert all(not m.name.startswith("perf_") for m in result.metrics)
+
+
+def test_parallel_suite_times_cases_in_parent_process(monkeypatch):
+    timed_in = []
+
+    def fake_measure(test_case, iterations):
+        timed_in.append(os.getpid())
+        return [EvalPerformanceMetric(name=EXTRACTION_P95_METRIC, value=1.0, unit="ms")]
+
+    monkeypatch.setattr(runner, "measure_extraction_performance", fake_measure)
+
+    output = run_eval_suite(FIXTURES_PATH, workers=2, timing_iterations=3)
+
+    # Pool workers only score quality; every case is timed here, uncontended
+    assert timed_in == [os.getpid()] * output["total_test_cases"]
+    assert all(r.performance for r in output["results"] if r.metrics)
+
+
+def test_latency_threshold_violation_fails_suite(monkeypatch):
+    monkeypatch.setitem(runner.PERFORMANCE_THRESHOLDS_MS, EXTRACTION_P95_METRIC, 10.0)
+    results = [_timed_result(f"case {i}", 1.0) for i in range(19)]
+    results.append(_timed_result("slow case", 500.0))
+    results.append(_timed_result("slower case", 900.0))
+
+    check = check_evaluation_thresholds(results)
+
+    summary = check["performance_summary"][EXTRACTION_P95_METRIC]
+    assert summary["passes"] is False
+    assert summary["max"] == 900.0
+    assert check["passes_thresholds"] is False
+    assert check["critical_violations"] == 1
+    violation = check["threshold_violations"][-1]
+    assert violation["metric"] == EXTRACTION_P95_METRIC
+    assert violation["direction"] == "above"
+
+
+def test_single_slow_outlier_within_p95_passes(monkeypatch):
+    monkeypatch.setitem(runner.PERFORMANCE_THRESHOLDS_MS, EXTRACTION_P95_METRIC, 10.0)
+    results = [_timed_result(f"case {i}", 1.0) for i in range(39)]
+    results.append(_timed_result("one slow case", 500.0))
+
+    check = check_evaluation_thresholds(results)
+
+    assert check["performance_summary"][EXTRACTION_P95_METRIC]["passes"] is True
+    assert check["passes_thresholds"] is True
+
+
+def test_untimed_results_have_no_performance_summary():
+    results = [
+        EvalResult(
+            test_description="untimed",
+            metrics=[EvalMetricScore(name="mention_precision", value=1.0, passed=True)],
+            overall_passed=True,
+        )
+    ]
+
+    assert check_evaluation_thresholds(results)["performance_summary"] == {}
+
+
+def test_performance_metrics_stored_cached_and_trended(tmp_path):
+    db_path = tmp_path / "eval_results.db"
+    first = run_eval_suite(FIXTURES_PATH, timing_iterations=2)
+    write_eval_results("2025-11-02T13-00-00Z", first["results"], str(db_path))
+
+    second = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path, timing_iterations=2)
+
+    assert second["summary"]["cache_hits"] == len(load_test_cases(FIXTURES_PATH))
+    cached_perf = second["results"][0].performance
+    assert [m.name for m in cached_perf] == [m.name for m in first["results"][0].performance]
+    assert {m.unit for m in cached_perf} == {"ms", "KiB"}
+    assert all(m.details is None or "unit" not in m.details for m in cached_perf)
+    assert EXTRACTION_P95_METRIC in second["threshold_check"]["performance_summary"]
+
+    with sqlite3.connect(str(db_path)) as conn:
+        trends = get_performance_trends(conn, days=30)
+
+    assert EXTRACTION_P95_METRIC in trends
+    assert "mention_precision" not in trends
+    point = trends[EXTRACTION_P95_METRIC][0]
+    assert point["count"] == len(first["results"])
+    assert point["min_value"] <= point["avg_value"] <= point["max_value"]
+
+
+def test_untimed_cached_results_are_re_evaluated_when_timing(tmp_path):
+    db_path = tmp_path / "eval_results.db"
+    untimed = run_eval_suite(FIXTURES_PATH, timing_iterations=0)
+    write_eval_results("2025-11-02T13-00-00Z", untimed["results"], str(db_path))
+
+    reused = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path, timing_iterations=0)
+    assert reused["summary"]["cache_hits"] == len(untimed["results"])
+
+    timed = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path, timing_iterations=2)
+    assert timed["summary"]["cache_hits"] == 0
+    assert all(r.performance for r in timed["results"])
@@ -6,6 +6,7 @@ Tests cover all runner functions with various scenarios:
 - evaluate_single_test_case() - Single test case evaluation
 - run_eval_suite() - Complete evaluation orchestration
 - write_eval_results() - Results database storage
+- Parallel evaluation and reuse of stored results for unchanged cases
 """
 
 import tempfile
@@ -14,7 +15,9 @@ from pathlib import Path
 import pytest
 import yaml
 
+from llm_answer_watcher.evals import runner
 from llm_answer_watcher.evals.runner import (
+    compute_case_hash,
     evaluate_single_test_case,
     load_test_cases,
     run_eval_suite,
@@ -623,3 +626,106 @@ class TestWriteEvalResults:
 
             # Should have written all 8 test cases
             # (We could query the database here to verify, but that's tested in eval_db tests)
+
+
+FIXTURES_PATH = "llm_answer_watcher/evals/testcases/fixtures.yaml"
+
+
+def _result_signature(results):
+    """Comparable view of EvalResult objects (descriptions, pass flags, metric values)."""
+    return [
+        (
+            r.test_description,
+            r.overall_passed,
+            [(m.name, m.value, m.passed) for m in r.metrics],
+        )
+        for r in results
+    ]
+
+
+class TestParallelAndCachedEval:
+    """Test cases for parallel execution and result reuse in run_eval_suite()."""
+
+    def test_case_hash_changes_with_content_and_code_version(self):
+        """Case hash depends on both the test case and the extractor code version."""
+        case = load_test_cases(FIXTURES_PATH)[0]
+        edited = case.model_copy(update={"llm_answer_text": case.llm_answer_text + "!"})
+
+        assert compute_case_hash(case) == compute_case_hash(case)
+        assert compute_case_hash(case) != compute_case_hash(edited)
+        assert compute_case_hash(case, "v1") != compute_case_hash(case, "v2")
+
+    def test_parallel_results_match_sequential_order(self):
+        """Process pool evaluation returns the same results in fixture order."""
+        sequential = run_eval_suite(FIXTURES_PATH)
+        parallel = run_eval_suite(FIXTURES_PATH, workers=2)
+
+        assert _result_signature(parallel["results"]) == _result_signature(
+            sequential["results"]
+        )
+        assert parallel["summary"]["workers"] == 2
+        assert parallel["summary"]["wall_time_seconds"] > 0
+
+    def test_negative_workers_rejected(self):
+        """Negative worker counts are rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            run_eval_suite(FIXTURES_PATH, workers=-1)
+
+    def test_missing_cache_database_evaluates_everything(self, tmp_path):
+        """A cache path that doesn't exist yet is treated as an empty cache."""
+        results = run_eval_suite(FIXTURES_PATH, cache_db_path=tmp_path / "missing.db")
+
+        assert results["summary"]["cache_hits"] == 0
+        assert results["summary"]["cache_hit_rate"] == 0.0
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_stored_results_are_reused(self, tmp_path, monkeypatch):
+        """Cases with stored results are not re-evaluated on the next run."""
+        db_path = tmp_path / "eval_results.db"
+        first = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path)
+        write_eval_results("2025-11-02T13-00-00Z", first["results"], str(db_path))
+
+        def fail_if_called(test_case):
+            raise AssertionError(f"re-evaluated cached case: {test_case.description}")
+
+        monkeypatch.setattr(runner, "evaluate_single_test_case", fail_if_called)
+        second = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path)
+
+        assert second["summary"]["cache_hits"] == first["total_test_cases"]
+        assert second["summary"]["cache_hit_rate"] == 1.0
+        assert _result_signature(second["results"]) == _result_signature(
+            first["results"]
+        )
+        assert second["summary"]["pass_rate"] == first["summary"]["pass_rate"]
+
+    def test_changed_code_version_invalidates_cache(self, tmp_path, monkeypatch):
+        """Stored results are ignored once the extractor code version changes."""
+        db_path = tmp_path / "eval_results.db"
+        first = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path)
+        write_eval_results("2025-11-02T13-00-00Z", first["results"], str(db_path))
+
+        monkeypatch.setattr(runner, "extractor_code_version", lambda: "edited-extractor")
+        second = run_eval_suite(FIXTURES_PATH, cache_db_path=db_path)
+
+        assert second["summary"]["cache_hits"] == 0
+
+    def test_only_changed_cases_are_evaluated(self, tmp_path):
+        """Editing one case re-evaluates it while the rest come from the cache."""
+        db_path = tmp_path / "eval_results.db"
+        fixtures = yaml.safe_load(Path(FIXTURES_PATH).read_text(encoding="utf-8"))
+        fixtures_path = tmp_path / "fixtures.yaml"
+        fixtures_path.write_text(yaml.safe_dump(fixtures), encoding="utf-8")
+
+        first = run_eval_suite(fixtures_path, cache_db_path=db_path)
+        write_eval_results("2025-11-02T13-00-00Z", first["results"], str(db_path))
+
+        fixtures["test_cases"][0]["llm_answer_text"] += " Also consider Lemwarm."
+        fixtures_path.write_text(yaml.safe_dump(fixtures), encoding="utf-8")
+        second = run_eval_suite(fixtures_path, workers=2, cache_db_path=db_path)
+
+        total = first["total_test_cases"]
+        assert second["summary"]["cache_hits"] == total - 1
+        assert second["results"][0].case_hash != first["results"][0].case_hash
+        assert [r.test_description for r in second["results"]] == [
+            r.test_description for r in first["results"]
+        ]
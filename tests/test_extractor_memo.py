@@ -0,0 +1,260 @@
+"""
+Tests for extractor/memo.py module.
+
+Tests cover:
+- Memo key components (answer hash, brands and settings fingerprints)
+- API keys excluded from the settings fingerprint
+- parse_answer() memo hits (metadata replaced, zero cost, cost saved reported)
+- Function-calling results memoized; regex fallbacks not memoized
+- In-memory LRU eviction
+- SQLite persistence across memo instances, TTL, and pruning
+"""
+
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    ExtractionCacheConfig,
+    RuntimeExtractionModel,
+    RuntimeExtractionSettings,
+)
+from llm_answer_watcher.extractor.function_extractor import FunctionExtractionResult
+from llm_answer_watcher.extractor.memo import ExtractionMemo, compute_memo_key
+from llm_answer_watcher.extractor.parser import parse_answer
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+ANSWER = "Top tools:\n1. Warmly\n2. HubSpot\n3. Instantly"
+
+
+@pytest.fixture
+def brands():
+    return Brands(mine=["Warmly"], competitors=["HubSpot", "Instantly"])
+
+
+@pytest.fixture
+def function_settings():
+    return RuntimeExtractionSettings(
+        extraction_model=RuntimeExtractionModel(
+            provider="openai", model_name="gpt-5-nano", api_key="sk-test-key"
+        ),
+        method="function_calling",
+        fallback_to_regex=True,
+        min_confidence=0.0,
+        enable_sentiment_analysis=False,
+        enable_intent_classification=False,
+    )
+
+
+@pytest.fixture
+def function_result():
+    return FunctionExtractionResult(
+        brands_mentioned=[
+            {"name": "Warmly", "rank": 1, "confidence": "high"},
+            {"name": "HubSpot", "rank": 2, "confidence": "medium"},
+        ],
+        extraction_notes=None,
+        confidence_scores={"Warmly": "high", "HubSpot": "medium"},
+        method="function_calling",
+        fallback_used=False,
+        raw_function_call={},
+        extraction_cost_usd=0.0002,
+    )
+
+
+async def _parse(brands, memo, intent_id="best-tools", settings=None, answer=ANSWER):
+    return await parse_answer(
+        answer_text=answer,
+        brands=brands,
+        intent_id=intent_id,
+        provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc="2025-11-02T08:00:00Z",
+        extraction_settings=settings,
+        memo=memo,
+    )
+
+
+# ============================================================================
+# Memo Keys
+# ============================================================================
+
+
+def test_key_changes_with_answer_brands_and_settings(brands, function_settings):
+    base = compute_memo_key(ANSWER, brands)
+
+    assert compute_memo_key(ANSWER, brands) == base
+    assert compute_memo_key(ANSWER + "!", brands).digest != base.digest
+    assert (
+        compute_memo_key(ANSWER, Brands(mine=["Warmly"], competitors=["HubSpot"])).digest
+        != base.digest
+    )
+    assert compute_memo_key(ANSWER, brands, function_settings).digest != base.digest
+    assert compute_memo_key(ANSWER, brands, use_llm_extraction=True).digest != base.digest
+
+
+def test_api_key_not_part_of_fingerprint(brands, function_settings):
+    rotated = function_settings.model_copy(
+        update={
+            "extraction_model": function_settings.extraction_model.model_copy(
+                update={"api_key": "sk-other-key"}
+            )
+        }
+    )
+
+    assert (
+        compute_memo_key(ANSWER, brands, function_settings).settings_fingerprint
+        == compute_memo_key(ANSWER, brands, rotated).settings_fingerprint
+    )
+
+
+# ============================================================================
+# parse_answer Integration
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_regex_result_memoized(brands):
+    memo = ExtractionMemo()
+
+    first = await _parse(brands, memo)
+    second = await _parse(brands, memo, intent_id="other-intent")
+
+    assert first.from_cache is False
+    assert second.from_cache is True
+    assert second.intent_id == "other-intent"
+    assert second.ranked_list == first.ranked_list
+    assert second.my_mentions == first.my_mentions
+    assert memo.stats() == {"hits": 1, "misses": 1, "cost_saved_usd": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_stats_since_snapshot(brands):
+    memo = ExtractionMemo()
+    await _parse(brands, memo)
+    baseline = memo.stats()
+
+    await _parse(brands, memo)
+
+    assert memo.stats(since=baseline) == {"hits": 1, "misses": 0, "cost_saved_usd": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_brand_change_invalidates(brands):
+    memo = ExtractionMemo()
+
+    await _parse(brands, memo)
+    result = await _parse(Brands(mine=["Instantly"], competitors=["HubSpot"]), memo)
+
+    assert result.from_cache is False
+    assert result.appeared_mine is True
+    assert result.my_mentions[0].normalized_name == "Instantly"
+
+
+@pytest.mark.asyncio
+async def test_function_calling_cost_saved(brands, function_settings, function_result):
+    memo = ExtractionMemo()
+
+    with patch(
+        "llm_answer_watcher.extractor.function_extractor.extract_with_function_calling",
+        new=AsyncMock(return_value=function_result),
+    ) as mock_extract:
+        first = await _parse(brands, memo, settings=function_settings)
+        second = await _parse(brands, memo, settings=function_settings)
+
+    assert mock_extract.await_count == 1
+    assert first.extraction_cost_usd == 0.0002
+    assert second.extraction_cost_usd == 0.0
+    assert second.extraction_cost_saved_usd == 0.0002
+    assert second.rank_extraction_method == "function_calling"
+    assert memo.cost_saved_usd == pytest.approx(0.0002)
+
+
+@pytest.mark.asyncio
+async def test_regex_fallback_not_memoized(brands, function_settings):
+    memo = ExtractionMemo()
+
+    with patch(
+        "llm_answer_watcher.extractor.function_extractor.extract_with_function_calling",
+        new=AsyncMock(side_effect=RuntimeError("API down")),
+    ):
+        await _parse(brands, memo, settings=function_settings)
+        result = await _parse(brands, memo, settings=function_settings)
+
+    assert result.from_cache is False
+    assert memo.hits == 0
+
+
+# ============================================================================
+# Eviction and Persistence
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_memory_lru_eviction(brands):
+    memo = ExtractionMemo(max_memory_entries=2)
+
+    for answer in ("1. Warmly", "1. HubSpot", "1. Instantly"):
+        await _parse(brands, memo, answer=answer)
+
+    assert (await _parse(brands, memo, answer="1. Warmly")).from_cache is False
+    assert (await _parse(brands, memo, answer="1. Instantly")).from_cache is True
+
+
+@pytest.mark.asyncio
+async def test_sqlite_tier_shared_across_instances(tmp_path, brands):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+
+    await _parse(brands, ExtractionMemo(db_path=db_path))
+    fresh = ExtractionMemo(db_path=db_path)
+    result = await _parse(brands, fresh)
+
+    assert result.from_cache is True
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT hit_count FROM extraction_cache").fetchone()[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_ttl_expiry(tmp_path, brands):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    await _parse(brands, ExtractionMemo(db_path=db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE extraction_cache SET cached_at = '2020-01-01T00:00:00Z'")
+        conn.commit()
+
+    result = await _parse(brands, ExtractionMemo(db_path=db_path, ttl_days=30))
+
+    assert result.from_cache is False
+
+
+@pytest.mark.asyncio
+async def test_prune_applies_max_db_entries(tmp_path, brands):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    memo = ExtractionMemo(db_path=db_path, max_db_entries=2)
+
+    for answer in ("1. Warmly", "1. HubSpot", "1. Instantly"):
+        await _parse(brands, memo, answer=answer)
+
+    assert memo.prune() == 1
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0] == 2
+
+
+def test_from_config_without_persistence():
+    memo = ExtractionMemo.from_config(
+        ExtractionCacheConfig(persist=False, max_memory_entries=8), "./unused.db"
+    )
+
+    assert memo.db_path is None
+    assert memo.max_memory_entries == 8
+
+
+def test_config_rejects_non_positive_limits():
+    with pytest.raises(ValueError):
+        ExtractionCacheConfig(max_memory_entries=0)
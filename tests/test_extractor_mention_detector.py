@@ -159,6 +159,11 @@ class TestCreateBrandPattern:
         match = pattern.search("I use HUBSPOT daily")
         assert match.group(0) == "HUBSPOT"  # Preserves uppercase from text
 
+    def test_create_brand_pattern_cached(self):
+        """Test that patterns are compiled once per alias and reused."""
+        assert create_brand_pattern("HubSpot") is create_brand_pattern("HubSpot")
+        assert create_brand_pattern("HubSpot") is not create_brand_pattern("Hubspot")
+
 
 class TestNormalizeBrandName:
     """Test suite for normalize_brand_name function."""
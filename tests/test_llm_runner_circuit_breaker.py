@@ -0,0 +1,343 @@
+"""
+Tests for llm_runner.circuit_breaker and circuit breaking in run_all().
+
+Tests cover:
+- Breaker state machine (closed -> open -> half-open -> closed/open)
+- Run-wide retry budget
+- retry_if_permitted stopping tenacity retries when the breaker opens or
+  the budget runs out, and leaving retries unchanged outside run_all
+- CircuitBreakerConfig and fallback validation
+- run_all() failing fast and rerouting to a fallback model, with breaker
+  state in run_meta
+- Half-open probes cancelled by a deadline releasing their slot
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    CircuitBreakerConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    BreakerRegistry,
+    CircuitBreaker,
+    RetryBudget,
+    RetryGuard,
+    retry_guard,
+    retry_if_permitted,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock=None, **settings) -> CircuitBreaker:
+    settings = {"window_size": 4, "min_calls": 2, "open_seconds": 30.0, **settings}
+    return CircuitBreaker(
+        "openai/gpt-4o", CircuitBreakerConfig(**settings), clock=clock or FakeClock()
+    )
+
+
+class TestCircuitBreaker:
+    """State transitions."""
+
+    def test_opens_at_failure_rate(self):
+        breaker = _breaker(failure_rate_threshold=0.5)
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.opened_count == 1
+        assert not breaker.allow_request()
+        assert breaker.rejected == 1
+
+    def test_needs_min_calls(self):
+        breaker = _breaker(min_calls=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_probe_success_closes(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        clock.now = 30.0
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # one probe at a time
+        breaker.record_success()
+
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["recent_calls"] == 0
+
+    def test_half_open_probe_failure_reopens(self):
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 31.0
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.opened_count == 2
+
+    def test_window_forgets_old_failures(self):
+        breaker = _breaker(window_size=4, min_calls=4, failure_rate_threshold=0.75)
+        breaker.record_failure()
+        breaker.record_failure()
+        for _ in range(4):
+            breaker.record_success()
+
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_registry_creates_breakers_per_model(self):
+        breakers = BreakerRegistry(CircuitBreakerConfig())
+
+        assert breakers.get("openai", "gpt-4o") is breakers.get("openai", "gpt-4o")
+        breakers.get("anthropic", "claude-3-5-haiku")
+        assert list(breakers.snapshot()) == ["anthropic/claude-3-5-haiku", "openai/gpt-4o"]
+
+
+def test_retry_budget():
+    budget = RetryBudget(limit=1)
+
+    assert budget.try_consume()
+    assert not budget.try_consume()
+    assert (budget.used, budget.denied) == (1, 1)
+    assert RetryBudget(limit=None).try_consume()
+
+
+class TestRetryIfPermitted:
+    """Tenacity integration."""
+
+    def _flaky(self, calls):
+        @retry(
+            stop=stop_after_attempt(3),
+            retry=retry_if_exception_type(httpx.ConnectError) & retry_if_permitted(3),
+            reraise=True,
+        )
+        def call():
+            calls.append(1)
+            raise httpx.ConnectError("connection refused")
+
+        return call
+
+    def test_without_guard_retries_unchanged(self):
+        calls = []
+        with pytest.raises(httpx.ConnectError):
+            self._flaky(calls)()
+        assert len(calls) == 3
+
+    def test_records_attempts_and_charges_budget(self):
+        calls = []
+        guard = RetryGuard(_breaker(min_calls=4), RetryBudget(limit=10))
+
+        with retry_guard(guard), pytest.raises(httpx.ConnectError):
+            self._flaky(calls)()
+
+        assert len(calls) == 3
+        assert guard.failures == 3
+        assert guard.budget.used == 2  # the final failure is not a retry
+
+    def test_exhausted_budget_stops_retries(self):
+        calls = []
+        guard = RetryGuard(_breaker(min_calls=4), RetryBudget(limit=0))
+
+        with retry_guard(guard), pytest.raises(httpx.ConnectError):
+            self._flaky(calls)()
+
+        assert len(calls) == 1
+        assert guard.budget.denied == 1
+
+    def test_open_breaker_stops_retries(self):
+        calls = []
+        guard = RetryGuard(_breaker(min_calls=2), RetryBudget(limit=10))
+
+        with retry_guard(guard), pytest.raises(httpx.ConnectError):
+            self._flaky(calls)()
+
+        assert len(calls) == 2
+        assert guard.breaker.state == OPEN
+
+
+class TestConfig:
+    """Configuration validation."""
+
+    def test_min_calls_within_window(self):
+        with pytest.raises(ValidationError, match="cannot exceed"):
+            CircuitBreakerConfig(window_size=3, min_calls=5)
+
+    def test_threshold_is_fraction(self):
+        with pytest.raises(ValidationError, match="failure_rate_threshold"):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+
+    def test_fallback_cannot_nest(self):
+        inner = ModelConfig(
+            provider="mistral",
+            model_name="mistral-small",
+            env_api_key="K",
+            fallback=ModelConfig(provider="openai", model_name="gpt-4o", env_api_key="K"),
+        )
+        with pytest.raises(ValidationError, match="own fallback"):
+            ModelConfig(
+                provider="openai", model_name="gpt-4o-mini", env_api_key="K", fallback=inner
+            )
+
+
+class FailingClient:
+    """Client whose provider is down (a non-retryable error per request)."""
+
+    async def generate_answer(self, prompt):
+        raise RuntimeError("503 Service Unavailable")
+
+
+def _config(tmp_path, fallback=None) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            max_concurrent_requests=1,
+            circuit_breaker=CircuitBreakerConfig(window_size=2, min_calls=2),
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"crm-{i}", prompt=f"Best CRM number {i}?") for i in range(4)],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="sk-test",
+                fallback=fallback,
+            )
+        ],
+    )
+
+
+def _build_client(provider, model_name, **kwargs):
+    if provider == "openai":
+        return FailingClient()
+    return MockLLMClient(default_response="1. Warmly\n2. HubSpot")
+
+
+@pytest.mark.asyncio
+async def test_run_all_fails_fast_once_circuit_opens(tmp_path):
+    config = _config(tmp_path)
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.build_client", side_effect=_build_client
+    ) as build_client:
+        result = await run_all(config)
+
+    # Two failures open the breaker; the remaining intents never reach the provider
+    assert build_client.call_count == 2
+    assert result["error_count"] == 4
+    assert "Circuit open for openai/gpt-4o-mini" in result["errors"][-1]["error_message"]
+
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        circuit = json.load(f)["circuit_breakers"]
+    assert circuit["models"]["openai/gpt-4o-mini"]["state"] == OPEN
+    assert circuit["models"]["openai/gpt-4o-mini"]["rejected"] == 2
+    assert [f["intent_id"] for f in circuit["fast_failed"]] == ["crm-2", "crm-3"]
+    assert circuit["retry_budget"]["limit"] == 20
+
+
+@pytest.mark.asyncio
+async def test_run_all_reroutes_to_fallback(tmp_path):
+    fallback = RuntimeModel(provider="anthropic", model_name="claude-3-5-haiku", api_key="sk-ant")
+    config = _config(tmp_path, fallback=fallback)
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", side_effect=_build_client):
+        result = await run_all(config)
+
+    assert (result["success_count"], result["error_count"]) == (2, 2)
+
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        circuit = json.load(f)["circuit_breakers"]
+    assert circuit["rerouted"] == [
+        {"intent_id": f"crm-{i}", "from": "openai/gpt-4o-mini", "to": "anthropic/claude-3-5-haiku"}
+        for i in (2, 3)
+    ]
+    assert circuit["models"]["anthropic/claude-3-5-haiku"]["state"] == CLOSED
+    assert circuit["fast_failed"] == []
+
+
+@pytest.mark.asyncio
+async def test_run_all_without_circuit_breaker(tmp_path):
+    config = _config(tmp_path)
+    config.run_settings.circuit_breaker = None
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.build_client", side_effect=_build_client
+    ) as build_client:
+        result = await run_all(config)
+
+    assert build_client.call_count == 4
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        assert "circuit_breakers" not in json.load(f)
+
+
+class StallingClient:
+    """Client that fails twice, then hangs until the unit deadline fires."""
+
+    calls = 0
+
+    async def generate_answer(self, prompt):
+        StallingClient.calls += 1
+        if StallingClient.calls <= 2:
+            raise RuntimeError("503 Service Unavailable")
+        await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+async def test_run_all_releases_probe_cancelled_by_deadline(tmp_path):
+    config = _config(tmp_path)
+    config.run_settings.circuit_breaker = CircuitBreakerConfig(
+        window_size=2, min_calls=2, open_seconds=0.0
+    )
+    config.models[0].timeout_seconds = 0.05
+    StallingClient.calls = 0
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=StallingClient()):
+        result = await run_all(config)
+
+    # Each timed-out probe reopens the breaker instead of holding the slot,
+    # so the next intent is probed rather than failed fast
+    assert StallingClient.calls == 4
+    assert [u["intent_id"] for u in result["timed_out"]] == ["crm-2", "crm-3"]
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        circuit = json.load(f)["circuit_breakers"]
+    assert circuit["fast_failed"] == []
+    assert circuit["models"]["openai/gpt-4o-mini"]["opened_count"] == 3
@@ -0,0 +1,288 @@
+"""
+Tests for llm_runner.deadline and deadlines in run_all().
+
+Tests cover:
+- Nested deadline scopes keep the earliest deadline
+- unit_deadline cancelling work with TimeoutError
+- Tenacity retries stopping when the next backoff would pass the deadline
+- run_all() marking units timed_out for the run deadline, a model's
+  timeout_seconds and units not started before the deadline, while
+  finished units are kept and timed-out units are reported to progress
+  callbacks as failed queries
+- Blocking runner threads serialized on a shared runner and finished
+  before the runner is closed, even when their unit timed out
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunnerConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.deadline import (
+    current_deadline,
+    deadline_scope,
+    expired,
+    remaining,
+    stop_before_deadline,
+    unit_deadline,
+)
+from llm_answer_watcher.llm_runner.intent_runner import IntentResult
+from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.runner import (
+    TIMEOUT_MODEL,
+    TIMEOUT_NOT_STARTED,
+    TIMEOUT_RUN_DEADLINE,
+    run_all,
+)
+from llm_answer_watcher.storage.layout import get_error_filename
+
+
+class TestDeadlineScope:
+    """Context-variable deadlines."""
+
+    def test_no_deadline_by_default(self):
+        assert current_deadline() is None
+        assert remaining() is None
+        assert not expired()
+
+    def test_inner_scope_cannot_extend_outer(self):
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(60.0) as inner:
+                assert inner == outer
+            with deadline_scope(0.5) as inner:
+                assert inner < outer
+            assert current_deadline() == outer
+        assert current_deadline() is None
+
+    def test_none_keeps_outer_deadline(self):
+        with deadline_scope(10.0) as outer, deadline_scope(None) as inner:
+            assert inner == outer
+
+    @pytest.mark.asyncio
+    async def test_unit_deadline_cancels_work(self):
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            async with unit_deadline(0.05):
+                await asyncio.sleep(5)
+        assert time.monotonic() - started < 1
+
+
+def test_retries_stop_before_deadline():
+    calls = []
+
+    @retry(
+        stop=stop_after_attempt(3) | stop_before_deadline(),
+        wait=wait_fixed(5),
+        retry=retry_if_exception_type(httpx.ConnectError),
+        reraise=True,
+    )
+    def call():
+        calls.append(1)
+        raise httpx.ConnectError("connection refused")
+
+    started = time.monotonic()
+    with deadline_scope(1.0), pytest.raises(httpx.ConnectError):
+        call()
+
+    assert len(calls) == 1
+    assert time.monotonic() - started < 1
+
+
+class SlowClient:
+    """Answers prompts containing "slow" after 5s, others immediately."""
+
+    async def generate_answer(self, prompt):
+        if "slow" in prompt:
+            await asyncio.sleep(5)
+        return LLMResponse(
+            answer_text="1. Warmly\n2. HubSpot",
+            tokens_used=10,
+            cost_usd=0.001,
+            provider="openai",
+            model_name="gpt-4o-mini",
+            timestamp_utc="2025-11-01T08:00:00Z",
+        )
+
+
+def _config(tmp_path, prompts, deadline_seconds=None, timeout_seconds=None) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            max_concurrent_requests=1,
+            deadline_seconds=deadline_seconds,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"q-{i}", prompt=prompt) for i, prompt in enumerate(prompts)],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="sk-test",
+                timeout_seconds=timeout_seconds,
+            )
+        ],
+    )
+
+
+class RecordingProgress:
+    """Progress callback recording complete_query() calls."""
+
+    def __init__(self):
+        self.completed = []
+
+    async def complete_query(self, query_key, success=True):
+        self.completed.append((query_key, success))
+
+
+async def _run(config):
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=SlowClient()):
+        started = time.monotonic()
+        result = await run_all(config)
+    return result, time.monotonic() - started
+
+
+@pytest.mark.asyncio
+async def test_run_deadline_times_out_pending_units(tmp_path):
+    config = _config(
+        tmp_path, ["fast question?", "slow question?", "other slow question?"], deadline_seconds=0.3
+    )
+
+    result, elapsed = await _run(config)
+
+    assert elapsed < 3
+    assert (result["success_count"], result["error_count"]) == (1, 0)
+    assert result["timed_out_count"] == 2
+    assert {unit["intent_id"] for unit in result["timed_out"]} == {"q-1", "q-2"}
+    assert {unit["reason"] for unit in result["timed_out"]} == {TIMEOUT_RUN_DEADLINE}
+
+    error_path = os.path.join(
+        result["output_dir"], get_error_filename("q-1", "openai", "gpt-4o-mini")
+    )
+    with open(error_path) as f:
+        assert "timed_out" in f.read()
+
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        run_meta = json.load(f)
+    assert run_meta["timed_out_count"] == 2
+    assert run_meta["deadline"]["deadline_seconds"] == 0.3
+
+
+@pytest.mark.asyncio
+async def test_timed_out_units_reported_to_progress(tmp_path):
+    config = _config(tmp_path, ["fast question?"] + ["slow question?"] * 4, deadline_seconds=0.3)
+    progress = RecordingProgress()
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=SlowClient()):
+        result = await run_all(config, progress_callback=progress)
+
+    # Every timed-out unit, started or not, counts as a failed query
+    assert result["timed_out_count"] == 4
+    assert len(progress.completed) == result["total_queries"] == 5
+    assert [success for _, success in progress.completed] == [True] + [False] * 4
+
+
+@pytest.mark.asyncio
+async def test_model_timeout_only_affects_slow_unit(tmp_path):
+    config = _config(tmp_path, ["slow question?", "fast question?"], timeout_seconds=0.1)
+
+    result, elapsed = await _run(config)
+
+    assert elapsed < 3
+    assert result["success_count"] == 1
+    assert result["timed_out"] == [
+        {
+            "intent_id": "q-0",
+            "model_provider": "openai",
+            "model_name": "gpt-4o-mini",
+            "reason": TIMEOUT_MODEL,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_units_after_deadline_are_not_started(tmp_path):
+    config = _config(tmp_path, ["slow question?"] * 8, deadline_seconds=0.2)
+
+    result, _ = await _run(config)
+
+    assert result["timed_out_count"] == 8
+    reasons = [unit["reason"] for unit in result["timed_out"]]
+    assert TIMEOUT_NOT_STARTED in reasons
+
+
+@pytest.mark.asyncio
+async def test_no_deadline_section_without_deadline(tmp_path):
+    config = _config(tmp_path, ["fast question?"])
+
+    result, _ = await _run(config)
+
+    assert result["timed_out_count"] == 0
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        assert "deadline" not in json.load(f)
+
+
+class BlockingRunner:
+    """Browser-style runner whose blocking run_intent tracks overlapping calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.active_at_close = None
+        self.lock = threading.Lock()
+
+    def run_intent(self, prompt):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.2)
+        with self.lock:
+            self.active -= 1
+        return IntentResult(
+            answer_text="1. Warmly",
+            runner_type="browser",
+            runner_name="fake-browser",
+            provider="chatgpt-web",
+            model_name="chatgpt-unknown",
+            timestamp_utc="2025-11-01T08:00:00Z",
+        )
+
+    def close(self):
+        self.active_at_close = self.active
+
+
+@pytest.mark.asyncio
+async def test_runner_threads_serialized_and_finished_before_close(tmp_path):
+    config = _config(tmp_path, ["q?"] * 3, deadline_seconds=0.3)
+    config.run_settings.max_concurrent_requests = 3
+    config.models = []
+    config.runner_configs = [RunnerConfig(runner_plugin="fake-browser", config={"k": "v"})]
+    runner = BlockingRunner()
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.RunnerRegistry.create_runner",
+        return_value=runner,
+    ):
+        result = await run_all(config)
+
+    # No session pool: one run_intent at a time on the shared runner
+    assert runner.max_active == 1
+    assert result["timed_out_count"] == 2
+    # The timed-out unit's thread finished before the runner was closed
+    assert runner.active_at_close == 0
@@ -0,0 +1,285 @@
+"""
+Tests for llm_runner.hedging and hedged requests in run_all().
+
+Tests cover:
+- Percentile thresholds and latency history from answers_raw
+- Hedge rate and extra-cost limits
+- HedgedLLMClient: fast answers are not hedged, a slow request is hedged
+  and the loser cancelled, failures fall through to the other request,
+  cancelling the caller cancels every in-flight request
+- run_all() charging hedge spend to RawAnswerRecord and reporting hedge
+  statistics in run_meta
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    HedgingConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.hedging import (
+    OUTCOME_HEDGE,
+    OUTCOME_PRIMARY,
+    HedgedLLMClient,
+    HedgePolicy,
+)
+from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.db import init_db_if_needed, insert_answer_raw, insert_run
+from llm_answer_watcher.storage.layout import get_raw_answer_filename
+
+MODEL = ("openai", "gpt-4o-mini")
+
+
+class ScriptedClient:
+    """Finishes call n after delays[n - 1] seconds; calls in fail_calls then raise."""
+
+    def __init__(self, delays, cost=0.001, fail_calls=()):
+        self.delays = list(delays)
+        self.cost = cost
+        self.fail_calls = set(fail_calls)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_answer(self, prompt):
+        self.calls += 1
+        call = self.calls
+        try:
+            await asyncio.sleep(self.delays[call - 1])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if call in self.fail_calls:
+            raise RuntimeError(f"call {call} failed")
+        return LLMResponse(
+            answer_text=f"1. Warmly (call {call})",
+            tokens_used=10,
+            cost_usd=self.cost,
+            provider=MODEL[0],
+            model_name=MODEL[1],
+            timestamp_utc="2025-11-01T08:00:00Z",
+        )
+
+
+def _policy(latencies=(0.01,) * 20, **settings) -> HedgePolicy:
+    settings = {"min_samples": 5, "max_hedge_rate": 1.0, **settings}
+    policy = HedgePolicy(HedgingConfig(**settings))
+    policy.state(*MODEL).latencies.extend(latencies)
+    return policy
+
+
+class TestHedgePolicy:
+    """Thresholds and limits."""
+
+    def test_no_threshold_without_enough_history(self):
+        policy = _policy(latencies=[1.0] * 4)
+        assert policy.hedge_delay(*MODEL) is None
+
+    def test_threshold_is_percentile(self):
+        policy = _policy(latencies=[float(i) for i in range(1, 21)], latency_percentile=50)
+        assert policy.hedge_delay(*MODEL) == pytest.approx(10.5)
+
+    def test_hedge_rate_limit(self):
+        policy = _policy(max_hedge_rate=0.25)
+        state = policy.state(*MODEL)
+
+        state.requests = 3
+        assert not policy.try_hedge(*MODEL)
+        state.requests = 4
+        assert policy.try_hedge(*MODEL)
+        assert not policy.try_hedge(*MODEL)
+
+    def test_extra_cost_cap(self):
+        policy = _policy(max_extra_cost_usd=0.01)
+        state = policy.state(*MODEL)
+        state.requests = 10
+        state.expected_cost_usd = 0.004
+        state.extra_cost_usd = 0.005
+
+        assert policy.try_hedge(*MODEL)
+        state.extra_cost_usd = 0.007
+        assert not policy.try_hedge(*MODEL)
+
+    def test_from_config_seeds_latencies(self, tmp_path):
+        config = _config(tmp_path)
+        db_path = config.run_settings.sqlite_db_path
+        init_db_if_needed(db_path)
+        with sqlite3.connect(db_path) as conn:
+            for day, latency in enumerate([3000, 1000, 2000], start=1):
+                run_id = f"2025-10-0{day}T08-00-00Z"
+                insert_run(conn, run_id, f"2025-10-0{day}T08:00:00Z", 1, 1)
+                insert_answer_raw(
+                    conn,
+                    run_id,
+                    "i",
+                    *MODEL,
+                    f"2025-10-0{day}T08:00:00Z",
+                    "?",
+                    "...",
+                    estimated_cost_usd=0.002,
+                    latency_ms=latency,
+                )
+            conn.commit()
+
+        state = HedgePolicy.from_config(config).state(*MODEL)
+
+        assert list(state.latencies) == [3.0, 1.0, 2.0]
+        assert state.expected_cost_usd == pytest.approx(0.002)
+
+    def test_config_validation(self):
+        with pytest.raises(ValidationError, match="cannot exceed"):
+            HedgingConfig(min_samples=50, latency_window=10)
+        with pytest.raises(ValidationError, match="between 0 and 100"):
+            HedgingConfig(latency_percentile=100)
+
+
+@pytest.mark.asyncio
+class TestHedgedLLMClient:
+    """Racing the original request against a hedge."""
+
+    async def test_fast_answer_not_hedged(self):
+        base = ScriptedClient([0.0])
+        client = HedgedLLMClient(base, _policy(), *MODEL)
+
+        response = await client.generate_answer("Best CRM?")
+
+        assert base.calls == 1
+        assert response.hedge_outcome is None
+        assert response.hedge_cost_usd == 0.0
+
+    async def test_slow_request_hedged_and_cancelled(self):
+        base = ScriptedClient([5.0, 0.0], cost=0.003)
+        policy = _policy()
+        client = HedgedLLMClient(base, policy, *MODEL)
+
+        response = await client.generate_answer("Best CRM?")
+
+        assert response.answer_text == "1. Warmly (call 2)"
+        assert response.hedge_outcome == OUTCOME_HEDGE
+        assert response.hedge_cost_usd == 0.003
+        await asyncio.sleep(0)
+        assert base.cancelled == 1
+        state = policy.state(*MODEL)
+        assert (state.requests, state.hedges, state.hedge_wins) == (1, 1, 1)
+
+    async def test_original_wins_race(self):
+        base = ScriptedClient([0.05, 5.0])
+        client = HedgedLLMClient(base, _policy(), *MODEL)
+
+        response = await client.generate_answer("Best CRM?")
+
+        assert response.answer_text == "1. Warmly (call 1)"
+        assert response.hedge_outcome == OUTCOME_PRIMARY
+
+    async def test_failed_original_falls_back_to_hedge(self):
+        base = ScriptedClient([0.05, 0.1], fail_calls={1})
+        client = HedgedLLMClient(base, _policy(), *MODEL)
+
+        response = await client.generate_answer("Best CRM?")
+
+        assert response.answer_text == "1. Warmly (call 2)"
+        assert response.hedge_outcome == OUTCOME_HEDGE
+
+    async def test_both_failing_raises_original_error(self):
+        base = ScriptedClient([0.1, 0.05], fail_calls={1, 2})
+        client = HedgedLLMClient(base, _policy(), *MODEL)
+
+        with pytest.raises(RuntimeError, match="call 1 failed"):
+            await client.generate_answer("Best CRM?")
+
+    async def test_cancelled_caller_cancels_primary_before_hedge(self):
+        base = ScriptedClient([5.0])
+        client = HedgedLLMClient(base, _policy(latencies=(1.0,) * 20), *MODEL)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await client.generate_answer("Best CRM?")
+
+        await asyncio.sleep(0)
+        assert (base.calls, base.cancelled) == (1, 1)
+
+    async def test_cancelled_caller_cancels_both_requests(self):
+        base = ScriptedClient([5.0, 5.0])
+        client = HedgedLLMClient(base, _policy(), *MODEL)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.1):
+                await client.generate_answer("Best CRM?")
+
+        await asyncio.sleep(0)
+        assert (base.calls, base.cancelled) == (2, 2)
+
+    async def test_rate_limit_prevents_hedge(self):
+        base = ScriptedClient([0.05])
+        client = HedgedLLMClient(base, _policy(max_hedge_rate=0.0), *MODEL)
+
+        response = await client.generate_answer("Best CRM?")
+
+        assert base.calls == 1
+        assert response.hedge_outcome is None
+
+
+def _config(tmp_path) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider=MODEL[0], model_name=MODEL[1], env_api_key="K")],
+            hedging=HedgingConfig(min_samples=3, max_hedge_rate=1.0),
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id="best-crm", prompt="What is the best CRM?")],
+        models=[RuntimeModel(provider=MODEL[0], model_name=MODEL[1], api_key="sk-test")],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_all_charges_hedge_spend(tmp_path):
+    config = _config(tmp_path)
+    base = ScriptedClient([5.0, 0.0], cost=0.002)
+
+    with (
+        patch.object(HedgePolicy, "hedge_delay", return_value=0.01),
+        patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=base),
+    ):
+        result = await run_all(config)
+
+    assert result["success_count"] == 1
+    assert result["total_cost_usd"] == pytest.approx(0.004)
+
+    with open(os.path.join(result["output_dir"], get_raw_answer_filename("best-crm", *MODEL))) as f:
+        raw = json.load(f)
+    assert raw["hedge_outcome"] == OUTCOME_HEDGE
+    assert raw["hedge_cost_usd"] == 0.002
+    assert raw["estimated_cost_usd"] == pytest.approx(0.004)
+
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        hedging = json.load(f)["hedging"]
+    assert hedging["models"]["openai/gpt-4o-mini"]["hedge_wins"] == 1
+    assert hedging["extra_cost_usd"] == 0.002
+
+
+@pytest.mark.asyncio
+async def test_run_all_without_hedging(tmp_path):
+    config = _config(tmp_path)
+    config.run_settings.hedging = None
+    base = ScriptedClient([0.0])
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=base):
+        result = await run_all(config)
+
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        assert "hedging" not in json.load(f)
+    assert base.calls == 1
@@ -0,0 +1,76 @@
+"""
+Tests for llm_runner/http_pool.py module.
+
+Tests cover:
+- Per-request clients outside connection_pool()
+- Shared client reuse inside connection_pool(), including nested pools and tasks
+- Provider clients sending requests through the shared pool
+"""
+
+import asyncio
+
+import pytest
+
+from llm_answer_watcher.llm_runner.http_pool import (
+    connection_pool,
+    pool_active,
+    pooled_client,
+)
+from llm_answer_watcher.llm_runner.openai_client import OPENAI_API_URL, OpenAIClient
+
+
+@pytest.mark.asyncio
+async def test_per_request_client_without_pool():
+    async with pooled_client() as first:
+        pass
+    async with pooled_client() as second:
+        pass
+
+    assert first is not second
+    assert first.is_closed
+    assert not pool_active()
+
+
+@pytest.mark.asyncio
+async def test_shared_client_inside_pool():
+    async with connection_pool() as pool:
+        async with connection_pool() as nested:
+            assert nested is pool
+
+        async def _get():
+            async with pooled_client() as client:
+                return client
+
+        clients = await asyncio.gather(_get(), _get())
+
+        assert all(client is pool for client in clients)
+        assert not pool.is_closed
+
+    assert pool.is_closed
+    assert not pool_active()
+
+
+@pytest.mark.asyncio
+async def test_provider_requests_use_pool(httpx_mock, monkeypatch):
+    # Keep cost estimation offline (fallback pricing)
+    monkeypatch.setattr("llm_answer_watcher.utils.pricing._fetch_remote_pricing", lambda: None)
+    body = {
+        "output": [
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": "1. Warmly"}],
+            }
+        ],
+        "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+    }
+    httpx_mock.add_response(url=OPENAI_API_URL, json=body)
+    httpx_mock.add_response(url=OPENAI_API_URL, json=body)
+    client = OpenAIClient("gpt-4o-mini", "sk-test", "You are a helpful assistant.")
+
+    async with connection_pool() as pool:
+        await client.generate_answer("Best tools?")
+        await client.generate_answer("Best tools?")
+
+        assert not pool.is_closed
+
+    assert len(httpx_mock.get_requests(url=OPENAI_API_URL)) == 2
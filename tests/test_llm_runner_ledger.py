@@ -0,0 +1,251 @@
+"""
+Tests for llm_runner.ledger and live budget enforcement in run_all().
+
+Tests cover:
+- Reservations refused once spend plus reservations would pass the limit
+- Charges replacing reservations, and settling releasing the remainder
+- Concurrent charges applied atomically
+- run_all() stopping scheduling when actual spend crosses max_per_run_usd,
+  recording unscheduled units as errors (and failed queries for progress
+  callbacks) and the stop reason in run_meta
+- Units that pay for an answer and then fail counting toward total_cost_usd
+"""
+
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    BudgetConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.ledger import CostLedger
+from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.layout import get_error_filename
+
+
+class TestCostLedger:
+    """Reservation and spend accounting."""
+
+    def test_reserve_within_limit(self):
+        ledger = CostLedger(limit_usd=1.0)
+
+        reservation = ledger.reserve(0.4, "a")
+
+        assert reservation is not None
+        assert ledger.reserved_usd == pytest.approx(0.4)
+        assert not ledger.stopped
+
+    def test_refuses_and_stops_when_limit_would_be_exceeded(self):
+        ledger = CostLedger(limit_usd=1.0)
+        ledger.reserve(0.6, "a")
+
+        assert ledger.reserve(0.5, "b") is None
+        assert ledger.stopped
+        assert "b" in ledger.stop_reason
+        # Stays stopped even for units that would fit
+        assert ledger.reserve(0.01, "c") is None
+        assert ledger.refused == 2
+        assert "b" in ledger.stop_reason
+
+    def test_charge_consumes_reservation_and_settle_releases_rest(self):
+        ledger = CostLedger(limit_usd=1.0)
+        reservation = ledger.reserve(0.3, "a")
+
+        reservation.charge(0.1)
+        assert ledger.spent_usd == pytest.approx(0.1)
+        assert ledger.reserved_usd == pytest.approx(0.2)
+
+        reservation.settle()
+        reservation.settle()
+        assert ledger.reserved_usd == 0.0
+        assert ledger.spent_usd == pytest.approx(0.1)
+
+    def test_charge_beyond_estimate_counts_in_full(self):
+        ledger = CostLedger(limit_usd=1.0)
+        reservation = ledger.reserve(0.1, "a")
+
+        reservation.charge(0.7)
+        reservation.settle()
+
+        assert ledger.spent_usd == pytest.approx(0.7)
+        assert ledger.reserved_usd == 0.0
+        assert ledger.reserve(0.4, "b") is None
+
+    def test_no_limit_only_tracks(self):
+        ledger = CostLedger(limit_usd=None)
+
+        assert ledger.reserve(1000.0, "a") is not None
+        ledger.spend(5.0)
+        assert ledger.snapshot()["spent_usd"] == 5.0
+
+    def test_concurrent_charges_are_atomic(self):
+        ledger = CostLedger(limit_usd=None)
+        reservations = [ledger.reserve(0.001, str(i)) for i in range(8)]
+
+        def work(reservation):
+            for _ in range(1000):
+                reservation.charge(0.000001)
+
+        threads = [threading.Thread(target=work, args=(r,)) for r in reservations]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ledger.spent_usd == pytest.approx(0.008)
+        assert ledger.reserved_usd == pytest.approx(0.0)
+
+
+class ExpensiveClient:
+    """Answers immediately, each answer costing far more than estimated."""
+
+    def __init__(self, cost):
+        self.cost = cost
+        self.calls = 0
+
+    async def generate_answer(self, prompt):
+        self.calls += 1
+        return LLMResponse(
+            answer_text="1. Warmly\n2. HubSpot",
+            tokens_used=10,
+            cost_usd=self.cost,
+            provider="openai",
+            model_name="gpt-4o-mini",
+            timestamp_utc="2025-11-01T08:00:00Z",
+        )
+
+
+class RecordingProgress:
+    """Progress callback recording complete_query() calls."""
+
+    def __init__(self):
+        self.completed = []
+
+    async def complete_query(self, query_key, success=True):
+        self.completed.append((query_key, success))
+
+
+def _config(tmp_path, budget=None) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            max_concurrent_requests=1,
+            budget=budget,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"q-{i}", prompt=f"Best CRM {i}?") for i in range(8)],
+        models=[RuntimeModel(provider="openai", model_name="gpt-4o-mini", api_key="sk-test")],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_all_stops_scheduling_when_spend_crosses_limit(tmp_path):
+    config = _config(tmp_path, BudgetConfig(max_per_run_usd=0.6))
+    client = ExpensiveClient(cost=0.25)
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+        result = await run_all(config)
+
+    assert result["stop_reason"] is not None
+    assert "max_per_run_usd" in result["stop_reason"]
+    assert client.calls < 8
+    assert result["success_count"] == client.calls
+    assert result["error_count"] == 8 - client.calls
+
+    refused = [e for e in result["errors"] if e["error_message"].startswith("Not run")]
+    assert len(refused) == 8 - client.calls
+    error_path = os.path.join(
+        result["output_dir"],
+        get_error_filename(refused[0]["intent_id"], "openai", "gpt-4o-mini"),
+    )
+    assert os.path.exists(error_path)
+
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        budget = json.load(f)["budget"]
+    assert budget["stopped_early"] is True
+    assert budget["refused_units"] == 8 - client.calls
+    assert budget["spent_usd"] == pytest.approx(0.25 * client.calls)
+    assert budget["reserved_usd"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_refused_units_reported_to_progress(tmp_path):
+    config = _config(tmp_path, BudgetConfig(max_per_run_usd=0.6))
+    client = ExpensiveClient(cost=0.25)
+    progress = RecordingProgress()
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+        await run_all(config, progress_callback=progress)
+
+    assert len(progress.completed) == 8
+    failed = [key for key, success in progress.completed if not success]
+    assert len(failed) == 8 - client.calls
+
+
+@pytest.mark.asyncio
+async def test_run_all_within_budget_runs_everything(tmp_path):
+    config = _config(tmp_path, BudgetConfig(max_per_run_usd=10.0))
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.build_client",
+        return_value=ExpensiveClient(cost=0.001),
+    ):
+        result = await run_all(config)
+
+    assert result["success_count"] == 8
+    assert result["stop_reason"] is None
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        assert json.load(f)["budget"]["stopped_early"] is False
+
+
+@pytest.mark.asyncio
+async def test_run_all_without_budget_has_no_ledger(tmp_path):
+    config = _config(tmp_path)
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.build_client",
+        return_value=ExpensiveClient(cost=0.25),
+    ):
+        result = await run_all(config)
+
+    assert result["success_count"] == 8
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        assert "budget" not in json.load(f)
+
+
+@pytest.mark.parametrize("budget", [None, BudgetConfig(max_per_run_usd=10.0)])
+@pytest.mark.asyncio
+async def test_units_failing_after_answer_count_their_spend(tmp_path, budget):
+    config = _config(tmp_path, budget)
+
+    with (
+        patch(
+            "llm_answer_watcher.llm_runner.runner.build_client",
+            return_value=ExpensiveClient(cost=0.25),
+        ),
+        patch(
+            "llm_answer_watcher.llm_runner.runner.parse_answer",
+            side_effect=RuntimeError("extraction failed"),
+        ),
+    ):
+        result = await run_all(config)
+
+    assert result["error_count"] == 8
+    assert result["total_cost_usd"] == pytest.approx(2.0)
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        run_meta = json.load(f)
+    assert run_meta["total_cost_usd"] == pytest.approx(2.0)
+    if budget is not None:
+        assert run_meta["budget"]["spent_usd"] == pytest.approx(2.0)
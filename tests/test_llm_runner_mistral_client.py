@@ -224,6 +224,70 @@ class TestGenerateAnswerSuccess:
         assert response.tokens_used == 50000
 
 
+class TestGenerateAnswers:
+    """Test suite for multi-sample requests with the native `n` parameter."""
+
+    @pytest.mark.asyncio
+    async def test_generate_answers_splits_usage(self, httpx_mock):
+        """Test that n choices become n responses and the prompt is billed once."""
+        httpx_mock.add_response(
+            method="POST",
+            url=MISTRAL_API_URL,
+            json={
+                "choices": [
+                    {"index": i, "message": {"role": "assistant", "content": f"Answer {i}"}}
+                    for i in range(3)
+                ],
+                "usage": {"prompt_tokens": 90, "completion_tokens": 301, "total_tokens": 391},
+            },
+        )
+
+        client = MistralClient(
+            "mistral-large-latest", "test-api-key", TEST_SYSTEM_PROMPT
+        )
+        responses = await client.generate_answers("Best CRM?", n=3)
+
+        import json
+
+        assert json.loads(httpx_mock.get_request().read())["n"] == 3
+        assert all(isinstance(r, LLMResponse) for r in responses)
+        assert [r.answer_text for r in responses] == ["Answer 0", "Answer 1", "Answer 2"]
+        assert [r.prompt_tokens for r in responses] == [90, 0, 0]
+        assert [r.completion_tokens for r in responses] == [101, 100, 100]
+        assert responses[0].cost_usd > responses[1].cost_usd > 0
+
+    @pytest.mark.asyncio
+    async def test_generate_answer_omits_n(self, httpx_mock):
+        """Test that single-answer requests do not send `n`."""
+        httpx_mock.add_response(
+            method="POST",
+            url=MISTRAL_API_URL,
+            json={
+                "choices": [{"message": {"role": "assistant", "content": "Test"}}],
+                "usage": {"total_tokens": 10},
+            },
+        )
+
+        client = MistralClient(
+            "mistral-large-latest", "test-api-key", TEST_SYSTEM_PROMPT
+        )
+        await client.generate_answer("Test")
+
+        import json
+
+        assert "n" not in json.loads(httpx_mock.get_request().read())
+
+    @pytest.mark.asyncio
+    async def test_generate_answers_rejects_invalid_n(self):
+        """Test that n must be positive."""
+        client = MistralClient(
+            "mistral-large-latest", "test-api-key", TEST_SYSTEM_PROMPT
+        )
+
+        with pytest.raises(ValueError, match="n must be at least 1"):
+            await client.generate_answers("Test", n=0)
+
+
 class TestGenerateAnswerValidation:
     """Test suite for input validation."""
 
@@ -0,0 +1,192 @@
+"""
+Tests for llm_runner/operation_executor.py template rendering and conditions.
+
+Tests cover:
+- render_template() with raw and precompiled templates
+- Operation chaining placeholders
+- evaluate_condition() for null, numeric, and contains conditions
+- Precompiled templates on RuntimeOperation built by the config loader
+- Microbenchmark: large responses and long operation chains
+"""
+
+import time
+
+import pytest
+
+from llm_answer_watcher.config.loader import resolve_operations
+from llm_answer_watcher.config.schema import Operation
+from llm_answer_watcher.config.templates import compile_condition, compile_template
+from llm_answer_watcher.llm_runner.operation_executor import (
+    OperationContext,
+    evaluate_condition,
+    render_template,
+)
+
+
+@pytest.fixture
+def context():
+    """Operation context with a ranked brand and one prior operation result."""
+    return OperationContext(
+        intent_data={
+            "id": "best-crm",
+            "prompt": "What is the best CRM?",
+            "response": "1. HubSpot 2. Warmly 3. Salesforce",
+        },
+        extraction_data={
+            "my_brand": "Warmly",
+            "my_brand_aliases": ["Warmly", "Warmly.ai"],
+            "competitors": ["HubSpot", "Salesforce"],
+            "competitors_mentioned": ["HubSpot", "Salesforce"],
+            "my_rank": 2,
+            "my_mentions": ["Warmly"],
+            "competitor_mentions": ["HubSpot", "Salesforce"],
+        },
+        run_metadata={"run_id": "2025-11-05T10-00-00Z", "timestamp": "2025-11-05T10:00:00Z"},
+        model_info={"provider": "openai", "name": "gpt-4o-mini"},
+        operation_results={"gap-analysis": "Write more comparison pages"},
+    )
+
+
+def _legacy_render(template: str, context: OperationContext) -> str:
+    """Chained str.replace rendering used before templates were precompiled."""
+    data = context.extraction_data
+    rank = data.get("my_rank")
+    replacements = {
+        "{brand:mine}": data.get("my_brand", "unknown"),
+        "{brand:mine_all}": ", ".join(data.get("my_brand_aliases", [])),
+        "{brand:competitors}": ", ".join(data.get("competitors", [])),
+        "{competitors:mentioned}": ", ".join(data.get("competitors_mentioned", [])),
+        "{intent:id}": context.intent_data.get("id", ""),
+        "{intent:prompt}": context.intent_data.get("prompt", ""),
+        "{intent:response}": context.intent_data.get("response", ""),
+        "{rank:mine}": str(rank) if rank is not None else "not found",
+        "{mentions:mine}": ", ".join(data.get("my_mentions", [])),
+        "{mentions:competitors}": ", ".join(data.get("competitor_mentions", [])),
+        "{model:provider}": context.model_info.get("provider", ""),
+        "{model:name}": context.model_info.get("name", ""),
+        "{run:id}": context.run_metadata.get("run_id", ""),
+        "{run:timestamp}": context.run_metadata.get("timestamp", ""),
+    }
+    rendered = template
+    for placeholder, value in replacements.items():
+        rendered = rendered.replace(placeholder, value)
+    for op_id, result in context.operation_results.items():
+        rendered = rendered.replace(f"{{operation:{op_id}}}", result)
+    return rendered
+
+
+class TestRenderTemplate:
+    """Tests for render_template()."""
+
+    def test_all_variables(self, context):
+        template = (
+            "{brand:mine}|{brand:mine_all}|{brand:competitors}|{competitors:mentioned}|"
+            "{intent:id}|{intent:prompt}|{intent:response}|{rank:mine}|{mentions:mine}|"
+            "{mentions:competitors}|{model:provider}|{model:name}|{run:id}|{run:timestamp}|"
+            "{operation:gap-analysis}"
+        )
+
+        assert render_template(template, context) == _legacy_render(template, context)
+
+    def test_precompiled_matches_raw(self, context):
+        template = "Improve {brand:mine} (rank {rank:mine}) using {operation:gap-analysis}"
+
+        assert render_template(compile_template(template), context) == render_template(
+            template, context
+        )
+
+    def test_rank_not_found(self, context):
+        context.extraction_data["my_rank"] = None
+
+        assert render_template("Rank: {rank:mine}", context) == "Rank: not found"
+
+    def test_defaults_for_missing_data(self):
+        empty = OperationContext(intent_data={}, extraction_data={}, run_metadata={}, model_info={})
+
+        assert render_template("{brand:mine}/{mentions:mine}/{run:id}", empty) == "unknown//"
+
+    def test_unresolved_operation_left_as_is(self, context):
+        assert render_template("{operation:not-run}", context) == "{operation:not-run}"
+
+    def test_response_placeholders_not_substituted(self, context):
+        context.intent_data["response"] = "Literal {brand:mine} in answer"
+
+        assert render_template("{intent:response}", context) == "Literal {brand:mine} in answer"
+
+
+class TestEvaluateCondition:
+    """Tests for evaluate_condition()."""
+
+    @pytest.mark.parametrize(
+        ("condition", "expected"),
+        [
+            ("{rank:mine} > 1", True),
+            ("{rank:mine} > 3", False),
+            ("{rank:mine} <= 2", True),
+            ("{rank:mine} >= 3", False),
+            ("{rank:mine} == 2", True),
+            ("{rank:mine} != 2", False),
+            ("{rank:mine} == null", False),
+            ('{competitors:mentioned} contains "HubSpot"', True),
+            ("{competitors:mentioned} contains 'Pipedrive'", False),
+        ],
+    )
+    def test_conditions(self, context, condition, expected):
+        assert evaluate_condition(condition, context) is expected
+        assert evaluate_condition(compile_condition(condition), context) is expected
+
+    def test_null_when_not_ranked(self, context):
+        context.extraction_data["my_rank"] = None
+
+        assert evaluate_condition("{rank:mine} == null", context) is True
+        assert evaluate_condition("{rank:mine} > 3", context) is False
+
+    def test_unsupported_condition_runs_operation(self, context):
+        assert evaluate_condition("rank is bad", context) is True
+
+
+def test_resolve_operations_precompiles_templates():
+    operations = [
+        Operation(id="gaps", prompt="Improve {brand:mine}", condition="{rank:mine} > 1"),
+        Operation(id="plain", prompt="Summarize {intent:response}"),
+    ]
+
+    resolved = resolve_operations(operations, [])
+
+    assert resolved[0].compiled_prompt is compile_template("Improve {brand:mine}")
+    assert resolved[0].compiled_condition.kind == "compare"
+    assert resolved[1].compiled_condition is None
+    assert "compiled_prompt" not in resolved[0].model_dump()
+
+
+@pytest.mark.slow
+def test_render_benchmark_large_response_long_chain(context):
+    """Precompiled rendering should beat chained str.replace on large inputs."""
+    chain_length = 50
+    context.intent_data["response"] = "HubSpot and Warmly compared in depth. " * 500  # ~19 KB
+    context.operation_results = {f"op-{i}": f"result {i} " * 20 for i in range(chain_length)}
+    template = (
+        "Brand {brand:mine} ranked {rank:mine} against {competitors:mentioned}.\n"
+        "Response:\n{intent:response}\n"
+        "Prior analysis: {operation:op-0} {operation:op-25} {operation:op-49}\n"
+    ) * 3
+    compiled = compile_template(template)
+    iterations = 300
+
+    assert render_template(compiled, context) == _legacy_render(template, context)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _legacy_render(template, context)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render_template(compiled, context)
+    compiled_seconds = time.perf_counter() - start
+
+    print(
+        f"\nrender x{iterations}: chained replace {legacy_seconds * 1000:.1f}ms, "
+        f"precompiled {compiled_seconds * 1000:.1f}ms"
+    )
+    assert compiled_seconds < legacy_seconds
@@ -0,0 +1,208 @@
+"""
+Tests for llm_runner.response_schemas and utils.fastjson modules.
+
+Tests cover:
+- Typed msgspec decoding matching each client's dict extraction
+- Fallback to dict extraction for bodies outside the schemas
+- Client behavior when msgspec is not installed
+- dumps_pretty() parity with stdlib json
+- Decode and encode speed versus stdlib json (benchmark)
+"""
+
+import json
+import time
+
+import httpx
+import pytest
+
+# msgspec is optional (the "fast" extra); clients fall back to stdlib json
+pytest.importorskip("msgspec")
+
+from llm_answer_watcher.llm_runner import (
+    gemini_client,
+    openai_client,
+    perplexity_client,
+)
+from llm_answer_watcher.llm_runner.gemini_client import GeminiClient
+from llm_answer_watcher.llm_runner.openai_client import OpenAIClient
+from llm_answer_watcher.llm_runner.perplexity_client import PerplexityClient
+from llm_answer_watcher.llm_runner.response_schemas import (
+    decode_gemini_response,
+    decode_openai_response,
+    decode_perplexity_response,
+)
+from llm_answer_watcher.utils import fastjson
+from llm_answer_watcher.utils.fastjson import dumps_pretty
+
+TEST_SYSTEM_PROMPT = "You are a test assistant."
+
+OPENAI_BODY = {
+    "id": "resp_1",
+    "output": [
+        {"type": "web_search_call", "id": "ws_1", "status": "completed"},
+        {
+            "type": "message",
+            "content": [
+                {"type": "output_text", "text": "HubSpot and Salesforce.", "annotations": []}
+            ],
+        },
+    ],
+    "usage": {"input_tokens": 120, "output_tokens": 45, "total_tokens": 165},
+}
+GEMINI_BODY = {
+    "candidates": [
+        {
+            "content": {"parts": [{"text": "Pipedrive leads."}], "role": "model"},
+            "finishReason": "STOP",
+            "safetyRatings": [{"category": "HARM", "probability": "NEGLIGIBLE"}],
+            "groundingMetadata": {
+                "webSearchQueries": ["best crm"],
+                "groundingChunks": [{"web": {"uri": "https://a.example", "title": "A"}}],
+                "groundingSupports": [{"segment": {"startIndex": 0}}],
+            },
+        }
+    ],
+    "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5, "totalTokenCount": 15},
+}
+PERPLEXITY_BODY = {
+    "choices": [{"message": {"role": "assistant", "content": "Zoho CRM."}}],
+    "citations": ["https://b.example"],
+    "usage": {"prompt_tokens": 8, "completion_tokens": 4, "total_tokens": 12},
+}
+
+
+def _response(body):
+    return httpx.Response(200, content=json.dumps(body).encode())
+
+
+def _clients():
+    return {
+        "openai": OpenAIClient("gpt-4o-mini", "sk-test", TEST_SYSTEM_PROMPT),
+        "gemini": GeminiClient("gemini-2.0-flash", "AIza-test", TEST_SYSTEM_PROMPT),
+        "perplexity": PerplexityClient("sonar", "pplx-test", TEST_SYSTEM_PROMPT),
+    }
+
+
+CASES = [
+    ("openai", openai_client, "decode_openai_response", OPENAI_BODY),
+    ("gemini", gemini_client, "decode_gemini_response", GEMINI_BODY),
+    ("perplexity", perplexity_client, "decode_perplexity_response", PERPLEXITY_BODY),
+]
+
+
+@pytest.mark.parametrize(("name", "module", "decoder", "body"), CASES)
+def test_typed_decode_matches_dict_extraction(monkeypatch, name, module, decoder, body):
+    client = _clients()[name]
+    fast = client._decode_response(_response(body))
+
+    monkeypatch.setattr(module, decoder, None)
+    slow = client._decode_response(_response(body))
+
+    assert fast == slow
+    assert fast.answer_text
+
+
+def test_openai_web_search_results_kept_verbatim():
+    decoded = decode_openai_response(json.dumps(OPENAI_BODY).encode())
+
+    assert decoded.web_search_results == [OPENAI_BODY["output"][0]]
+    assert decoded.web_search_count == 1
+
+
+def test_gemini_grounding_results():
+    decoded = decode_gemini_response(json.dumps(GEMINI_BODY).encode())
+
+    assert [r["type"] for r in decoded.web_search_results] == [
+        "web_search_query",
+        "web_search_source",
+        "grounding_supports",
+    ]
+    assert decoded.web_search_count == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"not json",
+        b"[]",
+        json.dumps({**PERPLEXITY_BODY, "usage": {}}).encode(),
+        json.dumps({**PERPLEXITY_BODY, "choices": []}).encode(),
+        json.dumps({**PERPLEXITY_BODY, "usage": {"total_tokens": "12"}}).encode(),
+    ],
+)
+def test_bodies_outside_schema_return_none(content):
+    assert decode_perplexity_response(content) is None
+
+
+def test_gemini_blocked_candidate_uses_dict_extraction():
+    body = json.loads(json.dumps(GEMINI_BODY))
+    body["candidates"][0]["finishReason"] = "SAFETY"
+
+    assert decode_gemini_response(json.dumps(body).encode()) is None
+    with pytest.raises(RuntimeError, match="SAFETY"):
+        _clients()["gemini"]._decode_response(_response(body))
+
+
+def test_openai_function_call_uses_dict_extraction():
+    body = {
+        "output": [{"type": "function_call", "name": "f", "arguments": "{}"}],
+        "usage": OPENAI_BODY["usage"],
+    }
+
+    assert decode_openai_response(json.dumps(body).encode()) is None
+
+
+def test_invalid_json_still_raises_client_error():
+    with pytest.raises(RuntimeError, match="Failed to parse Perplexity response JSON"):
+        _clients()["perplexity"]._decode_response(httpx.Response(200, content=b"{"))
+
+
+def test_dumps_pretty_matches_stdlib(monkeypatch):
+    data = {"brand": "Café", "rank": [1, 2], "cost": 0.5, "nested": {"ok": None}}
+    expected = json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+    assert dumps_pretty(data) == expected
+    monkeypatch.setattr(fastjson, "msgspec", None)
+    assert dumps_pretty(data) == expected
+
+
+def test_dumps_pretty_unserializable_raises_type_error():
+    with pytest.raises(TypeError):
+        dumps_pretty({"bad": object()})
+
+
+def _best_ms(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+@pytest.mark.slow
+def test_decode_and_encode_speed_vs_stdlib(monkeypatch):
+    # A web-search answer with many unused annotations and search results
+    body = json.loads(json.dumps(OPENAI_BODY))
+    body["output"][1]["content"][0]["annotations"] = [
+        {"type": "url_citation", "url": f"https://site{i}.example", "title": "t" * 80}
+        for i in range(2000)
+    ]
+    body["output"].insert(0, {"type": "web_search", "results": [{"url": "u"}] * 200})
+    response = _response(body)
+    client = _clients()["openai"]
+
+    typed_ms = _best_ms(lambda: [client._decode_response(response) for _ in range(20)])
+    monkeypatch.setattr(openai_client, "decode_openai_response", None)
+    dict_ms = _best_ms(lambda: [client._decode_response(response) for _ in range(20)])
+
+    artifact = {"results": [{"intent_id": f"i{i}", "answer": "x" * 400} for i in range(2000)]}
+    fast_ms = _best_ms(lambda: dumps_pretty(artifact))
+    monkeypatch.setattr(fastjson, "msgspec", None)
+    stdlib_ms = _best_ms(lambda: dumps_pretty(artifact))
+
+    print()
+    print(f"decode: typed {typed_ms:.1f}ms vs json+dict {dict_ms:.1f}ms")
+    print(f"encode: msgspec {fast_ms:.1f}ms vs json {stdlib_ms:.1f}ms")
+    assert typed_ms < dict_ms
+    assert fast_ms < stdlib_ms
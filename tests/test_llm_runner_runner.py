@@ -4,10 +4,14 @@ Tests for llm_runner.runner module.
 Tests the core orchestration engine with mocked LLM clients and database.
 """
 
+import dataclasses
 import json
 import os
+import time
+import tracemalloc
 from unittest.mock import MagicMock, patch
 
+import pytest
 from freezegun import freeze_time
 
 from llm_answer_watcher.config.schema import (
@@ -73,6 +77,127 @@ class TestRawAnswerRecord:
         assert data["intent_id"] == "test"
         assert data["usage_meta"] == {"prompt_tokens": 10, "completion_tokens": 20}
 
+    def test_record_is_frozen_and_slotted(self):
+        record = _raw_record()
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.latency_ms = 5
+
+    def test_to_dict_matches_asdict_without_copying(self):
+        record = _raw_record()
+
+        data = record.to_dict()
+
+        assert data == dataclasses.asdict(record)
+        assert data["web_search_results"] is record.web_search_results
+
+    def test_db_params_encode_json_once(self):
+        record = _raw_record()
+
+        params = record.db_params()
+
+        assert json.loads(params["usage_meta_json"]) == record.usage_meta
+        assert json.loads(params["web_search_results_json"]) == record.web_search_results
+        assert params["web_search_results"] is record.web_search_results
+        assert params["latency_ms"] == 1200
+        assert _raw_record(web_search_results=None).db_params()["web_search_results_json"] is None
+
+
+def _raw_record(**overrides):
+    fields = {
+        "intent_id": "best-crm",
+        "prompt": "What is the best CRM?",
+        "model_provider": "openai",
+        "model_name": "gpt-4o-mini",
+        "timestamp_utc": "2025-11-02T08:00:00Z",
+        "answer_text": "1. HubSpot\n2. Salesforce\n3. Pipedrive\n" * 20,
+        "answer_length": 780,
+        "usage_meta": {"prompt_tokens": 100, "completion_tokens": 400, "total_tokens": 500},
+        "estimated_cost_usd": 0.001,
+        "web_search_results": [
+            {"url": f"https://example.com/{i}", "title": f"Result {i}"} for i in range(5)
+        ],
+        "web_search_count": 5,
+        "latency_ms": 1200,
+    }
+    return RawAnswerRecord(**(fields | overrides))
+
+
+def _extraction_result():
+    mentions = [
+        BrandMention(name, name, "mine" if i == 0 else "competitor", i * 12)
+        for i, name in enumerate(["HubSpot", "Salesforce", "Pipedrive", "Zoho", "Close"])
+    ]
+    return ExtractionResult(
+        intent_id="best-crm",
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc="2025-11-02T08:00:00Z",
+        appeared_mine=True,
+        my_mentions=mentions[:1],
+        competitor_mentions=mentions[1:],
+        ranked_list=[RankedBrand(m.normalized_name, i + 1, 0.95) for i, m in enumerate(mentions)],
+        rank_extraction_method="pattern",
+        rank_confidence=0.95,
+    )
+
+
+def test_extraction_result_to_dict_matches_asdict():
+    result = _extraction_result()
+
+    assert result.to_dict() == dataclasses.asdict(result)
+
+
+def _serialize_previous(record, result):
+    """Serialization as run_all() did it before to_dict()/db_params()."""
+    return (
+        dataclasses.asdict(record),
+        dataclasses.asdict(result),
+        json.dumps(record.usage_meta),
+        json.dumps(record.web_search_results),
+    )
+
+
+def _serialize(record, result):
+    return record.to_dict(), result.to_dict(), record.db_params()
+
+
+def _measure(serialize, pairs):
+    """(seconds, peak traced bytes) to serialize all pairs, keeping the output."""
+    start = time.perf_counter()
+    outputs = [serialize(record, result) for record, result in pairs]
+    elapsed = time.perf_counter() - start
+    del outputs
+
+    # Separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    try:
+        outputs = [serialize(record, result) for record, result in pairs]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+@pytest.mark.slow
+def test_benchmark_serialization_10k_answers():
+    tracemalloc.start()
+    pairs = [(_raw_record(), _extraction_result()) for _ in range(10_000)]
+    records_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    previous_seconds, previous_peak = _measure(_serialize_previous, pairs)
+    seconds, peak = _measure(_serialize, pairs)
+
+    print(
+        f"\n10k answers: records {records_bytes / 2**20:.1f} MiB; serialization "
+        f"asdict {previous_seconds * 1000:.0f} ms / {previous_peak / 2**20:.1f} MiB, "
+        f"to_dict {seconds * 1000:.0f} ms / {peak / 2**20:.1f} MiB"
+    )
+    assert seconds * 2 < previous_seconds
+    assert peak < previous_peak
+
 
 def create_test_config(
     my_brand: str = "InstantFlow",
@@ -0,0 +1,253 @@
+"""
+Tests for llm_runner.sampling and adaptive sampling in run_all().
+
+Tests cover:
+- Wilson score intervals and online mention-rate tracking
+- Early stopping once intervals are narrow enough, and the max_samples cap
+- Native `n` batches (prompt billed once) vs one request per sample
+- Failed follow-up requests keeping the samples collected so far
+- split_batch_usage token attribution
+- run_all() storing answer_samples and sample_aggregates rows
+"""
+
+import itertools
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    SamplingConfig,
+)
+from llm_answer_watcher.extractor.parser import parse_answer
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.models import split_batch_usage
+from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
+from llm_answer_watcher.llm_runner.sampling import (
+    STOP_CONVERGED,
+    STOP_ERROR,
+    STOP_MAX_SAMPLES,
+    MentionRateTracker,
+    UnitSample,
+    sample_until_confident,
+    wilson_interval,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+BRANDS = Brands(mine=["Warmly"], competitors=["HubSpot", "Salesforce"])
+MENTIONED = "1. Warmly\n2. HubSpot"
+NOT_MENTIONED = "1. Salesforce\n2. HubSpot"
+
+
+class CyclingClient(MockLLMClient):
+    """Mock client returning answers from a fixed cycle, one per request."""
+
+    def __init__(self, answers):
+        super().__init__()
+        self._answers = itertools.cycle(answers)
+        self.calls = 0
+
+    async def generate_answer(self, prompt, on_chunk=None):
+        self.calls += 1
+        self.default_response = next(self._answers)
+        return await super().generate_answer(prompt)
+
+
+class BatchingClient(CyclingClient):
+    """Cycling client that also supports native `n`."""
+
+    def __init__(self, answers):
+        super().__init__(answers)
+        self.batch_sizes = []
+
+    async def generate_answers(self, prompt, n):
+        self.batch_sizes.append(n)
+        return [await super().generate_answer(prompt) for _ in range(n)]
+
+
+async def _parse(text):
+    return await parse_answer(
+        answer_text=text,
+        brands=BRANDS,
+        intent_id="best-crm",
+        provider="mock",
+        model_name="mock-model",
+        timestamp_utc="2025-11-02T08:00:00Z",
+    )
+
+
+async def _first(client, prompt="Best CRM?"):
+    response = await client.generate_answer(prompt)
+    return UnitSample(0, response, await _parse(response.answer_text), 1)
+
+
+class TestWilsonInterval:
+    """Interval math and tracking."""
+
+    def test_bounds_stay_in_unit_interval(self):
+        low, high = wilson_interval(5, 5, 0.9)
+
+        assert high == 1.0
+        assert 0.6 < low < 0.7
+
+    def test_narrows_with_more_samples(self):
+        narrow = wilson_interval(50, 100, 0.9)
+        wide = wilson_interval(5, 10, 0.9)
+
+        assert narrow[1] - narrow[0] < wide[1] - wide[0]
+
+    def test_no_trials(self):
+        assert wilson_interval(0, 0, 0.9) == (0.0, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_tracker_counts_each_brand_once_per_sample(self):
+        tracker = MentionRateTracker(confidence=0.9)
+        tracker.add(await _parse("Warmly beats HubSpot. HubSpot is pricey."))
+        tracker.add(await _parse(NOT_MENTIONED))
+
+        assert (tracker.samples, tracker.mine) == (2, 1)
+        assert tracker.competitors == {"HubSpot": 2, "Salesforce": 1}
+        assert tracker.mine_interval()[0] == 0.5
+        assert tracker.brand_rates()["HubSpot"]["rate"] == 1.0
+
+
+@pytest.mark.asyncio
+class TestSampleUntilConfident:
+    """Stopping rule and request batching."""
+
+    async def test_stable_answers_stop_early(self):
+        client = CyclingClient([MENTIONED])
+        settings = SamplingConfig(min_samples=3, max_samples=20, target_ci_width=0.4)
+
+        result = await sample_until_confident(
+            client, "Best CRM?", settings, _parse, await _first(client)
+        )
+
+        assert result.stop_reason == STOP_CONVERGED
+        assert len(result.samples) < 20
+        assert result.tracker.max_width() <= 0.4
+        assert client.calls == len(result.samples) == result.requests
+
+    async def test_unstable_answers_hit_max_samples(self):
+        client = CyclingClient([MENTIONED, NOT_MENTIONED])
+        settings = SamplingConfig(min_samples=2, max_samples=6, target_ci_width=0.2)
+
+        result = await sample_until_confident(
+            client, "Best CRM?", settings, _parse, await _first(client)
+        )
+
+        assert result.stop_reason == STOP_MAX_SAMPLES
+        assert [s.index for s in result.samples] == list(range(6))
+        assert result.tracker.mine_interval()[0] == 0.5
+
+    async def test_native_n_batches_and_uses_prefetched(self):
+        client = BatchingClient([MENTIONED, NOT_MENTIONED])
+        settings = SamplingConfig(min_samples=2, max_samples=7, batch_size=3, target_ci_width=0.1)
+        first_batch = await client.generate_answers("Best CRM?", n=3)
+        first = UnitSample(0, first_batch[0], await _parse(first_batch[0].answer_text), 3)
+
+        result = await sample_until_confident(
+            client, "Best CRM?", settings, _parse, first, prefetched=first_batch[1:]
+        )
+
+        # 3 prefetched + 3 + a final batch capped at the 1 remaining sample
+        assert client.batch_sizes == [3, 3]
+        assert client.calls == 7
+        assert result.requests == 3
+        assert [s.request_samples for s in result.samples] == [3, 3, 3, 3, 3, 3, 1]
+
+    async def test_failed_request_keeps_samples(self):
+        client = CyclingClient([MENTIONED, NOT_MENTIONED])
+        first = await _first(client)
+        settings = SamplingConfig(min_samples=2, max_samples=6, target_ci_width=0.1)
+
+        with patch.object(client, "generate_answer", side_effect=RuntimeError("429")):
+            result = await sample_until_confident(client, "Best CRM?", settings, _parse, first)
+
+        assert result.stop_reason == STOP_ERROR
+        assert len(result.samples) == 1
+
+
+class TestSamplingConfig:
+    """Configuration validation and budgeting."""
+
+    def test_min_cannot_exceed_max(self):
+        with pytest.raises(ValidationError, match="cannot exceed"):
+            SamplingConfig(min_samples=5, max_samples=3)
+
+    @pytest.mark.parametrize("field", ["target_ci_width", "confidence"])
+    def test_fractions_validated(self, field):
+        with pytest.raises(ValidationError, match="between 0 and 1"):
+            SamplingConfig(**{field: 1.0})
+
+    def test_split_batch_usage_bills_prompt_once(self):
+        assert split_batch_usage(120, 1001, 3) == [(120, 335), (0, 333), (0, 333)]
+        assert split_batch_usage(10, 5, 1) == [(10, 5)]
+
+
+def _config(tmp_path, sampling) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            sampling=sampling,
+        ),
+        brands=BRANDS,
+        intents=[Intent(id="best-crm", prompt="What is the best CRM?")],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="sk-test",
+                system_prompt="You are a helpful assistant.",
+            )
+        ],
+    )
+
+
+def test_estimate_budgets_for_max_samples(tmp_path):
+    single = estimate_run_cost(_config(tmp_path, None))
+    sampled = estimate_run_cost(_config(tmp_path, SamplingConfig(max_samples=5)))
+
+    assert sampled["max_samples_per_query"] == 5
+    assert sampled["total_queries"] == single["total_queries"]
+    assert sampled["base_cost"] == pytest.approx(single["base_cost"] * 5, rel=1e-2)
+
+
+@pytest.mark.asyncio
+async def test_run_all_stores_samples_and_aggregates(tmp_path):
+    config = _config(
+        tmp_path, SamplingConfig(min_samples=2, max_samples=4, batch_size=2, target_ci_width=0.1)
+    )
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+    client = BatchingClient([MENTIONED, NOT_MENTIONED])
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+        result = await run_all(config)
+
+    assert result["success_count"] == 1
+    assert client.batch_sizes == [2, 2]
+
+    with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+        samples = conn.execute(
+            "SELECT sample_index, appeared_mine, request_samples FROM answer_samples "
+            "ORDER BY sample_index"
+        ).fetchall()
+        aggregate = conn.execute(
+            "SELECT sample_count, request_count, mention_rate, stop_reason "
+            "FROM sample_aggregates WHERE run_id = ?",
+            (result["run_id"],),
+        ).fetchone()
+        answers = conn.execute("SELECT COUNT(*) FROM answers_raw").fetchone()[0]
+
+    assert samples == [(0, 1, 2), (1, 0, 2), (2, 1, 2), (3, 0, 2)]
+    assert aggregate == (4, 2, 0.5, STOP_MAX_SAMPLES)
+    assert answers == 1  # only the canonical answer goes to answers_raw
@@ -0,0 +1,250 @@
+"""
+Tests for llm_runner.scheduler and latency-aware scheduling in run_all().
+
+Tests cover:
+- List-scheduling makespan simulation
+- Ordering by intent priority, expected latency and cost
+- Latency estimates from answers_raw history, and defaults without history
+- run_all() dispatching slow models first, recording latency_ms, and
+  reporting predicted vs actual makespan in run_meta
+"""
+
+import json
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunnerConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    SchedulingConfig,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.scheduler import (
+    DEFAULT_API_SECONDS,
+    DEFAULT_RUNNER_SECONDS,
+    LatencyEstimate,
+    LatencyScheduler,
+    simulate_makespan,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed, insert_answer_raw, insert_run
+
+FAST = ("openai", "gpt-4o-mini")
+SLOW = ("perplexity", "sonar-pro")
+
+
+def _config(tmp_path, strategy="longest_first", intents=None) -> RuntimeConfig:
+    models = [FAST, SLOW]
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider=p, model_name=m, env_api_key="K") for p, m in models],
+            max_concurrent_requests=1,
+            scheduling=SchedulingConfig(strategy=strategy),
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=intents
+        or [
+            Intent(id="crm-1", prompt="What is the best CRM?"),
+            Intent(id="crm-2", prompt="What is the cheapest CRM?"),
+        ],
+        models=[
+            RuntimeModel(
+                provider=p, model_name=m, api_key="sk-test", system_prompt="You are helpful."
+            )
+            for p, m in models
+        ],
+    )
+
+
+def _seed_latencies(db_path, model, latencies_ms, cost=0.001):
+    init_db_if_needed(db_path)
+    with sqlite3.connect(db_path) as conn:
+        for i, latency in enumerate(latencies_ms):
+            run_id = f"2025-10-{i + 1:02d}T08-00-00Z"
+            timestamp = f"2025-10-{i + 1:02d}T08:00:00Z"
+            insert_run(conn, run_id, timestamp, total_intents=1, total_models=1)
+            insert_answer_raw(
+                conn,
+                run_id,
+                "old-intent",
+                model[0],
+                model[1],
+                timestamp,
+                "?",
+                "...",
+                estimated_cost_usd=cost,
+                latency_ms=latency,
+            )
+        conn.commit()
+
+
+class TestSimulateMakespan:
+    """List-scheduling simulation."""
+
+    def test_longest_first_shortens_tail(self):
+        assert simulate_makespan([1, 1, 1, 3], workers=2) == 4.0
+        assert simulate_makespan([3, 1, 1, 1], workers=2) == 3.0
+
+    def test_empty_and_single_worker(self):
+        assert simulate_makespan([], workers=4) == 0.0
+        assert simulate_makespan([2, 3], workers=1) == 5.0
+
+
+class TestOrdering:
+    """Dispatch order."""
+
+    def _scheduler(self, strategy="longest_first"):
+        return LatencyScheduler(
+            {
+                ("model", *FAST): LatencyEstimate(2.0, 0.001, 10),
+                ("model", *SLOW): LatencyEstimate(20.0, 0.005, 10),
+            },
+            strategy=strategy,
+        )
+
+    def _units(self, scheduler, intents):
+        models = [ModelConfig(provider=p, model_name=m, env_api_key="K") for p, m in (FAST, SLOW)]
+        return [scheduler.unit(intent, model_config=m) for intent in intents for m in models]
+
+    def _labels(self, units):
+        return [(u.intent.id, u.model_config.provider) for u in units]
+
+    def test_longest_first_then_intent_order(self):
+        scheduler = self._scheduler()
+        intents = [Intent(id="a", prompt="Question A?"), Intent(id="b", prompt="Question B?")]
+
+        ordered = scheduler.order(self._units(scheduler, intents))
+
+        assert self._labels(ordered) == [
+            ("a", "perplexity"),
+            ("b", "perplexity"),
+            ("a", "openai"),
+            ("b", "openai"),
+        ]
+
+    def test_priority_beats_latency(self):
+        scheduler = self._scheduler()
+        intents = [
+            Intent(id="a", prompt="Question A?"),
+            Intent(id="urgent", prompt="Question B?", priority=5),
+        ]
+
+        ordered = scheduler.order(self._units(scheduler, intents))
+
+        assert [u.intent.id for u in ordered[:2]] == ["urgent", "urgent"]
+
+    def test_intent_order_strategy_keeps_order(self):
+        scheduler = self._scheduler(strategy="intent_order")
+        intents = [Intent(id="a", prompt="Question A?")]
+
+        units = self._units(scheduler, intents)
+
+        assert scheduler.order(units) == units
+
+    def test_predictions_count_dispatched_units_only(self):
+        scheduler = self._scheduler()
+        units = self._units(scheduler, [Intent(id="a", prompt="Question A?")])
+        for unit in scheduler.order(units)[:1]:
+            scheduler.record_dispatch(unit)
+
+        assert scheduler.dispatched_count == 1
+        assert scheduler.predicted_makespan(workers=2) == 20.0
+
+
+class TestEstimates:
+    """Latency estimates from answers_raw."""
+
+    def test_median_latency_and_mean_cost(self, tmp_path):
+        config = _config(tmp_path)
+        _seed_latencies(config.run_settings.sqlite_db_path, SLOW, [9000, 30000, 12000], cost=0.004)
+
+        estimates = LatencyScheduler.from_config(config).estimates
+
+        assert estimates[("model", *SLOW)] == LatencyEstimate(12.0, 0.004, 3)
+        assert estimates[("model", *FAST)] == LatencyEstimate(DEFAULT_API_SECONDS)
+
+    def test_runners_default_to_slow(self, tmp_path):
+        config = _config(tmp_path)
+        init_db_if_needed(config.run_settings.sqlite_db_path)
+        config = config.model_copy(
+            update={
+                "runner_configs": [
+                    RunnerConfig(runner_plugin="steel-chatgpt", config={"steel_api_key": "x"})
+                ]
+            }
+        )
+
+        estimates = LatencyScheduler.from_config(config).estimates
+
+        assert estimates[("runner", "steel-chatgpt", "")].seconds == DEFAULT_RUNNER_SECONDS
+
+    def test_latency_window_limits_history(self, tmp_path):
+        config = _config(tmp_path)
+        config.run_settings.scheduling.latency_window = 2
+        _seed_latencies(config.run_settings.sqlite_db_path, FAST, [90000, 1000, 3000])
+
+        estimate = LatencyScheduler.from_config(config).estimates[("model", *FAST)]
+
+        assert (estimate.seconds, estimate.samples) == (2.0, 2)
+
+
+@pytest.mark.asyncio
+async def test_run_all_dispatches_slow_model_first(tmp_path):
+    config = _config(tmp_path)
+    db_path = config.run_settings.sqlite_db_path
+    _seed_latencies(db_path, SLOW, [25000, 30000])
+    _seed_latencies(db_path, FAST, [1000, 2000])
+    built = []
+
+    def build_client(provider, model_name, **kwargs):
+        built.append(provider)
+        return MockLLMClient(default_response="1. Warmly\n2. HubSpot")
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", side_effect=build_client):
+        result = await run_all(config)
+
+    assert result["success_count"] == 4
+    assert built == ["perplexity", "perplexity", "openai", "openai"]
+
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        scheduling = json.load(f)["scheduling"]
+    assert scheduling["strategy"] == "longest_first"
+    assert scheduling["dispatched_units"] == 4
+    assert scheduling["predicted_makespan_seconds"] == pytest.approx(2 * 27.5 + 2 * 1.5)
+    assert scheduling["actual_makespan_seconds"] >= 0
+    assert scheduling["estimates"]["perplexity/sonar-pro"]["history_answers"] == 2
+
+    with sqlite3.connect(db_path) as conn:
+        latencies = conn.execute(
+            "SELECT latency_ms FROM answers_raw WHERE run_id = ?", (result["run_id"],)
+        ).fetchall()
+    assert len(latencies) == 4
+    assert all(latency is not None for (latency,) in latencies)
+
+
+@pytest.mark.asyncio
+async def test_run_all_without_scheduling_keeps_intent_order(tmp_path):
+    config = _config(tmp_path)
+    config.run_settings.scheduling = None
+    _seed_latencies(config.run_settings.sqlite_db_path, SLOW, [25000])
+    built = []
+
+    def build_client(provider, model_name, **kwargs):
+        built.append(provider)
+        return MockLLMClient(default_response="1. Warmly")
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", side_effect=build_client):
+        result = await run_all(config)
+
+    assert built == ["openai", "perplexity", "openai", "perplexity"]
+    with open(f"{result['output_dir']}/run_meta.json") as f:
+        assert "scheduling" not in json.load(f)
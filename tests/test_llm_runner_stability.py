@@ -0,0 +1,287 @@
+"""
+Tests for llm_runner.stability and stability-aware skipping in run_all().
+
+Tests cover:
+- Normalized rank-list edit distance
+- Skip decisions from answers_raw/mentions history (insufficient history,
+  volatile, stable, refresh due after max skips)
+- StabilityConfig validation
+- run_all() skipping a stable unit: no query, query_skips row, artifacts
+  carried forward, skipped units in the summary and run_meta
+"""
+
+import json
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    StabilityConfig,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.stability import (
+    REASON_INSUFFICIENT_HISTORY,
+    REASON_REFRESH_DUE,
+    REASON_STABLE,
+    REASON_VOLATILE,
+    StabilityPolicy,
+    rank_edit_distance,
+)
+from llm_answer_watcher.storage.db import (
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_mention,
+    insert_query_skip,
+    insert_run,
+)
+from llm_answer_watcher.storage.layout import get_parsed_answer_filename
+
+UNIT = ("best-crm", "openai", "gpt-4o-mini")
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "watcher.db")
+    init_db_if_needed(path)
+    return path
+
+
+def _add_run(db_path, index, ranking):
+    """Store one answered run of UNIT with brands in `ranking` order."""
+    run_id = f"2025-11-0{index}T08-00-00Z"
+    timestamp = f"2025-11-0{index}T08:00:00Z"
+    intent_id, provider, model_name = UNIT
+    with sqlite3.connect(db_path) as conn:
+        insert_run(conn, run_id, timestamp, total_intents=1, total_models=1)
+        insert_answer_raw(conn, run_id, intent_id, provider, model_name, timestamp, "?", "...")
+        for position, name in enumerate(ranking, start=1):
+            insert_mention(
+                conn,
+                run_id,
+                timestamp,
+                intent_id,
+                provider,
+                model_name,
+                brand_name=name,
+                normalized_name=name,
+                is_mine=False,
+                first_position=position * 10,
+                rank_position=position,
+            )
+        conn.commit()
+    return run_id
+
+
+def _add_skip(db_path, day):
+    intent_id, provider, model_name = UNIT
+    with sqlite3.connect(db_path) as conn:
+        insert_query_skip(
+            conn,
+            f"2025-11-{day:02d}T08-00-00Z",
+            intent_id,
+            provider,
+            model_name,
+            timestamp_utc=f"2025-11-{day:02d}T08:00:00Z",
+            reason=REASON_STABLE,
+            rank_distance=0.0,
+            history_runs=3,
+            runs_since_query=1,
+            query_interval=4,
+        )
+        conn.commit()
+
+
+class TestRankEditDistance:
+    """Normalized Levenshtein distance over brand lists."""
+
+    @pytest.mark.parametrize(
+        ("a", "b", "expected"),
+        [
+            ([], [], 0.0),
+            (["a", "b"], ["a", "b"], 0.0),
+            (["a", "b"], ["b", "a"], 1.0),
+            (["a", "b", "c"], ["a", "b"], 1 / 3),
+            (["a", "b", "c", "d"], ["a", "x", "c", "d"], 0.25),
+            ([], ["a"], 1.0),
+        ],
+    )
+    def test_distance(self, a, b, expected):
+        assert rank_edit_distance(a, b) == pytest.approx(expected)
+
+    def test_symmetric(self):
+        a, b = ["hubspot", "warmly", "zoho"], ["warmly", "pipedrive"]
+        assert rank_edit_distance(a, b) == rank_edit_distance(b, a)
+
+
+class TestStabilityPolicy:
+    """Skip decisions from stored history."""
+
+    def test_insufficient_history(self, db_path):
+        _add_run(db_path, 1, ["hubspot", "warmly"])
+        _add_run(db_path, 2, ["hubspot", "warmly"])
+
+        decision = StabilityPolicy(db_path, StabilityConfig()).decide(*UNIT)
+
+        assert not decision.skip
+        assert decision.reason == REASON_INSUFFICIENT_HISTORY
+        assert decision.history_runs == 2
+
+    def test_identical_rankings_skip_with_longest_interval(self, db_path):
+        for day in (1, 2, 3):
+            last = _add_run(db_path, day, ["hubspot", "warmly", "zoho"])
+
+        decision = StabilityPolicy(db_path, StabilityConfig(max_skip_runs=3)).decide(*UNIT)
+
+        assert decision.skip
+        assert decision.reason == REASON_STABLE
+        assert decision.rank_distance == 0.0
+        assert decision.query_interval == 4
+        assert decision.carried_from_run_id == last
+
+    def test_volatile_rankings_always_queried(self, db_path):
+        _add_run(db_path, 1, ["hubspot", "warmly"])
+        _add_run(db_path, 2, ["warmly", "hubspot"])
+        _add_run(db_path, 3, ["zoho", "pipedrive"])
+
+        decision = StabilityPolicy(db_path, StabilityConfig()).decide(*UNIT)
+
+        assert not decision.skip
+        assert decision.reason == REASON_VOLATILE
+        assert decision.rank_distance == 1.0
+
+    def test_slight_changes_shorten_interval(self, db_path):
+        _add_run(db_path, 1, ["a", "b", "c", "d", "e"])
+        _add_run(db_path, 2, ["a", "b", "c", "d", "e"])
+        _add_run(db_path, 3, ["a", "b", "c", "d", "x"])
+        settings = StabilityConfig(max_rank_distance=0.2, max_skip_runs=4)
+
+        decision = StabilityPolicy(db_path, settings).decide(*UNIT)
+
+        # Mean distance 0.1 is half the threshold: 1 + round(0.5 * 4)
+        assert decision.rank_distance == pytest.approx(0.1)
+        assert decision.query_interval == 3
+
+    def test_refresh_due_after_max_skips(self, db_path):
+        for day in (1, 2, 3):
+            _add_run(db_path, day, ["hubspot", "warmly"])
+        for day in (4, 5, 6):
+            _add_skip(db_path, day)
+
+        decision = StabilityPolicy(db_path, StabilityConfig(max_skip_runs=3)).decide(*UNIT)
+
+        assert not decision.skip
+        assert decision.reason == REASON_REFRESH_DUE
+        assert decision.runs_since_query == 4
+
+    def test_lookback_limits_history(self, db_path):
+        _add_run(db_path, 1, ["zoho"])
+        _add_run(db_path, 2, ["pipedrive"])
+        for day in (3, 4, 5):
+            _add_run(db_path, day, ["hubspot", "warmly"])
+
+        decision = StabilityPolicy(db_path, StabilityConfig(lookback_runs=3)).decide(*UNIT)
+
+        assert decision.skip
+        assert decision.history_runs == 3
+
+
+class TestStabilityConfig:
+    """Configuration validation."""
+
+    def test_min_history_within_lookback(self):
+        with pytest.raises(ValidationError, match="cannot exceed"):
+            StabilityConfig(lookback_runs=3, min_history=4)
+
+    def test_distance_is_fraction(self):
+        with pytest.raises(ValidationError, match="between 0 and 1"):
+            StabilityConfig(max_rank_distance=1.5)
+
+    def test_history_needs_two_runs(self):
+        with pytest.raises(ValidationError, match="at least 2"):
+            StabilityConfig(min_history=1)
+
+
+def _config(tmp_path) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            stability=StabilityConfig(lookback_runs=3, min_history=3, max_skip_runs=2),
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id="best-crm", prompt="What is the best CRM?")],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="sk-test",
+                system_prompt="You are a helpful assistant.",
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_all_skips_stable_unit_and_carries_answer(tmp_path):
+    config = _config(tmp_path)
+    db = config.run_settings.sqlite_db_path
+    init_db_if_needed(db)
+    mock = MockLLMClient(default_response="1. Warmly\n2. HubSpot")
+
+    with patch(
+        "llm_answer_watcher.llm_runner.runner.build_client", return_value=mock
+    ) as build_client:
+        for day in (1, 2, 3):
+            await run_all(config, run_id=f"2025-11-0{day}T08-00-00Z")
+        # Answers from one test run share a timestamp; spread them out
+        with sqlite3.connect(db) as conn:
+            conn.execute(
+                "UPDATE answers_raw SET timestamp_utc = replace(run_id, '-00-00Z', ':00:00Z')"
+            )
+        builds_before = build_client.call_count
+
+        result = await run_all(config, run_id="2025-11-04T08-00-00Z")
+
+    assert build_client.call_count == builds_before
+    assert (result["success_count"], result["error_count"], result["skipped_count"]) == (0, 0, 1)
+    assert result["skipped"][0]["carried_from_run_id"] == "2025-11-03T08-00-00Z"
+
+    parsed_path = os.path.join(result["output_dir"], get_parsed_answer_filename(*UNIT))
+    with open(parsed_path) as f:
+        parsed = json.load(f)
+    assert parsed["appeared_mine"] is True
+    assert parsed["carried_from_run_id"] == "2025-11-03T08-00-00Z"
+
+    with open(os.path.join(result["output_dir"], "run_meta.json")) as f:
+        run_meta = json.load(f)
+    assert run_meta["skipped_count"] == 1
+    assert run_meta["stability"]["skipped"][0]["reason"] == REASON_STABLE
+
+    with sqlite3.connect(db) as conn:
+        skips = conn.execute("SELECT run_id, reason, query_interval FROM query_skips").fetchall()
+    assert skips == [("2025-11-04T08-00-00Z", REASON_STABLE, 3)]
+
+
+@pytest.mark.asyncio
+async def test_run_all_queries_when_previous_artifacts_missing(tmp_path):
+    config = _config(tmp_path)
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+    for day in (1, 2, 3):
+        _add_run(config.run_settings.sqlite_db_path, day, ["warmly", "hubspot"])
+    mock = MockLLMClient(default_response="1. Warmly\n2. HubSpot")
+
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=mock):
+        result = await run_all(config, run_id="2025-11-04T08-00-00Z")
+
+    assert (result["success_count"], result["skipped_count"]) == (1, 0)
@@ -0,0 +1,258 @@
+"""
+Tests for llm_runner.work_queue and distributed coordinator/worker runs.
+
+Tests cover:
+- SQLiteWorkQueue leasing order, heartbeats, fencing of expired leases,
+  retries up to max_attempts, cancellation, batched enqueue of streamed
+  units and the done units' cost sum
+- DistributedConfig validation
+- unit_config() restricting a config to one unit
+- run_coordinator() with concurrent workers: aggregated summary, runs row
+  and run_meta.json, and failed units reported as errors and as failed
+  queries to progress callbacks
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    DistributedConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.distributed import (
+    build_units,
+    run_coordinator,
+    run_worker,
+    unit_config,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.work_queue import SQLiteWorkQueue
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.storage.layout import get_error_filename
+
+RUN_ID = "2025-11-02T08-00-00Z"
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteWorkQueue(str(tmp_path / "queue.db"), max_attempts=2)
+
+
+class TestSQLiteWorkQueue:
+    """Lease lifecycle of the SQLite queue."""
+
+    def test_enqueue_is_idempotent_and_leases_in_order(self, queue):
+        assert queue.enqueue(RUN_ID, [{"n": 0}, {"n": 1}]) == 2
+        assert queue.enqueue(RUN_ID, [{"n": 0}, {"n": 1}]) == 0
+
+        first = queue.lease("w1", lease_seconds=60)
+        second = queue.lease("w2", lease_seconds=60)
+
+        assert (first.seq, first.payload, first.attempt) == (0, {"n": 0}, 1)
+        assert second.seq == 1
+        assert queue.lease("w3", lease_seconds=60) is None
+        assert queue.progress(RUN_ID)["leased"] == 2
+
+    def test_lease_filters_by_run(self, queue):
+        queue.enqueue("other-run", [{"n": 0}])
+        queue.enqueue(RUN_ID, [{"n": 0}])
+
+        assert queue.lease("w1", lease_seconds=60, run_id=RUN_ID).run_id == RUN_ID
+
+    def test_expired_lease_is_fenced(self, queue):
+        queue.enqueue(RUN_ID, [{"n": 0}])
+        stale = queue.lease("w1", lease_seconds=-1)
+
+        fresh = queue.lease("w2", lease_seconds=60)
+
+        assert fresh.attempt == 2
+        assert not queue.heartbeat(stale, lease_seconds=60)
+        assert not queue.complete(stale, {"ok": False})
+        assert queue.heartbeat(fresh, lease_seconds=60)
+        assert queue.complete(fresh, {"ok": True})
+        [unit] = queue.results(RUN_ID)
+        assert (unit.state, unit.worker_id, unit.result) == ("done", "w2", {"ok": True})
+
+    def test_fail_retries_until_max_attempts(self, queue):
+        queue.enqueue(RUN_ID, [{"n": 0}])
+
+        assert queue.fail(queue.lease("w1", lease_seconds=60), "boom")
+        assert queue.progress(RUN_ID)["pending"] == 1
+        assert queue.fail(queue.lease("w1", lease_seconds=60), "boom again")
+
+        [unit] = queue.results(RUN_ID)
+        assert (unit.state, unit.attempts, unit.error) == ("failed", 2, "boom again")
+        assert queue.lease("w1", lease_seconds=60) is None
+
+    def test_expiry_on_last_attempt_fails_unit(self, queue):
+        queue.enqueue(RUN_ID, [{"n": 0}])
+        queue.lease("w1", lease_seconds=-1)
+        queue.lease("w2", lease_seconds=-1)
+
+        assert queue.progress(RUN_ID)["failed"] == 1
+        assert queue.results(RUN_ID)[0].error == "Lease expired on worker w2"
+
+    def test_enqueue_streams_in_batches(self, queue):
+        payloads = ({"n": n} for n in range(5))
+
+        with patch("llm_answer_watcher.llm_runner.work_queue.ENQUEUE_BATCH_SIZE", 2):
+            assert queue.enqueue(RUN_ID, payloads) == 5
+
+        assert [unit.seq for unit in queue.results(RUN_ID)] == [0, 1, 2, 3, 4]
+        assert queue.results(RUN_ID)[4].payload == {"n": 4}
+
+    def test_done_cost_sums_done_units(self, queue):
+        queue.enqueue(RUN_ID, [{"n": 0}, {"n": 1}, {"n": 2}])
+        queue.complete(queue.lease("w1", lease_seconds=60), {"total_cost_usd": 0.25})
+        queue.complete(queue.lease("w1", lease_seconds=60), {"total_cost_usd": 0.5})
+        queue.lease("w1", lease_seconds=60)
+
+        assert queue.done_cost(RUN_ID) == pytest.approx(0.75)
+        assert queue.done_cost("other-run") == 0.0
+
+    def test_cancel_only_pending_units(self, queue):
+        queue.enqueue(RUN_ID, [{"n": 0}, {"n": 1}])
+        leased = queue.lease("w1", lease_seconds=60)
+
+        assert queue.cancel(RUN_ID, "run_deadline") == 1
+        assert queue.complete(leased, {"ok": True})
+        assert queue.progress(RUN_ID) == {
+            "pending": 0,
+            "leased": 0,
+            "done": 1,
+            "failed": 0,
+            "cancelled": 1,
+        }
+
+
+def test_distributed_config_requires_heartbeat_within_lease():
+    with pytest.raises(ValidationError, match="heartbeat_seconds"):
+        DistributedConfig(lease_seconds=30, heartbeat_seconds=30)
+    with pytest.raises(ValidationError):
+        DistributedConfig(max_attempts=0)
+
+
+def _config(tmp_path, model_names=("gpt-4o-mini", "gpt-4o")) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[
+                ModelConfig(provider="openai", model_name=name, env_api_key="K")
+                for name in model_names
+            ],
+            distributed=DistributedConfig(
+                queue_path=str(tmp_path / "queue.db"),
+                lease_seconds=5,
+                heartbeat_seconds=0.05,
+                max_attempts=2,
+                poll_seconds=0.01,
+            ),
+            max_concurrent_requests=2,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[
+            Intent(id="best-crm", prompt="What is the best CRM?"),
+            Intent(id="cheap-crm", prompt="What is the cheapest CRM?"),
+        ],
+        models=[
+            RuntimeModel(provider="openai", model_name=name, api_key="sk-test")
+            for name in model_names
+        ],
+    )
+
+
+def test_unit_config_restricts_to_one_unit(tmp_path):
+    config = _config(tmp_path)
+    units = list(build_units(config, deadline_at=None))
+
+    restricted = unit_config(config, units[1])
+
+    assert len(units) == 4
+    assert [u["classify"] for u in units] == [True, False, True, False]
+    assert [i.id for i in restricted.intents] == ["best-crm"]
+    assert [m.model_name for m in restricted.models] == ["gpt-4o"]
+    assert restricted.run_settings.deadline_seconds is None
+
+    with pytest.raises(ValueError, match="not configured on this worker"):
+        unit_config(_config(tmp_path, model_names=("gpt-4o",)), units[0])
+
+
+class RecordingProgress:
+    """Progress callback recording complete_query() calls."""
+
+    def __init__(self):
+        self.completed = []
+
+    async def complete_query(self, query_key, success=True):
+        self.completed.append((query_key, success))
+
+
+async def _run_distributed(coordinator_config, worker_configs, progress_callback=None):
+    queue = SQLiteWorkQueue(coordinator_config.run_settings.distributed.queue_path, max_attempts=2)
+    mock = MockLLMClient(default_response="1. Warmly\n2. HubSpot", cost_per_response=0.01)
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=mock):
+        results, *worker_stats = await asyncio.gather(
+            run_coordinator(
+                coordinator_config, queue, run_id=RUN_ID, progress_callback=progress_callback
+            ),
+            *(
+                run_worker(config, queue, worker_id=f"w{n}", run_id=RUN_ID)
+                for n, config in enumerate(worker_configs, start=1)
+            ),
+        )
+    return results, worker_stats
+
+
+@pytest.mark.asyncio
+async def test_coordinator_aggregates_worker_results(tmp_path):
+    config = _config(tmp_path)
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+
+    results, worker_stats = await _run_distributed(config, [config, config])
+
+    assert (results["success_count"], results["error_count"]) == (4, 0)
+    assert results["total_cost_usd"] == pytest.approx(0.04)
+    assert sum(stats["completed"] for stats in worker_stats) == 4
+
+    with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        assert conn.execute("SELECT total_cost_usd FROM runs").fetchone()[0] == pytest.approx(0.04)
+        assert conn.execute("SELECT COUNT(*) FROM answers_raw").fetchone()[0] == 4
+
+    with open(os.path.join(results["output_dir"], "run_meta.json")) as f:
+        run_meta = json.load(f)
+    assert run_meta["success_count"] == 4
+    assert run_meta["distributed"]["states"] == {"done": 4}
+    assert sum(run_meta["distributed"]["workers"].values()) == 4
+
+
+@pytest.mark.asyncio
+async def test_unit_failing_on_every_attempt_is_reported_as_error(tmp_path):
+    config = _config(tmp_path)
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+    # The worker lacks gpt-4o, so its units fail on both attempts
+    worker_config = _config(tmp_path, model_names=("gpt-4o-mini",))
+
+    progress = RecordingProgress()
+
+    results, [stats] = await _run_distributed(config, [worker_config], progress)
+
+    assert (results["success_count"], results["error_count"]) == (2, 2)
+    assert stats["failed"] == 4
+    assert {e["model_name"] for e in results["errors"]} == {"gpt-4o"}
+    assert results["errors"][0]["error_message"].startswith("Unit failed after 2 attempts")
+    assert sorted(success for _, success in progress.completed) == [False, False, True, True]
+    error_file = get_error_filename("best-crm", "openai", "gpt-4o")
+    assert os.path.exists(os.path.join(results["output_dir"], error_file))
@@ -12,6 +12,7 @@ This comprehensive test suite validates HTML report generation with:
 - Error handling (missing files, invalid JSON)
 - Data aggregation across intents/models
 - File writing with UTF-8 encoding
+- build_result_rows() statuses and costs from a run summary
 - Integration tests with realistic scenarios
 
 Coverage target: 100% (critical module for user-facing output)
@@ -34,6 +35,7 @@ from llm_answer_watcher.report.generator import (
     _build_template_data,
     _calculate_visibility_scores,
     _load_model_result,
+    build_result_rows,
     generate_report,
     write_report,
 )
@@ -1702,6 +1704,50 @@ class TestWriteReport:
             write_report("/nonexistent/path", runtime_config, sample_results)
 
 
+# ============================================================================
+# Tests - build_result_rows() Function
+# ============================================================================
+
+
+class TestBuildResultRows:
+    """Tests for build_result_rows() used by `run` and the daemon."""
+
+    def test_statuses_and_costs(self, multi_intent_config):
+        def unit(intent_id, model_name):
+            return {"intent_id": intent_id, "model_provider": "openai", "model_name": model_name}
+
+        summary = {
+            "timestamp_utc": "2025-11-02T08:00:00Z",
+            "success_count": 1,
+            "total_cost_usd": 0.004,
+            "errors": [{**unit("email-warmup", "gpt-4o"), "error_message": "boom"}],
+            "skipped": [unit("crm-tools", "gpt-4o-mini")],
+            "timed_out": [unit("crm-tools", "gpt-4o")],
+        }
+
+        rows = build_result_rows(multi_intent_config, summary)
+
+        assert [(r["intent_id"], r["model_name"], r["status"], r["cost_usd"]) for r in rows] == [
+            ("email-warmup", "gpt-4o-mini", "success", 0.004),
+            ("email-warmup", "gpt-4o", "error", 0.0),
+            ("crm-tools", "gpt-4o-mini", "skipped", 0.0),
+            ("crm-tools", "gpt-4o", "timed_out", 0.0),
+        ]
+        assert {r["timestamp_utc"] for r in rows} == {"2025-11-02T08:00:00Z"}
+
+    def test_no_successes_costs_nothing(self, runtime_config):
+        summary = {
+            "timestamp_utc": "2025-11-02T08:00:00Z",
+            "success_count": 0,
+            "total_cost_usd": 0.0,
+        }
+
+        [row] = build_result_rows(runtime_config, summary)
+
+        assert row["status"] == "success"
+        assert row["cost_usd"] == 0.0
+
+
 # ============================================================================
 # Tests - Empty and Partial Data
 # ============================================================================
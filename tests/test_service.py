@@ -0,0 +1,253 @@
+"""
+Tests for service.py (HTTP job API over run_all).
+
+Tests cover:
+- POST /runs -> GET /runs/{id} end to end with MockLLMClient
+- SSE progress stream built from start_query/complete_query hooks, with
+  total_queries counting intents_source rows once the run starts
+- Request validation errors (unknown config/intent/job, bad JSON)
+- Bounded queue (429) and per-tenant concurrency cap
+- Unique run_ids for jobs started in the same second
+- Lifespan startup sharing one HTTP connection pool across jobs
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    IntentsSource,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.http_pool import pool_active
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.service import RunService, ServiceApp
+
+RUN_SUMMARY = {"run_id": "r", "success_count": 1, "total_queries": 1, "errors": []}
+
+
+def _config(tmp_path) -> RuntimeConfig:
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="KEY")],
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[
+            Intent(id="best-tools", prompt="What are the best sales tools?"),
+            Intent(id="best-crm", prompt="What is the best CRM?"),
+        ],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="sk-test",
+                system_prompt="You are a helpful assistant.",
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    return RunService({"watcher": _config(tmp_path)})
+
+
+def _client(service):
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=ServiceApp(service)), base_url="http://test"
+    )
+
+
+async def _wait_finished(service):
+    await asyncio.gather(*list(service._running.values()))
+
+
+def _blocking_run_all(release: asyncio.Event):
+    async def run(*args, **kwargs):
+        await release.wait()
+        return RUN_SUMMARY
+
+    return AsyncMock(side_effect=run)
+
+
+@pytest.mark.asyncio
+class TestRunEndpoints:
+    """End-to-end job execution with MockLLMClient."""
+
+    async def test_post_and_get_run(self, service):
+        mock = MockLLMClient(default_response="1. Warmly\n2. HubSpot")
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=mock):
+            async with _client(service) as client:
+                response = await client.post(
+                    "/runs", json={"config": "watcher", "intent_ids": ["best-crm"]}
+                )
+                assert response.status_code == 202
+                job_id = response.json()["job_id"]
+                assert response.headers["location"] == f"/runs/{job_id}"
+
+                await _wait_finished(service)
+                job = (await client.get(f"/runs/{job_id}")).json()
+
+        assert job["status"] == "completed"
+        assert job["progress"] == {
+            "total_queries": 1,
+            "completed_queries": 1,
+            "failed_queries": 0,
+        }
+        assert job["result"]["success_count"] == 1
+        assert job["result"]["run_id"] == job["run_id"]
+
+    async def test_total_queries_counts_intents_source(self, tmp_path):
+        source = tmp_path / "intents.csv"
+        source.write_text("id,prompt\nq-1,Best CRM?\nq-2,Cheapest CRM?\nq-3,CRM for startups?\n")
+        config = _config(tmp_path)
+        config.intents_source = IntentsSource(path=str(source))
+        service = RunService({"watcher": config})
+        mock = MockLLMClient(default_response="1. Warmly")
+
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=mock):
+            job = service.submit({"config": "watcher"})
+            assert job.total_queries == 2  # inline intents until the run starts
+            await _wait_finished(service)
+
+        assert job.total_queries == 5
+        assert job.completed_queries == 5
+
+    async def test_event_stream(self, service):
+        mock = MockLLMClient(default_response="1. Warmly")
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=mock):
+            async with _client(service) as client:
+                job_id = (await client.post("/runs", json={})).json()["job_id"]
+                response = await client.get(f"/runs/{job_id}/events")
+
+        assert response.headers["content-type"] == "text/event-stream"
+        events = [
+            (block.split("\n")[1][len("event: ") :], json.loads(block.split("\n")[2][6:]))
+            for block in response.text.strip().split("\n\n")
+        ]
+        names = [name for name, _ in events]
+        assert names.count("query_started") == 2
+        assert names.count("query_completed") == 2
+        assert events[-1][0] == "status"
+        assert events[-1][1]["status"] == "completed"
+
+    async def test_event_stream_resumes_after_last_event_id(self, service):
+        with patch("llm_answer_watcher.service.run_all", new=AsyncMock(return_value=RUN_SUMMARY)):
+            async with _client(service) as client:
+                job_id = (await client.post("/runs", json={})).json()["job_id"]
+                await _wait_finished(service)
+                response = await client.get(
+                    f"/runs/{job_id}/events", headers={"Last-Event-ID": "1"}
+                )
+
+        assert response.text.startswith("id: 2\n")
+
+    @pytest.mark.parametrize(
+        ("body", "status"),
+        [
+            ({"config": "missing"}, 404),
+            ({"intent_ids": ["nope"]}, 400),
+            ({"intent_ids": []}, 400),
+            ([1, 2], 400),
+        ],
+    )
+    async def test_invalid_requests(self, service, body, status):
+        async with _client(service) as client:
+            response = await client.post("/runs", json=body)
+
+        assert response.status_code == status
+        assert "error" in response.json()
+
+    async def test_invalid_json_and_unknown_routes(self, service):
+        async with _client(service) as client:
+            assert (await client.post("/runs", content=b"{not json")).status_code == 400
+            assert (await client.get("/runs/unknown")).status_code == 404
+            assert (await client.delete("/runs")).status_code == 404
+
+
+@pytest.mark.asyncio
+class TestScheduling:
+    """Queue bounds and per-tenant concurrency."""
+
+    async def test_queue_full_returns_429(self, tmp_path):
+        service = RunService(
+            {"watcher": _config(tmp_path)}, max_queue_size=1, max_concurrent_jobs=1
+        )
+        release = asyncio.Event()
+
+        with patch("llm_answer_watcher.service.run_all", new=_blocking_run_all(release)):
+            async with _client(service) as client:
+                statuses = [(await client.post("/runs", json={})).status_code for _ in range(3)]
+                health = (await client.get("/health")).json()
+                release.set()
+                await _wait_finished(service)
+                await _wait_finished(service)
+
+        assert statuses == [202, 202, 429]
+        assert health["queued"] == 1
+        assert health["running"] == 1
+
+    async def test_tenant_cap_does_not_block_other_tenants(self, tmp_path):
+        service = RunService(
+            {"watcher": _config(tmp_path)}, max_concurrent_jobs=4, max_jobs_per_tenant=1
+        )
+        release = asyncio.Event()
+
+        with patch("llm_answer_watcher.service.run_all", new=_blocking_run_all(release)):
+            first = service.submit({}, tenant="a")
+            second = service.submit({}, tenant="a")
+            other = service.submit({"tenant": "b"})
+
+            assert (first.status, second.status, other.status) == ("running", "queued", "running")
+            assert service.health()["running_by_tenant"] == {"a": 1, "b": 1}
+
+            release.set()
+            await _wait_finished(service)
+            await _wait_finished(service)
+
+        assert second.status == "completed"
+
+    async def test_unique_run_ids_within_one_second(self, service):
+        with patch("llm_answer_watcher.service.run_all", new=_blocking_run_all(asyncio.Event())):
+            with patch(
+                "llm_answer_watcher.service.run_id_from_timestamp",
+                return_value="2025-11-03T10-00-00Z",
+            ):
+                jobs = [service.submit({}, tenant=f"t{i}") for i in range(3)]
+            for task in service._running.values():
+                task.cancel()
+
+        assert [job.run_id for job in jobs] == [
+            "2025-11-03T10-00-00Z",
+            "2025-11-03T10-00-00-01Z",
+            "2025-11-03T10-00-00-02Z",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_jobs_share_connection_pool_after_start(service):
+    seen = []
+
+    async def record_pool(*args, **kwargs):
+        seen.append(pool_active())
+        return RUN_SUMMARY
+
+    await service.start()
+    with patch("llm_answer_watcher.service.run_all", new=AsyncMock(side_effect=record_pool)):
+        service.submit({})
+        service.submit({})
+        await _wait_finished(service)
+    await service.shutdown()
+
+    assert seen == [True, True]
+    assert not pool_active()
@@ -0,0 +1,381 @@
+"""
+Tests for the warm Steel session pool.
+
+A local fake Steel API (a real HTTP server speaking the /v1/sessions
+endpoints) stands in for api.steel.dev; the Steel SDK is pointed at it
+through SteelConfig.base_url.
+
+Tests cover:
+- Sessions created lazily up to the pool size, then reused across intents
+- warm() pre-creating sessions
+- Recycling after max age, max errors, failed health checks or resets
+- acquire() blocking while every session is leased
+- close() releasing idle sessions
+- SteelChatGPTRunner leasing pooled sessions instead of creating one per intent
+- run_all() sharing one runner (and its pool) across intents
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("steel")
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    RunnerConfig,
+    RunSettings,
+    RuntimeConfig,
+)
+from llm_answer_watcher.llm_runner.browser.session_pool import (
+    RECYCLE_AGE,
+    RECYCLE_CLOSED,
+    RECYCLE_ERRORS,
+    RECYCLE_RESET_FAILED,
+    RECYCLE_UNHEALTHY,
+    SteelSessionPool,
+)
+from llm_answer_watcher.llm_runner.browser.steel_base import SteelConfig
+from llm_answer_watcher.llm_runner.browser.steel_chatgpt import (
+    SteelChatGPTPlugin,
+    SteelChatGPTRunner,
+)
+from llm_answer_watcher.llm_runner.runner import run_all
+
+
+class FakeSteelAPI:
+    """In-process HTTP server implementing the Steel session endpoints."""
+
+    def __init__(self):
+        self.sessions: dict[str, str] = {}  # id -> status
+        self.created = 0
+        self.released: list[str] = []
+        self._lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                if self.path == "/v1/sessions":
+                    self._send(api.create())
+                elif match := re.fullmatch(r"/v1/sessions/([^/]+)/release", self.path):
+                    self._send(api.release(match.group(1)))
+                else:
+                    self.send_error(404)
+
+            def do_GET(self):
+                if match := re.fullmatch(r"/v1/sessions/([^/]+)", self.path):
+                    self._send(api.session(match.group(1)))
+                else:
+                    self.send_error(404)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    def create(self) -> dict:
+        with self._lock:
+            self.created += 1
+            session_id = f"sess-{self.created}"
+            self.sessions[session_id] = "live"
+        return self.session(session_id)
+
+    def release(self, session_id: str) -> dict:
+        with self._lock:
+            self.sessions[session_id] = "released"
+            self.released.append(session_id)
+        return {"success": True}
+
+    def session(self, session_id: str) -> dict:
+        return {
+            "id": session_id,
+            "status": self.sessions.get(session_id, "failed"),
+            "websocketUrl": "",
+            "createdAt": "2025-11-01T08:00:00Z",
+            "creditsUsed": 0,
+            "debugUrl": "",
+            "dimensions": {"width": 1280, "height": 800},
+            "duration": 0,
+            "eventCount": 0,
+            "optimizeBandwidth": {},
+            "proxyBytesUsed": 0,
+            "sessionViewerUrl": "",
+            "timeout": 300,
+        }
+
+    @property
+    def live(self) -> int:
+        return sum(status == "live" for status in self.sessions.values())
+
+    def shutdown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def steel_api():
+    api = FakeSteelAPI()
+    yield api
+    api.shutdown()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SilentChatGPTRunner(SteelChatGPTRunner):
+    """ChatGPT runner with the browser steps stubbed out."""
+
+    def _navigate_and_submit(self, session, prompt):
+        if "fail" in prompt:
+            raise RuntimeError("input field not found")
+
+    def _extract_answer(self, session):
+        return f"1. Warmly (from {session['id']})"
+
+    def _extract_web_sources(self, session):
+        return None
+
+
+def _runner(steel_api, **overrides) -> SilentChatGPTRunner:
+    config = SteelConfig(
+        steel_api_key="ste-test",
+        target_url="https://chat.openai.com",
+        take_screenshots=False,
+        save_html_snapshot=False,
+        base_url=steel_api.url,
+        **overrides,
+    )
+    return SilentChatGPTRunner(config)
+
+
+def _pool(runner, clock=None, **settings) -> SteelSessionPool:
+    settings = {"size": 2, "max_age_seconds": 60, "max_errors": 2, **settings}
+    return SteelSessionPool(
+        create=runner._create_session,
+        release=runner._release_session,
+        check=runner._check_session,
+        reset=runner._reset_session,
+        clock=clock or FakeClock(),
+        **settings,
+    )
+
+
+class TestSteelSessionPool:
+    """Pool behaviour against the fake Steel API."""
+
+    def test_reuses_sessions(self, steel_api):
+        pool = _pool(_runner(steel_api))
+
+        for _ in range(5):
+            with pool.session() as session:
+                assert session["id"] == "sess-1"
+
+        assert steel_api.created == 1
+        assert pool.reused == 4
+
+    def test_creates_up_to_size_when_all_leased(self, steel_api):
+        pool = _pool(_runner(steel_api))
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        third = pool.acquire()
+
+        assert {first.session_id, second.session_id} == {"sess-1", "sess-2"}
+        assert third.session_id == "sess-1"
+        assert steel_api.created == 2
+
+    def test_warm_precreates_sessions(self, steel_api):
+        pool = _pool(_runner(steel_api), size=3)
+
+        assert pool.warm() == 3
+        assert pool.warm() == 0
+        assert steel_api.live == 3
+        assert pool.stats()["idle"] == 3
+
+    def test_recycles_after_max_age(self, steel_api):
+        clock = FakeClock()
+        pool = _pool(_runner(steel_api), clock=clock)
+
+        with pool.session():
+            pass
+        clock.now = 61
+        with pool.session() as session:
+            assert session["id"] == "sess-2"
+
+        assert steel_api.released == ["sess-1"]
+        assert pool.recycled[RECYCLE_AGE] == 1
+
+    def test_recycles_after_max_errors(self, steel_api):
+        pool = _pool(_runner(steel_api))
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError), pool.session():
+                raise RuntimeError("page crashed")
+
+        assert steel_api.released == ["sess-1"]
+        assert pool.recycled[RECYCLE_ERRORS] == 1
+        with pool.session() as session:
+            assert session["id"] == "sess-2"
+
+    def test_replaces_session_that_failed_health_check(self, steel_api):
+        pool = _pool(_runner(steel_api))
+        with pool.session():
+            pass
+        steel_api.sessions["sess-1"] = "failed"
+
+        with pool.session() as session:
+            assert session["id"] == "sess-2"
+        assert pool.recycled[RECYCLE_UNHEALTHY] == 1
+
+    def test_recycles_session_whose_reset_failed(self, steel_api):
+        runner = _runner(steel_api)
+        pool = _pool(runner)
+
+        with patch.object(runner, "_reset_session", return_value=False):
+            pool._reset = runner._reset_session
+            with pool.session():
+                pass
+
+        assert pool.recycled[RECYCLE_RESET_FAILED] == 1
+        assert steel_api.live == 0
+
+    def test_acquire_waits_for_a_free_session(self, steel_api):
+        pool = _pool(_runner(steel_api), size=1)
+        leased = pool.acquire()
+        acquired = []
+
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert acquired == []
+
+        pool.release(leased)
+        waiter.join(timeout=5)
+        assert acquired[0].session_id == leased.session_id
+        assert steel_api.created == 1
+
+    def test_close_releases_idle_sessions(self, steel_api):
+        pool = _pool(_runner(steel_api))
+        pool.warm()
+
+        pool.close()
+
+        assert steel_api.live == 0
+        assert pool.recycled[RECYCLE_CLOSED] == 2
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
+
+    def test_size_must_be_positive(self, steel_api):
+        with pytest.raises(ValueError, match="at least 1"):
+            _pool(_runner(steel_api), size=0)
+
+
+class TestPooledRunner:
+    """SteelChatGPTRunner with session_pool_size set."""
+
+    def test_runner_reuses_pooled_session(self, steel_api):
+        runner = _runner(steel_api, session_pool_size=1)
+
+        results = [runner.run_intent(f"Best CRM {i}?") for i in range(3)]
+
+        assert all(result.success for result in results)
+        assert {result.session_id for result in results} == {"sess-1"}
+        assert steel_api.created == 1
+
+        runner.close()
+        assert steel_api.released == ["sess-1"]
+
+    def test_failed_prompts_count_against_session(self, steel_api):
+        runner = _runner(steel_api, session_pool_size=1, session_max_errors=1)
+
+        result = runner.run_intent("please fail")
+
+        assert not result.success
+        assert "input field not found" in result.error_message
+        assert steel_api.released == ["sess-1"]
+
+    def test_without_pool_creates_session_per_intent(self, steel_api):
+        runner = _runner(steel_api, session_reuse=False)
+
+        for i in range(2):
+            runner.run_intent(f"Best CRM {i}?")
+
+        assert steel_api.created == 2
+        assert steel_api.released == ["sess-1", "sess-2"]
+        assert runner.session_pool is None
+
+    def test_plugin_validates_pool_settings(self):
+        ok, _ = SteelChatGPTPlugin.validate_config(
+            {"steel_api_key": "ste-test", "session_pool_size": 2}
+        )
+        assert ok
+        ok, message = SteelChatGPTPlugin.validate_config(
+            {"steel_api_key": "ste-test", "session_pool_size": -1}
+        )
+        assert not ok
+        assert "session_pool_size" in message
+
+
+@pytest.mark.asyncio
+async def test_run_all_shares_pool_across_intents(steel_api, tmp_path):
+    config = RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "watcher.db"),
+            models=[],
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"q-{i}", prompt=f"Best CRM {i}?") for i in range(4)],
+        models=[],
+        runner_configs=[
+            RunnerConfig(
+                runner_plugin="steel-chatgpt",
+                config={
+                    "steel_api_key": "ste-test",
+                    "base_url": steel_api.url,
+                    "take_screenshots": False,
+                    "save_html_snapshot": False,
+                    "session_pool_size": 2,
+                },
+            )
+        ],
+    )
+
+    with (
+        patch.object(SteelChatGPTRunner, "_navigate_and_submit"),
+        patch.object(SteelChatGPTRunner, "_extract_answer", return_value="1. Warmly"),
+        patch.object(SteelChatGPTRunner, "_extract_web_sources", return_value=None),
+    ):
+        result = await run_all(config)
+
+    assert result["success_count"] == 4
+    assert steel_api.created <= 2
+    # Pool closed at the end of the run
+    assert steel_api.live == 0
@@ -0,0 +1,270 @@
+"""
+Tests for storage/blobs.py module.
+
+Tests cover:
+- Content addressing and deduplication of identical artifacts
+- Compressed HTML snapshots readable through BlobStore.read()
+- Background writes completing on flush()/close()
+- Pillow requirement for screenshot conversion
+- Garbage collection of blobs no longer referenced by answers_raw, with
+  reused blobs kept for the grace period
+- Blob GC as part of run_maintenance
+"""
+
+import io
+import os
+import sqlite3
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from llm_answer_watcher.config.schema import RetentionConfig
+from llm_answer_watcher.storage import blobs
+from llm_answer_watcher.storage.blobs import BlobStore, collect_garbage
+from llm_answer_watcher.storage.db import init_db_if_needed, insert_answer_raw, insert_run
+from llm_answer_watcher.storage.maintenance import run_maintenance
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+HTML = "<html><body>" + "HubSpot is the best CRM. " * 200 + "</body></html>"
+
+
+@pytest.fixture
+def store(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    yield blob_store
+    blob_store.close()
+
+
+def _age(path, seconds):
+    """Backdate a blob's mtime so it falls outside the GC grace period."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _add_answer(conn, run_id, screenshot_path=None, html_snapshot_path=None):
+    insert_run(conn, run_id, "2025-05-30T08:00:00Z", total_intents=1, total_models=1)
+    insert_answer_raw(
+        conn,
+        run_id=run_id,
+        intent_id="best-crm",
+        model_provider="chatgpt-web",
+        model_name="chatgpt",
+        timestamp_utc="2025-05-30T08:00:00Z",
+        prompt="What is the best CRM?",
+        answer_text="HubSpot",
+        runner_type="browser",
+        screenshot_path=screenshot_path,
+        html_snapshot_path=html_snapshot_path,
+    )
+    conn.commit()
+
+
+def test_identical_screenshots_are_deduplicated(store, tmp_path):
+    first = store.put_screenshot(PNG_BYTES)
+    second = store.put_screenshot(PNG_BYTES)
+    store.flush()
+
+    assert first == second
+    assert Path(first).parent.parent == tmp_path / "blobs"
+    assert Path(first).suffix == ".png"
+    assert Path(first).read_bytes() == PNG_BYTES
+    assert store.stats()["written"] == 1
+    assert store.stats()["deduplicated"] == 1
+
+
+def test_different_content_gets_different_blobs(store):
+    first = store.put_screenshot(PNG_BYTES)
+    second = store.put_screenshot(PNG_BYTES + b"\x01")
+    store.flush()
+
+    assert first != second
+    assert Path(first).exists()
+    assert Path(second).exists()
+
+
+def test_existing_blob_not_rewritten(tmp_path):
+    first_store = BlobStore(str(tmp_path))
+    path = first_store.put_html(HTML)
+    first_store.close()
+
+    second_store = BlobStore(str(tmp_path))
+    assert second_store.put_html(HTML) == path
+    second_store.close()
+    assert second_store.written == 0
+    assert second_store.deduplicated == 1
+
+
+def test_html_is_compressed_and_readable(store):
+    path = store.put_html(HTML)
+    store.close()
+
+    assert path.endswith(".html.zst" if blobs.zstandard is not None else ".html.gz")
+    assert Path(path).stat().st_size < len(HTML)
+    assert BlobStore.read(path).decode("utf-8") == HTML
+
+
+def test_gzip_fallback_without_zstandard(tmp_path, monkeypatch):
+    monkeypatch.setattr(blobs, "zstandard", None)
+    gzip_store = BlobStore(str(tmp_path))
+    path = gzip_store.put_html(HTML)
+    gzip_store.close()
+
+    assert path.endswith(".html.gz")
+    assert BlobStore.read(path).decode("utf-8") == HTML
+
+
+def test_read_plain_legacy_artifact(tmp_path):
+    legacy = tmp_path / "snapshot_best-crm_abc.html"
+    legacy.write_text(HTML, encoding="utf-8")
+
+    assert BlobStore.read(legacy).decode("utf-8") == HTML
+
+
+def test_close_waits_for_pending_writes(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    paths = [blob_store.put_html(f"<p>{i}</p>") for i in range(20)]
+    blob_store.close()
+
+    assert all(Path(p).exists() for p in paths)
+    assert blob_store.stats()["pending"] == 0
+    assert not list((tmp_path / "blobs").glob("*/.tmp-*"))
+
+
+def test_unknown_screenshot_format_rejected(tmp_path):
+    with pytest.raises(ValueError, match="screenshot_format"):
+        BlobStore(str(tmp_path), screenshot_format="gif")
+
+
+def test_conversion_without_pillow_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(blobs, "Image", None)
+    with pytest.raises(ImportError, match="Pillow"):
+        BlobStore(str(tmp_path), screenshot_format="webp")
+    with pytest.raises(ImportError, match="Pillow"):
+        BlobStore(str(tmp_path), screenshot_max_width=800)
+
+
+def test_downscale_to_webp(tmp_path):
+    image_module = pytest.importorskip("PIL.Image")
+
+    source = io.BytesIO()
+    image_module.new("RGB", (1600, 1000), "white").save(source, format="PNG")
+
+    webp_store = BlobStore(str(tmp_path), screenshot_format="webp", screenshot_max_width=800)
+    path = webp_store.put_screenshot(source.getvalue())
+    webp_store.close()
+
+    assert path.endswith(".webp")
+    with image_module.open(path) as stored:
+        assert stored.format == "WEBP"
+        assert stored.size == (800, 500)
+
+
+def test_gc_deletes_only_unreferenced_blobs(tmp_path, store):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+
+    kept_png = store.put_screenshot(PNG_BYTES)
+    kept_html = store.put_html(HTML)
+    orphan = store.put_screenshot(PNG_BYTES + b"orphan")
+    store.flush()
+    for path in (kept_png, kept_html, orphan):
+        _age(path, 7200)
+
+    with sqlite3.connect(db_path) as conn:
+        _add_answer(conn, "run-1", screenshot_path=kept_png, html_snapshot_path=kept_html)
+        report = collect_garbage(conn, str(tmp_path))
+
+    assert report.blobs_scanned == 3
+    assert report.blobs_referenced == 2
+    assert report.blobs_deleted == 1
+    assert report.bytes_freed == len(PNG_BYTES) + len(b"orphan")
+    assert Path(kept_png).exists()
+    assert Path(kept_html).exists()
+    assert not Path(orphan).exists()
+    assert not Path(orphan).parent.exists() or any(Path(orphan).parent.iterdir())
+
+
+def test_gc_matches_relative_reference_paths(tmp_path, store):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    path = store.put_screenshot(PNG_BYTES)
+    store.flush()
+    _age(path, 7200)
+
+    relative = os.path.join("output", "blobs", Path(path).parent.name, Path(path).name)
+    with sqlite3.connect(db_path) as conn:
+        _add_answer(conn, "run-1", screenshot_path=relative)
+        report = collect_garbage(conn, str(tmp_path))
+
+    assert report.blobs_deleted == 0
+    assert Path(path).exists()
+
+
+def test_gc_keeps_recent_orphans_and_dry_run(tmp_path, store):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    recent = store.put_screenshot(PNG_BYTES)
+    old = store.put_html(HTML)
+    store.flush()
+    _age(old, 7200)
+
+    with sqlite3.connect(db_path) as conn:
+        dry = collect_garbage(conn, str(tmp_path), dry_run=True)
+        assert dry.blobs_deleted == 1
+        assert dry.blobs_in_grace == 1
+        assert Path(old).exists()
+
+        report = collect_garbage(conn, str(tmp_path))
+
+    assert report.blobs_deleted == 1
+    assert Path(recent).exists()
+    assert not Path(old).exists()
+
+
+def test_reused_blob_is_protected_by_grace_period(tmp_path, store):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    path = store.put_html(HTML)
+    store.flush()
+    _age(path, 7200)
+
+    # A later run deduplicates against the old, unreferenced blob
+    assert store.put_html(HTML) == path
+
+    with sqlite3.connect(db_path) as conn:
+        report = collect_garbage(conn, str(tmp_path))
+
+    assert report.blobs_in_grace == 1
+    assert Path(path).exists()
+
+
+def test_gc_without_blob_directory(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    with sqlite3.connect(db_path) as conn:
+        report = collect_garbage(conn, str(tmp_path))
+
+    assert report.blobs_scanned == 0
+
+
+def test_maintenance_collects_orphaned_blobs(tmp_path):
+    output_dir = tmp_path / "output"
+    db_path = output_dir / "watcher.db"
+    init_db_if_needed(str(db_path))
+
+    blob_store = BlobStore(str(output_dir))
+    orphan = blob_store.put_screenshot(PNG_BYTES)
+    blob_store.close()
+    _age(orphan, 7200)
+
+    report = run_maintenance(
+        str(db_path),
+        str(output_dir),
+        RetentionConfig(),
+        now=datetime.now(UTC),
+    )
+
+    assert report.blobs_deleted == 1
+    assert not Path(orphan).exists()
@@ -111,7 +111,7 @@ def test_init_db_creates_schema_version_table(tmp_path):
 
 
 def test_init_db_creates_all_tables(tmp_path):
-    """Test that all tables are created (runs, answers_raw, mentions, operations, intent_classifications, intent_classification_cache, schema_version)."""
+    """Test that all tables are created (runs, answers_raw, mentions, operations, intent_classifications, intent_classification_cache, extraction_cache, answer_samples, sample_aggregates, query_skips, sources, schema_version)."""
     db_path = tmp_path / "test.db"
     init_db_if_needed(str(db_path))
 
@@ -122,13 +122,18 @@ def test_init_db_creates_all_tables(tmp_path):
         tables = [row[0] for row in cursor.fetchall()]
 
     expected_tables = [
+        "answer_samples",
         "answers_raw",
+        "extraction_cache",
         "intent_classification_cache",
         "intent_classifications",
         "mentions",
         "operations",
+        "query_skips",
         "runs",
+        "sample_aggregates",
         "schema_version",
+        "sources",
     ]
     assert sorted(tables) == sorted(expected_tables)
 
@@ -162,6 +167,16 @@ def test_init_db_creates_all_indexes(tmp_path):
         "idx_operations_operation_id",
         "idx_intent_cache_cached_at",
         "idx_intent_cache_last_accessed",
+        "idx_extraction_cache_last_accessed",
+        "idx_extraction_cache_brands",
+        "idx_answer_samples_run",
+        "idx_sample_aggregates_intent_model",
+        "idx_query_skips_unit",
+        "idx_answers_unit",
+        "idx_answers_model",
+        "idx_sources_domain",
+        "idx_sources_run",
+        "idx_sources_intent",
     ]
     assert sorted(indexes) == sorted(expected_indexes)
 
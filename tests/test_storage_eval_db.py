@@ -8,6 +8,7 @@ This test module validates all eval database functionality including:
 - Migration functionality
 - Index creation and query optimization
 - Transaction handling and error cases
+- Result lookup by case hash (eval result cache)
 """
 
 import json
@@ -18,6 +19,8 @@ import pytest
 
 from llm_answer_watcher.storage.eval_db import (
     EVAL_CURRENT_SCHEMA_VERSION,
+    apply_eval_migrations,
+    get_cached_eval_results,
     get_eval_schema_version,
     get_failing_tests,
     get_metric_trend,
@@ -69,6 +72,7 @@ class TestEvalDatabaseInitialization:
 
         # Verify all expected indexes exist
         expected_indexes = [
+            "idx_eval_results_case_hash",
             "idx_eval_results_metric_name",
             "idx_eval_results_passed",
             "idx_eval_results_run_id",
@@ -825,6 +829,100 @@ class TestEvalDatabaseIntegration:
         assert final_count == initial_count  # Should be unchanged
 
 
+class TestEvalResultCache:
+    """Test looking up stored results by case hash."""
+
+    def _store(self, conn, run_id, value, case_hash="hash-a"):
+        insert_eval_run(conn, run_id, {"total_test_cases": 1})
+        for name in ("mention_precision", "mention_recall"):
+            insert_eval_result(
+                conn,
+                eval_run_id=run_id,
+                test_description="Cached case",
+                overall_passed=value >= 0.5,
+                metric_name=name,
+                metric_value=value,
+                metric_passed=value >= 0.5,
+                metric_details={"run": run_id},
+                case_hash=case_hash,
+            )
+        conn.commit()
+
+    def test_lookup_returns_metrics_in_stored_order(self, tmp_path):
+        """Stored metrics come back with values, pass flags and details."""
+        db_path = tmp_path / "test_eval.db"
+        init_eval_db_if_needed(str(db_path))
+
+        with sqlite3.connect(str(db_path)) as conn:
+            self._store(conn, "run-1", 0.9)
+            cached = get_cached_eval_results(conn, ["hash-a", "hash-missing"])
+
+        assert list(cached) == ["hash-a"]
+        entry = cached["hash-a"]
+        assert entry["test_description"] == "Cached case"
+        assert entry["overall_passed"] is True
+        assert [m["name"] for m in entry["metrics"]] == [
+            "mention_precision",
+            "mention_recall",
+        ]
+        assert entry["metrics"][0] == {
+            "name": "mention_precision",
+            "value": 0.9,
+            "passed": True,
+            "details": {"run": "run-1"},
+        }
+
+    def test_lookup_prefers_most_recent_run(self, tmp_path):
+        """When several runs stored a case, the latest one is returned."""
+        db_path = tmp_path / "test_eval.db"
+        init_eval_db_if_needed(str(db_path))
+
+        with sqlite3.connect(str(db_path)) as conn:
+            self._store(conn, "run-1", 0.2)
+            self._store(conn, "run-2", 0.8)
+            cached = get_cached_eval_results(conn, ["hash-a"])
+
+        assert len(cached["hash-a"]["metrics"]) == 2
+        assert all(m["value"] == 0.8 for m in cached["hash-a"]["metrics"])
+
+    def test_lookup_chunks_large_hash_lists(self, tmp_path):
+        """More hashes than SQLite host parameters are looked up in chunks."""
+        db_path = tmp_path / "test_eval.db"
+        init_eval_db_if_needed(str(db_path))
+        hashes = [f"hash-{i}" for i in range(1500)]
+
+        with sqlite3.connect(str(db_path)) as conn:
+            self._store(conn, "run-1", 0.9, case_hash=hashes[-1])
+            cached = get_cached_eval_results(conn, hashes)
+
+        assert list(cached) == [hashes[-1]]
+
+    def test_v1_database_migrates_to_case_hash(self, tmp_path):
+        """Existing v1 databases gain the case_hash column; old rows never match."""
+        db_path = tmp_path / "test_eval.db"
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.execute(
+                "CREATE TABLE eval_schema_version "
+                "(version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+            )
+            apply_eval_migrations(conn, 0, 1)
+            insert_eval_run(conn, "old-run", {"total_test_cases": 1})
+            conn.execute(
+                "INSERT INTO eval_results (eval_run_id, test_description, overall_passed, "
+                "metric_name, metric_value, metric_passed, created_at) "
+                "VALUES ('old-run', 'Old case', 1, 'mention_f1', 1.0, 1, 'now')"
+            )
+            conn.commit()
+
+        init_eval_db_if_needed(str(db_path))
+
+        with sqlite3.connect(str(db_path)) as conn:
+            assert get_eval_schema_version(conn) == 2
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(eval_results)")]
+            assert "case_hash" in columns
+            assert get_cached_eval_results(conn, ["anything"]) == {}
+
+
 class TestEvalDatabasePerformance:
     """Test eval database performance and optimization."""
 
@@ -0,0 +1,383 @@
+"""
+Tests for storage/maintenance.py module.
+
+Tests cover:
+- Retention day resolution (global default, per-table overrides, caps)
+- Whole-run archival (NDJSON rows + run directory tarball) and deletion
+- Per-table purge with shorter retention than runs
+- Intent classification cache eviction
+- Dry runs (nothing archived or deleted)
+- Resumability (re-running is a no-op, an interrupted purge finishes on
+  the next pass without orphaning run directories)
+- Incremental vacuum on freshly created databases
+- RetentionConfig validation
+"""
+
+import gzip
+import json
+import sqlite3
+import tarfile
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import RetentionConfig
+from llm_answer_watcher.storage import maintenance
+from llm_answer_watcher.storage.db import (
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_mention,
+    insert_run,
+    store_intent_classification_cache,
+)
+from llm_answer_watcher.storage.maintenance import (
+    resolve_retention_days,
+    run_maintenance,
+    vacuum_database,
+)
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+OLD_RUN = "2025-01-01T08-00-00Z"
+NEW_RUN = "2025-05-30T08-00-00Z"
+
+
+def _add_run(conn, run_id, timestamp):
+    insert_run(conn, run_id, timestamp, total_intents=1, total_models=1)
+    insert_answer_raw(
+        conn,
+        run_id=run_id,
+        intent_id="best-crm",
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc=timestamp,
+        prompt="What is the best CRM?",
+        answer_text="HubSpot and Salesforce are popular.",
+    )
+    insert_mention(
+        conn,
+        run_id=run_id,
+        timestamp_utc=timestamp,
+        intent_id="best-crm",
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        brand_name="HubSpot",
+        normalized_name="hubspot",
+        is_mine=True,
+        rank_position=1,
+    )
+
+
+@pytest.fixture
+def populated(tmp_path):
+    """Database with one old run, one recent run, and run directories on disk."""
+    db_path = tmp_path / "output" / "watcher.db"
+    output_dir = tmp_path / "output"
+    init_db_if_needed(str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        _add_run(conn, OLD_RUN, "2025-01-01T08:00:00Z")
+        _add_run(conn, NEW_RUN, "2025-05-30T08:00:00Z")
+        conn.commit()
+
+    for run_id in (OLD_RUN, NEW_RUN):
+        run_dir = output_dir / run_id
+        run_dir.mkdir(parents=True)
+        (run_dir / "run_meta.json").write_text(json.dumps({"run_id": run_id}))
+
+    return db_path, output_dir
+
+
+def _count(db_path, table, run_id=None):
+    with sqlite3.connect(db_path) as conn:
+        if run_id is None:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE run_id = ?", (run_id,)).fetchone()[
+            0
+        ]
+
+
+# ============================================================================
+# Retention Resolution
+# ============================================================================
+
+
+def test_resolve_retention_days_inherits_max_age():
+    days = resolve_retention_days(RetentionConfig(max_age_days=90))
+
+    assert days["runs"] == 90
+    assert days["answers_raw"] == 90
+    assert days["mentions"] == 90
+    assert "intent_classification_cache" not in days
+
+
+def test_resolve_retention_days_table_override_capped_by_runs():
+    retention = RetentionConfig(
+        max_age_days=90,
+        tables={"answers_raw": 30, "mentions": 365, "intent_classification_cache": 7},
+    )
+
+    days = resolve_retention_days(retention)
+
+    assert days["answers_raw"] == 30
+    assert days["mentions"] == 90  # cannot outlive its run
+    assert days["intent_classification_cache"] == 7
+
+
+def test_resolve_retention_days_empty_without_policy():
+    assert resolve_retention_days(RetentionConfig()) == {}
+
+
+def test_retention_config_rejects_unknown_table():
+    with pytest.raises(ValidationError, match="Unknown retention table"):
+        RetentionConfig(tables={"brands": 10})
+
+
+def test_retention_config_rejects_non_positive_days():
+    with pytest.raises(ValidationError):
+        RetentionConfig(max_age_days=0)
+    with pytest.raises(ValidationError):
+        RetentionConfig(tables={"answers_raw": -1})
+
+
+# ============================================================================
+# Run Expiry
+# ============================================================================
+
+
+def test_expired_run_archived_and_deleted(populated):
+    db_path, output_dir = populated
+
+    report = run_maintenance(
+        str(db_path), str(output_dir), RetentionConfig(max_age_days=30), now=NOW
+    )
+
+    assert report.runs_deleted == 1
+    assert report.run_dirs_removed == 1
+    assert report.rows_deleted["runs"] == 1
+    assert report.rows_deleted["answers_raw"] == 1
+    assert report.rows_deleted["mentions"] == 1
+
+    # Old run gone from database and disk, new run untouched
+    assert _count(db_path, "runs", OLD_RUN) == 0
+    assert _count(db_path, "answers_raw", OLD_RUN) == 0
+    assert _count(db_path, "runs", NEW_RUN) == 1
+    assert not (output_dir / OLD_RUN).exists()
+    assert (output_dir / NEW_RUN).exists()
+
+    # Archived rows are readable NDJSON
+    archive = output_dir / "archive" / OLD_RUN
+    with gzip.open(archive / "answers_raw.ndjson.gz", "rt") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[0]["answer_text"] == "HubSpot and Salesforce are popular."
+
+    with tarfile.open(archive / "artifacts.tar.gz") as tar:
+        assert any(name.endswith("run_meta.json") for name in tar.getnames())
+
+
+def test_maintenance_is_idempotent(populated):
+    db_path, output_dir = populated
+    retention = RetentionConfig(max_age_days=30)
+
+    run_maintenance(str(db_path), str(output_dir), retention, now=NOW)
+    second = run_maintenance(str(db_path), str(output_dir), retention, now=NOW)
+
+    assert second.runs_deleted == 0
+    assert second.rows_deleted == {}
+    assert second.archive_files == []
+
+
+def test_interrupted_purge_resumes_on_next_pass(populated, monkeypatch):
+    db_path, output_dir = populated
+    retention = RetentionConfig(max_age_days=30)
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("interrupted")
+
+    with monkeypatch.context() as m:
+        m.setattr(maintenance, "_purge_run_tables", crash)
+        with pytest.raises(RuntimeError):
+            run_maintenance(str(db_path), str(output_dir), retention, now=NOW)
+
+    # Directory archived and removed first; the row is left for the next pass
+    assert not (output_dir / OLD_RUN).exists()
+    assert (output_dir / "archive" / OLD_RUN / "artifacts.tar.gz").exists()
+    assert _count(db_path, "runs", OLD_RUN) == 1
+
+    report = run_maintenance(str(db_path), str(output_dir), retention, now=NOW)
+
+    assert report.runs_deleted == 1
+    assert _count(db_path, "runs", OLD_RUN) == 0
+    assert _count(db_path, "answers_raw", OLD_RUN) == 0
+
+
+def test_no_archive_deletes_without_writing(populated):
+    db_path, output_dir = populated
+
+    report = run_maintenance(
+        str(db_path),
+        str(output_dir),
+        RetentionConfig(max_age_days=30, archive=False),
+        now=NOW,
+    )
+
+    assert report.runs_deleted == 1
+    assert report.archive_files == []
+    assert not (output_dir / "archive").exists()
+
+
+def test_dry_run_changes_nothing(populated):
+    db_path, output_dir = populated
+
+    report = run_maintenance(
+        str(db_path), str(output_dir), RetentionConfig(max_age_days=30), dry_run=True, now=NOW
+    )
+
+    assert report.dry_run is True
+    assert report.runs_deleted == 1
+    assert report.rows_deleted["answers_raw"] == 1
+    assert _count(db_path, "runs") == 2
+    assert (output_dir / OLD_RUN).exists()
+    assert not (output_dir / "archive").exists()
+
+
+def test_disabled_retention_skips_purge(populated):
+    db_path, output_dir = populated
+
+    report = run_maintenance(
+        str(db_path),
+        str(output_dir),
+        RetentionConfig(enabled=False, max_age_days=30),
+        now=NOW,
+    )
+
+    assert report.runs_deleted == 0
+    assert _count(db_path, "runs") == 2
+
+
+def test_chunk_size_processes_all_batches(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    with sqlite3.connect(db_path) as conn:
+        for day in range(1, 8):
+            _add_run(conn, f"2025-01-0{day}T08-00-00Z", f"2025-01-0{day}T08:00:00Z")
+        conn.commit()
+
+    report = run_maintenance(
+        str(db_path),
+        str(tmp_path),
+        RetentionConfig(max_age_days=30, chunk_size=2, archive=False),
+        now=NOW,
+    )
+
+    assert report.runs_deleted == 7
+    assert _count(db_path, "runs") == 0
+
+
+# ============================================================================
+# Per-Table Purge and Cache Eviction
+# ============================================================================
+
+
+def test_table_retention_shorter_than_runs(populated):
+    db_path, output_dir = populated
+    retention = RetentionConfig(max_age_days=365, tables={"answers_raw": 30})
+
+    report = run_maintenance(str(db_path), str(output_dir), retention, now=NOW)
+
+    assert report.runs_deleted == 0
+    assert report.rows_deleted == {"answers_raw": 1}
+    assert _count(db_path, "answers_raw", OLD_RUN) == 0
+    assert _count(db_path, "mentions", OLD_RUN) == 1
+    assert _count(db_path, "runs", OLD_RUN) == 1
+    assert (output_dir / "archive" / OLD_RUN / "answers_raw.ndjson.gz").exists()
+
+
+def test_cache_eviction_by_last_access(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    with sqlite3.connect(db_path) as conn:
+        store_intent_classification_cache(
+            conn, "a" * 64, "best crm", "commercial_investigation", "consideration", "medium", 0.9
+        )
+        store_intent_classification_cache(
+            conn, "b" * 64, "crm pricing", "transactional", "decision", "high", 0.8
+        )
+        conn.execute(
+            "UPDATE intent_classification_cache SET last_accessed_at = ? WHERE query_hash = ?",
+            ("2025-01-01T00:00:00Z", "a" * 64),
+        )
+        conn.execute(
+            "UPDATE intent_classification_cache SET last_accessed_at = ? WHERE query_hash = ?",
+            ("2025-05-31T00:00:00Z", "b" * 64),
+        )
+        conn.commit()
+
+    report = run_maintenance(
+        str(db_path),
+        str(tmp_path),
+        RetentionConfig(tables={"intent_classification_cache": 30}),
+        now=NOW,
+    )
+
+    assert report.cache_rows_deleted == 1
+    assert _count(db_path, "intent_classification_cache") == 1
+
+
+# ============================================================================
+# Archive Formats and Vacuum
+# ============================================================================
+
+
+def test_parquet_without_pyarrow_raises(populated, monkeypatch):
+    db_path, output_dir = populated
+    monkeypatch.setattr(maintenance, "pa", None)
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        run_maintenance(
+            str(db_path),
+            str(output_dir),
+            RetentionConfig(max_age_days=30, archive_format="parquet"),
+            now=NOW,
+        )
+
+    assert _count(db_path, "runs") == 2
+
+
+def test_parquet_archive_roundtrip(populated):
+    pq = pytest.importorskip("pyarrow.parquet")
+    db_path, output_dir = populated
+
+    run_maintenance(
+        str(db_path),
+        str(output_dir),
+        RetentionConfig(max_age_days=30, archive_format="parquet"),
+        now=NOW,
+    )
+
+    table = pq.read_table(output_dir / "archive" / OLD_RUN / "mentions.parquet")
+    assert table.column("brand_name").to_pylist() == ["HubSpot"]
+
+
+def test_new_database_uses_incremental_auto_vacuum(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_vacuum_releases_free_pages(populated):
+    db_path, output_dir = populated
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE filler (data TEXT)")
+        conn.executemany("INSERT INTO filler VALUES (?)", [("x" * 4000,) for _ in range(50)])
+        conn.commit()
+        conn.execute("DROP TABLE filler")
+        conn.commit()
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+
+        freed = vacuum_database(conn)
+
+        assert freed > 0
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
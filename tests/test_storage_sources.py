@@ -0,0 +1,257 @@
+"""
+Tests for storage.sources and the sources table in storage.db.
+
+Tests cover:
+- URL normalization and domain extraction
+- Source extraction from OpenAI, Gemini and Perplexity result shapes
+- Sources populated by insert_answer_raw() and by the v10 backfill
+- insert_answer_raw() never decodes the stored results JSON
+- get_source_domains() ranking and filters
+- Sources export, `sources` CLI commands and retention
+"""
+
+import csv
+import json
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+from typer.testing import CliRunner
+
+from llm_answer_watcher.cli import EXIT_SUCCESS, app
+from llm_answer_watcher.config.schema import RetentionConfig
+from llm_answer_watcher.storage.db import (
+    apply_migrations,
+    backfill_sources,
+    get_source_domains,
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_run,
+)
+from llm_answer_watcher.storage.exporter import export_sources_csv, export_sources_json
+from llm_answer_watcher.storage.maintenance import run_maintenance
+from llm_answer_watcher.storage.sources import Source, extract_sources, normalize_url
+
+RUN_ID = "2025-11-02T08-00-00Z"
+
+OPENAI_RESULTS = [
+    {
+        "type": "web_search_call",
+        "action": {
+            "query": "best crm",
+            "sources": [
+                {"type": "url", "url": "https://www.g2.com/categories/crm?utm_source=openai"},
+                {"type": "url", "url": "https://hubspot.com/products/crm/"},
+            ],
+        },
+    }
+]
+GEMINI_RESULTS = [
+    {"type": "web_search_query", "query": "best crm"},
+    {
+        "type": "web_search_source",
+        "uri": "https://vertexaisearch.cloud.google.com/grounding-api-redirect/abc",
+        "title": "capterra.com",
+    },
+    {"type": "grounding_supports", "supports": [{"segment": {"startIndex": 0}}]},
+]
+PERPLEXITY_RESULTS = [
+    {"url": "https://g2.com/categories/crm#reviews", "title": "Best CRM", "snippet": "..."},
+    {"url": "https://zoho.com/crm", "title": "Zoho CRM"},
+]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.G2.com/crm/?utm_source=openai", ("https://g2.com/crm", "g2.com")),
+        ("HTTP://example.com:80", ("http://example.com/", "example.com")),
+        (
+            "https://example.com:8443/a?id=1&gclid=x#top",
+            ("https://example.com:8443/a?id=1", "example.com"),
+        ),
+        ("ftp://example.com/file", None),
+        ("not a url", None),
+        ("https://[::1", None),
+    ],
+)
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+def test_extract_openai_nested_sources():
+    assert extract_sources(OPENAI_RESULTS) == [
+        Source(1, "https://g2.com/categories/crm", "g2.com", None),
+        Source(2, "https://hubspot.com/products/crm", "hubspot.com", None),
+    ]
+
+
+def test_extract_gemini_redirect_uses_title_domain():
+    [source] = extract_sources(GEMINI_RESULTS)
+
+    assert source.domain == "capterra.com"
+    assert source.url.startswith("https://vertexaisearch.cloud.google.com/")
+
+
+def test_extract_deduplicates_by_normalized_url():
+    results = [*PERPLEXITY_RESULTS, {"url": "https://www.g2.com/categories/crm/"}]
+
+    sources = extract_sources(results)
+
+    assert [(s.position, s.domain, s.title) for s in sources] == [
+        (1, "g2.com", "Best CRM"),
+        (2, "zoho.com", "Zoho CRM"),
+    ]
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    init_db_if_needed(str(db_path))
+    with sqlite3.connect(db_path) as conn:
+        insert_run(conn, RUN_ID, "2025-11-02T08:00:00Z", 2, 2)
+        yield conn
+
+
+def _insert_answer(conn, intent_id, model_name, results):
+    insert_answer_raw(
+        conn,
+        run_id=RUN_ID,
+        intent_id=intent_id,
+        model_provider="openai",
+        model_name=model_name,
+        timestamp_utc="2025-11-02T08:00:05Z",
+        prompt="What is the best CRM?",
+        answer_text="HubSpot.",
+        web_search_count=len(results),
+        web_search_results_json=json.dumps(results),
+        web_search_results=results,
+    )
+    conn.commit()
+
+
+def test_insert_answer_raw_populates_sources(conn):
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+    # Duplicate answer is ignored along with its sources
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+
+    rows = conn.execute(
+        "SELECT run_id, intent_id, model_name, position, domain FROM sources ORDER BY position"
+    ).fetchall()
+    assert rows == [
+        (RUN_ID, "best-crm", "gpt-4o", 1, "g2.com"),
+        (RUN_ID, "best-crm", "gpt-4o", 2, "hubspot.com"),
+    ]
+
+
+def test_insert_answer_raw_does_not_decode_results_json(conn):
+    insert_answer_raw(
+        conn,
+        run_id=RUN_ID,
+        intent_id="best-crm",
+        model_provider="openai",
+        model_name="gpt-4o",
+        timestamp_utc="2025-11-02T08:00:05Z",
+        prompt="What is the best CRM?",
+        answer_text="HubSpot.",
+        web_search_count=1,
+        web_search_results_json="{not json",
+    )
+
+    assert conn.execute("SELECT COUNT(*) FROM answers_raw").fetchone()[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 0
+    # Undecodable results are skipped by the backfill as well
+    assert backfill_sources(conn) == 0
+
+
+def test_get_source_domains_ranks_by_answers(conn):
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+    _insert_answer(conn, "best-crm", "sonar", PERPLEXITY_RESULTS)
+    _insert_answer(conn, "cheap-crm", "gpt-4o", PERPLEXITY_RESULTS[1:])
+
+    top = get_source_domains(conn, intent_id="best-crm", limit=2)
+
+    assert top[0] == {"domain": "g2.com", "answers": 2, "citations": 2, "avg_position": 1.0}
+    assert len(top) == 2
+    assert [d["domain"] for d in get_source_domains(conn, intent_id="cheap-crm")] == ["zoho.com"]
+    assert get_source_domains(conn, since_utc="2026-01-01T00:00:00Z") == []
+
+
+def test_migration_backfills_existing_answers(tmp_path):
+    db_path = tmp_path / "watcher.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+        )
+        apply_migrations(conn, 0, 9)
+        insert_run(conn, RUN_ID, "2025-11-02T08:00:00Z", 1, 1)
+        for model_name, results_json in [
+            ("gemini", json.dumps(GEMINI_RESULTS)),
+            ("broken", "{not json"),
+            ("no-search", None),
+        ]:
+            conn.execute(
+                """
+                INSERT INTO answers_raw (run_id, intent_id, model_provider, model_name,
+                    timestamp_utc, prompt, answer_text, answer_length, web_search_results_json)
+                VALUES (?, 'best-crm', 'google', ?, '2025-11-02T08:00:05Z', 'p', 'a', 1, ?)
+                """,
+                (RUN_ID, model_name, results_json),
+            )
+        conn.commit()
+
+    init_db_if_needed(str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT domain FROM sources").fetchall() == [("capterra.com",)]
+        assert backfill_sources(conn) == 0
+
+
+def test_export_sources(conn, tmp_path):
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+    db_path = conn.execute("PRAGMA database_list").fetchone()[2]
+
+    csv_path = tmp_path / "sources.csv"
+    assert export_sources_csv(str(csv_path), db_path, domain="www.G2.com") == 1
+    with open(csv_path, encoding="utf-8") as f:
+        [row] = list(csv.DictReader(f))
+    assert row["url"] == "https://g2.com/categories/crm"
+    assert row["position"] == "1"
+
+    json_path = tmp_path / "sources.json"
+    assert export_sources_json(str(json_path), db_path, run_id="other-run") == 0
+    assert json.loads(json_path.read_text()) == []
+
+
+def test_sources_cli(conn, tmp_path):
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+    db_path = conn.execute("PRAGMA database_list").fetchone()[2]
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["sources", "domains", "--db", db_path, "--format", "json"])
+    assert result.exit_code == EXIT_SUCCESS
+    assert [d["domain"] for d in json.loads(result.stdout)["source_domains"]] == [
+        "g2.com",
+        "hubspot.com",
+    ]
+
+    result = runner.invoke(app, ["sources", "backfill", "--db", db_path])
+    assert result.exit_code == EXIT_SUCCESS
+
+    output = tmp_path / "sources.json"
+    result = runner.invoke(app, ["export", "sources", "--db", db_path, "--output", str(output)])
+    assert result.exit_code == EXIT_SUCCESS
+    assert len(json.loads(output.read_text())) == 2
+
+
+def test_sources_outlive_answers_raw_retention(conn, tmp_path):
+    _insert_answer(conn, "best-crm", "gpt-4o", OPENAI_RESULTS)
+    db_path = conn.execute("PRAGMA database_list").fetchone()[2]
+    retention = RetentionConfig(max_age_days=365, tables={"answers_raw": 30}, archive=False)
+
+    now = datetime(2025, 12, 15, tzinfo=UTC)
+
+    report = run_maintenance(db_path, str(tmp_path), retention, vacuum=False, now=now)
+
+    assert report.rows_deleted == {"answers_raw": 1}
+    assert conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 2
@@ -34,10 +34,10 @@ def test_v5_migration_from_v4(tmp_path):
     # Initialize database with current schema
     init_db_if_needed(str(db_path))
 
-    # Verify we're at v5
+    # Verify we're at v5 or later
     with sqlite3.connect(str(db_path)) as conn:
         version = get_schema_version(conn)
-        assert version == CURRENT_SCHEMA_VERSION == 5, f"Expected v5, got v{version}"
+        assert version == CURRENT_SCHEMA_VERSION >= 5, f"Expected v5+, got v{version}"
 
         # Check that new columns exist
         cursor = conn.execute("PRAGMA table_info(answers_raw)")
@@ -0,0 +1,218 @@
+"""
+Tests for utils/logging.py module.
+
+Tests cover:
+- SecretRedactingFilter combined pattern and pre-check
+- Lazy %-style arguments surviving redaction
+- Queued pipeline (QueueHandler/QueueListener) output and flush_logging(),
+  with redaction and formatting off the calling thread
+- Exception tracebacks carried through the queue
+- Logging overhead per query at INFO and DEBUG (benchmark, `-m slow`)
+"""
+
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from llm_answer_watcher.utils import logging as log_utils
+from llm_answer_watcher.utils.logging import (
+    SecretRedactingFilter,
+    flush_logging,
+    setup_logging,
+)
+
+OPENAI_PROJECT_KEY = "sk-proj-" + "a1B2" * 12
+OPENAI_KEY = "sk-" + "x" * 16 + "9876"
+ANTHROPIC_KEY = "sk-ant-api03-" + "k" * 60 + "WXYZ"
+
+# Emitted per API query by the runner and OpenAI client (message, args)
+PER_QUERY_INFO = [
+    ("Processing: intent=%s, provider=%s, model=%s", ("best-crm", "openai", "gpt-4o-mini")),
+    ("Executing operations for intent=%s", ("best-crm",)),
+    ("Completed %d operations, cost=$%.6f", (2, 0.000412)),
+    (
+        "Extracted token usage for %s: total=%s, prompt=%s, completion=%s",
+        ("gpt-4o-mini", 812, 112, 700),
+    ),
+    (
+        "Success: intent=%s, provider=%s, model=%s, cost=$%.6f, appeared_mine=%s",
+        ("best-crm", "openai", "gpt-4o-mini", 0.001234, True),
+    ),
+]
+PER_QUERY_DEBUG = [
+    ("Using temperature %s for model: %s", (0.7, "gpt-4o-mini")),
+    ("Sending request to OpenAI: model=%s", ("gpt-4o-mini",)),
+    ("OpenAI Responses API response keys: %s", ({"id": 1, "output": 2, "usage": 3}.keys(),)),
+    ("OpenAI usage field content: %s", ({"input_tokens": 112, "output_tokens": 700},)),
+    ("Usage object content: %s", ({"input_tokens": 112, "output_tokens": 700},)),
+    ("Processing output item type: %s", ("message",)),
+    ("No web search results found in response", ()),
+]
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    log_utils._stop_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _entries(capsys):
+    return [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+
+
+def _redact(text):
+    return SecretRedactingFilter()._redact_secrets(text)
+
+
+class TestSecretRedaction:
+    def test_each_key_format_redacted(self):
+        assert _redact(f"key={OPENAI_PROJECT_KEY}") == "key=sk-proj-...a1B2"
+        assert _redact(f"key={OPENAI_KEY}") == "key=sk-...9876"
+        assert _redact(f"key={ANTHROPIC_KEY}") == "key=sk-ant-api03-...WXYZ"
+        assert _redact("Authorization: Bearer " + "t" * 20 + "abcd") == (
+            "Authorization: Bearer ***abcd"
+        )
+
+    def test_multiple_secrets_in_one_string(self):
+        text = f"{OPENAI_PROJECT_KEY} then {ANTHROPIC_KEY}"
+        assert _redact(text) == "sk-proj-...a1B2 then sk-ant-api03-...WXYZ"
+
+    def test_text_without_markers_returned_as_is(self):
+        text = "Processing: intent=best-crm, provider=openai"
+        assert _redact(text) is text
+
+    def test_non_string_args_keep_their_type(self):
+        record = logging.LogRecord(
+            "x", logging.INFO, __file__, 1, "cost=$%.6f key=%s", (0.5, OPENAI_KEY), None
+        )
+        assert SecretRedactingFilter().filter(record) is True
+        assert record.args == (0.5, "sk-...9876")
+        assert record.getMessage() == "cost=$0.500000 key=sk-...9876"
+
+
+class TestQueuedLogging:
+    def test_records_written_by_listener(self, capsys):
+        setup_logging()
+        logging.getLogger("watcher").info("cost=$%.6f key=%s", 0.25, OPENAI_PROJECT_KEY)
+        flush_logging()
+
+        [entry] = _entries(capsys)
+        assert entry["level"] == "INFO"
+        assert entry["component"] == "watcher"
+        assert entry["message"] == "cost=$0.250000 key=sk-proj-...a1B2"
+
+    def test_debug_requires_verbose(self, capsys):
+        setup_logging()
+        logging.getLogger("watcher").debug("hidden")
+        flush_logging()
+        assert capsys.readouterr().err == ""
+
+        setup_logging(verbose=True)
+        logging.getLogger("watcher").debug("shown")
+        flush_logging()
+        assert [e["message"] for e in _entries(capsys)] == ["shown"]
+
+    def test_args_mutated_after_call_not_seen(self, capsys):
+        setup_logging()
+        usage = {"tokens": 1}
+        logging.getLogger("watcher").info("usage=%s", usage)
+        usage["tokens"] = 2
+        flush_logging()
+
+        assert _entries(capsys)[0]["message"] == "usage={'tokens': 1}"
+
+    def test_exception_traceback_carried_through_queue(self, capsys):
+        setup_logging()
+        try:
+            raise ValueError(f"bad key {OPENAI_KEY}")
+        except ValueError:
+            logging.getLogger("watcher").exception("request failed")
+        flush_logging()
+
+        [entry] = _entries(capsys)
+        assert entry["message"] == "request failed"
+        assert "ValueError" in entry["exception"]
+        assert "Traceback" in entry["exception"]
+
+    def test_re_setup_drains_previous_listener(self, capsys):
+        setup_logging()
+        for i in range(50):
+            logging.getLogger("watcher").info("record %d", i)
+        setup_logging(queued=False)
+
+        assert len(_entries(capsys)) == 50
+
+    def test_redaction_and_formatting_run_off_the_calling_thread(self, capsys, monkeypatch):
+        threads = {}
+        original_filter = SecretRedactingFilter.filter
+        original_format = log_utils.JSONFormatter.format
+
+        def recording_filter(self, record):
+            threads["filter"] = threading.get_ident()
+            return original_filter(self, record)
+
+        def recording_format(self, record):
+            threads["format"] = threading.get_ident()
+            return original_format(self, record)
+
+        monkeypatch.setattr(SecretRedactingFilter, "filter", recording_filter)
+        monkeypatch.setattr(log_utils.JSONFormatter, "format", recording_format)
+        setup_logging()
+        logging.getLogger("watcher").info("key=%s", OPENAI_KEY)
+        flush_logging()
+
+        assert set(threads) == {"filter", "format"}
+        assert threading.get_ident() not in threads.values()
+        assert _entries(capsys)[0]["message"] == "key=sk-...9876"
+
+    def test_synchronous_mode(self, capsys):
+        setup_logging(queued=False)
+        logging.getLogger("watcher").info("key=%s", OPENAI_KEY)
+
+        assert _entries(capsys)[0]["message"] == "key=sk-...9876"
+
+
+def _per_query_overhead_us(queries, verbose, queued):
+    """Caller-thread time spent logging one query, in microseconds (best of 3)."""
+    setup_logging(verbose=verbose, queued=queued)
+    logger = logging.getLogger("llm_answer_watcher.llm_runner.runner")
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(queries):
+            for msg, args in PER_QUERY_DEBUG:
+                logger.debug(msg, *args)
+            for msg, args in PER_QUERY_INFO:
+                logger.info(msg, *args)
+        timings.append(time.perf_counter() - start)
+        flush_logging()
+    return min(timings) / queries * 1_000_000
+
+
+@pytest.mark.slow
+def test_logging_overhead_per_query(tmp_path, monkeypatch):
+    # Line-buffered like stderr on a terminal: every record is a write syscall
+    with open(tmp_path / "stderr.log", "w", buffering=1) as stream:
+        monkeypatch.setattr("sys.stderr", stream)
+        results = {
+            (level, mode): _per_query_overhead_us(300, level == "DEBUG", mode == "queued")
+            for level in ("INFO", "DEBUG")
+            for mode in ("sync", "queued")
+        }
+        log_utils._stop_listener()
+
+    print()
+    for (level, mode), overhead in results.items():
+        print(f"{level:5} {mode:6}: {overhead:7.1f} us/query")
+
+    # Suppressed DEBUG calls are cheap, so INFO stays well below DEBUG
+    assert results[("INFO", "queued")] < results[("DEBUG", "queued")]
+    # Redaction, JSON serialization and writes happen off the calling thread
+    assert results[("DEBUG", "queued")] < results[("DEBUG", "sync")]
@@ -10,6 +10,7 @@ Tests cover:
 - Tool pricing lookup
 - Refresh pricing functionality
 - List available models
+- Parsed pricing files reused until they change on disk
 """
 
 import json
@@ -507,3 +508,37 @@ class TestCacheExpiration:
 
         # Should refresh, not skip
         assert result["status"] == "success"
+
+
+class TestPricingFileReuse:
+    """Test suite for in-memory reuse of parsed pricing files."""
+
+    def test_cache_file_parsed_once_until_changed(self, tmp_path, monkeypatch):
+        """Test pricing cache is re-read only after the file changes."""
+        import os
+
+        cache_file = tmp_path / "cache.json"
+        cache_data = {
+            "cached_at": datetime.now(UTC).isoformat(),
+            "prices": [{"id": "gpt-4o-mini", "vendor": "openai", "input": 0.15, "output": 0.6}],
+        }
+        cache_file.write_text(json.dumps(cache_data))
+        monkeypatch.setattr("llm_answer_watcher.utils.pricing.CACHE_FILE", cache_file)
+        monkeypatch.setattr(
+            "llm_answer_watcher.utils.pricing.OVERRIDES_FILE", tmp_path / "overrides.json"
+        )
+
+        with patch(
+            "llm_answer_watcher.utils.pricing.json.load", wraps=json.load
+        ) as mock_load:
+            assert get_pricing("openai", "gpt-4o-mini").input == 0.15
+            assert get_pricing("openai", "gpt-4o-mini").input == 0.15
+            assert mock_load.call_count == 1
+
+            cache_data["prices"][0]["input"] = 0.2
+            cache_file.write_text(json.dumps(cache_data))
+            mtime = cache_file.stat().st_mtime_ns + 1_000_000_000
+            os.utime(cache_file, ns=(mtime, mtime))
+
+            assert get_pricing("openai", "gpt-4o-mini").input == 0.2
+            assert mock_load.call_count == 2
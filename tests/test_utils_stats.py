@@ -0,0 +1,21 @@
+"""
+Tests for utils.stats module.
+
+Tests cover:
+- percentile() interpolation, unordered input and single values
+"""
+
+import pytest
+
+from llm_answer_watcher.utils.stats import percentile
+
+
+def test_percentile_interpolates():
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+
+
+def test_percentile_bounds_and_single_value():
+    assert percentile([3.0, 1.0, 2.0], 0) == 1.0
+    assert percentile([3.0, 1.0, 2.0], 100) == 3.0
+    assert percentile([7.0], 99) == 7.0